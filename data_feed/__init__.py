@@ -6,6 +6,8 @@ Data Feed 模組：統一處理多家 API 來源的 Tick 資料
 - BaseTickConverter：抽象基底類別
 - SinopacConverter：永豐 API 的轉換器
 - MockSinopacAPI：模擬永豐 API 的資料來源
+- CompactTick / TickBatch：精簡 Tick 與欄式批次（批次轉換見 convert_batch）
+- TickRecorder / TickStore / TickReplayer：Tick 錄製檔與高速重播
 """
 
 from .tick_handler import (
@@ -13,6 +15,20 @@ from .tick_handler import (
     BaseTickConverter,
     SinopacConverter,
     MockSinopacAPI,
+    CompactTick,
+    TickBatch,
+    TickBatchConversion,
+    RejectedTick,
+    TICK_DTYPE,
+)
+from .tick_store import (
+    TickRecorder,
+    TickStore,
+    TickFile,
+    TickReplayer,
+    ReplayStats,
+    open_tick_file,
+    RECORD_DTYPE,
 )
 
 __all__ = [
@@ -20,5 +36,17 @@ __all__ = [
     "BaseTickConverter",
     "SinopacConverter",
     "MockSinopacAPI",
+    "CompactTick",
+    "TickBatch",
+    "TickBatchConversion",
+    "RejectedTick",
+    "TICK_DTYPE",
+    "TickRecorder",
+    "TickStore",
+    "TickFile",
+    "TickReplayer",
+    "ReplayStats",
+    "open_tick_file",
+    "RECORD_DTYPE",
 ]
 
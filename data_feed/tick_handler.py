@@ -6,6 +6,8 @@ Tick Handler：統一處理多家 API 來源的 Tick 資料
 2. BaseTickConverter：抽象基底類別，規範不同 API 來源的轉換流程
 3. SinopacConverter：永豐 API 的轉換器（目前為骨架，待正式 API 文件）
 4. MockSinopacAPI：模擬永豐 API 的資料來源（用於開發與測試）
+5. CompactTick / TickBatch：不驗證的精簡 Tick 與欄式批次（numpy structured array），
+   供全市場 Tick 流的批次轉換與因子計算使用
 
 作者：創世紀量化系統開發團隊
 版本：v1.0
@@ -13,11 +15,14 @@ Tick Handler：統一處理多家 API 來源的 Tick 資料
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Union
+from operator import itemgetter
 import time
 import random
 
+import numpy as np
+
 
 # ============================================================================
 # 任務一：定義統一的 Tick 數據結構（UnifiedTick）
@@ -62,6 +67,178 @@ class UnifiedTick:
             raise ValueError(f"Bid price ({self.bid_price}) should be less than ask price ({self.ask_price})")
 
 
+# ============================================================================
+# 精簡 Tick 與欄式 TickBatch（批次 / 高頻路徑）
+# ============================================================================
+
+class CompactTick(NamedTuple):
+    """
+    精簡 Tick：欄位與 UnifiedTick 相同，但不做 __post_init__ 驗證
+
+    NamedTuple（無 __dict__），建立成本遠低於 dataclass。用於已經批次驗證過的資料
+    （例如 TickBatch 逐筆迭代）；下游引擎只讀取屬性，可直接取代 UnifiedTick。
+    """
+    timestamp: float
+    symbol: str
+    source: str
+    price: float
+    volume: int
+    bid_price: float
+    ask_price: float
+
+    @classmethod
+    def from_unified(cls, tick: UnifiedTick) -> "CompactTick":
+        return cls(tick.timestamp, tick.symbol, tick.source, tick.price, tick.volume, tick.bid_price, tick.ask_price)
+
+    def to_unified(self) -> UnifiedTick:
+        """轉回 UnifiedTick（會執行驗證）"""
+        return UnifiedTick(*self)
+
+
+# TickBatch 的 structured dtype；symbol 以 batch 內的 symbol 表索引保存
+TICK_DTYPE = np.dtype([
+    ("timestamp", "f8"),
+    ("symbol_id", "i4"),
+    ("price", "f8"),
+    ("volume", "i8"),
+    ("bid_price", "f8"),
+    ("ask_price", "f8"),
+])
+
+
+class TickBatch:
+    """
+    欄式 Tick 批次
+
+    Attributes:
+        data: TICK_DTYPE 的 numpy structured array（依到達順序）
+        symbols: symbol 表，data["symbol_id"] 為其索引
+        source: 資料來源（整批相同）
+
+    欄位以屬性取得（timestamp / symbol_id / price / volume / bid_price / ask_price，皆為 view）；
+    逐筆迭代得到 CompactTick。批次內的資料視為已驗證（由 convert_batch 或 from_ticks 建立）。
+    """
+
+    __slots__ = ("data", "symbols", "source")
+
+    def __init__(self, data: np.ndarray, symbols: Sequence[str], source: str = ""):
+        if data.dtype != TICK_DTYPE:
+            raise ValueError(f"TickBatch data must have dtype TICK_DTYPE, got {data.dtype}")
+        self.data = data
+        self.symbols = list(symbols)
+        self.source = source
+
+    @classmethod
+    def empty(cls, source: str = "") -> "TickBatch":
+        return cls(np.empty(0, dtype=TICK_DTYPE), [], source)
+
+    @classmethod
+    def from_ticks(cls, ticks: Iterable[Union[UnifiedTick, CompactTick]], source: Optional[str] = None) -> "TickBatch":
+        """
+        由 UnifiedTick / CompactTick 序列建立批次
+
+        Args:
+            ticks: Tick 序列
+            source: 批次來源（預設取第一筆的 source）
+        """
+        ticks = list(ticks)
+        ids: Dict[str, int] = {}
+        data = np.empty(len(ticks), dtype=TICK_DTYPE)
+        data["symbol_id"] = [ids.setdefault(t.symbol, len(ids)) for t in ticks]
+        for name in ("timestamp", "price", "volume", "bid_price", "ask_price"):
+            data[name] = [getattr(t, name) for t in ticks]
+        if source is None:
+            source = ticks[0].source if ticks else ""
+        return cls(data, list(ids), source)
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["TickBatch"]) -> "TickBatch":
+        """串接多個批次（合併 symbol 表）"""
+        if not batches:
+            return cls.empty()
+        ids: Dict[str, int] = {}
+        parts = []
+        for batch in batches:
+            remap = np.array([ids.setdefault(s, len(ids)) for s in batch.symbols], dtype=np.int32)
+            part = batch.data.copy()
+            if len(remap):
+                part["symbol_id"] = remap[part["symbol_id"]]
+            parts.append(part)
+        return cls(np.concatenate(parts), list(ids), batches[0].source)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._tick(self.data[index])
+        return TickBatch(self.data[index], self.symbols, self.source)
+
+    def __iter__(self) -> Iterator[CompactTick]:
+        symbols, source = self.symbols, self.source
+        for ts, sid, price, volume, bid, ask in self.data.tolist():
+            yield CompactTick(ts, symbols[sid], source, price, volume, bid, ask)
+
+    def __repr__(self) -> str:
+        return f"TickBatch(n={len(self)}, symbols={len(self.symbols)}, source={self.source!r})"
+
+    def _tick(self, row) -> CompactTick:
+        ts, sid, price, volume, bid, ask = row.tolist()
+        return CompactTick(ts, self.symbols[sid], self.source, price, volume, bid, ask)
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self.data["timestamp"]
+
+    @property
+    def symbol_id(self) -> np.ndarray:
+        return self.data["symbol_id"]
+
+    @property
+    def price(self) -> np.ndarray:
+        return self.data["price"]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.data["volume"]
+
+    @property
+    def bid_price(self) -> np.ndarray:
+        return self.data["bid_price"]
+
+    @property
+    def ask_price(self) -> np.ndarray:
+        return self.data["ask_price"]
+
+    def symbol_names(self) -> np.ndarray:
+        """每筆的 symbol 代號"""
+        return np.asarray(self.symbols, dtype=object)[self.symbol_id]
+
+    def to_unified(self) -> List[UnifiedTick]:
+        """逐筆轉成 UnifiedTick（會執行驗證）"""
+        return [tick.to_unified() for tick in self]
+
+
+@dataclass(frozen=True)
+class RejectedTick:
+    """批次轉換時被拒絕的原始資料列"""
+    index: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class TickBatchConversion:
+    """
+    批次轉換結果
+
+    Attributes:
+        batch: 通過驗證的 Tick（保持原始順序）
+        rejected: 被拒絕的列（原始資料中的位置與原因）
+    """
+    batch: TickBatch
+    rejected: List[RejectedTick] = field(default_factory=list)
+
+
 # ============================================================================
 # 任務二：建立 Tick 校準與轉換的基底類別（BaseTickConverter）
 # ============================================================================
@@ -90,6 +267,27 @@ class BaseTickConverter(ABC):
         """
         pass
     
+    def convert_batch(self, raw_rows: Sequence[Dict[str, Any]]) -> TickBatchConversion:
+        """
+        批次轉換：預設逐筆呼叫 convert_to_unified，轉換失敗的列記錄於 rejected
+        
+        子類別可覆寫為向量化版本（見 SinopacConverter.convert_batch）。
+        
+        Args:
+            raw_rows: 原始 Tick 數據列表
+        
+        Returns:
+            TickBatchConversion
+        """
+        ticks: List[UnifiedTick] = []
+        rejected: List[RejectedTick] = []
+        for index, raw in enumerate(raw_rows):
+            try:
+                ticks.append(self.convert_to_unified(raw))
+            except (ValueError, TypeError) as exc:
+                rejected.append(RejectedTick(index, str(exc)))
+        return TickBatchConversion(TickBatch.from_ticks(ticks, getattr(self, "source_name", None)), rejected)
+    
     def validate_raw_data(self, raw_data: Dict[str, Any], required_fields: list) -> bool:
         """
         驗證原始數據是否包含必要欄位
@@ -186,6 +384,100 @@ class SinopacConverter(BaseTickConverter):
         )
         
         return unified_tick
+    
+    def convert_batch(self, raw_rows: Sequence[Dict[str, Any]]) -> TickBatchConversion:
+        """
+        向量化批次轉換：欄位映射與 convert_to_unified 相同，驗證規則與 UnifiedTick 相同，
+        但整批以 numpy 檢查，不建立逐筆物件
+        
+        每個被拒絕的列只回報第一個不符合的規則（依序：非 dict、缺欄位、timestamp、price、
+        volume、bid/ask、bid >= ask）。
+        
+        Args:
+            raw_rows: Sinopac 原始 Tick 數據列表
+        
+        Returns:
+            TickBatchConversion（batch.source 為 "sinopac"）
+        """
+        rows = list(raw_rows)
+        n = len(rows)
+        required_fields = ("ts", "code", "price", "volume", "bid", "ask")
+        try:
+            # 快速路徑：每列都是含所有必要欄位的 dict，逐欄以 itemgetter 取值
+            columns = [list(map(itemgetter(key), rows)) for key in required_fields]
+            is_dict = np.ones(n, dtype=bool)
+            missing = np.zeros(n, dtype=bool)
+        except (KeyError, TypeError):
+            is_dict = np.fromiter((isinstance(row, dict) for row in rows), dtype=bool, count=n)
+            dict_rows = [row if ok else {} for row, ok in zip(rows, is_dict)]
+            missing = np.zeros(n, dtype=bool)
+            for key in required_fields:
+                missing |= np.fromiter((key not in row for row in dict_rows), dtype=bool, count=n)
+            columns = [[row.get(key) for row in dict_rows] for key in required_fields]
+        ts_raw, code_raw, price_raw, volume_raw, bid_raw, ask_raw = columns
+        
+        timestamp = _float_column(ts_raw)
+        price = _float_column(price_raw)
+        volume = np.trunc(_float_column(volume_raw))
+        bid = _float_column(bid_raw)
+        ask = _float_column(ask_raw)
+        
+        # 與 UnifiedTick.__post_init__ 相同的規則（NaN 一律視為無效）
+        with np.errstate(invalid="ignore"):
+            checks = [
+                (~is_dict, "raw_data is not a dict"),
+                (missing, "Missing required fields in Sinopac raw_data"),
+                (~(timestamp > 0), "Invalid timestamp"),
+                (~(price > 0), "Invalid price"),
+                (~(volume >= 0), "Invalid volume"),
+                (~((bid > 0) & (ask > 0)), "Invalid bid/ask prices"),
+                (~(bid < ask), "Bid price should be less than ask price"),
+            ]
+        reason = np.full(n, -1, dtype=np.int8)
+        for code, (failed, _) in reversed(list(enumerate(checks))):
+            reason[failed] = code
+        
+        # 股票代號：與 convert_to_unified 相同，補上 ".TW" 後綴
+        accepted = np.flatnonzero(reason < 0)
+        if len(accepted) == n:
+            codes = list(map(str, code_raw))
+        else:
+            codes = [str(code_raw[i]) for i in accepted]
+        ids: Dict[str, int] = {}
+        id_of_code: Dict[str, int] = {}
+        for code in dict.fromkeys(codes):
+            symbol = code if code.endswith(".TW") else f"{code}.TW"
+            id_of_code[code] = ids.setdefault(symbol, len(ids))
+        symbol_id = np.fromiter(map(id_of_code.__getitem__, codes), dtype=np.int32, count=len(codes))
+        
+        data = np.empty(len(accepted), dtype=TICK_DTYPE)
+        data["timestamp"] = timestamp[accepted]
+        data["symbol_id"] = symbol_id
+        data["price"] = price[accepted]
+        data["volume"] = volume[accepted]
+        data["bid_price"] = bid[accepted]
+        data["ask_price"] = ask[accepted]
+        
+        rejected = [RejectedTick(int(i), checks[reason[i]][1]) for i in np.flatnonzero(reason >= 0)]
+        return TickBatchConversion(TickBatch(data, list(ids), self.source_name), rejected)
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    """轉成 float 陣列；無法轉換的值（None、非數字字串等）為 NaN"""
+    try:
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                pass
+        return out
 
 
 class MockSinopacAPI:
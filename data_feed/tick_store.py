@@ -0,0 +1,462 @@
+"""
+Tick Store：Tick 錄製與高速重播
+
+本模組提供：
+1. TickRecorder：把 UnifiedTick / CompactTick / TickBatch 串流寫入 append-only 的欄式檔案
+   （每個 symbol 每個交易日一個檔案）
+2. TickStore：以 np.memmap 開啟錄製檔，或把一個交易日合併成依時間排序的 TickBatch
+3. TickReplayer：以指定倍速或最快速度把錄製的 Tick 餵給因子鏈，回報吞吐量（ticks/sec）
+
+檔案格式（<root>/<YYYYMMDD>/<symbol>.ticks）：
+
+    [64 bytes header][record][record]...
+
+- header：magic / 版本 / record 大小 / source / symbol（見 _HEADER）
+- record：RECORD_DTYPE（little-endian，40 bytes；symbol 與 source 在 header，不逐筆保存）
+- 只會在檔尾追加；寫到一半中斷留下的殘缺 record 在讀取時忽略、下次追加前截掉
+- 交易日以市場時區（預設 UTC+8）由 timestamp 決定
+
+作者：創世紀量化系統開發團隊
+版本：v1.0
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from .tick_handler import TICK_DTYPE, CompactTick, TickBatch, UnifiedTick
+
+
+# 錄製檔 record：TICK_DTYPE 去掉 symbol_id，固定 little-endian
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("price", "<f8"),
+    ("volume", "<i8"),
+    ("bid_price", "<f8"),
+    ("ask_price", "<f8"),
+])
+
+TICK_FILE_SUFFIX = ".ticks"
+TICK_FILE_MAGIC = b"JGODTICK"
+TICK_FILE_VERSION = 1
+
+# magic(8s) version(H) record_size(H) reserved(4x) source(16s) symbol(32s) = 64 bytes
+_HEADER = struct.Struct("<8sHH4x16s32s")
+HEADER_SIZE = _HEADER.size
+
+# 市場時區（台股 UTC+8），用來決定 Tick 屬於哪個交易日
+MARKET_UTC_OFFSET_HOURS = float(os.getenv("JGOD_TICK_STORE_UTC_OFFSET_HOURS", "8"))
+
+# TickRecorder 逐筆錄製時累積多少筆寫一次檔
+TICK_RECORDER_FLUSH_SIZE = int(os.getenv("JGOD_TICK_RECORDER_FLUSH_SIZE", "65536"))
+
+DayLike = Union[date, str]
+
+
+def _day_key(day: DayLike) -> str:
+    """date / 'YYYYMMDD' / 'YYYY-MM-DD' → 'YYYYMMDD'"""
+    if isinstance(day, date):
+        return day.strftime("%Y%m%d")
+    key = str(day).replace("-", "")
+    if len(key) != 8 or not key.isdigit():
+        raise ValueError(f"day must be a date or 'YYYYMMDD' string, got {day!r}")
+    return key
+
+
+def _check_symbol(symbol: str) -> str:
+    if not symbol or "/" in symbol or "\\" in symbol or symbol.startswith("."):
+        raise ValueError(f"symbol cannot be used as a file name: {symbol!r}")
+    if len(symbol.encode("utf-8")) > 32:
+        raise ValueError(f"symbol longer than 32 bytes: {symbol!r}")
+    return symbol
+
+
+def trading_days(timestamps: np.ndarray, utc_offset_hours: float = MARKET_UTC_OFFSET_HOURS) -> np.ndarray:
+    """每筆 timestamp（Unix 秒）在市場時區的日序（自 1970-01-01 起的天數）"""
+    return np.floor_divide(np.asarray(timestamps, dtype=np.float64) + utc_offset_hours * 3600.0, 86400.0).astype(np.int64)
+
+
+def _day_from_ordinal(days: int) -> date:
+    return date(1970, 1, 1) + timedelta(days=int(days))
+
+
+# ============================================================================
+# 錄製檔讀取
+# ============================================================================
+
+@dataclass(frozen=True)
+class TickFile:
+    """
+    單一錄製檔（一個 symbol 一個交易日）
+
+    Attributes:
+        path: 檔案路徑
+        symbol: 標的代號
+        source: 資料來源
+        records: RECORD_DTYPE 陣列（np.memmap，唯讀；空檔為一般空陣列）
+    """
+    path: Path
+    symbol: str
+    source: str
+    records: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def to_batch(self) -> TickBatch:
+        """轉成 TickBatch（複製資料）"""
+        data = np.empty(len(self.records), dtype=TICK_DTYPE)
+        for name in RECORD_DTYPE.names:
+            data[name] = self.records[name]
+        data["symbol_id"] = 0
+        return TickBatch(data, [self.symbol], self.source)
+
+
+def _read_header(fh, path: Path) -> Tuple[str, str]:
+    raw = fh.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated tick file header")
+    magic, version, record_size, source, symbol = _HEADER.unpack(raw)
+    if magic != TICK_FILE_MAGIC:
+        raise ValueError(f"{path}: not a tick file")
+    if version != TICK_FILE_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path}: unsupported tick file version {version} (record size {record_size})")
+    return symbol.rstrip(b"\0").decode("utf-8"), source.rstrip(b"\0").decode("utf-8")
+
+
+def _record_count(path: Path) -> int:
+    return max(0, (path.stat().st_size - HEADER_SIZE) // RECORD_DTYPE.itemsize)
+
+
+def open_tick_file(path: Union[str, Path]) -> TickFile:
+    """
+    以 memory map 開啟錄製檔
+
+    Args:
+        path: 錄製檔路徑
+
+    Returns:
+        TickFile（records 只包含完整的 record）
+    """
+    path = Path(path)
+    with open(path, "rb") as fh:
+        symbol, source = _read_header(fh, path)
+    count = _record_count(path)
+    if count == 0:
+        records = np.empty(0, dtype=RECORD_DTYPE)
+    else:
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+    return TickFile(path, symbol, source, records)
+
+
+class TickStore:
+    """
+    錄製檔目錄（<root>/<YYYYMMDD>/<symbol>.ticks）
+
+    Args:
+        root: 根目錄
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path_for(self, symbol: str, day: DayLike) -> Path:
+        return self.root / _day_key(day) / f"{_check_symbol(symbol)}{TICK_FILE_SUFFIX}"
+
+    def days(self) -> List[date]:
+        """有錄製資料的交易日（遞增）"""
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            datetime.strptime(p.name, "%Y%m%d").date()
+            for p in self.root.iterdir()
+            if p.is_dir() and len(p.name) == 8 and p.name.isdigit()
+        )
+
+    def symbols(self, day: DayLike) -> List[str]:
+        """某交易日有錄製的標的（依代號排序）"""
+        directory = self.root / _day_key(day)
+        if not directory.is_dir():
+            return []
+        return sorted(p.name[:-len(TICK_FILE_SUFFIX)] for p in directory.glob(f"*{TICK_FILE_SUFFIX}"))
+
+    def open(self, symbol: str, day: DayLike) -> TickFile:
+        return open_tick_file(self.path_for(symbol, day))
+
+    def load_day(self, day: DayLike, symbols: Optional[Sequence[str]] = None) -> TickBatch:
+        """
+        讀取一個交易日，合併成依 timestamp 排序的 TickBatch
+
+        同一 symbol 維持錄製順序；不同 symbol 的同一 timestamp 依 symbol 代號排序
+        （錄製檔不保存跨 symbol 的到達順序）。
+
+        Args:
+            day: 交易日
+            symbols: 只讀取這些標的（預設全部）
+        """
+        names = sorted(symbols) if symbols is not None else self.symbols(day)
+        files = [self.open(symbol, day) for symbol in names]
+        files = [f for f in files if len(f)]
+        if not files:
+            return TickBatch.empty()
+
+        data = np.empty(sum(len(f) for f in files), dtype=TICK_DTYPE)
+        start = 0
+        for sid, f in enumerate(files):
+            part = data[start:start + len(f)]
+            for name in RECORD_DTYPE.names:
+                part[name] = f.records[name]
+            part["symbol_id"] = sid
+            start += len(f)
+        order = np.argsort(data["timestamp"], kind="stable")
+        return TickBatch(data[order], [f.symbol for f in files], files[0].source)
+
+
+# ============================================================================
+# 錄製
+# ============================================================================
+
+class TickRecorder:
+    """
+    Tick 錄製器：依 symbol / 交易日追加寫入錄製檔
+
+    逐筆 record() 的 Tick 先暫存，累積 flush_size 筆（或呼叫 flush / close）才寫檔；
+    record_batch() 直接寫入（先寫出暫存的逐筆 Tick，保持順序）。
+
+    Args:
+        root: 錄製根目錄
+        flush_size: 逐筆錄製時的暫存筆數上限
+        utc_offset_hours: 市場時區（決定交易日）
+
+    使用方式：
+
+        with TickRecorder("data_cache/ticks") as recorder:
+            recorder.record(tick)
+            recorder.record_batch(converter.convert_batch(raw_rows).batch)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        flush_size: int = TICK_RECORDER_FLUSH_SIZE,
+        utc_offset_hours: float = MARKET_UTC_OFFSET_HOURS,
+    ):
+        self.store = TickStore(root)
+        self.flush_size = max(1, flush_size)
+        self.utc_offset_hours = utc_offset_hours
+        self.ticks_written = 0
+        self._pending: List[CompactTick] = []
+        self._prepared: Set[Path] = set()
+
+    def __enter__(self) -> "TickRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def record(self, tick: Union[UnifiedTick, CompactTick]) -> None:
+        """錄製一筆 Tick"""
+        self._pending.append(tick)
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def record_batch(self, batch: TickBatch) -> None:
+        """錄製一個 TickBatch"""
+        self.flush()
+        self._write(batch)
+
+    def flush(self) -> int:
+        """寫出暫存的逐筆 Tick，回傳寫出的筆數"""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, []
+        sources: Dict[str, List[CompactTick]] = {}
+        for tick in pending:
+            sources.setdefault(tick.source, []).append(tick)
+        for source, ticks in sources.items():
+            self._write(TickBatch.from_ticks(ticks, source=source))
+        return len(pending)
+
+    def close(self) -> None:
+        self.flush()
+
+    def _write(self, batch: TickBatch) -> None:
+        if not len(batch):
+            return
+        n_symbols = len(batch.symbols)
+        keys = trading_days(batch.timestamp, self.utc_offset_hours) * n_symbols + batch.symbol_id
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+
+        for i, key in enumerate(unique_keys.tolist()):
+            day, sid = divmod(key, n_symbols)
+            rows = batch.data[order[bounds[i]:bounds[i + 1]]]
+            records = np.empty(len(rows), dtype=RECORD_DTYPE)
+            for name in RECORD_DTYPE.names:
+                records[name] = rows[name]
+            self._append(batch.symbols[sid], _day_from_ordinal(day), batch.source, records)
+        self.ticks_written += len(batch)
+
+    def _append(self, symbol: str, day: date, source: str, records: np.ndarray) -> None:
+        path = self.store.path_for(symbol, day)
+        if path not in self._prepared:
+            self._prepare(path, symbol, source)
+            self._prepared.add(path)
+        with open(path, "ab") as fh:
+            fh.write(records.tobytes())
+
+    def _prepare(self, path: Path, symbol: str, source: str) -> None:
+        """新檔寫 header；既有檔驗證 header 並截掉殘缺的尾端 record"""
+        if path.exists() and path.stat().st_size > 0:
+            with open(path, "r+b") as fh:
+                existing, _ = _read_header(fh, path)
+                if existing != symbol:
+                    raise ValueError(f"{path}: recorded symbol {existing!r} does not match {symbol!r}")
+                fh.truncate(HEADER_SIZE + _record_count(path) * RECORD_DTYPE.itemsize)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = _HEADER.pack(
+            TICK_FILE_MAGIC, TICK_FILE_VERSION, RECORD_DTYPE.itemsize,
+            source.encode("utf-8")[:16], symbol.encode("utf-8"),
+        )
+        with open(path, "wb") as fh:
+            fh.write(header)
+
+
+# ============================================================================
+# 重播
+# ============================================================================
+
+@dataclass
+class ReplayStats:
+    """
+    重播統計
+
+    Attributes:
+        ticks: 已送出的 Tick 數
+        batches: 已送出的批次數
+        wall_seconds: 實際耗時（含 callback，即因子鏈的處理時間）
+        market_seconds: 已重播的市場時間跨度
+    """
+    ticks: int = 0
+    batches: int = 0
+    wall_seconds: float = 0.0
+    market_seconds: float = 0.0
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """市場時間 / 實際時間（> 1 表示快於即時）"""
+        return self.market_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.ticks:,} ticks in {self.wall_seconds:.3f}s "
+            f"({self.ticks_per_second:,.0f} ticks/s, {self.batches:,} batches, "
+            f"{self.market_seconds:,.1f}s market time, {self.speedup:,.1f}x real time)"
+        )
+
+
+class TickReplayer:
+    """
+    Tick 重播器
+
+    - speed=None：最快速度，每批 batch_size 筆
+    - speed=k：k 倍速（1.0 為即時），每批包含「此刻已到時間」的 Tick（最多 batch_size 筆），
+      沒有到時間的 Tick 時 sleep 到下一筆
+
+    Args:
+        batch: 依 timestamp 排序的 Tick（例如 TickStore.load_day 的輸出）
+        speed: 重播倍速（None 或 <= 0 為最快速度）
+        batch_size: 每批最多筆數
+        clock / sleep: 計時與等待函數（測試可替換）
+    """
+
+    def __init__(
+        self,
+        batch: TickBatch,
+        speed: Optional[float] = None,
+        batch_size: int = 4096,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.batch = batch
+        self.speed = speed if speed and speed > 0 else None
+        self.batch_size = max(1, batch_size)
+        self.clock = clock
+        self.sleep = sleep
+
+    @classmethod
+    def from_store(
+        cls,
+        store: Union[TickStore, str, Path],
+        day: DayLike,
+        symbols: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> "TickReplayer":
+        if not isinstance(store, TickStore):
+            store = TickStore(store)
+        return cls(store.load_day(day, symbols), **kwargs)
+
+    def replay_batches(self, on_batch: Callable[[TickBatch], object]) -> ReplayStats:
+        """
+        逐批重播
+
+        Args:
+            on_batch: 每批呼叫一次（例如 MultiSymbolTickPipeline.process_tick_batch）
+
+        Returns:
+            ReplayStats
+        """
+        stats = ReplayStats()
+        timestamps = self.batch.timestamp
+        n = len(timestamps)
+        if n == 0:
+            return stats
+        t0 = float(timestamps[0])
+        started = self.clock()
+        start = 0
+        while start < n:
+            end = min(start + self.batch_size, n)
+            if self.speed is not None:
+                due = t0 + (self.clock() - started) * self.speed
+                if timestamps[start] > due:
+                    self.sleep((float(timestamps[start]) - due) / self.speed)
+                    continue
+                end = min(end, int(np.searchsorted(timestamps, due, side="right")))
+            on_batch(self.batch[start:end])
+            stats.ticks += end - start
+            stats.batches += 1
+            start = end
+        stats.wall_seconds = self.clock() - started
+        stats.market_seconds = float(timestamps[n - 1]) - t0
+        return stats
+
+    def replay(self, on_tick: Callable[[CompactTick], object]) -> ReplayStats:
+        """
+        逐筆重播（CompactTick，可直接餵給 InfoTimeBarGenerator.add_tick /
+        CapitalFlowEngine.update_from_tick 等逐筆引擎）
+
+        Args:
+            on_tick: 每筆呼叫一次
+
+        Returns:
+            ReplayStats
+        """
+        def on_batch(batch: TickBatch) -> None:
+            for tick in batch:
+                on_tick(tick)
+
+        return self.replay_batches(on_batch)
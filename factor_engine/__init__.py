@@ -8,6 +8,7 @@ Factor Engine 模組：核心因子計算引擎
 - CrossAssetFactorEngine：跨資產聯動因子引擎（Step 5）
 - InertiaFactorEngine：資金流慣性因子引擎（Step 6）
 - FSignalEngine：訊號生成因子引擎（Step 7）
+- MultiSymbolTickPipeline：多標的 Tick 因子管線（Step 2/4/6/7 的 struct-of-arrays 批次版）
 """
 
 from .info_time_engine import (
@@ -45,6 +46,14 @@ from .signal_factor import (
     FSignalEngine,
 )
 
+from .multi_symbol_pipeline import (
+    MultiSymbolPipelineConfig,
+    MultiSymbolTickPipeline,
+    MultiSymbolBatchResult,
+    VolumeBarColumns,
+    TickFactorColumns,
+)
+
 __all__ = [
     # Step 2 - F_InfoTime
     "VolumeBar",
@@ -69,5 +78,11 @@ __all__ = [
     "FSignalBucket",
     "FSignalFactor",
     "FSignalEngine",
+    # 多標的批次管線
+    "MultiSymbolPipelineConfig",
+    "MultiSymbolTickPipeline",
+    "MultiSymbolBatchResult",
+    "VolumeBarColumns",
+    "TickFactorColumns",
 ]
 
@@ -12,6 +12,7 @@ F_C 資金流基礎因子引擎（SAI & MOI）
 - 輕量狀態：只保留最近 N 筆 CapitalFlowSample
 - 不依賴特定 Tick 類型：只要求欄位存在
 - 適合硬體加速與向量化
+- 每筆 Tick O(1)：視窗與前/後半段的成交量總和以累加器在 push/evict 時更新
 
 作者：創世紀量化系統開發團隊
 版本：v1.0
@@ -91,6 +92,7 @@ class CapitalFlowEngine:
         min_points: int = 10,
         mid_epsilon: float = 1e-9,
         at_mid_tolerance_bp: float = 1.0,
+        incremental: bool = True,
     ) -> None:
         """
         Args:
@@ -106,6 +108,9 @@ class CapitalFlowEngine:
             at_mid_tolerance_bp:
                 判斷成交價是否「明顯偏離 mid」的容忍區間（以 bp 為單位）。
                 |price - mid| / mid * 10000 <= at_mid_tolerance_bp → 視為中性 (side=0)。
+            incremental:
+                True（預設）：以累加器維護視窗統計，每筆 Tick O(1)。
+                False：每筆 Tick 重新掃描整個視窗（原始 O(window) 實作，供比對）。
         """
         if window_size <= 0:
             raise ValueError("window_size must be positive")
@@ -118,11 +123,29 @@ class CapitalFlowEngine:
         self.mid_epsilon = mid_epsilon
         self.at_mid_tolerance_bp = at_mid_tolerance_bp
 
+        self.incremental = incremental
+
         self._window: Deque[CapitalFlowSample] = deque(maxlen=window_size)
+        # 後半段（MOI 的 recent）樣本；前半段 = _window 的前 _early_count 筆
+        self._recent: Deque[CapitalFlowSample] = deque()
+        self._reset_accumulators()
 
     def reset(self) -> None:
         """清空內部視窗狀態。"""
         self._window.clear()
+        self._recent.clear()
+        self._reset_accumulators()
+
+    def _reset_accumulators(self) -> None:
+        self._early_count = 0
+        self._window_volume = 0.0
+        self._buy_volume = 0.0
+        self._sell_volume = 0.0
+        self._early_volume = 0.0
+        self._early_net = 0.0
+        self._recent_volume = 0.0
+        self._recent_net = 0.0
+        self._pushes_since_resync = 0
 
     # ---- 外部主要接口 ----
 
@@ -181,12 +204,17 @@ class CapitalFlowEngine:
             volume=float(volume),
             side=side,
         )
-        self._window.append(sample)
+        if self.incremental:
+            self._push(sample)
+        else:
+            self._window.append(sample)
 
         if len(self._window) < self.min_points:
             return None
 
-        return self._compute_factor()
+        if self.incremental:
+            return self._compute_factor()
+        return self._compute_factor_full()
 
     def compute_from_ticks(self, ticks: Iterable[Any]) -> Optional[CapitalFlowFactor]:
         """
@@ -220,9 +248,119 @@ class CapitalFlowEngine:
             return -1
         return 0
 
+    # ---- 累加器（incremental=True）----
+
+    def _push(self, sample: CapitalFlowSample) -> None:
+        """
+        加入一筆樣本並以 O(1) 更新累加器：
+        - 視窗滿時先移除最舊樣本（屬於前半段；視窗只有 1 筆時屬於後半段）
+        - 新樣本進入後半段，再把後半段最舊的樣本移到前半段，
+          維持 前半段筆數 = len(window) // 2（與 _compute_factor_full 的切法相同）
+        """
+        evicted = self._window[0] if len(self._window) == self.window_size else None
+        self._window.append(sample)
+        self._recent.append(sample)
+
+        signed = sample.volume * sample.side
+        self._window_volume += sample.volume
+        if sample.side > 0:
+            self._buy_volume += sample.volume
+        elif sample.side < 0:
+            self._sell_volume += sample.volume
+        self._recent_volume += sample.volume
+        self._recent_net += signed
+
+        if evicted is not None:
+            self._window_volume -= evicted.volume
+            if evicted.side > 0:
+                self._buy_volume -= evicted.volume
+            elif evicted.side < 0:
+                self._sell_volume -= evicted.volume
+            if self._early_count > 0:
+                self._early_count -= 1
+                self._early_volume -= evicted.volume
+                self._early_net -= evicted.volume * evicted.side
+            else:
+                self._recent.popleft()
+                self._recent_volume -= evicted.volume
+                self._recent_net -= evicted.volume * evicted.side
+
+        target_early = len(self._window) // 2
+        while self._early_count < target_early:
+            moved = self._recent.popleft()
+            moved_signed = moved.volume * moved.side
+            self._recent_volume -= moved.volume
+            self._recent_net -= moved_signed
+            self._early_volume += moved.volume
+            self._early_net += moved_signed
+            self._early_count += 1
+
+        # 浮點加減會累積誤差：每 window_size 筆重算一次（攤銷後仍為 O(1)）。
+        # 成交量為整數（股 / 張）時加減皆為精確運算，結果與全掃描逐位元相同。
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self.window_size:
+            self._resync_accumulators()
+
+    def _resync_accumulators(self) -> None:
+        """以與 _compute_factor_full 相同的加總順序重算所有累加器。"""
+        samples = list(self._window)
+        early = samples[:self._early_count]
+        recent = samples[self._early_count:]
+        self._window_volume = sum(s.volume for s in samples)
+        self._buy_volume = sum(s.volume for s in samples if s.side > 0)
+        self._sell_volume = sum(s.volume for s in samples if s.side < 0)
+        self._early_volume = sum(s.volume for s in early)
+        self._early_net = sum(s.volume * s.side for s in early)
+        self._recent_volume = sum(s.volume for s in recent)
+        self._recent_net = sum(s.volume * s.side for s in recent)
+        self._pushes_since_resync = 0
+
     def _compute_factor(self) -> CapitalFlowFactor:
         """
-        從目前視窗內的樣本計算 F_C 因子（SAI & MOI）。
+        從累加器計算 F_C 因子（SAI & MOI），O(1)。
+        """
+        latest = self._window[-1]
+        window_trades = len(self._window)
+        window_volume = self._window_volume
+        buy_volume = self._buy_volume
+        sell_volume = self._sell_volume
+        net_signed_volume = buy_volume - sell_volume
+
+        if window_volume <= 0:
+            sai: Optional[float] = None
+        else:
+            sai = net_signed_volume / window_volume  # ∈ [-1, 1]
+
+        def _imbalance(count: int, vol: float, net_vol: float) -> Optional[float]:
+            if count == 0 or vol <= 0:
+                return None
+            return net_vol / vol
+
+        early_imbalance = _imbalance(self._early_count, self._early_volume, self._early_net)
+        recent_imbalance = _imbalance(len(self._recent), self._recent_volume, self._recent_net)
+
+        if early_imbalance is not None and recent_imbalance is not None:
+            moi: Optional[float] = recent_imbalance - early_imbalance
+        else:
+            moi = None
+
+        return CapitalFlowFactor(
+            timestamp=latest.timestamp,
+            symbol=latest.symbol,
+            window_trades=window_trades,
+            window_volume=window_volume,
+            buy_volume=buy_volume,
+            sell_volume=sell_volume,
+            net_signed_volume=net_signed_volume,
+            smart_aggression_index=sai,
+            momentum_of_imbalance=moi,
+        )
+
+    # ---- 全掃描（incremental=False）----
+
+    def _compute_factor_full(self) -> CapitalFlowFactor:
+        """
+        從目前視窗內的樣本計算 F_C 因子（SAI & MOI），O(window)。
         """
         samples: List[CapitalFlowSample] = list(self._window)
         latest = samples[-1]
@@ -12,6 +12,7 @@
 - 接收 VolumeBar（而非 Tick），計算跨市場聯動強度
 - 支援多個 reference symbols（例如：QQQ, ES, USD/TWD）
 - 使用 rolling window 計算動態相關性與 beta
+- 每個 Bar 攤銷 O(1)：以 ring buffer + Welford add/remove 維護 target 對各 reference 的滑動動差
 
 作者：創世紀量化系統開發團隊
 版本：v1.0
@@ -21,7 +22,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, List, Deque
-from collections import deque
+from collections import deque, OrderedDict
+import math
 import numpy as np
 
 from .info_time_engine import VolumeBar
@@ -77,6 +79,223 @@ class CrossAssetFactor:
     spread_zscore: Optional[float] = None
 
 
+# ============================================================================
+# Rolling 動差（ring buffer + Welford add / remove）
+# ============================================================================
+
+class RingBuffer:
+    """
+    固定容量的 float ring buffer
+    
+    以累計寫入序號（sequence，從 0 起算）定址：第 seq 筆寫入的值在仍保留於
+    buffer 內時（seq >= count - capacity）可由 at(seq) 取得。append 為 O(1)。
+    """
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data: List[float] = [0.0] * capacity
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def clear(self) -> None:
+        self.count = 0
+    
+    def append(self, value: float) -> None:
+        self._data[self.count % self.capacity] = value
+        self.count += 1
+    
+    def at(self, seq: int) -> float:
+        return self._data[seq % self.capacity]
+    
+    def window(self, n: int, end: Optional[int] = None) -> np.ndarray:
+        """序號 [end - n, end) 的值（依寫入順序），end 預設為 count"""
+        end = self.count if end is None else end
+        start = (end - n) % self.capacity
+        stop = start + n
+        if stop <= self.capacity:
+            return np.asarray(self._data[start:stop], dtype=float)
+        return np.asarray(self._data[start:] + self._data[:stop - self.capacity], dtype=float)
+
+
+class RollingPairMoments:
+    """
+    成對樣本 (x, y) 的一、二階動差，以 Welford 公式做 add / remove 更新
+    
+    維護 n、mean_x、mean_y、M2_x、M2_y、C_xy；sample variance / covariance
+    （ddof=1）皆可 O(1) 取得。
+    """
+    
+    __slots__ = ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c_xy")
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+    
+    def reset_from(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """以 two-pass 重算（用於初始化與定期重新同步）"""
+        self.n = len(xs)
+        if self.n == 0:
+            self.reset()
+            return
+        self.mean_x = float(np.mean(xs))
+        self.mean_y = float(np.mean(ys))
+        dx = xs - self.mean_x
+        dy = ys - self.mean_y
+        self.m2_x = float(np.dot(dx, dx))
+        self.m2_y = float(np.dot(dy, dy))
+        self.c_xy = float(np.dot(dx, dy))
+    
+    def add(self, x: float, y: float) -> None:
+        self.n += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.n
+        dy = y - self.mean_y
+        self.mean_y += dy / self.n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+    
+    def remove(self, x: float, y: float) -> None:
+        if self.n <= 1:
+            self.reset()
+            return
+        self.n -= 1
+        dx = x - self.mean_x
+        self.mean_x -= dx / self.n
+        dy = y - self.mean_y
+        self.mean_y -= dy / self.n
+        self.m2_x -= dx * (x - self.mean_x)
+        self.m2_y -= dy * (y - self.mean_y)
+        self.c_xy -= dx * (y - self.mean_y)
+    
+    @property
+    def var_x(self) -> float:
+        return max(self.m2_x, 0.0) / (self.n - 1) if self.n > 1 else float("nan")
+    
+    @property
+    def var_y(self) -> float:
+        return max(self.m2_y, 0.0) / (self.n - 1) if self.n > 1 else float("nan")
+    
+    @property
+    def cov(self) -> float:
+        return self.c_xy / (self.n - 1) if self.n > 1 else float("nan")
+
+
+class _OffsetWindow:
+    """單一配對位移下的滑動視窗狀態（end 為 target 序號，不含）"""
+    
+    __slots__ = ("end", "moments", "steps")
+    
+    def __init__(self):
+        self.end = 0
+        self.moments = RollingPairMoments()
+        self.steps = 0
+
+
+class AlignedRollingMoments:
+    """
+    target 與 reference 兩條序列「末端對齊」的 rolling 動差
+    
+    與 np.cov(target[-W:], ref[-W:]) 的逐位配對相同：target 第 i 筆配 ref 第
+    i - offset 筆，offset = target.count - ref.count。兩條序列各自 append，offset
+    會隨更新順序改變（例如輪流餵入時在 0 / 1 之間切換），因此每個 offset 各維護
+    一份滑動 Welford 狀態：視窗前進一格只需 add 一對、remove 一對。
+    
+    - 落後超過 window_size 格或首次出現的 offset：由 ring buffer 以 two-pass 重建
+    - 每累積 window_size 次 add/remove 重建一次，限制浮點誤差累積（攤銷 O(1)）
+    - remove 後 M2 縮小到 add 後的 CANCELLATION_RATIO 以下（移除的是離群點，
+      相減會吃掉有效位數）時立即重建
+    - 只保留最近使用的 max_offsets 個 offset 狀態
+    
+    Args:
+        target: target 序列的 ring buffer（容量需 >= 2 * window_size）
+        ref: reference 序列的 ring buffer（容量需 >= 2 * window_size）
+        window_size: 視窗長度 W
+        max_offsets: 保留的 offset 狀態數
+    """
+    
+    CANCELLATION_RATIO = 1e-4
+    
+    def __init__(
+        self,
+        target: RingBuffer,
+        ref: RingBuffer,
+        window_size: int,
+        max_offsets: int = 4,
+    ):
+        if min(target.capacity, ref.capacity) < 2 * window_size:
+            raise ValueError("ring buffer capacity must be >= 2 * window_size")
+        self.target = target
+        self.ref = ref
+        self.window_size = window_size
+        self.max_offsets = max_offsets
+        self._windows: "OrderedDict[int, _OffsetWindow]" = OrderedDict()
+    
+    def clear(self) -> None:
+        self._windows.clear()
+    
+    def current(self) -> Optional[RollingPairMoments]:
+        """
+        目前 target[-W:] 對 ref[-W:] 的動差
+        
+        Returns:
+            RollingPairMoments（x = target, y = ref）；任一序列不足 W 筆時回傳 None
+        """
+        w = self.window_size
+        end = self.target.count
+        if end < w or self.ref.count < w:
+            return None
+        
+        offset = end - self.ref.count
+        state = self._windows.get(offset)
+        if state is None:
+            state = _OffsetWindow()
+            self._windows[offset] = state
+            while len(self._windows) > self.max_offsets:
+                self._windows.popitem(last=False)
+            self._rebuild(state, offset, end)
+        else:
+            self._windows.move_to_end(offset)
+            lag = end - state.end
+            if lag >= w or state.steps + lag >= w:
+                self._rebuild(state, offset, end)
+            elif not self._advance(state, offset, end):
+                self._rebuild(state, offset, end)
+        return state.moments
+    
+    def _advance(self, state: _OffsetWindow, offset: int, end: int) -> bool:
+        """逐格滑動到 end；偵測到嚴重相消時回傳 False（由呼叫端重建）"""
+        w = self.window_size
+        ratio = self.CANCELLATION_RATIO
+        target, ref, moments = self.target, self.ref, state.moments
+        for i in range(state.end, end):
+            moments.add(target.at(i), ref.at(i - offset))
+            peak_x, peak_y = moments.m2_x, moments.m2_y
+            moments.remove(target.at(i - w), ref.at(i - w - offset))
+            if moments.m2_x < peak_x * ratio or moments.m2_y < peak_y * ratio:
+                return False
+        state.steps += end - state.end
+        state.end = end
+        return True
+    
+    def _rebuild(self, state: _OffsetWindow, offset: int, end: int) -> None:
+        w = self.window_size
+        state.moments.reset_from(self.target.window(w, end), self.ref.window(w, end - offset))
+        state.end = end
+        state.steps = 0
+
+
 # ============================================================================
 # 跨資產因子引擎
 # ============================================================================
@@ -105,14 +324,18 @@ class CrossAssetFactorEngine:
                 print(f"Corr: {f.rolling_corr:.3f}, Beta: {f.rolling_beta:.3f}")
     """
     
-    def __init__(self, config: CrossAssetWindowConfig):
+    def __init__(self, config: CrossAssetWindowConfig, incremental: bool = True):
         """
         初始化跨資產因子引擎
         
         Args:
             config: 視窗配置（target_symbol, reference_symbols, window_size）
+            incremental: True（預設）以 AlignedRollingMoments 維護各 pair 的滑動動差，
+                每個 Bar 攤銷 O(1)；False 每個 Bar 由歷史序列重算
+                （原始 O(window) 實作，供比對）
         """
         self.config = config
+        self.incremental = incremental
         
         # 儲存各 symbol 的歷史價格序列（需要 window_size + 1 個點才能計算 window_size 個報酬）
         self.price_history: dict[str, Deque[float]] = {}
@@ -125,10 +348,25 @@ class CrossAssetFactorEngine:
         
         # 初始化所有相關 symbol 的歷史序列
         all_symbols = [config.target_symbol] + config.reference_symbols
+        self._symbols = frozenset(all_symbols)
         for symbol in all_symbols:
             self.price_history[symbol] = deque(maxlen=config.window_size + 1)
             self.return_history[symbol] = deque(maxlen=config.window_size)
             self.last_timestamp[symbol] = 0.0
+        
+        # incremental 模式：價格 / 報酬的 ring buffer 與 target 對各 reference 的滑動動差
+        capacity = 2 * config.window_size
+        self._price_buffers = {symbol: RingBuffer(capacity) for symbol in all_symbols}
+        self._return_buffers = {symbol: RingBuffer(capacity) for symbol in all_symbols}
+        target = config.target_symbol
+        self._price_moments = {
+            ref: AlignedRollingMoments(self._price_buffers[target], self._price_buffers[ref], config.window_size)
+            for ref in config.reference_symbols
+        }
+        self._return_moments = {
+            ref: AlignedRollingMoments(self._return_buffers[target], self._return_buffers[ref], config.window_size)
+            for ref in config.reference_symbols
+        }
     
     def reset(self) -> None:
         """清空所有歷史資料，重置引擎狀態"""
@@ -136,6 +374,11 @@ class CrossAssetFactorEngine:
             self.price_history[symbol].clear()
             self.return_history[symbol].clear()
             self.last_timestamp[symbol] = 0.0
+            self._price_buffers[symbol].clear()
+            self._return_buffers[symbol].clear()
+        for ref in self.config.reference_symbols:
+            self._price_moments[ref].clear()
+            self._return_moments[ref].clear()
     
     def update_with_bar(self, bar: VolumeBar) -> Optional[List[CrossAssetFactor]]:
         """
@@ -151,22 +394,23 @@ class CrossAssetFactorEngine:
         symbol = bar.symbol
         
         # 若 bar.symbol 不在 config 的 target 或 reference 裡面，則忽略
-        all_symbols = [self.config.target_symbol] + self.config.reference_symbols
-        if symbol not in all_symbols:
+        if symbol not in self._symbols:
             return None
         
         # 更新價格歷史（使用 close_price）
         self.price_history[symbol].append(bar.close_price)
+        self._price_buffers[symbol].append(float(bar.close_price))
         self.last_timestamp[symbol] = bar.end_ts
         
         # 計算新的報酬（log return: log(p_t / p_{t-1})）
         if len(self.price_history[symbol]) >= 2:
-            prev_price = list(self.price_history[symbol])[-2]
+            prev_price = self.price_history[symbol][-2]
             curr_price = self.price_history[symbol][-1]
             
             if prev_price > 0 and curr_price > 0:
                 log_return = np.log(curr_price / prev_price)
                 self.return_history[symbol].append(log_return)
+                self._return_buffers[symbol].append(float(log_return))
         
         # 檢查 target 是否有足夠的資料（至少需要 window_size 個 returns）
         # target 是必須的，其他 reference symbols 的檢查留給 _compute_factors 處理
@@ -179,7 +423,9 @@ class CrossAssetFactorEngine:
         # 實際上，只要 target 有足夠資料，就可以嘗試計算因子（_compute_factors 會跳過資料不足的 references）
         
         # 若足夠，計算因子並回傳
-        return self._compute_factors()
+        if self.incremental:
+            return self._compute_factors()
+        return self._compute_factors_full()
     
     def _compute_spread_zscore(
         self, 
@@ -225,7 +471,92 @@ class CrossAssetFactorEngine:
     
     def _compute_factors(self) -> List[CrossAssetFactor]:
         """
-        計算跨資產因子（內部方法）
+        由滑動動差計算跨資產因子（內部方法，攤銷 O(1) / reference）
+        
+        與 _compute_factors_full 的定義相同：
+        - rolling_corr：returns 的 Cov / (Std_t * Std_ref)
+        - rolling_beta：prices 的 Cov / Var_ref（ddof=1）
+        - spread_zscore：spread = r_t - beta * r_ref 的 mean / std 由 returns 動差推得
+        
+        Returns:
+            CrossAssetFactor 列表（每個 reference_symbol 一個）
+        """
+        factors: List[CrossAssetFactor] = []
+        target_symbol = self.config.target_symbol
+        latest_ts = self.last_timestamp.get(target_symbol, 0.0)
+        target_returns = self._return_buffers[target_symbol]
+        
+        for ref_symbol in self.config.reference_symbols:
+            price_moments = self._price_moments[ref_symbol].current()
+            if price_moments is None:
+                continue  # 價格點不足 window_size，跳過這個 reference
+            
+            var_ref_prices = price_moments.var_y
+            if price_moments.n >= 2 and var_ref_prices > 1e-12:
+                rolling_beta = price_moments.cov / var_ref_prices
+            else:
+                rolling_beta = 0.0
+            
+            rolling_corr = 0.0
+            spread_zscore = 0.0
+            return_moments = self._return_moments[ref_symbol].current()
+            if return_moments is not None and return_moments.n >= 2:
+                std_target = math.sqrt(return_moments.var_x)
+                std_ref = math.sqrt(return_moments.var_y)
+                if std_target > 1e-12 and std_ref > 1e-12:
+                    # 與 np.corrcoef 相同：cov / std_x / std_y 並截斷到 [-1, 1]
+                    rolling_corr = min(1.0, max(-1.0, return_moments.cov / std_target / std_ref))
+                
+                ref_returns = self._return_buffers[ref_symbol]
+                spread_zscore = self._spread_zscore_from_moments(
+                    return_moments,
+                    rolling_beta,
+                    target_returns.at(target_returns.count - 1),
+                    ref_returns.at(ref_returns.count - 1),
+                )
+            
+            factors.append(CrossAssetFactor(
+                target_symbol=target_symbol,
+                reference_symbol=ref_symbol,
+                timestamp=latest_ts,
+                rolling_corr=rolling_corr,
+                rolling_beta=rolling_beta,
+                spread_zscore=spread_zscore,
+            ))
+        
+        return factors
+    
+    @staticmethod
+    def _spread_zscore_from_moments(
+        moments: RollingPairMoments,
+        beta: float,
+        last_target: float,
+        last_ref: float,
+    ) -> float:
+        """
+        由 returns 動差計算 spread = target - beta * ref 的 Z-score
+        
+        mean_s = mean_t - beta * mean_ref
+        var_s = (M2_t - 2 * beta * C + beta^2 * M2_ref) / (n - 1)
+        
+        門檻與 _compute_spread_zscore 相同（std < 1e-6 或非有限值時回傳 0.0）。
+        """
+        mean_spread = moments.mean_x - beta * moments.mean_y
+        m2_spread = moments.m2_x - 2.0 * beta * moments.c_xy + beta * beta * moments.m2_y
+        std_spread = math.sqrt(max(m2_spread, 0.0) / (moments.n - 1))
+        
+        EPS = 1e-6
+        if std_spread <= EPS:
+            return 0.0
+        
+        spread_zscore = (last_target - beta * last_ref - mean_spread) / std_spread
+        if not math.isfinite(spread_zscore):
+            return 0.0
+        return float(spread_zscore)
+    
+    def _compute_factors_full(self) -> List[CrossAssetFactor]:
+        """
+        計算跨資產因子（內部方法，由歷史序列重算，O(window) / reference）
         
         對於每一個 reference_symbol：
         1. 計算 target 與 ref 的 rolling correlation
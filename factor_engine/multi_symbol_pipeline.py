@@ -0,0 +1,685 @@
+"""
+多標的 Tick 因子管線（Multi-Symbol Pipeline）
+
+單標的因子鏈：
+
+    UnifiedTick → InfoTimeBarGenerator → VolumeBar（+ F_InfoTime）
+    UnifiedTick → CapitalFlowEngine → InertiaFactorEngine → FSignalEngine
+
+每個引擎只服務一個 symbol，追蹤 300 檔就是 300 × 5 個 Python 物件與逐筆 dispatch。
+本模組以一個引擎同時追蹤所有標的：
+
+1. MultiSymbolPipelineConfig：Bar / F_C / F_Inertia / F_Signal 參數（所有標的共用）
+2. MultiSymbolTickPipeline：狀態以 struct-of-arrays 保存（每個欄位一個 numpy 陣列，
+   以 symbol id 為索引），一次處理一個 micro-batch
+   （symbol_id / price / volume / bid / ask / timestamp 陣列）
+3. VolumeBarColumns / TickFactorColumns：批次輸出（欄式陣列，需要物件時再轉成
+   VolumeBar / CapitalFlowFactor / InertiaFactor / FSignalFactor）
+
+向量化方式：
+- 同一標的的 tick 有先後依賴，因此依「該 tick 在所屬標的批次內的序位」分層；
+  同一層每個標的最多一筆，整層以 numpy 一次更新
+- 層數 = 批次內單一標的的最大 tick 數；標的越多、批次越寬，每層向量越長
+
+輸出與「每個標的各自一條單標的因子鏈逐筆處理」相同：Bar 與 F_C 欄位在整數成交量下
+逐位元相同；F_InfoTime 與 inertia_sai 的平均值只有浮點加總順序造成的差異。
+
+作者：創世紀量化系統開發團隊
+版本：v1.0
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data_feed.tick_handler import TickBatch
+
+from .info_time_engine import InfoTimeBarGenerator, VolumeBar
+from .capital_flow_factor import CapitalFlowFactor
+from .inertia_factor import InertiaWindowConfig, InertiaFactor
+from .signal_factor import FSignalConfig, FSignalBucket, FSignalFactor
+
+
+# F_Signal 分桶代碼（TickFactorColumns.signal_bucket；無訊號時為 0 且 signal_score 為 NaN）
+BUCKET_CODES: Dict[FSignalBucket, int] = {
+    FSignalBucket.STRONG_SELL: -2,
+    FSignalBucket.WEAK_SELL: -1,
+    FSignalBucket.NEUTRAL: 0,
+    FSignalBucket.WEAK_BUY: 1,
+    FSignalBucket.STRONG_BUY: 2,
+}
+_BUCKETS_BY_CODE = {code: bucket for bucket, code in BUCKET_CODES.items()}
+
+# 各輸出欄位的 dtype（依 VolumeBarColumns / TickFactorColumns 的欄位順序，不含 symbols）
+_BAR_DTYPES = (np.int64, np.int64) + (np.float64,) * 3 + (np.int64,) * 2 + (np.float64,) * 7
+_FACTOR_DTYPES = (np.int64, np.int64, np.float64, np.int64) + (np.float64,) * 7 + (np.int8,)
+
+
+# ============================================================================
+# 配置
+# ============================================================================
+
+@dataclass(frozen=True)
+class MultiSymbolPipelineConfig:
+    """
+    多標的因子管線配置（所有標的共用）
+
+    欄位與單標的引擎參數一一對應：
+    - volume_bar_size, infotime_window：InfoTimeBarGenerator（infotime_window 為 bar_intervals 長度）
+    - flow_*, mid_epsilon, at_mid_tolerance_bp：CapitalFlowEngine
+    - inertia_*：InertiaWindowConfig
+    - w_* / moi_scale / *_threshold：FSignalConfig
+    """
+    volume_bar_size: int = InfoTimeBarGenerator.K_VOLUME_BAR_SIZE
+    infotime_window: int = 20
+    flow_window_size: int = 100
+    flow_min_points: int = 10
+    mid_epsilon: float = 1e-9
+    at_mid_tolerance_bp: float = 1.0
+    inertia_window_size: int = 100
+    inertia_min_effective_points: int = 20
+    w_sai: float = 0.4
+    w_moi: float = 0.2
+    w_inertia: float = 0.4
+    moi_scale: float = 2.0
+    strong_threshold: float = 0.4
+    weak_threshold: float = 0.15
+
+    def __post_init__(self):
+        """驗證配置參數（F_Inertia / F_Signal 沿用單標的配置的檢查）"""
+        if self.volume_bar_size <= 0:
+            raise ValueError("volume_bar_size must be positive")
+        if self.infotime_window <= 0:
+            raise ValueError("infotime_window must be positive")
+        if self.flow_window_size <= 0:
+            raise ValueError("flow_window_size must be positive")
+        if self.flow_min_points <= 0:
+            raise ValueError("flow_min_points must be positive")
+        self.inertia_config("*")
+        self.signal_config("*")
+
+    def inertia_config(self, symbol: str) -> InertiaWindowConfig:
+        """對應的單標的 InertiaWindowConfig"""
+        return InertiaWindowConfig(
+            symbol=symbol,
+            window_size=self.inertia_window_size,
+            min_effective_points=self.inertia_min_effective_points,
+        )
+
+    def signal_config(self, symbol: str) -> FSignalConfig:
+        """對應的單標的 FSignalConfig"""
+        return FSignalConfig(
+            symbol=symbol,
+            w_sai=self.w_sai,
+            w_moi=self.w_moi,
+            w_inertia=self.w_inertia,
+            moi_scale=self.moi_scale,
+            strong_threshold=self.strong_threshold,
+            weak_threshold=self.weak_threshold,
+        )
+
+
+# ============================================================================
+# 批次輸出（欄式）
+# ============================================================================
+
+@dataclass(frozen=True)
+class VolumeBarColumns:
+    """
+    一個批次內完成的 VolumeBar（欄式，依完成 Bar 的 tick 在批次內的順序排列）
+
+    Attributes:
+        symbols: symbol id → 代號（管線的 symbol 表）
+        tick_index: 完成 Bar 的 tick 在批次內的位置
+        symbol_id ... avg_ask: 與 VolumeBar 欄位相同
+        infotime: 完成該 Bar 後的 F_InfoTime（calculate_infotime_factor）
+    """
+    symbols: Sequence[str]
+    tick_index: np.ndarray
+    symbol_id: np.ndarray
+    start_ts: np.ndarray
+    end_ts: np.ndarray
+    vwap: np.ndarray
+    total_volume: np.ndarray
+    tick_count: np.ndarray
+    open_price: np.ndarray
+    high_price: np.ndarray
+    low_price: np.ndarray
+    close_price: np.ndarray
+    avg_bid: np.ndarray
+    avg_ask: np.ndarray
+    infotime: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tick_index)
+
+    def volume_bars(self) -> List[VolumeBar]:
+        """轉成 VolumeBar 物件列表"""
+        return [
+            VolumeBar(
+                start_ts=float(self.start_ts[i]),
+                end_ts=float(self.end_ts[i]),
+                symbol=self.symbols[self.symbol_id[i]],
+                vwap=float(self.vwap[i]),
+                total_volume=int(self.total_volume[i]),
+                tick_count=int(self.tick_count[i]),
+                open_price=float(self.open_price[i]),
+                high_price=float(self.high_price[i]),
+                low_price=float(self.low_price[i]),
+                close_price=float(self.close_price[i]),
+                avg_bid=float(self.avg_bid[i]),
+                avg_ask=float(self.avg_ask[i]),
+            )
+            for i in range(len(self))
+        ]
+
+
+@dataclass(frozen=True)
+class TickFactorColumns:
+    """
+    一個批次內輸出的 F_C / F_Inertia / F_Signal（欄式，每列對應一筆產生 CapitalFlowFactor 的 tick）
+
+    缺值以 NaN 表示（對應單標的引擎回傳 None 或欄位為 None）：
+    - smart_aggression_index / momentum_of_imbalance：CapitalFlowFactor 欄位為 None
+    - inertia_sai：InertiaFactorEngine 在該 tick 回傳 None
+    - signal_score：FSignalEngine 在該 tick 回傳 None（此時 signal_bucket 為 0）
+    """
+    symbols: Sequence[str]
+    tick_index: np.ndarray
+    symbol_id: np.ndarray
+    timestamp: np.ndarray
+    window_trades: np.ndarray
+    window_volume: np.ndarray
+    buy_volume: np.ndarray
+    sell_volume: np.ndarray
+    smart_aggression_index: np.ndarray
+    momentum_of_imbalance: np.ndarray
+    inertia_sai: np.ndarray
+    signal_score: np.ndarray
+    signal_bucket: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tick_index)
+
+    def capital_flow_factors(self) -> List[CapitalFlowFactor]:
+        """轉成 CapitalFlowFactor 物件列表"""
+        return [
+            CapitalFlowFactor(
+                timestamp=float(self.timestamp[i]),
+                symbol=self.symbols[self.symbol_id[i]],
+                window_trades=int(self.window_trades[i]),
+                window_volume=float(self.window_volume[i]),
+                buy_volume=float(self.buy_volume[i]),
+                sell_volume=float(self.sell_volume[i]),
+                net_signed_volume=float(self.buy_volume[i] - self.sell_volume[i]),
+                smart_aggression_index=_optional(self.smart_aggression_index[i]),
+                momentum_of_imbalance=_optional(self.momentum_of_imbalance[i]),
+            )
+            for i in range(len(self))
+        ]
+
+    def inertia_factors(self) -> List[InertiaFactor]:
+        """轉成 InertiaFactor 物件列表（僅有值的列）"""
+        return [
+            InertiaFactor(
+                symbol=self.symbols[self.symbol_id[i]],
+                timestamp=float(self.timestamp[i]),
+                inertia_sai=float(self.inertia_sai[i]),
+            )
+            for i in np.flatnonzero(~np.isnan(self.inertia_sai))
+        ]
+
+    def signals(self) -> List[FSignalFactor]:
+        """轉成 FSignalFactor 物件列表（僅有值的列）"""
+        return [
+            FSignalFactor(
+                symbol=self.symbols[self.symbol_id[i]],
+                timestamp=float(self.timestamp[i]),
+                raw_score=float(self.signal_score[i]),
+                bucket=_BUCKETS_BY_CODE[int(self.signal_bucket[i])],
+            )
+            for i in np.flatnonzero(~np.isnan(self.signal_score))
+        ]
+
+
+@dataclass(frozen=True)
+class MultiSymbolBatchResult:
+    """process_batch 的輸出：完成的 Bar 與逐 tick 因子"""
+    bars: VolumeBarColumns
+    factors: TickFactorColumns
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+def _levels(symbol_ids: np.ndarray, rows: np.ndarray) -> List[np.ndarray]:
+    """
+    將 rows（批次內位置）依「在所屬 symbol 內的序位」分層
+
+    第 k 層包含每個 symbol 的第 k 筆 tick（每個 symbol 至多一筆，依 symbol id 排序），
+    各層依序處理即可保持每個 symbol 內的先後順序。
+    """
+    if len(rows) == 0:
+        return []
+    sids = symbol_ids[rows]
+    order = np.lexsort((rows, sids))
+    sorted_sids = sids[order]
+    group_start = np.r_[0, np.flatnonzero(np.diff(sorted_sids)) + 1]
+    group_len = np.diff(np.r_[group_start, len(order)])
+    rank = np.arange(len(order)) - np.repeat(group_start, group_len)
+    by_rank = np.argsort(rank, kind="stable")
+    counts = np.bincount(rank)
+    return np.split(rows[order[by_rank]], np.cumsum(counts)[:-1])
+
+
+# ============================================================================
+# 多標的管線
+# ============================================================================
+
+class MultiSymbolTickPipeline:
+    """
+    多標的 Tick 因子管線（struct-of-arrays 狀態 + micro-batch 向量化更新）
+
+    每個 symbol 的行為等同一組單標的引擎：
+    - InfoTimeBarGenerator(volume_bar_size)
+    - CapitalFlowEngine(symbol, flow_window_size, flow_min_points, ...)
+    - InertiaFactorEngine(config.inertia_config(symbol))
+    - FSignalEngine(config.signal_config(symbol))，每筆 F_C 與同一筆 tick 的 F_Inertia 一起送入
+
+    使用方式：
+        pipeline = MultiSymbolTickPipeline(MultiSymbolPipelineConfig(volume_bar_size=50_000))
+        ids = pipeline.symbol_ids(["2330.TW", "2317.TW"])
+        result = pipeline.process_batch(ids[sym_idx], price, volume, bid, ask, ts)
+        result.factors.signals()
+    """
+
+    def __init__(self, config: Optional[MultiSymbolPipelineConfig] = None, capacity: int = 64):
+        """
+        Args:
+            config: 管線配置（預設 MultiSymbolPipelineConfig()）
+            capacity: 初始 symbol 容量（超過時自動加倍）
+        """
+        self.config = config or MultiSymbolPipelineConfig()
+        self.symbols: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._capacity = 0
+        self._allocate(max(1, capacity))
+
+    # ---- symbol 表 ----
+
+    def symbol_id(self, symbol: str) -> int:
+        """symbol 的 id（首次出現時註冊）"""
+        sid = self._ids.get(symbol)
+        if sid is None:
+            sid = len(self.symbols)
+            if sid >= self._capacity:
+                self._allocate(self._capacity * 2)
+            self._ids[symbol] = sid
+            self.symbols.append(symbol)
+        return sid
+
+    def symbol_ids(self, symbols: Iterable[str]) -> np.ndarray:
+        """多個 symbol 的 id 陣列（首次出現時註冊）"""
+        return np.array([self.symbol_id(s) for s in symbols], dtype=np.int64)
+
+    def reset(self) -> None:
+        """清空所有標的的狀態（保留 symbol 表）"""
+        self._allocate(self._capacity, keep=False)
+
+    def _allocate(self, capacity: int, keep: bool = True) -> None:
+        """配置（或擴充）struct-of-arrays 狀態；新增的列為初始狀態"""
+        cfg = self.config
+        old = self._capacity if keep else 0
+
+        def grow(name: str, shape: Tuple[int, ...], dtype, fill=0) -> None:
+            arr = np.full((capacity,) + shape, fill, dtype=dtype)
+            if old:
+                arr[:old] = getattr(self, name)[:old]
+            setattr(self, name, arr)
+
+        # Volume Bar（InfoTimeBarGenerator）
+        grow("_bar_ticks", (), np.int64)            # 當前 Bar 的 tick 數（0 = 尚無 Bar）
+        grow("_bar_volume", (), np.int64)
+        grow("_bar_pv", (), np.float64)             # Σ price * volume（VWAP）
+        grow("_bar_open", (), np.float64)
+        grow("_bar_high", (), np.float64)
+        grow("_bar_low", (), np.float64)
+        grow("_bar_close", (), np.float64)
+        grow("_bar_bid_sum", (), np.float64)
+        grow("_bar_ask_sum", (), np.float64)
+        grow("_bar_start_ts", (), np.float64)
+        grow("_bar_end_ts", (), np.float64)
+        grow("_bars_completed", (), np.int64)
+        grow("_last_bar_end_ts", (), np.float64)
+        grow("_intervals", (cfg.infotime_window,), np.float64)
+        grow("_interval_count", (), np.int64)
+
+        # F_C（CapitalFlowEngine 的視窗 ring buffer 與累加器）
+        grow("_flow_volume", (cfg.flow_window_size,), np.float64)
+        grow("_flow_side", (cfg.flow_window_size,), np.float64)
+        grow("_flow_count", (), np.int64)
+        grow("_window_volume", (), np.float64)
+        grow("_buy_volume", (), np.float64)
+        grow("_sell_volume", (), np.float64)
+        grow("_early_volume", (), np.float64)
+        grow("_early_net", (), np.float64)
+
+        # F_Inertia（SAI ring buffer 與總和）
+        grow("_sai", (cfg.inertia_window_size,), np.float64)
+        grow("_sai_count", (), np.int64)
+        grow("_sai_sum", (), np.float64)
+
+        # F_Signal（FSignalEngine 的 _latest_inertia）
+        grow("_signal_inertia", (), np.float64, fill=np.nan)
+
+        self._capacity = capacity
+
+    # ---- 主要接口 ----
+
+    def process_ticks(self, ticks: Iterable) -> MultiSymbolBatchResult:
+        """
+        以 UnifiedTick（或具相同欄位的物件）序列作為一個批次處理
+
+        Args:
+            ticks: 需有 symbol / price / volume / bid_price / ask_price / timestamp
+        """
+        ticks = list(ticks)
+        return self.process_batch(
+            self.symbol_ids(t.symbol for t in ticks),
+            np.array([t.price for t in ticks], dtype=np.float64),
+            np.array([t.volume for t in ticks], dtype=np.float64),
+            np.array([t.bid_price for t in ticks], dtype=np.float64),
+            np.array([t.ask_price for t in ticks], dtype=np.float64),
+            np.array([t.timestamp for t in ticks], dtype=np.float64),
+        )
+
+    def process_tick_batch(self, batch: TickBatch) -> MultiSymbolBatchResult:
+        """
+        處理 data_feed.TickBatch（直接使用其欄位陣列，不建立逐筆物件）
+
+        Args:
+            batch: 已驗證的 TickBatch（例如 SinopacConverter.convert_batch 的輸出）
+        """
+        ids = self.symbol_ids(batch.symbols)
+        symbol_id = ids[batch.symbol_id] if len(ids) else np.empty(0, dtype=np.int64)
+        return self.process_batch(
+            symbol_id, batch.price, batch.volume, batch.bid_price, batch.ask_price, batch.timestamp,
+        )
+
+    def process_batch(
+        self,
+        symbol_id: np.ndarray,
+        price: np.ndarray,
+        volume: np.ndarray,
+        bid: np.ndarray,
+        ask: np.ndarray,
+        timestamp: np.ndarray,
+    ) -> MultiSymbolBatchResult:
+        """
+        處理一個 micro-batch（各陣列等長，依到達順序排列）
+
+        Args:
+            symbol_id: symbol id（由 symbol_id / symbol_ids 取得）
+            price: 成交價
+            volume: 成交量（股 / 張；整數值時 F_C 與單標的引擎逐位元相同）
+            bid: 買一價
+            ask: 賣一價
+            timestamp: 時間戳
+
+        Returns:
+            MultiSymbolBatchResult（bars 與 factors 皆依 tick 在批次內的順序排列）
+        """
+        symbol_id = np.asarray(symbol_id, dtype=np.int64)
+        price = np.asarray(price, dtype=np.float64)
+        volume = np.asarray(volume, dtype=np.float64)
+        bid = np.asarray(bid, dtype=np.float64)
+        ask = np.asarray(ask, dtype=np.float64)
+        timestamp = np.asarray(timestamp, dtype=np.float64)
+        n = len(symbol_id)
+        if not (len(price) == len(volume) == len(bid) == len(ask) == len(timestamp) == n):
+            raise ValueError("batch arrays must have the same length")
+        if n and (symbol_id.min() < 0 or symbol_id.max() >= len(self.symbols)):
+            raise ValueError("unknown symbol id in batch")
+
+        batch = (symbol_id, price, volume, bid, ask, timestamp)
+
+        # Volume Bar：InfoTimeBarGenerator 只忽略無成交量的 tick
+        bar_rows = np.flatnonzero(volume > 0)
+        bar_parts = [self._bar_level(rows, *batch) for rows in _levels(symbol_id, bar_rows)]
+
+        # F_C：與 CapitalFlowEngine.update_from_tick 相同的欄位檢查
+        with np.errstate(invalid="ignore"):
+            mid = 0.5 * (bid + ask)
+            flow_ok = (
+                np.isfinite(price) & np.isfinite(volume) & np.isfinite(bid) & np.isfinite(ask)
+                & (volume > 0) & (bid > 0) & (ask > 0) & (ask > bid) & (mid > self.config.mid_epsilon)
+            )
+        flow_rows = np.flatnonzero(flow_ok)
+        flow_parts = [self._flow_level(rows, *batch) for rows in _levels(symbol_id, flow_rows)]
+
+        return MultiSymbolBatchResult(
+            bars=VolumeBarColumns(self.symbols, *self._concat(bar_parts, _BAR_DTYPES)),
+            factors=TickFactorColumns(self.symbols, *self._concat(flow_parts, _FACTOR_DTYPES)),
+        )
+
+    @staticmethod
+    def _concat(parts: List[Optional[Tuple[np.ndarray, ...]]], dtypes: Tuple) -> List[np.ndarray]:
+        """合併各層輸出（None 表示該層沒有輸出），並依 tick_index（第一欄）排序"""
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            return [np.empty(0, dtype=dtype) for dtype in dtypes]
+        columns = [np.concatenate(col).astype(dtype, copy=False) for col, dtype in zip(zip(*parts), dtypes)]
+        order = np.argsort(columns[0], kind="stable")
+        return [col[order] for col in columns]
+
+    # ---- Volume Bar ----
+
+    def _bar_level(self, rows, symbol_id, price, volume, bid, ask, timestamp) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        一層 tick（每個 symbol 至多一筆）的 Volume Bar 更新
+
+        與 InfoTimeBarGenerator.add_tick 相同：尚無 Bar 時先以該 tick 開始新 Bar 再累積；
+        完成 Bar 的 tick 同時作為下一個 Bar 的第一筆。
+        """
+        s = symbol_id[rows]
+        p, v, b, a, t = price[rows], volume[rows].astype(np.int64), bid[rows], ask[rows], timestamp[rows]
+        pv = p * v
+
+        fresh = self._bar_ticks[s] == 0
+        if fresh.any():
+            self._start_bars(s[fresh], p[fresh], v[fresh], pv[fresh], b[fresh], a[fresh], t[fresh])
+
+        self._bar_ticks[s] += 1
+        self._bar_volume[s] += v
+        self._bar_pv[s] += pv
+        self._bar_high[s] = np.maximum(self._bar_high[s], p)
+        self._bar_low[s] = np.minimum(self._bar_low[s], p)
+        self._bar_close[s] = p
+        self._bar_bid_sum[s] += b
+        self._bar_ask_sum[s] += a
+        self._bar_start_ts[s] = np.minimum(self._bar_start_ts[s], t)
+        self._bar_end_ts[s] = np.maximum(self._bar_end_ts[s], t)
+
+        done = self._bar_volume[s] >= self.config.volume_bar_size
+        if not done.any():
+            return None
+
+        ds = s[done]
+        ticks = self._bar_ticks[ds]
+        bar_volume = self._bar_volume[ds]
+        end_ts = self._bar_end_ts[ds]
+        columns = (
+            rows[done],
+            ds,
+            self._bar_start_ts[ds],
+            end_ts,
+            self._bar_pv[ds] / bar_volume,
+            bar_volume,
+            ticks,
+            self._bar_open[ds],
+            self._bar_high[ds],
+            self._bar_low[ds],
+            self._bar_close[ds],
+            self._bar_bid_sum[ds] / ticks,
+            self._bar_ask_sum[ds] / ticks,
+            self._record_bar_interval(ds, end_ts),
+        )
+        self._start_bars(ds, p[done], v[done], pv[done], b[done], a[done], t[done])
+        return columns
+
+    def _start_bars(self, s, p, v, pv, b, a, t) -> None:
+        self._bar_ticks[s] = 1
+        self._bar_volume[s] = v
+        self._bar_pv[s] = pv
+        self._bar_open[s] = p
+        self._bar_high[s] = p
+        self._bar_low[s] = p
+        self._bar_close[s] = p
+        self._bar_bid_sum[s] = b
+        self._bar_ask_sum[s] = a
+        self._bar_start_ts[s] = t
+        self._bar_end_ts[s] = t
+
+    def _record_bar_interval(self, s: np.ndarray, end_ts: np.ndarray) -> np.ndarray:
+        """記錄 Bar 間隔並回傳 F_InfoTime（同 calculate_infotime_factor）"""
+        window = self.config.infotime_window
+        has_prev = self._bars_completed[s] >= 1
+        ps = s[has_prev]
+        self._intervals[ps, self._interval_count[ps] % window] = end_ts[has_prev] - self._last_bar_end_ts[ps]
+        self._interval_count[ps] += 1
+        self._bars_completed[s] += 1
+        self._last_bar_end_ts[s] = end_ts
+
+        filled = np.minimum(self._interval_count[s], window)
+        last = self._intervals[s, (self._interval_count[s] - 1) % window]
+        avg = self._intervals[s].sum(axis=1) / np.maximum(filled, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            infotime = np.where((filled >= 2) & (avg > 0), last / avg, 1.0)
+        return infotime
+
+    # ---- F_C → F_Inertia → F_Signal ----
+
+    def _flow_level(self, rows, symbol_id, price, volume, bid, ask, timestamp) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        一層 tick 的 F_C / F_Inertia / F_Signal 更新
+
+        F_C 累加器與 CapitalFlowEngine(incremental=True) 相同：視窗滿時移除最舊樣本，
+        前半段（MOI early）維持 len(window) // 2 筆，後半段 = 視窗 - 前半段。
+        """
+        cfg = self.config
+        w = cfg.flow_window_size
+        s = symbol_id[rows]
+        p, v, t = price[rows], volume[rows], timestamp[rows]
+        mid = 0.5 * (bid[rows] + ask[rows])
+        bp_diff = (p - mid) / mid * 10_000.0
+        side = np.where(bp_diff > cfg.at_mid_tolerance_bp, 1.0,
+                        np.where(bp_diff < -cfg.at_mid_tolerance_bp, -1.0, 0.0))
+
+        count = self._flow_count[s]
+        n_before = np.minimum(count, w)
+        start = count - n_before
+        slot = count % w
+        evicted = n_before == w
+        ev_volume = np.where(evicted, self._flow_volume[s, slot], 0.0)
+        ev_side = np.where(evicted, self._flow_side[s, slot], 0.0)
+
+        self._flow_volume[s, slot] = v
+        self._flow_side[s, slot] = side
+        self._flow_count[s] = count + 1
+
+        self._window_volume[s] += v - ev_volume
+        self._buy_volume[s] += np.where(side > 0, v, 0.0) - np.where(ev_side > 0, ev_volume, 0.0)
+        self._sell_volume[s] += np.where(side < 0, v, 0.0) - np.where(ev_side < 0, ev_volume, 0.0)
+
+        # 前半段：視窗滑動時移除最舊樣本並納入新的中點；視窗成長到偶數筆時納入中點
+        if w >= 2:
+            self._early_volume[s] -= ev_volume
+            self._early_net[s] -= ev_volume * ev_side
+        moved = (evicted & (w >= 2)) | (~evicted & (n_before % 2 == 1))
+        moved_seq = np.where(evicted, start + w // 2, start + n_before // 2)
+        ms, mseq = s[moved], moved_seq[moved]
+        moved_volume = self._flow_volume[ms, mseq % w]
+        self._early_volume[ms] += moved_volume
+        self._early_net[ms] += moved_volume * self._flow_side[ms, mseq % w]
+
+        n = np.minimum(count + 1, w)
+        out = n >= cfg.flow_min_points
+        if not out.any():
+            return None
+
+        rows, s, t, n = rows[out], s[out], t[out], n[out]
+        window_volume = self._window_volume[s]
+        buy_volume = self._buy_volume[s]
+        sell_volume = self._sell_volume[s]
+        early_count = n // 2
+        early_volume = self._early_volume[s]
+        early_net = self._early_net[s]
+        recent_volume = window_volume - early_volume
+        recent_net = (buy_volume - sell_volume) - early_net
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sai = np.where(window_volume > 0, (buy_volume - sell_volume) / window_volume, np.nan)
+            early_imbalance = np.where((early_count > 0) & (early_volume > 0), early_net / early_volume, np.nan)
+            recent_imbalance = np.where(recent_volume > 0, recent_net / recent_volume, np.nan)
+        moi = recent_imbalance - early_imbalance
+
+        inertia = self._update_inertia(s, sai)
+        score, bucket = self._update_signal(s, sai, moi, inertia)
+        return (rows, s, t, n, window_volume, buy_volume, sell_volume, sai, moi, inertia, score, bucket)
+
+    def _update_inertia(self, s: np.ndarray, sai: np.ndarray) -> np.ndarray:
+        """InertiaFactorEngine：SAI 有效時推入視窗，筆數足夠時輸出平均（裁切到 [-1, 1]）"""
+        cfg = self.config
+        w = cfg.inertia_window_size
+        inertia = np.full(len(s), np.nan)
+        valid = ~np.isnan(sai)
+        vs, vsai = s[valid], sai[valid]
+
+        count = self._sai_count[vs]
+        slot = count % w
+        evicted = np.where(count >= w, self._sai[vs, slot], 0.0)
+        self._sai[vs, slot] = vsai
+        self._sai_count[vs] = count + 1
+        self._sai_sum[vs] += vsai - evicted
+        # 每 window_size 筆重算總和，避免浮點誤差累積（攤銷 O(1)）
+        resync = vs[(count + 1) % w == 0]
+        self._sai_sum[resync] = self._sai[resync].sum(axis=1)
+
+        filled = np.minimum(count + 1, w)
+        ready = filled >= cfg.inertia_min_effective_points
+        values = np.clip(self._sai_sum[vs] / filled, -1.0, 1.0)
+        inertia[np.flatnonzero(valid)[ready]] = values[ready]
+        return inertia
+
+    def _update_signal(
+        self,
+        s: np.ndarray,
+        sai: np.ndarray,
+        moi: np.ndarray,
+        inertia: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        FSignalEngine：SAI / MOI 皆有效時才更新最新 inertia 並輸出訊號
+        （與單標的引擎相同，MOI 無效的 tick 不會記錄該 tick 的 inertia）
+        """
+        cfg = self.config
+        active = ~np.isnan(sai) & ~np.isnan(moi)
+        update = active & ~np.isnan(inertia)
+        self._signal_inertia[s[update]] = inertia[update]
+        latest = self._signal_inertia[s]
+
+        moi_scaled = np.clip(moi / cfg.moi_scale, -1.0, 1.0)
+        score = cfg.w_sai * sai + cfg.w_moi * moi_scaled + cfg.w_inertia * latest
+        score = np.where(active & ~np.isnan(latest), np.clip(score, -1.0, 1.0), np.nan)
+
+        st, wt = cfg.strong_threshold, cfg.weak_threshold
+        bucket = np.select(
+            [score >= st, score >= wt, score <= -st, score <= -wt],
+            [2, 1, -2, -1],
+            default=0,
+        ).astype(np.int8)
+        return score, bucket
@@ -14,14 +14,20 @@ import yaml
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy import desc
+from sqlalchemy.orm import load_only
 
-from jgod.storage.db import get_session
+from jgod.storage.db import get_db_path, get_read_session
 from jgod.storage.models import PredictionSnapshot, Stock
+from jgod.storage.prediction_cache import TTLCache, version_file_for
+from jgod.storage.prediction_projection import normalize_factor_list, normalize_risk_flags
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# "latest per symbol" / "by date" 回應快取（寫入 prediction_snapshots 時失效）
+response_cache = TTLCache(version_file=version_file_for(get_db_path()))
+
 
 # Pydantic models for timeline endpoint
 class PredictionTimelinePoint(BaseModel):
@@ -98,7 +104,7 @@ async def get_prediction_timeline(
         )
     
     # Query predictions from DB
-    session_gen = get_session()
+    session_gen = get_read_session()
     session = next(session_gen)
     try:
         predictions = (
@@ -158,29 +164,52 @@ async def get_latest_prediction(
         GET /api/predictions/latest/2330
         GET /api/predictions/latest/2330?date=2024-12-01
     """
-    session_gen = get_session()
+    as_of_date = None
+    if date:
+        try:
+            as_of_date = datetime.strptime(date, "%Y-%m-%d").date()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    
+    pred = response_cache.get_or_compute(
+        ("latest", symbol, as_of_date),
+        lambda: _query_latest_prediction(symbol, as_of_date),
+    )
+    if pred is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No prediction found for symbol {symbol}",
+        )
+    return pred
+
+
+def _query_latest_prediction(symbol: str, as_of_date: Optional[date]) -> Optional[LatestPrediction]:
+    """Latest snapshot of symbol (on or before as_of_date) via ix_prediction_snapshots_symbol_date_desc."""
+    session_gen = get_read_session()
     session = next(session_gen)
     try:
-        query = session.query(PredictionSnapshot).filter(
-            PredictionSnapshot.symbol == symbol
+        query = (
+            session.query(PredictionSnapshot)
+            .options(load_only(
+                PredictionSnapshot.symbol,
+                PredictionSnapshot.date,
+                PredictionSnapshot.score,
+                PredictionSnapshot.total_score,
+                PredictionSnapshot.signal,
+                PredictionSnapshot.verdict,
+                PredictionSnapshot.positive_factor_labels,
+                PredictionSnapshot.negative_factor_labels,
+                PredictionSnapshot.risk_flag_labels,
+            ))
+            .filter(PredictionSnapshot.symbol == symbol)
         )
-        
-        # If date is provided, filter by <= date
-        if date:
-            try:
-                as_of_date = datetime.strptime(date, "%Y-%m-%d").date()
-                query = query.filter(PredictionSnapshot.date <= as_of_date)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        if as_of_date is not None:
+            query = query.filter(PredictionSnapshot.date <= as_of_date)
         
         # Get the latest prediction (by date desc)
         pred = query.order_by(desc(PredictionSnapshot.date)).first()
-        
         if not pred:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No prediction found for symbol {symbol}",
-            )
+            return None
         
         # Extract score
         score_value = pred.score if pred.score is not None else (pred.total_score or 0.0)
@@ -188,39 +217,17 @@ async def get_latest_prediction(
         # Extract signal
         signal_value = pred.signal if pred.signal is not None else (pred.verdict or "UNKNOWN")
         
-        # Extract positive factors
-        positive_factors = []
-        if pred.positive_factors_json:
-            if isinstance(pred.positive_factors_json, list):
-                positive_factors = [str(item) for item in pred.positive_factors_json]
-            else:
-                positive_factors = [str(pred.positive_factors_json)]
-        elif pred.positive_indicators:
-            if isinstance(pred.positive_indicators, list):
-                positive_factors = [str(item) for item in pred.positive_indicators]
-            elif isinstance(pred.positive_indicators, str):
-                positive_factors = [item.strip() for item in pred.positive_indicators.split(",") if item.strip()]
-        
-        # Extract negative factors
-        negative_factors = []
-        if pred.negative_factors_json:
-            if isinstance(pred.negative_factors_json, list):
-                negative_factors = [str(item) for item in pred.negative_factors_json]
-            else:
-                negative_factors = [str(pred.negative_factors_json)]
-        elif pred.negative_indicators:
-            if isinstance(pred.negative_indicators, list):
-                negative_factors = [str(item) for item in pred.negative_indicators]
-            elif isinstance(pred.negative_indicators, str):
-                negative_factors = [item.strip() for item in pred.negative_indicators.split(",") if item.strip()]
-        
-        # Extract risk flags
-        risk_flags = []
-        if pred.risk_flags_json:
-            if isinstance(pred.risk_flags_json, list):
-                risk_flags = [str(item) for item in pred.risk_flags_json]
-            else:
-                risk_flags = [str(pred.risk_flags_json)]
+        # Factor lists: precomputed projection; rows written before the
+        # projection existed are normalized here (loads the JSON columns lazily)
+        positive_factors = pred.positive_factor_labels
+        if positive_factors is None:
+            positive_factors = normalize_factor_list(pred.positive_factors_json, pred.positive_indicators)
+        negative_factors = pred.negative_factor_labels
+        if negative_factors is None:
+            negative_factors = normalize_factor_list(pred.negative_factors_json, pred.negative_indicators)
+        risk_flags = pred.risk_flag_labels
+        if risk_flags is None:
+            risk_flags = normalize_risk_flags(pred.risk_flags_json)
         
         return LatestPrediction(
             symbol=pred.symbol,
@@ -260,23 +267,33 @@ async def get_predictions_by_date(
     if not universe_data:
         raise HTTPException(status_code=404, detail=f"Universe not found: {universe}")
     
+    return response_cache.get_or_compute(
+        ("by_date", as_of_date, universe),
+        lambda: _query_predictions_by_date(as_of_date, universe_data),
+    )
+
+
+def _query_predictions_by_date(as_of_date: date, universe_data: List[dict]) -> List[dict]:
+    """Universe rows of one date via ix_prediction_snapshots_date_score (three columns only)."""
     # Create symbol lookup
     symbol_to_info = {s["symbol"]: s for s in universe_data}
     
-    # Query predictions from DB
-    session_gen = get_session()
+    session_gen = get_read_session()
     session = next(session_gen)
     try:
         predictions = (
-            session.query(PredictionSnapshot)
+            session.query(
+                PredictionSnapshot.symbol,
+                PredictionSnapshot.total_score,
+                PredictionSnapshot.verdict,
+            )
             .filter(PredictionSnapshot.date == as_of_date)
             .all()
         )
         
         # Build response
         result = []
-        for pred in predictions:
-            symbol = pred.symbol
+        for symbol, total_score, verdict in predictions:
             if symbol not in symbol_to_info:
                 continue  # Skip symbols not in universe
             
@@ -287,8 +304,8 @@ async def get_predictions_by_date(
                 "name_en": info.get("name_en"),
                 "sector_zh": info.get("sector_zh"),
                 "sector_en": info.get("sector_en"),
-                "total_score": pred.total_score,
-                "verdict": pred.verdict,
+                "total_score": total_score,
+                "verdict": verdict,
             })
         
         return result
@@ -318,7 +335,7 @@ async def get_prediction_by_symbol(
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid date format: {date}. Use YYYY-MM-DD")
     
-    session_gen = get_session()
+    session_gen = get_read_session()
     session = next(session_gen)
     try:
         pred = (
@@ -1,6 +1,19 @@
 from pathlib import Path
+import os
 import sqlite3
-from typing import Iterator
+import threading
+from typing import Dict, Iterator, Set, Tuple
+
+from jgod.storage.db import SQLITE_BUSY_TIMEOUT_MS, SQLITE_PRAGMAS, apply_sqlite_pragmas
+
+# 資料庫檔案位於 project_root/data/jgod_tw_stock.db（jgod 目錄的上上層）
+DB_PATH = Path(__file__).resolve().parents[2] / "data" / "jgod_tw_stock.db"
+
+# 已建表的資料庫檔案（每個 process 只跑一次 CREATE TABLE）
+_SCHEMA_READY: Set[str] = set()
+
+# 每個執行緒重用的連線：{db_path: (pid, connection)}
+_local = threading.local()
 
 
 def get_connection() -> sqlite3.Connection:
@@ -11,15 +24,41 @@ def get_connection() -> sqlite3.Connection:
     - tw_index_daily
     - tw_stock_institutional
     - tw_stock_fundamentals
+
+    同一執行緒重複呼叫會拿到同一個連線（sqlite3 連線不可跨執行緒使用）；
+    呼叫端不需要 close()，若連線已被 close() 則下次呼叫時重新開啟。
+    每個連線都套用 jgod.storage.db.SQLITE_PRAGMAS（WAL、busy_timeout），
+    與 SQLAlchemy engine 共用同一個檔案時不會互相卡住。
     """
-    # 定位專案根目錄（jgod 目錄的上上層）並建立 data 資料夾
-    project_root = Path(__file__).resolve().parents[2]
-    data_dir = project_root / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+    db_path = Path(DB_PATH)
+    key = str(db_path)
+    connections: Dict[str, Tuple[int, sqlite3.Connection]] = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    cached = connections.get(key)
+    if cached is not None and cached[0] == os.getpid():
+        conn = cached[1]
+        try:
+            conn.total_changes  # 已 close() 的連線會丟 ProgrammingError
+            return conn
+        except sqlite3.ProgrammingError:
+            pass
+
+    conn = _open_connection(db_path)
+    connections[key] = (os.getpid(), conn)
+    return conn
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """開啟新連線、套用 pragmas，並在每個 process 第一次開啟時建表"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    db_path = data_dir / "jgod_tw_stock.db"
+    conn = sqlite3.connect(str(db_path), timeout=SQLITE_BUSY_TIMEOUT_MS / 1000.0)
+    apply_sqlite_pragmas(conn, SQLITE_PRAGMAS)
+    if str(db_path) in _SCHEMA_READY:
+        return conn
 
-    conn = sqlite3.connect(str(db_path))
     # 建表語句（使用 IF NOT EXISTS）
     sql_tw_stock_daily = """
     CREATE TABLE IF NOT EXISTS tw_stock_daily (
@@ -90,6 +129,7 @@ def get_connection() -> sqlite3.Connection:
     ]))
 
     conn.commit()
+    _SCHEMA_READY.add(str(db_path))
     return conn
 
 
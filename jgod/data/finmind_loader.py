@@ -97,6 +97,10 @@ def load_stock_daily(stock_id: str, start_date: str, end_date: str) -> int:
         cur.executemany(sql, rows_to_insert)
         conn.commit()
         return cur.rowcount
+    except Exception:
+        # 連線由同一執行緒共用，失敗時不能留下未結束的 transaction
+        conn.rollback()
+        raise
     finally:
         cur.close()
 
@@ -166,6 +170,10 @@ def load_index_daily(index_id: str, start_date: str, end_date: str) -> int:
         cur.executemany(sql, rows_to_insert)
         conn.commit()
         return cur.rowcount
+    except Exception:
+        # 連線由同一執行緒共用，失敗時不能留下未結束的 transaction
+        conn.rollback()
+        raise
     finally:
         cur.close()
 
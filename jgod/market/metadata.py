@@ -94,10 +94,11 @@ def get_stock_display_name(symbol: str) -> str:
             result = cursor.fetchone()
             if result:
                 stock_name = result[0]
-                conn.close()
+                cursor.close()
                 return f"{symbol} {stock_name}"
         
-        conn.close()
+        # 連線由 get_connection 在同一執行緒內重用，只關閉 cursor
+        cursor.close()
     except Exception:
         # 資料庫查詢失敗，繼續使用內建對應表
         pass
@@ -0,0 +1,112 @@
+"""Factor-structured Covariance
+
+以風險模型的因子結構表示 Σ，而不建立 N × N 矩陣：
+
+    Σ = X F Xᵀ + diag(d)
+
+- X: 個股因子暴露（N × K，對應 risk model 的 B）
+- F: 因子共變異數（K × K）
+- d: 個股特有變異數（N，對應 D 的對角線）
+
+w'Σw = (Xᵀw)ᵀ F (Xᵀw) + Σ d_i w_i²，Σw = X (F (Xᵀw)) + d ∘ w，
+兩者皆為 O(N K)，讓 OptimizerCore 能提供解析梯度給 SLSQP。
+
+Reference: docs/J-GOD_RISK_MODEL_STANDARD_v1.md
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 找不到的股票使用與 dense fallback 相同的預設變異數
+DEFAULT_SPECIFIC_VARIANCE = 1e-4
+
+
+@dataclass
+class FactorCovariance:
+    """
+    Σ = X F Xᵀ + diag(d)，以因子結構儲存。
+
+    Attributes:
+        exposures: 因子暴露 X（N × K），已對齊到 stock_ids
+        factor_cov: 因子共變異數 F（K × K）
+        specific_var: 特有變異數 d（N）
+    """
+
+    exposures: np.ndarray
+    factor_cov: np.ndarray
+    specific_var: np.ndarray
+
+    @classmethod
+    def from_risk_model(
+        cls,
+        stock_ids: List[str],
+        risk_model: Any,
+    ) -> Optional["FactorCovariance"]:
+        """
+        從 risk model 取出 B / F / D 並對齊到 stock_ids。
+
+        支援 MultiFactorRiskModel（B, F DataFrame, D）以及
+        MultiFactorRiskModelExtreme（B, F ndarray, S）。
+
+        Args:
+            stock_ids: 股票代碼（輸出順序）
+            risk_model: 已 fit 完成的風險模型
+
+        Returns:
+            FactorCovariance，或在 risk model 沒有因子結構時回傳 None
+        """
+        B = getattr(risk_model, "B", None)
+        F = getattr(risk_model, "F", None)
+        D = getattr(risk_model, "D", None)
+        if D is None:
+            D = getattr(risk_model, "S", None)
+        if B is None or F is None or D is None:
+            return None
+
+        try:
+            symbols = list(risk_model.get_symbols())
+            B = np.asarray(B, dtype=float)
+            F = np.asarray(F.values if isinstance(F, pd.DataFrame) else F, dtype=float)
+            D = np.asarray(D, dtype=float)
+            specific = np.diag(D) if D.ndim == 2 else D
+        except Exception:
+            return None
+
+        n_symbols = len(symbols)
+        if (
+            n_symbols == 0
+            or B.ndim != 2
+            or B.shape[0] != n_symbols
+            or F.shape != (B.shape[1], B.shape[1])
+            or specific.shape != (n_symbols,)
+        ):
+            return None
+
+        # 對齊到 stock_ids；不在模型中的股票 → 無因子暴露、預設特有變異數
+        positions = pd.Index(symbols).get_indexer(stock_ids)
+        found = positions >= 0
+        exposures = np.zeros((len(stock_ids), B.shape[1]))
+        exposures[found] = B[positions[found]]
+        specific_var = np.full(len(stock_ids), DEFAULT_SPECIFIC_VARIANCE)
+        specific_var[found] = specific[positions[found]]
+
+        return cls(exposures=exposures, factor_cov=F, specific_var=specific_var)
+
+    def matvec(self, w: np.ndarray) -> np.ndarray:
+        """Σ w = X (F (Xᵀ w)) + d ∘ w"""
+        return self.exposures @ (self.factor_cov @ (self.exposures.T @ w)) + self.specific_var * w
+
+    def quad(self, w: np.ndarray) -> float:
+        """wᵀ Σ w = (Xᵀ w)ᵀ F (Xᵀ w) + Σ d_i w_i²"""
+        y = self.exposures.T @ w
+        return float(y @ self.factor_cov @ y + np.dot(self.specific_var, w * w))
+
+    def to_dense(self) -> np.ndarray:
+        """建立 N × N Σ（僅供驗證 / 診斷使用）"""
+        return self.exposures @ self.factor_cov @ self.exposures.T + np.diag(self.specific_var)
@@ -114,6 +114,10 @@ class OptimizerConfig:
     - weight_constraints: 權重限制配置
     - factor_constraints: 因子暴露限制配置
     - sector_constraints: Sector 中性限制配置
+    - covariance_mode: Σ 的表示方式
+        - "dense": 由 risk model 取得 N × N Σ（預設）
+        - "factor": 直接使用 B / F / D 因子結構（不建立 N × N Σ），
+          並提供解析梯度；risk model 沒有因子結構時自動退回 dense
     """
 
     risk_objective: RiskObjectiveConfig = field(default_factory=RiskObjectiveConfig)
@@ -121,6 +125,7 @@ class OptimizerConfig:
     weight_constraints: WeightConstraints = field(default_factory=WeightConstraints)
     factor_constraints: FactorExposureConstraints = field(default_factory=FactorExposureConstraints)
     sector_constraints: SectorNeutralityConstraints = field(default_factory=SectorNeutralityConstraints)
+    covariance_mode: str = "dense"  # "dense" / "factor"
 
     # 預留欄位：例如 turnover 限制、VaR/CVaR 限制... 可在 v2 擴充
 
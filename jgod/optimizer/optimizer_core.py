@@ -16,8 +16,9 @@ Reference:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Dict
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -30,6 +31,13 @@ except ImportError:
 from jgod.risk.risk_model import MultiFactorRiskModel
 from .optimizer_config import OptimizerConfig
 from .optimizer_constraints import ConstraintBuilder
+from .factor_covariance import FactorCovariance
+
+
+COVARIANCE_MODES = ("dense", "factor")
+
+# Σ 的兩種表示：N × N 矩陣，或因子結構（見 FactorCovariance）
+CovarianceLike = Union[np.ndarray, FactorCovariance]
 
 
 @dataclass
@@ -50,6 +58,27 @@ class OptimizerResult:
     diagnostics: Optional[Dict] = None
 
 
+@dataclass
+class _ConstraintStructures:
+    """
+    同一 universe（stock_ids 相同）且限制設定不變時，可跨 optimize() 重複使用的限制結構。
+
+    - config_key: 建立時的限制設定值（見 _constraint_config_key）
+    - bounds: 權重上下限
+    - sector_key / sector_constraints: sector_map 對應的 sector 限制
+    - factor_exposure / factor_constraints: factor_exposure 對齊 stock_ids 後的副本與對應的因子限制
+      （以內容比對，呼叫端原地修改 DataFrame 時會重建）
+    """
+
+    stock_ids: Tuple[str, ...]
+    config_key: Tuple
+    bounds: List[Tuple[float, float]]
+    sector_key: Optional[Tuple[Optional[str], ...]] = None
+    sector_constraints: List[Dict] = field(default_factory=list)
+    factor_exposure: Optional[pd.DataFrame] = None
+    factor_constraints: List[Dict] = field(default_factory=list)
+
+
 class OptimizerCore:
     """
     J-GOD Optimizer v1 核心類別。
@@ -70,6 +99,15 @@ class OptimizerCore:
         self.config = config or OptimizerConfig()
         self.constraint_builder = ConstraintBuilder(self.config)
         
+        # 上一次 optimize() 的限制結構；universe 不變時直接重用
+        self._structures: Optional[_ConstraintStructures] = None
+        
+        if self.config.covariance_mode not in COVARIANCE_MODES:
+            raise ValueError(
+                f"Unknown covariance_mode: {self.config.covariance_mode!r}. "
+                f"Expected one of {COVARIANCE_MODES}"
+            )
+        
         if minimize is None:
             raise ImportError(
                 "scipy.optimize.minimize is required for OptimizerCore. "
@@ -83,6 +121,7 @@ class OptimizerCore:
         factor_exposure: Optional[pd.DataFrame] = None,
         benchmark_weights: Optional[pd.Series] = None,
         sector_map: Optional[Dict[str, str]] = None,
+        initial_weights: Optional[pd.Series] = None,
     ) -> OptimizerResult:
         """
         執行一次投資組合優化。
@@ -100,6 +139,9 @@ class OptimizerCore:
             基準指數權重，用於 TE 限制。
         sector_map : Optional[Dict[str, str]]
             stock_id -> sector_name，用於 sector 中性限制。
+        initial_weights : Optional[pd.Series]
+            Warm start（通常為上一次再平衡的權重），index 為 stock_id。
+            不在 index 中的股票視為 0；無效時退回均勻分配。
 
         Returns
         -------
@@ -118,13 +160,19 @@ class OptimizerCore:
                 objective_value=0.0
             )
         
-        # 2. 從 risk_model 取得 Σ (covariance matrix)
-        cov_matrix = self._build_covariance_matrix(
-            pd.Index(stock_ids),
-            risk_model
-        )
+        # 2. 從 risk_model 取得 Σ
+        #    factor 模式：使用 B / F / D 因子結構（無因子結構時退回 dense N × N）
+        cov_matrix: Optional[CovarianceLike] = None
+        if self.config.covariance_mode == "factor":
+            cov_matrix = FactorCovariance.from_risk_model(stock_ids, risk_model)
+        use_factor = cov_matrix is not None
+        if not use_factor:
+            cov_matrix = self._build_covariance_matrix(
+                pd.Index(stock_ids),
+                risk_model
+            )
         
-        if cov_matrix is None or cov_matrix.shape[0] != n_stocks:
+        if cov_matrix is None or (not use_factor and cov_matrix.shape[0] != n_stocks):
             return OptimizerResult(
                 weights=pd.Series(index=stock_ids, dtype=float),
                 status='failed',
@@ -135,11 +183,15 @@ class OptimizerCore:
         # 3. 準備預期報酬向量（對齊到 stock_ids 順序）
         mu = expected_returns.values
         
-        # 4. 建立初始權重 guess（均勻分配）
-        w0 = np.ones(n_stocks) / n_stocks
+        # 4. 取得（或重用）本 universe 的限制結構，透過 ConstraintBuilder 構建權重 bounds
+        structures = self._get_structures(stock_ids)
+        bounds = structures.bounds
         
-        # 5. 透過 ConstraintBuilder 構建權重 bounds
-        bounds = self.constraint_builder.build_weight_bounds(stock_ids)
+        # 5. 建立初始權重 guess（warm start 或均勻分配）
+        w0 = self._build_initial_weights(initial_weights, stock_ids, bounds)
+        warm_start = w0 is not None
+        if not warm_start:
+            w0 = np.ones(n_stocks) / n_stocks
         
         # 6. 建立目標函數（Mean-Variance 形式）
         risk_aversion = self.config.risk_objective.risk_aversion
@@ -148,13 +200,21 @@ class OptimizerCore:
             """目標函數：負的 mean-variance 形式（因為 scipy minimize）"""
             return -self._objective_mean_variance(w, mu, cov_matrix, risk_aversion)
         
-        # 7. 建立 constraints
+        objective_jac = None
+        if use_factor:
+            def objective_jac(w: np.ndarray) -> np.ndarray:
+                """解析梯度：-(mu - 2λ Σw)，Σw 以因子結構計算（O(N K)）"""
+                return -(mu - 2.0 * risk_aversion * cov_matrix.matvec(w))
+        
+        # 7. 建立 constraints（線性限制皆提供常數 Jacobian）
         constraints = []
         
         # 7.1 權重合計 = 1 的限制
+        ones = np.ones(n_stocks)
         constraints.append({
             'type': 'eq',
-            'fun': lambda w: np.sum(w) - 1.0
+            'fun': lambda w: np.sum(w) - 1.0,
+            'jac': lambda w: ones
         })
         
         # 7.2 Tracking Error 限制（如果啟用）
@@ -172,29 +232,41 @@ class OptimizerCore:
         
         # 7.3 因子暴露限制（如果啟用且有 factor_exposure）
         if factor_exposure is not None and not factor_exposure.empty:
-            factor_constraints = self._build_factor_exposure_constraints(
-                factor_exposure, stock_ids, risk_model
-            )
-            constraints.extend(factor_constraints)
+            aligned_exposure = factor_exposure.reindex(stock_ids, fill_value=0.0)
+            if structures.factor_exposure is None or not structures.factor_exposure.equals(aligned_exposure):
+                structures.factor_constraints = self._build_factor_exposure_constraints(
+                    factor_exposure, stock_ids, risk_model
+                )
+                structures.factor_exposure = aligned_exposure.copy()
+            constraints.extend(structures.factor_constraints)
         
         # 7.4 Sector 中性限制（如果啟用）
         if sector_map is not None:
-            sector_constraints = self._build_sector_constraints(
-                stock_ids, sector_map
-            )
-            if sector_constraints:
-                constraints.extend(sector_constraints)
+            sector_key = tuple(sector_map.get(stock_id) for stock_id in stock_ids)
+            if structures.sector_key != sector_key:
+                structures.sector_constraints = self._build_sector_constraints(
+                    stock_ids, sector_map
+                )
+                structures.sector_key = sector_key
+            constraints.extend(structures.sector_constraints)
         
         # 8. 呼叫 minimize 求解
+        solve_start = time.perf_counter()
         try:
             result = minimize(
                 objective,
                 w0,
                 method='SLSQP',  # Sequential Least Squares Programming
+                jac=objective_jac,
                 bounds=bounds,
                 constraints=constraints,
                 options={'maxiter': 1000, 'ftol': 1e-9}
             )
+            solve_diagnostics = {
+                'iterations': int(getattr(result, 'nit', 0)),
+                'solve_time': time.perf_counter() - solve_start,
+                'warm_start': warm_start,
+            }
             
             if result.success:
                 # 優化成功
@@ -205,6 +277,8 @@ class OptimizerCore:
                     weights, mu, cov_matrix, risk_model,
                     benchmark_weights, factor_exposure
                 )
+                diagnostics['covariance_mode'] = 'factor' if use_factor else 'dense'
+                diagnostics.update(solve_diagnostics)
                 
                 return OptimizerResult(
                     weights=weights,
@@ -219,7 +293,8 @@ class OptimizerCore:
                     weights=pd.Series(result.x, index=stock_ids) if hasattr(result, 'x') else pd.Series(index=stock_ids, dtype=float),
                     status='failed',
                     message=f'Optimization failed: {result.message}',
-                    objective_value=result.fun if hasattr(result, 'fun') else 0.0
+                    objective_value=result.fun if hasattr(result, 'fun') else 0.0,
+                    diagnostics=solve_diagnostics
                 )
                 
         except Exception as e:
@@ -232,6 +307,76 @@ class OptimizerCore:
 
     # ---- 內部工具方法 ----
 
+    def _get_structures(self, stock_ids: List[str]) -> _ConstraintStructures:
+        """
+        取得 stock_ids 對應的限制結構；universe 與限制設定值都與上一次相同時直接重用
+        （config 在 optimize() 之間被原地修改時會重建）。
+
+        Args:
+            stock_ids: List of stock IDs（順序相關）
+
+        Returns:
+            _ConstraintStructures
+        """
+        key = tuple(stock_ids)
+        config_key = self._constraint_config_key()
+        if (
+            self._structures is None
+            or self._structures.stock_ids != key
+            or self._structures.config_key != config_key
+        ):
+            self._structures = _ConstraintStructures(
+                stock_ids=key,
+                config_key=config_key,
+                bounds=self.constraint_builder.build_weight_bounds(stock_ids),
+            )
+        return self._structures
+
+    def _constraint_config_key(self) -> Tuple:
+        """ConstraintBuilder 建立 bounds / 因子 / sector 限制時讀取的設定值"""
+        config = self.constraint_builder.config
+        weights = config.weight_constraints
+        sectors = config.sector_constraints
+        return (
+            weights.long_only,
+            weights.min_weight,
+            weights.max_weight,
+            weights.leverage_limit,
+            tuple(sorted(config.factor_constraints.factor_bounds.items())),
+            sectors.enabled,
+            tuple(sorted(sectors.sector_bounds.items())),
+        )
+
+    def _build_initial_weights(
+        self,
+        initial_weights: Optional[pd.Series],
+        stock_ids: List[str],
+        bounds: List[Tuple[float, float]],
+    ) -> Optional[np.ndarray]:
+        """
+        將 warm start 權重對齊到 stock_ids、裁切到 bounds 並正規化為合計 1。
+
+        Args:
+            initial_weights: Warm start weights（可為 None）
+            stock_ids: List of stock IDs
+            bounds: 權重上下限
+
+        Returns:
+            初始權重向量，或在無法使用 warm start 時回傳 None
+        """
+        if initial_weights is None:
+            return None
+        
+        w0 = initial_weights.reindex(stock_ids).astype(float).fillna(0.0).values
+        lower, upper = np.asarray(bounds, dtype=float).T
+        w0 = np.clip(w0, lower, upper)
+        
+        # 正規化後可能略微超出 bounds，SLSQP 可由不可行起點收斂
+        total = w0.sum()
+        if not np.all(np.isfinite(w0)) or total <= 1e-12:
+            return None
+        return w0 / total
+
     def _build_covariance_matrix(
         self,
         stock_ids: pd.Index,
@@ -287,7 +432,7 @@ class OptimizerCore:
         self,
         w: np.ndarray,
         mu: np.ndarray,
-        cov: np.ndarray,
+        cov: CovarianceLike,
         risk_aversion: float,
     ) -> float:
         """
@@ -299,21 +444,21 @@ class OptimizerCore:
         Args:
             w: Weight vector (N x 1)
             mu: Expected returns (N x 1)
-            cov: Covariance matrix (N x N)
+            cov: Covariance matrix (N x N) or FactorCovariance
             risk_aversion: Risk aversion parameter λ
 
         Returns:
             Objective function value: mu^T w - λ w^T Σ w
         """
         portfolio_return = np.dot(w, mu)
-        portfolio_variance = np.dot(w, np.dot(cov, w))
+        portfolio_variance = _portfolio_variance(cov, w)
         
         return portfolio_return - risk_aversion * portfolio_variance
 
     def _build_te_constraint(
         self,
         w_bench: np.ndarray,
-        cov: np.ndarray,
+        cov: CovarianceLike,
         te_max: float,
     ) -> Dict:
         """
@@ -323,9 +468,12 @@ class OptimizerCore:
         在 scipy 中可用非線性 constraint 方式實作：
         g(w) = te_max - TE(w) >= 0
 
+        使用 FactorCovariance 時另提供解析 Jacobian：
+        ∇g(w) = -Σ (w - w_bench) / TE(w)
+
         Args:
             w_bench: Benchmark weight vector (N x 1)
-            cov: Covariance matrix (N x N)
+            cov: Covariance matrix (N x N) or FactorCovariance
             te_max: Maximum tracking error
 
         Returns:
@@ -334,14 +482,28 @@ class OptimizerCore:
         def te_constraint(w: np.ndarray) -> float:
             """TE constraint: te_max - TE(w) >= 0"""
             active_weight = w - w_bench
-            te_squared = np.dot(active_weight, np.dot(cov, active_weight))
+            te_squared = _portfolio_variance(cov, active_weight)
             te = np.sqrt(max(te_squared, 0.0))
             return te_max - te
         
-        return {
+        constraint = {
             'type': 'ineq',
             'fun': te_constraint
         }
+        
+        if isinstance(cov, FactorCovariance):
+            def te_constraint_jac(w: np.ndarray) -> np.ndarray:
+                active_weight = w - w_bench
+                cov_active = cov.matvec(active_weight)
+                te = np.sqrt(max(float(np.dot(active_weight, cov_active)), 0.0))
+                if te < 1e-12:
+                    # TE(w) 在 w = w_bench 不可微；取次梯度 0
+                    return np.zeros_like(w)
+                return -cov_active / te
+            
+            constraint['jac'] = te_constraint_jac
+        
+        return constraint
 
     def _align_benchmark_weights(
         self,
@@ -414,7 +576,8 @@ class OptimizerCore:
                 min_val = min_delta
                 constraints.append({
                     'type': 'ineq',
-                    'fun': lambda w, f=factor_vec_min, mv=min_val: np.dot(w, f) - mv
+                    'fun': lambda w, f=factor_vec_min, mv=min_val: np.dot(w, f) - mv,
+                    'jac': lambda w, f=factor_vec_min: f
                 })
             
             if not np.isinf(max_delta):
@@ -422,7 +585,8 @@ class OptimizerCore:
                 max_val = max_delta
                 constraints.append({
                     'type': 'ineq',
-                    'fun': lambda w, f=factor_vec_max, mv=max_val: mv - np.dot(w, f)
+                    'fun': lambda w, f=factor_vec_max, mv=max_val: mv - np.dot(w, f),
+                    'jac': lambda w, f=-factor_vec_max: f
                 })
         
         return constraints
@@ -468,7 +632,8 @@ class OptimizerCore:
                 min_val = min_delta
                 constraints.append({
                     'type': 'ineq',
-                    'fun': lambda w, vec=sector_vec_min, mv=min_val: np.dot(w, vec) - mv
+                    'fun': lambda w, vec=sector_vec_min, mv=min_val: np.dot(w, vec) - mv,
+                    'jac': lambda w, vec=sector_vec_min: vec
                 })
             
             if not np.isinf(max_delta):
@@ -476,7 +641,8 @@ class OptimizerCore:
                 max_val = max_delta
                 constraints.append({
                     'type': 'ineq',
-                    'fun': lambda w, vec=sector_vec_max, mv=max_val: mv - np.dot(w, vec)
+                    'fun': lambda w, vec=sector_vec_max, mv=max_val: mv - np.dot(w, vec),
+                    'jac': lambda w, vec=-sector_vec_max: vec
                 })
         
         return constraints
@@ -485,7 +651,7 @@ class OptimizerCore:
         self,
         weights: pd.Series,
         mu: np.ndarray,
-        cov: np.ndarray,
+        cov: CovarianceLike,
         risk_model: MultiFactorRiskModel,
         benchmark_weights: Optional[pd.Series],
         factor_exposure: Optional[pd.DataFrame],
@@ -496,7 +662,7 @@ class OptimizerCore:
         Args:
             weights: Optimized weights
             mu: Expected returns
-            cov: Covariance matrix
+            cov: Covariance matrix (N x N) or FactorCovariance
             risk_model: Risk model instance
             benchmark_weights: Optional benchmark weights
             factor_exposure: Optional factor exposure DataFrame
@@ -508,7 +674,7 @@ class OptimizerCore:
         w = weights.values
         
         # 總風險
-        portfolio_variance = np.dot(w, np.dot(cov, w))
+        portfolio_variance = _portfolio_variance(cov, w)
         portfolio_vol = np.sqrt(max(portfolio_variance, 0.0))
         diagnostics['total_volatility'] = float(portfolio_vol)
         
@@ -526,7 +692,7 @@ class OptimizerCore:
             w_bench = self._align_benchmark_weights(benchmark_weights, weights.index.tolist())
             if w_bench is not None:
                 active_weight = w - w_bench
-                te_squared = np.dot(active_weight, np.dot(cov, active_weight))
+                te_squared = _portfolio_variance(cov, active_weight)
                 te = np.sqrt(max(te_squared, 0.0))
                 diagnostics['tracking_error'] = float(te)
         
@@ -545,3 +711,9 @@ class OptimizerCore:
         
         return diagnostics
 
+
+def _portfolio_variance(cov: CovarianceLike, w: np.ndarray) -> float:
+    """wᵀ Σ w，支援 N × N 矩陣與 FactorCovariance"""
+    if isinstance(cov, FactorCovariance):
+        return cov.quad(w)
+    return np.dot(w, np.dot(cov, w))
@@ -12,9 +12,13 @@ Reference:
 
 from __future__ import annotations
 
-import numpy as np
-from typing import Dict, Optional
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     import cvxpy as cp
@@ -72,111 +76,116 @@ class OptimizerCoreV2:
         # 驗證輸入
         req.validate()
         
-        N = len(req.expected_active_return)
-        
-        # 定義決策變數
-        w = cp.Variable(N)
-        
-        # === 目標函數 ===
-        active_ret = req.expected_active_return
-        Sigma = req.cov_matrix
-        
-        # 風險項：w^T Σ w
-        risk_term = cp.quad_form(w, Sigma)
-        
-        # 成本項
-        w_diff = w - req.prev_weights
-        
-        # 線性成本：sum(γ_i |w_i - w_i^prev|)
-        # 注意：cvxpy 的 norm1 是 sum of absolute values
-        cost_linear = cp.norm1(w_diff) * np.mean(req.linear_cost) if np.any(req.linear_cost) else 0
+        build_start = time.perf_counter()
+        problem = _build_problem(
+            req,
+            active_ret=req.expected_active_return,
+            risk_aversion=req.params["lambda"],
+            bounds=req.bounds,
+            prev_weights=req.prev_weights,
+        )
+        build_time = time.perf_counter() - build_start
         
-        # 二次成本：sum(β_i (w_i - w_i^prev)^2)
-        cost_quad = cp.quad_form(w_diff, np.diag(req.quad_cost)) if np.any(req.quad_cost) else 0
+        solve_time = self._solve_problem(problem.prob, warm_start=False)
         
-        # 目標函數：最大化 active return - λ * risk - cost
-        objective = cp.Maximize(
-            active_ret @ w
-            - req.params["lambda"] * risk_term
-            - cost_linear
-            - cost_quad
+        return _build_result(
+            req,
+            problem,
+            solver=self.solver,
+            timing={"build_time": build_time, "solve_time": solve_time, "warm_start": False},
         )
+    
+    def solve_many(
+        self,
+        requests: Sequence[OptimizerRequest],
+        max_workers: Optional[int] = None,
+    ) -> List[OptimizerResult]:
+        """批次求解多個結構相同的優化問題
+        
+        μ、權重邊界、λ 與 prev_weights 以 cvxpy Parameter 表示：
+        結構相同（Σ、因子 / 行業矩陣、成本、其餘 params 皆相同）的 request
+        共用同一個已 canonicalize 的問題，只更新參數並以 warm start 重解。
+        結構不同的 request 會各自建立一個參數化問題。
         
-        constraints = []
+        Args:
+            requests: OptimizerRequest 序列
+            max_workers: 若 > 1，將 requests 切成連續區塊並以 process pool 平行求解
+                （每個 worker 各自建立參數化問題）
         
-        # === 權重邊界限制 ===
-        lower, upper = req.bounds
-        constraints += [w >= lower, w <= upper]
+        Returns:
+            與 requests 同順序的 OptimizerResult 列表；
+            diagnostics 含每個 request 的 build_time / solve_time / warm_start
         
-        # === 換手率限制 ===
-        turnover = cp.norm1(w_diff)
-        T_max = req.params.get("T_max", 0.20)
-        constraints += [turnover <= T_max]
+        Raises:
+            ValueError: 輸入資料格式錯誤
+            RuntimeError: 任一 request 求解失敗（訊息含 request index）
+        """
+        requests = list(requests)
         
-        # === 因子暴露限制 ===
-        betas = req.factor_betas  # (N, K)
-        if betas is not None and betas.size > 0:
-            X = betas.T @ w  # (K,)
+        if max_workers is not None and max_workers > 1 and len(requests) > 1:
+            n_chunks = min(max_workers, len(requests))
+            edges = np.linspace(0, len(requests), n_chunks + 1).astype(int)
+            chunks = [requests[lo:hi] for lo, hi in zip(edges[:-1], edges[1:])]
             
-            factor_limits = req.params.get("factor_limits", {})
-            factor_index = req.params.get("factor_index", {})
+            results: List[OptimizerResult] = []
+            with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+                futures = [
+                    executor.submit(_solve_chunk, self.solver, self.verbose, chunk, int(offset))
+                    for chunk, offset in zip(chunks, edges[:-1])
+                ]
+                for future in futures:
+                    results.extend(future.result())
+            return results
+        
+        return self._solve_sequential(requests)
+    
+    def _solve_sequential(
+        self,
+        requests: List[OptimizerRequest],
+        offset: int = 0,
+    ) -> List[OptimizerResult]:
+        """依序求解 requests，重用結構相同的參數化問題"""
+        problems: List[_ParametrizedProblem] = []
+        results = []
+        
+        for i, req in enumerate(requests):
+            req.validate()
             
-            for k, limit in factor_limits.items():
-                if k in factor_index:
-                    idx = factor_index[k]
-                    if isinstance(limit, (list, tuple)) and len(limit) == 2:
-                        # 雙邊限制 (min, max)
-                        constraints += [X[idx] >= limit[0], X[idx] <= limit[1]]
-                    else:
-                        # 單邊限制（絕對值）
-                        constraints += [cp.abs(X[idx]) <= limit]
-        
-        # === 行業暴露限制 ===
-        sectors = req.sector_map  # (N, J)
-        if sectors is not None and sectors.size > 0:
-            S = sectors.T @ w  # (J,)
+            build_start = time.perf_counter()
+            problem = next((p for p in problems if p.matches(req)), None)
+            warm_start = problem is not None
+            if problem is None:
+                problem = _ParametrizedProblem(req)
+                problems.append(problem)
+            problem.assign(req)
+            build_time = time.perf_counter() - build_start
             
-            sector_limits = req.params.get("sector_limits", {})
+            try:
+                solve_time = self._solve_problem(problem.prob, warm_start=warm_start)
+            except RuntimeError as e:
+                raise RuntimeError(f"Request {offset + i}: {e}") from e
             
-            for j, limits in sector_limits.items():
-                if isinstance(limits, (list, tuple)) and len(limits) == 2:
-                    min_j, max_j = limits
-                    if j < S.shape[0]:
-                        constraints += [S[j] >= min_j, S[j] <= max_j]
-        
-        # === 槓桿和淨暴露限制 ===
-        # 多頭總權重限制
-        w_long = cp.maximum(w, 0)
-        constraints += [cp.sum(w_long) <= req.params.get("long_leverage", 1.30)]
-        
-        # 空頭總權重限制
-        w_short = cp.maximum(-w, 0)
-        constraints += [cp.sum(w_short) <= req.params.get("short_leverage", 0.30)]
-        
-        # 淨暴露限制
-        net_exposure_lower = req.params.get("net_exposure_lower", 0.90)
-        net_exposure_upper = req.params.get("net_exposure_upper", 1.10)
-        constraints += [
-            cp.sum(w) >= net_exposure_lower,
-            cp.sum(w) <= net_exposure_upper
-        ]
-        
-        # === Tracking Error 限制 ===
-        TE_max = req.params.get("TE_max", 0.04)
-        TE_matrix = req.params.get("TE_matrix", None)
-        
-        if TE_matrix is not None:
-            w_active = w - req.benchmark_weights
-            TE_square = cp.quad_form(w_active, TE_matrix)
-            constraints += [TE_square <= TE_max ** 2]
-        
-        # === 建立並求解問題 ===
-        prob = cp.Problem(objective, constraints)
+            results.append(_build_result(
+                req,
+                problem,
+                solver=self.solver,
+                timing={"build_time": build_time, "solve_time": solve_time, "warm_start": warm_start},
+            ))
+        
+        return results
+    
+    def _solve_problem(self, prob: "cp.Problem", warm_start: bool) -> float:
+        """求解 prob 並檢查狀態
         
+        Returns:
+            求解耗時（秒）
+        """
+        solve_start = time.perf_counter()
         try:
-            prob.solve(solver=self.solver, verbose=self.verbose)
+            prob.solve(solver=self.solver, verbose=self.verbose, warm_start=warm_start)
         except Exception as e:
             raise RuntimeError(f"Optimization solver failed: {e}") from e
+        solve_time = time.perf_counter() - solve_start
         
         # 檢查求解狀態
         if prob.status not in ["optimal", "optimal_inaccurate"]:
@@ -185,61 +194,304 @@ class OptimizerCoreV2:
                 f"Problem may be infeasible or unbounded."
             )
         
-        # 取得最優權重
-        weights = w.value
-        
-        if weights is None:
-            raise RuntimeError("Solver did not return optimal weights")
-        
-        # 計算後處理指標
-        turnover_val = float(np.sum(np.abs(weights - req.prev_weights)))
-        
-        # 計算 Tracking Error
-        TE_val = 0.0
-        if TE_matrix is not None:
-            w_active = weights - req.benchmark_weights
-            TE_val = float(np.sqrt(w_active.T @ TE_matrix @ w_active))
-        
-        # 計算因子暴露
-        factor_exposures = {}
-        if betas is not None and betas.size > 0:
-            X_val = betas.T @ weights
-            factor_names = req.params.get("factor_names", [f"factor_{i}" for i in range(len(X_val))])
-            for i, name in enumerate(factor_names[:len(X_val)]):
-                factor_exposures[name] = float(X_val[i])
-        
-        # 計算行業暴露
-        sector_exposures = {}
-        if sectors is not None and sectors.size > 0:
-            S_val = sectors.T @ weights
-            sector_names = req.params.get("sector_names", [f"sector_{i}" for i in range(len(S_val))])
-            for i, name in enumerate(sector_names[:len(S_val)]):
-                sector_exposures[name] = float(S_val[i])
-        
-        # 計算成本
-        cost_val = float(cost_linear.value if cost_linear != 0 else 0) + \
-                   float(cost_quad.value if cost_quad != 0 else 0)
-        
-        # 估計 Sharpe Ratio（簡化版）
-        expected_return = float(active_ret @ weights)
-        portfolio_risk = float(np.sqrt(weights.T @ Sigma @ weights))
-        sharpe_est = expected_return / portfolio_risk if portfolio_risk > 0 else 0.0
-        
-        # 建立結果物件
-        result = OptimizerResult(
-            weights=weights,
-            turnover=turnover_val,
-            TE=TE_val,
-            factor_exposures=factor_exposures,
-            sector_exposures=sector_exposures,
-            cost=cost_val,
-            sharpe_est=sharpe_est,
-            diagnostics={
-                "status": prob.status,
-                "objective_value": float(prob.value) if prob.value is not None else None,
-                "solver": self.solver,
-            }
+        return solve_time
+
+
+# ---------------------------------------------------------------------------
+# Problem construction
+# ---------------------------------------------------------------------------
+
+# 以 cvxpy Parameter 表示、不影響問題結構的欄位
+_PARAMETRIZED_PARAMS = ("lambda",)
+
+
+@dataclass
+class _Problem:
+    """cvxpy 問題與後處理需要的表示式"""
+    
+    prob: "cp.Problem"
+    w: "cp.Variable"
+    cost_linear: Any
+    cost_quad: Any
+
+
+def _build_problem(
+    req: OptimizerRequest,
+    active_ret: Any,
+    risk_aversion: Any,
+    bounds: Tuple[Any, Any],
+    prev_weights: Any,
+) -> _Problem:
+    """建立 MV / MVCO 問題
+    
+    active_ret / risk_aversion / bounds / prev_weights 可為常數（solve）
+    或 cvxpy Parameter（solve_many），其餘皆取自 req。
+    """
+    N = len(req.expected_active_return)
+    
+    # 定義決策變數
+    w = cp.Variable(N)
+    
+    # === 目標函數 ===
+    Sigma = req.cov_matrix
+    
+    # 風險項：w^T Σ w
+    risk_term = cp.quad_form(w, Sigma)
+    
+    # 成本項
+    w_diff = w - prev_weights
+    
+    # 線性成本：sum(γ_i |w_i - w_i^prev|)
+    # 注意：cvxpy 的 norm1 是 sum of absolute values
+    cost_linear = cp.norm1(w_diff) * np.mean(req.linear_cost) if np.any(req.linear_cost) else 0
+    
+    # 二次成本：sum(β_i (w_i - w_i^prev)^2)，β_i >= 0
+    # 以 sum_squares(√β ∘ Δw) 表示（prev_weights 為 Parameter 時 quad_form 不符合 DPP）
+    cost_quad = (
+        cp.sum_squares(cp.multiply(np.sqrt(req.quad_cost), w_diff))
+        if np.any(req.quad_cost) else 0
+    )
+    
+    # 目標函數：最大化 active return - λ * risk - cost
+    objective = cp.Maximize(
+        active_ret @ w
+        - risk_aversion * risk_term
+        - cost_linear
+        - cost_quad
+    )
+    
+    constraints = []
+    
+    # === 權重邊界限制 ===
+    lower, upper = bounds
+    constraints += [w >= lower, w <= upper]
+    
+    # === 換手率限制 ===
+    turnover = cp.norm1(w_diff)
+    T_max = req.params.get("T_max", 0.20)
+    constraints += [turnover <= T_max]
+    
+    # === 因子暴露限制 ===
+    betas = req.factor_betas  # (N, K)
+    if betas is not None and betas.size > 0:
+        X = betas.T @ w  # (K,)
+        
+        factor_limits = req.params.get("factor_limits", {})
+        factor_index = req.params.get("factor_index", {})
+        
+        for k, limit in factor_limits.items():
+            if k in factor_index:
+                idx = factor_index[k]
+                if isinstance(limit, (list, tuple)) and len(limit) == 2:
+                    # 雙邊限制 (min, max)
+                    constraints += [X[idx] >= limit[0], X[idx] <= limit[1]]
+                else:
+                    # 單邊限制（絕對值）
+                    constraints += [cp.abs(X[idx]) <= limit]
+    
+    # === 行業暴露限制 ===
+    sectors = req.sector_map  # (N, J)
+    if sectors is not None and sectors.size > 0:
+        S = sectors.T @ w  # (J,)
+        
+        sector_limits = req.params.get("sector_limits", {})
+        
+        for j, limits in sector_limits.items():
+            if isinstance(limits, (list, tuple)) and len(limits) == 2:
+                min_j, max_j = limits
+                if j < S.shape[0]:
+                    constraints += [S[j] >= min_j, S[j] <= max_j]
+    
+    # === 槓桿和淨暴露限制 ===
+    # 多頭總權重限制
+    w_long = cp.maximum(w, 0)
+    constraints += [cp.sum(w_long) <= req.params.get("long_leverage", 1.30)]
+    
+    # 空頭總權重限制
+    w_short = cp.maximum(-w, 0)
+    constraints += [cp.sum(w_short) <= req.params.get("short_leverage", 0.30)]
+    
+    # 淨暴露限制
+    net_exposure_lower = req.params.get("net_exposure_lower", 0.90)
+    net_exposure_upper = req.params.get("net_exposure_upper", 1.10)
+    constraints += [
+        cp.sum(w) >= net_exposure_lower,
+        cp.sum(w) <= net_exposure_upper
+    ]
+    
+    # === Tracking Error 限制 ===
+    TE_max = req.params.get("TE_max", 0.04)
+    TE_matrix = req.params.get("TE_matrix", None)
+    
+    if TE_matrix is not None:
+        w_active = w - req.benchmark_weights
+        TE_square = cp.quad_form(w_active, TE_matrix)
+        constraints += [TE_square <= TE_max ** 2]
+    
+    # === 建立問題 ===
+    prob = cp.Problem(objective, constraints)
+    
+    return _Problem(prob=prob, w=w, cost_linear=cost_linear, cost_quad=cost_quad)
+
+
+class _ParametrizedProblem(_Problem):
+    """μ / bounds / λ / prev_weights 參數化的問題：建立一次，之後只更新參數"""
+    
+    def __init__(self, req: OptimizerRequest):
+        N = len(req.expected_active_return)
+        self.template = req
+        self.mu = cp.Parameter(N)
+        self.risk_aversion = cp.Parameter(nonneg=True)
+        self.lower = cp.Parameter(N)
+        self.upper = cp.Parameter(N)
+        self.prev_weights = cp.Parameter(N)
+        
+        problem = _build_problem(
+            req,
+            active_ret=self.mu,
+            risk_aversion=self.risk_aversion,
+            bounds=(self.lower, self.upper),
+            prev_weights=self.prev_weights,
         )
-        
-        return result
+        super().__init__(
+            prob=problem.prob,
+            w=problem.w,
+            cost_linear=problem.cost_linear,
+            cost_quad=problem.cost_quad,
+        )
+    
+    def matches(self, req: OptimizerRequest) -> bool:
+        """req 與此問題結構相同（僅參數化欄位不同）"""
+        template = self.template
+        if len(req.expected_active_return) != len(template.expected_active_return):
+            return False
+        
+        for name in ("cov_matrix", "factor_betas", "sector_map", "benchmark_weights"):
+            if not _same_value(getattr(req, name), getattr(template, name)):
+                return False
+        
+        # 成本只透過 np.any / np.mean / np.diag 進入問題
+        if not _same_value(req.quad_cost, template.quad_cost):
+            return False
+        if bool(np.any(req.linear_cost)) != bool(np.any(template.linear_cost)):
+            return False
+        if np.any(req.linear_cost) and np.mean(req.linear_cost) != np.mean(template.linear_cost):
+            return False
+        
+        params = {k: v for k, v in req.params.items() if k not in _PARAMETRIZED_PARAMS}
+        template_params = {k: v for k, v in template.params.items() if k not in _PARAMETRIZED_PARAMS}
+        return _same_value(params, template_params)
+    
+    def assign(self, req: OptimizerRequest) -> None:
+        """將 req 的 μ / bounds / λ / prev_weights 寫入參數"""
+        lower, upper = req.bounds
+        self.mu.value = np.asarray(req.expected_active_return, dtype=float)
+        self.risk_aversion.value = float(req.params["lambda"])
+        self.lower.value = np.asarray(lower, dtype=float)
+        self.upper.value = np.asarray(upper, dtype=float)
+        self.prev_weights.value = np.asarray(req.prev_weights, dtype=float)
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """比較 request 欄位（ndarray / dict / list / 純量）是否相同"""
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.shape(a) == np.shape(b) and np.array_equal(a, b)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same_value(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(
+            _same_value(x, y) for x, y in zip(a, b)
+        )
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _build_result(
+    req: OptimizerRequest,
+    problem: _Problem,
+    solver: str,
+    timing: Dict[str, Any],
+) -> OptimizerResult:
+    """由已求解的問題計算後處理指標"""
+    prob = problem.prob
+    cost_linear, cost_quad = problem.cost_linear, problem.cost_quad
+    
+    # 取得最優權重
+    weights = problem.w.value
+    
+    if weights is None:
+        raise RuntimeError("Solver did not return optimal weights")
+    
+    active_ret = req.expected_active_return
+    Sigma = req.cov_matrix
+    betas = req.factor_betas
+    sectors = req.sector_map
+    TE_matrix = req.params.get("TE_matrix", None)
+    
+    # 計算後處理指標
+    turnover_val = float(np.sum(np.abs(weights - req.prev_weights)))
+    
+    # 計算 Tracking Error
+    TE_val = 0.0
+    if TE_matrix is not None:
+        w_active = weights - req.benchmark_weights
+        TE_val = float(np.sqrt(w_active.T @ TE_matrix @ w_active))
+    
+    # 計算因子暴露
+    factor_exposures = {}
+    if betas is not None and betas.size > 0:
+        X_val = betas.T @ weights
+        factor_names = req.params.get("factor_names", [f"factor_{i}" for i in range(len(X_val))])
+        for i, name in enumerate(factor_names[:len(X_val)]):
+            factor_exposures[name] = float(X_val[i])
+    
+    # 計算行業暴露
+    sector_exposures = {}
+    if sectors is not None and sectors.size > 0:
+        S_val = sectors.T @ weights
+        sector_names = req.params.get("sector_names", [f"sector_{i}" for i in range(len(S_val))])
+        for i, name in enumerate(sector_names[:len(S_val)]):
+            sector_exposures[name] = float(S_val[i])
+    
+    # 計算成本
+    # （成本項為 0 時是純量而非 cvxpy 表示式；表示式不可與 0 直接比較）
+    cost_val = float(cost_linear.value if isinstance(cost_linear, cp.Expression) else 0) + \
+               float(cost_quad.value if isinstance(cost_quad, cp.Expression) else 0)
+    
+    # 估計 Sharpe Ratio（簡化版）
+    expected_return = float(active_ret @ weights)
+    portfolio_risk = float(np.sqrt(weights.T @ Sigma @ weights))
+    sharpe_est = expected_return / portfolio_risk if portfolio_risk > 0 else 0.0
+    
+    # 建立結果物件
+    diagnostics = {
+        "status": prob.status,
+        "objective_value": float(prob.value) if prob.value is not None else None,
+        "solver": solver,
+    }
+    diagnostics.update(timing)
+    
+    return OptimizerResult(
+        weights=weights,
+        turnover=turnover_val,
+        TE=TE_val,
+        factor_exposures=factor_exposures,
+        sector_exposures=sector_exposures,
+        cost=cost_val,
+        sharpe_est=sharpe_est,
+        diagnostics=diagnostics,
+    )
+
 
+def _solve_chunk(
+    solver: str,
+    verbose: bool,
+    requests: List[OptimizerRequest],
+    offset: int,
+) -> List[OptimizerResult]:
+    """Process pool worker：在子行程中依序求解一段 requests"""
+    return OptimizerCoreV2(solver=solver, verbose=verbose)._solve_sequential(requests, offset)
@@ -24,6 +24,8 @@ from .path_a_backtest import (
     PathADataLoader,
     PathAErrorBridge,
 )
+from .path_a_price_cube import PathAPriceCube
+from .path_a_alpha_panel import PathAAlphaInputPanel, PathAAlphaPanelCache
 from .path_a_error_bridge import PathAErrorBridge as PathAErrorBridgeImpl
 from .mock_data_loader import MockPathADataLoader
 from .finmind_loader import FinMindPathADataLoader, FinMindClient
@@ -40,6 +42,9 @@ __all__ = [
     "PathADataLoader",
     "PathAErrorBridge",
     "PathAErrorBridgeImpl",
+    "PathAPriceCube",
+    "PathAAlphaInputPanel",
+    "PathAAlphaPanelCache",
     "MockPathADataLoader",
     "FinMindPathADataLoader",
     "FinMindClient",
@@ -14,7 +14,6 @@ Reference: docs/JGOD_FINMIND_LOADER_STANDARD_v1.md
 from __future__ import annotations
 
 import os
-import pickle
 from pathlib import Path
 from typing import Optional, Dict, Sequence
 from dataclasses import dataclass, field
@@ -24,6 +23,14 @@ import pandas as pd
 
 from jgod.path_a.path_a_schema import PathAConfig
 from jgod.path_a.path_a_backtest import PathADataLoader
+from jgod.path_a.finmind_range_cache import FinMindRangeCache
+from jgod.path_a.finmind_fetch_pool import (
+    ProgressFunc,
+    SymbolFetchStats,
+    fetch_symbols,
+    resolve_rate_limiter,
+)
+from jgod.utils.rate_limiter import RateLimiter
 from jgod.path_a.mock_data_loader import MockPathADataLoader, MockConfig
 
 try:
@@ -50,6 +57,13 @@ class FinMindLoaderConfig:
     max_retries: int = 3
     retry_delay: float = 1.0  # seconds
     
+    # Concurrent fetch settings (API calls always go through a shared RateLimiter)
+    fetch_workers: int = 1  # > 1: fetch symbols in a thread pool
+    rate_limiter: Optional[RateLimiter] = None  # None: a loader-owned one
+    max_calls_per_minute: int = 80
+    max_calls_per_hour: int = 5800
+    fetch_progress: Optional[ProgressFunc] = None  # progress(stats, completed, total)
+    
     # Data validation
     min_data_days: int = 1  # Minimum days required
     max_price_change: float = 0.20  # Reject if price changes > 20% in one day
@@ -99,9 +113,22 @@ class FinMindPathADataLoader(PathADataLoader):
         else:
             self.client = client
         
-        # Initialize cache directory
+        # Rate limiter shared by all fetch threads (acquired around every API attempt)
+        self.rate_limiter: RateLimiter = resolve_rate_limiter(
+            self.config.rate_limiter,
+            self.config.max_calls_per_minute,
+            self.config.max_calls_per_hour,
+        )
+        
+        # Per-symbol metrics of the last load_price_frame call
+        self.fetch_stats: Dict[str, SymbolFetchStats] = {}
+        
+        # Initialize range-aware cache (per-symbol, date-partitioned)
+        self.range_cache: Optional[FinMindRangeCache] = None
         if self.config.cache_enabled:
-            self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.range_cache = FinMindRangeCache(
+                self.config.cache_dir, use_parquet=True
+            )
         
         # Initialize mock loader for fallback
         self.mock_loader: Optional[MockPathADataLoader] = None
@@ -109,34 +136,6 @@ class FinMindPathADataLoader(PathADataLoader):
             mock_config = self.config.mock_config or MockConfig(seed=999)
             self.mock_loader = MockPathADataLoader(config=mock_config)
     
-    def _get_cache_path(self, symbol: str, start_date: str, end_date: str) -> Path:
-        """Get cache file path for a symbol and date range."""
-        cache_key = f"{symbol}_{start_date}_{end_date}.pkl"
-        return self.config.cache_dir / cache_key
-    
-    def _load_from_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
-        """Load data from cache if available."""
-        if not self.config.cache_enabled or not cache_path.exists():
-            return None
-        
-        try:
-            with open(cache_path, 'rb') as f:
-                return pickle.load(f)
-        except Exception as e:
-            print(f"Warning: Failed to load cache {cache_path}: {e}")
-            return None
-    
-    def _save_to_cache(self, data: pd.DataFrame, cache_path: Path) -> None:
-        """Save data to cache."""
-        if not self.config.cache_enabled:
-            return
-        
-        try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
-        except Exception as e:
-            print(f"Warning: Failed to save cache {cache_path}: {e}")
-    
     def _fetch_finmind_data(
         self,
         symbol: str,
@@ -150,20 +149,38 @@ class FinMindPathADataLoader(PathADataLoader):
             DataFrame with columns: date, open, high, low, close, volume
             Returns None if fetch fails after retries
         """
+        # Range cache: serve covered dates locally, fetch only the missing gaps
+        if self.range_cache is not None:
+            fetch = self._fetch_from_api if self.client is not None else None
+            return self.range_cache.get(symbol, start_date, end_date, fetch=fetch)
+        
         if self.client is None:
             return None
         
-        # Check cache first
-        cache_path = self._get_cache_path(symbol, start_date, end_date)
-        cached_data = self._load_from_cache(cache_path)
-        if cached_data is not None:
-            return cached_data
+        df = self._fetch_from_api(symbol, start_date, end_date)
+        if df is None or df.empty:
+            return None
+        return df
+    
+    def _fetch_from_api(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch a date range from the FinMind API with retry logic.
         
+        Returns:
+            Raw DataFrame (empty if the API keeps returning no rows),
+            or None if every attempt raised
+        """
         # Extract stock_id from symbol (e.g., "2330.TW" -> "2330")
         stock_id = symbol.split('.')[0] if '.' in symbol else symbol
         
         # Fetch with retry
         for attempt in range(self.config.max_retries):
+            self.rate_limiter.acquire("price")
             try:
                 df = self.client.get_stock_daily(
                     stock_id=stock_id,
@@ -174,15 +191,12 @@ class FinMindPathADataLoader(PathADataLoader):
                 if df is None or (isinstance(df, pd.DataFrame) and df.empty):
                     if attempt < self.config.max_retries - 1:
                         continue
-                    return None
+                    return pd.DataFrame()
                 
                 # Ensure DataFrame
                 if not isinstance(df, pd.DataFrame):
                     df = pd.DataFrame(df)
                 
-                # Save to cache
-                self._save_to_cache(df, cache_path)
-                
                 return df
                 
             except Exception as e:
@@ -408,21 +422,16 @@ class FinMindPathADataLoader(PathADataLoader):
         
         symbols: Sequence[str] = config.universe
         
-        # Collect data for all symbols
-        all_data: Dict[str, pd.DataFrame] = {}
-        missing_symbols: list[str] = []
-        
-        for symbol in symbols:
-            raw_data = self.load_raw_finmind(
-                symbol,
-                config.start_date,
-                config.end_date,
-            )
-            
-            if raw_data is None or raw_data.empty:
-                missing_symbols.append(symbol)
-            else:
-                all_data[symbol] = raw_data
+        # Collect data for all symbols (concurrently when fetch_workers > 1)
+        all_data, self.fetch_stats = fetch_symbols(
+            symbols,
+            lambda symbol: self.load_raw_finmind(symbol, config.start_date, config.end_date),
+            max_workers=self.config.fetch_workers,
+            progress=self.config.fetch_progress,
+        )
+        missing_symbols: list[str] = [
+            symbol for symbol, stats in self.fetch_stats.items() if stats.status != "ok"
+        ]
         
         # Fallback to mock for missing symbols
         if missing_symbols and self.mock_loader is not None:
@@ -23,6 +23,14 @@ import pandas as pd
 
 from jgod.path_a.path_a_schema import PathAConfig
 from jgod.path_a.path_a_backtest import PathADataLoader
+from jgod.path_a.finmind_range_cache import FinMindRangeCache
+from jgod.path_a.finmind_fetch_pool import (
+    ProgressFunc,
+    SymbolFetchStats,
+    fetch_symbols,
+    resolve_rate_limiter,
+)
+from jgod.utils.rate_limiter import RateLimiter
 
 try:
     from api_clients.finmind_client import FinMindClient
@@ -69,6 +77,13 @@ class FinMindLoaderConfigExtreme:
     max_retries: int = 3
     retry_delay: float = 1.0
     
+    # Concurrent fetch settings (API calls always go through a shared RateLimiter)
+    fetch_workers: int = 1  # > 1: fetch symbols in a thread pool
+    rate_limiter: Optional[RateLimiter] = None  # None: a loader-owned one
+    max_calls_per_minute: int = 80
+    max_calls_per_hour: int = 5800
+    fetch_progress: Optional[ProgressFunc] = None  # progress(stats, completed, total)
+    
     # Data integrity settings
     zscore_threshold: float = 6.0  # Outlier threshold
     gap_threshold: float = 0.15  # ±15% gap threshold
@@ -122,9 +137,22 @@ class FinMindPathADataLoaderExtreme(PathADataLoader):
         else:
             self.client = client
         
-        # Initialize cache directory
+        # Rate limiter shared by all fetch threads (acquired around every API attempt)
+        self.rate_limiter: RateLimiter = resolve_rate_limiter(
+            self.config.rate_limiter,
+            self.config.max_calls_per_minute,
+            self.config.max_calls_per_hour,
+        )
+        
+        # Per-symbol metrics of the last load_price_frame call
+        self.fetch_stats: Dict[str, SymbolFetchStats] = {}
+        
+        # Initialize range-aware cache (per-symbol, date-partitioned)
+        self.range_cache: Optional[FinMindRangeCache] = None
         if self.config.cache_enabled:
-            self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.range_cache = FinMindRangeCache(
+                self.config.cache_dir, use_parquet=self.config.use_parquet_cache
+            )
         
         # Initialize mock extreme loader for fallback
         self.mock_loader: Optional[MockPathADataLoaderExtreme] = None
@@ -132,45 +160,6 @@ class FinMindPathADataLoaderExtreme(PathADataLoader):
             mock_config = self.config.mock_config_extreme or MockConfigExtreme(seed=999)
             self.mock_loader = MockPathADataLoaderExtreme(config=mock_config)
     
-    def _get_cache_path(self, symbol: str, start_date: str, end_date: str) -> Path:
-        """Get cache file path for a symbol and date range."""
-        if self.config.use_parquet_cache and PARQUET_AVAILABLE:
-            cache_key = f"{symbol}_{start_date}_{end_date}.parquet"
-        else:
-            cache_key = f"{symbol}_{start_date}_{end_date}.pkl"
-        return self.config.cache_dir / cache_key
-    
-    def _load_from_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
-        """Load data from cache (Parquet or pickle)."""
-        if not self.config.cache_enabled or not cache_path.exists():
-            return None
-        
-        try:
-            if cache_path.suffix == ".parquet" and PARQUET_AVAILABLE:
-                return pd.read_parquet(cache_path)
-            else:
-                import pickle
-                with open(cache_path, 'rb') as f:
-                    return pickle.load(f)
-        except Exception as e:
-            print(f"Warning: Failed to load cache {cache_path}: {e}")
-            return None
-    
-    def _save_to_cache(self, data: pd.DataFrame, cache_path: Path) -> None:
-        """Save data to cache (Parquet or pickle)."""
-        if not self.config.cache_enabled:
-            return
-        
-        try:
-            if cache_path.suffix == ".parquet" and PARQUET_AVAILABLE:
-                data.to_parquet(cache_path, index=True)
-            else:
-                import pickle
-                with open(cache_path, 'wb') as f:
-                    pickle.dump(data, f)
-        except Exception as e:
-            print(f"Warning: Failed to save cache {cache_path}: {e}")
-    
     def _check_missing_dates(
         self,
         df: pd.DataFrame,
@@ -345,21 +334,39 @@ class FinMindPathADataLoaderExtreme(PathADataLoader):
         start_date: str,
         end_date: str,
     ) -> Optional[pd.DataFrame]:
-        """Fetch data from FinMind API with retry logic."""
+        """Fetch data for a date range (range cache first, then FinMind API)."""
+        # Range cache: serve covered dates locally, fetch only the missing gaps
+        if self.range_cache is not None:
+            fetch = self._fetch_from_api if self.client is not None else None
+            return self.range_cache.get(symbol, start_date, end_date, fetch=fetch)
+        
         if self.client is None:
             return None
         
-        # Check cache first
-        cache_path = self._get_cache_path(symbol, start_date, end_date)
-        cached_data = self._load_from_cache(cache_path)
-        if cached_data is not None:
-            return cached_data
+        df = self._fetch_from_api(symbol, start_date, end_date)
+        if df is None or df.empty:
+            return None
+        return df
+    
+    def _fetch_from_api(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch a date range from the FinMind API with retry logic.
         
-        # Extract stock_id
+        Returns:
+            Raw DataFrame (empty if the API keeps returning no rows),
+            or None if every attempt raised
+        """
+        # Extract stock_id from symbol (e.g., "2330.TW" -> "2330")
         stock_id = symbol.split('.')[0] if '.' in symbol else symbol
         
         # Fetch with retry
         for attempt in range(self.config.max_retries):
+            self.rate_limiter.acquire("price")
             try:
                 df = self.client.get_stock_daily(
                     stock_id=stock_id,
@@ -370,14 +377,12 @@ class FinMindPathADataLoaderExtreme(PathADataLoader):
                 if df is None or (isinstance(df, pd.DataFrame) and df.empty):
                     if attempt < self.config.max_retries - 1:
                         continue
-                    return None
+                    return pd.DataFrame()
                 
+                # Ensure DataFrame
                 if not isinstance(df, pd.DataFrame):
                     df = pd.DataFrame(df)
                 
-                # Save to cache
-                self._save_to_cache(df, cache_path)
-                
                 return df
                 
             except Exception as e:
@@ -485,23 +490,17 @@ class FinMindPathADataLoaderExtreme(PathADataLoader):
         
         symbols: Sequence[str] = config.universe
         
-        # Collect data for all symbols
-        all_data: Dict[str, pd.DataFrame] = {}
-        missing_symbols: list[str] = []
-        data_sources: Dict[str, str] = {}  # Track data source
-        
-        for symbol in symbols:
-            raw_data = self.load_raw_finmind(
-                symbol,
-                config.start_date,
-                config.end_date,
-            )
-            
-            if raw_data is None or raw_data.empty:
-                missing_symbols.append(symbol)
-            else:
-                all_data[symbol] = raw_data
-                data_sources[symbol] = "finmind"
+        # Collect data for all symbols (concurrently when fetch_workers > 1)
+        all_data, self.fetch_stats = fetch_symbols(
+            symbols,
+            lambda symbol: self.load_raw_finmind(symbol, config.start_date, config.end_date),
+            max_workers=self.config.fetch_workers,
+            progress=self.config.fetch_progress,
+        )
+        missing_symbols: list[str] = [
+            symbol for symbol, stats in self.fetch_stats.items() if stats.status != "ok"
+        ]
+        data_sources: Dict[str, str] = {symbol: "finmind" for symbol in all_data}  # Track data source
         
         # Fallback to mock extreme for missing symbols
         if missing_symbols and self.mock_loader is not None:
@@ -0,0 +1,122 @@
+"""
+FinMind Fetch Pool - bounded concurrent per-symbol loading
+
+The FinMind loaders fetch one symbol at a time, so a large universe is pure
+sequential network latency. fetch_symbols runs the per-symbol loader in a
+bounded thread pool (the work is I/O bound) and records per-symbol metrics.
+
+Quota safety does not depend on the pool size: every API attempt goes through
+one shared, thread-safe RateLimiter (jgod/utils/rate_limiter.py), either the
+configured one or one owned by the loader (see resolve_rate_limiter).
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from jgod.utils.rate_limiter import RateLimiter
+
+
+# load(symbol) -> normalized rows or None when no data is available
+SymbolLoadFunc = Callable[[str], Optional[pd.DataFrame]]
+
+# progress(stats, completed, total)
+ProgressFunc = Callable[["SymbolFetchStats", int, int], None]
+
+
+@dataclass
+class SymbolFetchStats:
+    """
+    Per-symbol fetch metrics.
+
+    Attributes:
+        symbol: Symbol identifier
+        status: "ok" (rows loaded) or "missing" (no data, falls back to mock)
+        rows: Number of rows returned
+        elapsed: Wall-clock seconds spent on this symbol (incl. rate-limit waits)
+    """
+
+    symbol: str
+    status: str
+    rows: int = 0
+    elapsed: float = 0.0
+
+
+def resolve_rate_limiter(
+    rate_limiter: Optional[RateLimiter],
+    max_calls_per_minute: Optional[int],
+    max_calls_per_hour: Optional[int],
+) -> RateLimiter:
+    """
+    Rate limiter the loader acquires before each of its own API attempts.
+
+    An explicitly configured limiter is used as is (share one instance across
+    loaders to share a quota); otherwise the loader owns one. A limiter the
+    client may carry is not relied on: it only covers the client's own
+    wrapper methods, not the call the loader makes.
+    """
+    if rate_limiter is not None:
+        return rate_limiter
+    return RateLimiter(minute_limit=max_calls_per_minute, hour_limit=max_calls_per_hour)
+
+
+def fetch_symbols(
+    symbols: Sequence[str],
+    load: SymbolLoadFunc,
+    max_workers: int = 1,
+    progress: Optional[ProgressFunc] = None,
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, SymbolFetchStats]]:
+    """
+    Load every symbol, concurrently when max_workers > 1.
+
+    Args:
+        symbols: Symbols to load (duplicates are loaded once)
+        load: Per-symbol loader
+        max_workers: Thread pool size; 1 keeps the serial loop
+        progress: Optional callback invoked after each symbol completes
+
+    Returns:
+        (data, stats): rows for symbols that returned data, and metrics for
+        every symbol in input order
+
+    Exceptions raised by load propagate, as in the serial loop.
+    """
+    unique: List[str] = list(dict.fromkeys(symbols))
+    data: Dict[str, pd.DataFrame] = {}
+    stats: Dict[str, SymbolFetchStats] = {}
+
+    def record(result: Tuple[Optional[pd.DataFrame], SymbolFetchStats]) -> None:
+        rows, symbol_stats = result
+        if rows is not None:
+            data[symbol_stats.symbol] = rows
+        stats[symbol_stats.symbol] = symbol_stats
+        if progress is not None:
+            progress(symbol_stats, len(stats), len(unique))
+
+    if max_workers <= 1 or len(unique) <= 1:
+        for symbol in unique:
+            record(_load_one(symbol, load))
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+            futures = [executor.submit(_load_one, symbol, load) for symbol in unique]
+            for future in as_completed(futures):
+                record(future.result())
+
+    return data, {symbol: stats[symbol] for symbol in unique}
+
+
+def _load_one(
+    symbol: str,
+    load: SymbolLoadFunc,
+) -> Tuple[Optional[pd.DataFrame], SymbolFetchStats]:
+    start = time.perf_counter()
+    rows = load(symbol)
+    elapsed = time.perf_counter() - start
+    if rows is None or rows.empty:
+        return None, SymbolFetchStats(symbol=symbol, status="missing", elapsed=elapsed)
+    return rows, SymbolFetchStats(symbol=symbol, status="ok", rows=len(rows), elapsed=elapsed)
@@ -0,0 +1,330 @@
+"""
+FinMind Range Cache - per-symbol, date-partitioned, append-only store
+
+The original FinMind loaders keyed cache files by the exact request string
+`{symbol}_{start}_{end}`, so a walk-forward run whose windows overlap (or are
+sub-ranges of an existing file) went back to the API for every new window.
+
+This store keeps, per symbol:
+
+    {cache_dir}/{symbol}/{YYYY}.parquet   raw FinMind rows, one file per year
+    {cache_dir}/{symbol}/coverage.json    merged calendar ranges already fetched
+
+A request is answered from local partitions for the covered part; only the
+missing gaps are fetched, appended to their year partitions and compacted
+(deduplicated by date, sorted). Coverage is tracked by *requested* range, not
+by returned dates, so weekends / holidays / suspended days inside a range that
+returned rows are not refetched. A fetch that returns no rows only covers a
+weekend-only gap; an empty answer for weekdays is retried on the next call.
+Dates from today onward are never marked covered because their bars may not be
+published yet.
+
+Legacy `{symbol}_{start}_{end}.parquet|pkl` files in cache_dir are imported
+the first time a symbol is accessed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# (start, end) inclusive calendar range as "YYYY-MM-DD" strings
+DateRange = Tuple[str, str]
+
+# fetch(symbol, start_date, end_date) -> raw rows (may be empty) or None on failure
+FetchFunc = Callable[[str, str, str], Optional[pd.DataFrame]]
+
+
+class FinMindRangeCache:
+    """
+    Range-aware FinMind cache.
+
+    Args:
+        cache_dir: Root cache directory (shared with the legacy file layout)
+        use_parquet: Store partitions as Parquet when pyarrow is available,
+            otherwise pickle
+        today: Override for the current date (tests); dates >= today are
+            never marked covered
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        use_parquet: bool = True,
+        today: Optional[date] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.suffix = ".parquet" if use_parquet and PARQUET_AVAILABLE else ".pkl"
+        self._today = today
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        fetch: Optional[FetchFunc] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Return raw rows for [start_date, end_date], fetching only missing gaps.
+
+        Args:
+            symbol: Symbol identifier (e.g. "2330.TW")
+            start_date / end_date: Inclusive range (YYYY-MM-DD)
+            fetch: Gap fetcher; None serves local data only
+
+        Returns:
+            Rows sorted by date (date as "YYYY-MM-DD" strings), or None if no
+            rows are available for the range
+        """
+        start_date, end_date = _to_str(start_date), _to_str(end_date)
+        coverage, imported = self._load_coverage(symbol)
+
+        if fetch is not None:
+            settled_end = _to_str(self._settled_date())
+            fetched_any = False
+            for gap_start, gap_end in _subtract(coverage, (start_date, end_date)):
+                rows = fetch(symbol, gap_start, gap_end)
+                if rows is None:
+                    # fetch failed: leave the gap uncovered so the next call retries
+                    continue
+                if rows.empty and _has_weekdays(gap_start, gap_end):
+                    # no rows for a range with weekdays may be a transient outage
+                    # (the loader returns an empty frame once retries run out)
+                    continue
+                self._append(symbol, rows)
+                covered_end = min(gap_end, settled_end)
+                if covered_end >= gap_start:
+                    coverage = _merge(coverage + [(gap_start, covered_end)])
+                fetched_any = True
+            if fetched_any:
+                self._save_coverage(symbol, coverage, imported)
+
+        rows = self._read(symbol, start_date, end_date)
+        return rows if not rows.empty else None
+
+    def missing_ranges(self, symbol: str, start_date: str, end_date: str) -> List[DateRange]:
+        """Sub-ranges of [start_date, end_date] that are not cached yet."""
+        coverage, _ = self._load_coverage(symbol)
+        return _subtract(coverage, (_to_str(start_date), _to_str(end_date)))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.cache_dir / symbol
+
+    def _coverage_path(self, symbol: str) -> Path:
+        return self._symbol_dir(symbol) / "coverage.json"
+
+    def _partition_path(self, symbol: str, year: int, suffix: Optional[str] = None) -> Path:
+        return self._symbol_dir(symbol) / f"{year}{suffix or self.suffix}"
+
+    def _load_coverage(self, symbol: str) -> Tuple[List[DateRange], List[str]]:
+        """Coverage ranges and imported legacy files (importing new legacy files)."""
+        coverage: List[DateRange] = []
+        imported: List[str] = []
+        path = self._coverage_path(symbol)
+        if path.exists():
+            try:
+                meta = json.loads(path.read_text())
+                coverage = [tuple(r) for r in meta.get("ranges", [])]
+                imported = list(meta.get("imported", []))
+            except (OSError, ValueError) as e:
+                print(f"Warning: Failed to read cache coverage {path}: {e}")
+
+        legacy = [f for f in self._legacy_files(symbol) if f[0].name not in imported]
+        if legacy:
+            for file_path, legacy_start, legacy_end in legacy:
+                rows = _read_frame(file_path)
+                imported.append(file_path.name)
+                if rows is None:
+                    continue
+                self._append(symbol, rows)
+                # a legacy file is complete only up to the day before it was written
+                written = datetime.fromtimestamp(file_path.stat().st_mtime).date()
+                covered_end = min(legacy_end, _to_str(written - timedelta(days=1)))
+                if covered_end >= legacy_start:
+                    coverage.append((legacy_start, covered_end))
+            coverage = _merge(coverage)
+            self._save_coverage(symbol, coverage, imported)
+
+        return coverage, imported
+
+    def _save_coverage(self, symbol: str, coverage: List[DateRange], imported: List[str]) -> None:
+        meta = {"ranges": [list(r) for r in coverage], "imported": imported}
+        _atomic_write(
+            self._coverage_path(symbol),
+            lambda tmp: tmp.write_text(json.dumps(meta, indent=2)),
+        )
+
+    def _legacy_files(self, symbol: str) -> List[Tuple[Path, str, str]]:
+        pattern = re.compile(
+            rf"^{re.escape(symbol)}_(\d{{4}}-\d{{2}}-\d{{2}})_(\d{{4}}-\d{{2}}-\d{{2}})\.(parquet|pkl)$"
+        )
+        files = []
+        for file_path in sorted(self.cache_dir.glob(f"{symbol}_*")):
+            match = pattern.match(file_path.name)
+            if match and file_path.is_file():
+                files.append((file_path, match.group(1), match.group(2)))
+        return files
+
+    def _append(self, symbol: str, rows: pd.DataFrame) -> None:
+        """Append rows to their year partitions and compact each touched partition."""
+        if rows is None or rows.empty or "date" not in rows.columns:
+            return
+        rows = rows.copy()
+        rows["date"] = pd.to_datetime(rows["date"]).dt.strftime(DATE_FORMAT)
+
+        for year, new_rows in rows.groupby(rows["date"].str[:4]):
+            existing = self._read_partition(symbol, int(year))
+            merged = pd.concat([existing, new_rows], ignore_index=True) if existing is not None else new_rows
+            merged = (
+                merged.drop_duplicates(subset="date", keep="last")
+                .sort_values("date")
+                .reset_index(drop=True)
+            )
+            path = self._partition_path(symbol, int(year))
+            _atomic_write(path, lambda tmp: _write_frame(merged, tmp, self.suffix))
+            # a partition written in the other format is superseded
+            for other in (".parquet", ".pkl"):
+                stale = self._partition_path(symbol, int(year), other)
+                if other != self.suffix and stale.exists():
+                    stale.unlink()
+
+    def _read_partition(self, symbol: str, year: int) -> Optional[pd.DataFrame]:
+        for suffix in (self.suffix, ".parquet", ".pkl"):
+            path = self._partition_path(symbol, year, suffix)
+            if path.exists():
+                return _read_frame(path)
+        return None
+
+    def _read(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        frames = []
+        for year in range(int(start_date[:4]), int(end_date[:4]) + 1):
+            partition = self._read_partition(symbol, year)
+            if partition is not None and not partition.empty:
+                frames.append(partition)
+        if not frames:
+            return pd.DataFrame()
+        rows = pd.concat(frames, ignore_index=True)
+        mask = (rows["date"] >= start_date) & (rows["date"] <= end_date)
+        # partitions hold the union of every fetch's columns; drop the ones this
+        # range never filled (e.g. legacy files written with another schema)
+        return rows[mask].dropna(axis=1, how="all").reset_index(drop=True)
+
+    def _settled_date(self) -> date:
+        """Last date whose bars are considered final (yesterday)."""
+        return (self._today or date.today()) - timedelta(days=1)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _to_str(value) -> str:
+    return pd.Timestamp(value).strftime(DATE_FORMAT)
+
+
+def _next_day(value: str) -> str:
+    return _to_str(pd.Timestamp(value) + timedelta(days=1))
+
+
+def _prev_day(value: str) -> str:
+    return _to_str(pd.Timestamp(value) - timedelta(days=1))
+
+
+def _has_weekdays(start: str, end: str) -> bool:
+    """Whether the inclusive range contains a Monday-Friday date."""
+    return len(pd.bdate_range(start, end)) > 0
+
+
+def _merge(ranges: List[DateRange]) -> List[DateRange]:
+    """Merge overlapping or adjacent inclusive ranges."""
+    merged: List[DateRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= _next_day(merged[-1][1]):
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _subtract(coverage: List[DateRange], request: DateRange) -> List[DateRange]:
+    """Parts of request not covered by the (merged) coverage ranges."""
+    start, end = request
+    gaps: List[DateRange] = []
+    cursor = start
+    for cov_start, cov_end in coverage:
+        if cov_end < cursor:
+            continue
+        if cov_start > end:
+            break
+        if cov_start > cursor:
+            gaps.append((cursor, _prev_day(cov_start)))
+        cursor = _next_day(cov_end)
+        if cursor > end:
+            return gaps
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _read_frame(path: Path) -> Optional[pd.DataFrame]:
+    try:
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+        else:
+            with open(path, "rb") as f:
+                frame = pickle.load(f)
+    except Exception as e:
+        print(f"Warning: Failed to load cache {path}: {e}")
+        return None
+    if isinstance(frame, pd.DataFrame) and "date" in frame.columns:
+        frame = frame.copy()
+        frame["date"] = pd.to_datetime(frame["date"]).dt.strftime(DATE_FORMAT)
+        return frame
+    return None
+
+
+def _write_frame(frame: pd.DataFrame, path: Path, suffix: str) -> None:
+    if suffix == ".parquet":
+        frame.to_parquet(path, index=False)
+    else:
+        with open(path, "wb") as f:
+            pickle.dump(frame, f)
+
+
+def _atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """Write via a temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
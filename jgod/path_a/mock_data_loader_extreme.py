@@ -39,6 +39,10 @@ class MockConfigExtreme:
     # Random seed for reproducibility
     seed: int = 42
     
+    # Generator: True simulates all symbols at once as (days × symbols) arrays;
+    # False keeps the per-symbol, per-day legacy loops (bit-identical to older runs)
+    vectorized: bool = True
+    
     # OU Process parameters (Ornstein-Uhlenbeck for mean reversion)
     ou_theta: float = 0.1  # Mean reversion speed
     ou_mu: float = 0.0005  # Long-term mean return
@@ -278,28 +282,24 @@ class MockPathADataLoaderExtreme(PathADataLoader):
         
         return pd.Series(volumes, index=dates)
     
-    def load_price_frame(self, config: PathAConfig) -> pd.DataFrame:
+    def _simulate_paths_legacy(
+        self,
+        rng: np.random.Generator,
+        dates: pd.DatetimeIndex,
+        symbols: Sequence[str],
+    ) -> Dict[str, np.ndarray]:
         """
-        Generate extreme-realistic price frame.
+        Per-symbol simulation (legacy draw order).
         
-        Format:
-            index: date (DatetimeIndex)
-            columns: MultiIndex (symbol, field)
+        Returns:
+            Dict field -> (n_days, n_symbols) array
         """
-        rng = np.random.default_rng(self.config.seed)
-        dates = self._build_date_index(config)
-        symbols: Sequence[str] = config.universe
-        
-        # Step 1: Simulate prices using OU process
+        # Step 1: Simulate prices using OU process (+ shocks)
         close_prices_dict = {}
         for symbol in symbols:
             base_price = self.config.base_prices.get(symbol, 100.0)
             close_series = self._simulate_ou_process(rng, dates, base_price)
-            
-            # Apply price shocks
-            close_series = self._apply_price_shocks(rng, close_series, dates)
-            
-            close_prices_dict[symbol] = close_series
+            close_prices_dict[symbol] = self._apply_price_shocks(rng, close_series, dates)
         
         # Step 2: Build OHLC from close prices
         ohlcv_dict = {}
@@ -313,39 +313,99 @@ class MockPathADataLoaderExtreme(PathADataLoader):
         # Step 3: Simulate volumes
         volumes_dict = {}
         for symbol in symbols:
-            volumes_dict[symbol] = self._simulate_volumes_extreme(
-                rng,
-                dates,
-                symbol
-            )
+            volumes_dict[symbol] = self._simulate_volumes_extreme(rng, dates, symbol)
         
-        # Step 4: Build MultiIndex DataFrame
-        arrays = []
-        data_rows = []
+        paths = {
+            field: np.column_stack([ohlcv_dict[symbol][field].values for symbol in symbols])
+            for field in ("open", "high", "low", "close")
+        }
+        paths["volume"] = np.column_stack([volumes_dict[symbol].values for symbol in symbols])
+        return paths
+    
+    def _simulate_paths_vectorized(
+        self,
+        rng: np.random.Generator,
+        dates: pd.DatetimeIndex,
+        symbols: Sequence[str],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Simulate all symbols at once.
         
-        for symbol in symbols:
-            arrays.extend([
-                (symbol, "open"),
-                (symbol, "high"),
-                (symbol, "low"),
-                (symbol, "close"),
-                (symbol, "volume"),
-            ])
-        
-        for date in dates:
-            row_data = []
-            for symbol in symbols:
-                row_data.extend([
-                    ohlcv_dict[symbol]["open"].loc[date],
-                    ohlcv_dict[symbol]["high"].loc[date],
-                    ohlcv_dict[symbol]["low"].loc[date],
-                    ohlcv_dict[symbol]["close"].loc[date],
-                    volumes_dict[symbol].loc[date],
-                ])
-            data_rows.append(row_data)
-        
-        columns = pd.MultiIndex.from_tuples(arrays, names=["symbol", "field"])
-        price_frame = pd.DataFrame(data_rows, index=dates, columns=columns)
+        Same processes and distributions as the per-symbol methods
+        (_simulate_ou_process, _apply_price_shocks, _build_ohlcv_from_close_extreme,
+        _simulate_volumes_extreme), drawn as (n_days, n_symbols) arrays. Output is
+        reproducible per seed but not draw-for-draw identical to the legacy path.
+        
+        Returns:
+            Dict field -> (n_days, n_symbols) array
+        """
+        cfg = self.config
+        n_days, n_symbols = len(dates), len(symbols)
+        base_prices = np.array([cfg.base_prices.get(symbol, 100.0) for symbol in symbols])
+        
+        # Step 1: OU process in log space, x_t = log(P_t / P_0):
+        #   x_t = x_{t-1} + θ(μ - x_{t-1}) + σ_t ε_t
+        vol_mid = (cfg.ou_sigma_min + cfg.ou_sigma_max) / 2
+        sigma = rng.uniform(cfg.ou_sigma_min, cfg.ou_sigma_max, size=(n_days - 1, n_symbols))
+        sigma *= self._get_volatility_regime_value() / vol_mid
+        shocks = sigma * rng.standard_normal(size=(n_days - 1, n_symbols))
+        
+        log_paths = np.zeros((n_days, n_symbols))
+        for t in range(1, n_days):
+            prev = log_paths[t - 1]
+            log_paths[t] = prev + cfg.ou_theta * (cfg.ou_mu - prev) + shocks[t - 1]
+        close = base_prices * np.exp(log_paths)
+        
+        # Price shocks (applied to the close only, not fed back into the OU path)
+        if cfg.allow_shocks and n_days > 1:
+            hit = rng.random(size=(n_days - 1, n_symbols)) < cfg.shock_probability
+            n_hits = int(hit.sum())
+            signs = rng.choice([-1, 1], size=n_hits)
+            magnitudes = rng.uniform(cfg.shock_magnitude * 0.5, cfg.shock_magnitude, size=n_hits)
+            factors = np.ones((n_days - 1, n_symbols))
+            factors[hit] = 1.0 + signs * magnitudes
+            close[1:] *= factors
+        
+        # Step 2: OHLC from close
+        open_ = close.copy()
+        open_[1:] = close[:-1] * rng.uniform(0.995, 1.005, size=(n_days - 1, n_symbols))
+        max_price = np.maximum(open_, close)
+        min_price = np.minimum(open_, close)
+        high_range = rng.uniform(0.001, 0.03, size=(n_days, n_symbols))
+        low_range = rng.uniform(0.001, 0.03, size=(n_days, n_symbols))
+        high = np.maximum.reduce([max_price * (1.0 + high_range), max_price, close * 1.001])
+        low = np.minimum.reduce([min_price * (1.0 - low_range), min_price, close * 0.999])
+        
+        # Step 3: Volumes (symbol base level × Gamma noise)
+        multipliers = np.array([cfg.volume_base_multiplier.get(symbol, 10.0) for symbol in symbols])
+        base_volume = rng.uniform(cfg.volume_base_min, cfg.volume_base_max, size=n_symbols)
+        gamma = rng.gamma(cfg.volume_gamma_shape, cfg.volume_gamma_scale, size=(n_days, n_symbols))
+        volume = np.maximum(base_volume * multipliers * gamma, 100.0)
+        
+        return {"open": open_, "high": high, "low": low, "close": close, "volume": volume}
+    
+    def load_price_frame(self, config: PathAConfig) -> pd.DataFrame:
+        """
+        Generate extreme-realistic price frame.
+        
+        Format:
+            index: date (DatetimeIndex)
+            columns: MultiIndex (symbol, field)
+        """
+        rng = np.random.default_rng(self.config.seed)
+        dates = self._build_date_index(config)
+        symbols: Sequence[str] = config.universe
+        
+        if self.config.vectorized:
+            paths = self._simulate_paths_vectorized(rng, dates, symbols)
+        else:
+            paths = self._simulate_paths_legacy(rng, dates, symbols)
+        
+        # Build MultiIndex DataFrame in one shot: (days, symbols, fields) -> (days, symbols × fields)
+        fields = ["open", "high", "low", "close", "volume"]
+        values = np.stack([paths[f] for f in fields], axis=2).reshape(len(dates), len(symbols) * len(fields))
+        columns = pd.MultiIndex.from_product([list(symbols), fields], names=["symbol", "field"])
+        price_frame = pd.DataFrame(values, index=dates, columns=columns)
         
         return price_frame.astype(float)
     
@@ -414,12 +474,16 @@ class MockPathADataLoaderExtreme(PathADataLoader):
         momentum_10d = (close_df / close_df.shift(10) - 1).fillna(0.0)
         
         # ATR (Average True Range) 14
-        true_range = pd.DataFrame(index=dates, columns=symbols)
-        for symbol in symbols:
-            high_low = high_df[symbol] - low_df[symbol]
-            high_close = (high_df[symbol] - close_df[symbol].shift(1)).abs()
-            low_close = (low_df[symbol] - close_df[symbol].shift(1)).abs()
-            true_range[symbol] = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+        prev_close = close_df.shift(1)
+        high_low = (high_df - low_df).values
+        high_close = (high_df - prev_close).abs().values
+        low_close = (low_df - prev_close).abs().values
+        # fmax ignores the NaN of the first row's previous close
+        true_range = pd.DataFrame(
+            np.fmax(np.fmax(high_low, high_close), low_close),
+            index=dates,
+            columns=list(symbols),
+        )
         
         atr_14 = true_range.rolling(window=14, min_periods=1).mean().fillna(0.0)
         
@@ -429,66 +493,47 @@ class MockPathADataLoaderExtreme(PathADataLoader):
         rolling_kurtosis = returns.rolling(window=20, min_periods=5).kurt().fillna(0.0)
         
         # VWAP (Volume Weighted Average Price) - 14-day
-        vwap_14 = pd.DataFrame(index=dates, columns=symbols)
-        for symbol in symbols:
-            typical_price = (high_df[symbol] + low_df[symbol] + close_df[symbol]) / 3
-            pv = typical_price * volume_df[symbol]
-            vwap_14[symbol] = pv.rolling(window=14, min_periods=1).sum() / volume_df[symbol].rolling(window=14, min_periods=1).sum()
+        typical_price = (high_df + low_df + close_df) / 3
+        pv = typical_price * volume_df
+        vwap_14 = pv.rolling(window=14, min_periods=1).sum() / volume_df.rolling(window=14, min_periods=1).sum()
         vwap_14 = vwap_14.fillna(close_df)
         
         # Turnover rate
-        turnover_rate = pd.DataFrame(index=dates, columns=symbols)
-        for symbol in symbols:
-            market_cap = self.config.market_cap_base.get(symbol, 100_000_000_000)
-            turnover_rate[symbol] = volume_df[symbol] / market_cap
-        turnover_rate = turnover_rate.fillna(0.0)
+        market_caps = pd.Series(
+            [self.config.market_cap_base.get(symbol, 100_000_000_000) for symbol in symbols],
+            index=list(symbols),
+        )
+        turnover_rate = (volume_df / market_caps).fillna(0.0)
         
         # Build MultiIndex index
         multi_index = pd.MultiIndex.from_product(
             [dates, symbols], names=["date", "symbol"]
         )
         
-        # Collect all feature data
-        feature_data = {
-            "daily_return_1d": [],
-            "rolling_vol_5d": [],
-            "rolling_vol_20d": [],
-            "rolling_momentum_3d": [],
-            "rolling_momentum_5d": [],
-            "rolling_momentum_10d": [],
-            "ATR_14": [],
-            "rolling_skew": [],
-            "rolling_kurtosis": [],
-            "VWAP_14": [],
-            "turnover_rate": [],
+        # (date × symbol) frames flatten row-major into the (date, symbol) index order
+        feature_sources = {
+            "daily_return_1d": returns,
+            "rolling_vol_5d": rolling_vol_5d,
+            "rolling_vol_20d": rolling_vol_20d,
+            "rolling_momentum_3d": momentum_3d,
+            "rolling_momentum_5d": momentum_5d,
+            "rolling_momentum_10d": momentum_10d,
+            "ATR_14": atr_14,
+            "rolling_skew": rolling_skew,
+            "rolling_kurtosis": rolling_kurtosis,
+            "VWAP_14": vwap_14,
+            "turnover_rate": turnover_rate,
             # Price fields
-            "close": [],
-            "volume": [],
-            "open": [],
-            "high": [],
-            "low": [],
+            "close": close_df,
+            "volume": volume_df,
+            "open": open_df,
+            "high": high_df,
+            "low": low_df,
+        }
+        feature_data = {
+            name: frame.to_numpy(dtype=float).reshape(-1)
+            for name, frame in feature_sources.items()
         }
-        
-        for date in dates:
-            for symbol in symbols:
-                feature_data["daily_return_1d"].append(returns.loc[date, symbol])
-                feature_data["rolling_vol_5d"].append(rolling_vol_5d.loc[date, symbol])
-                feature_data["rolling_vol_20d"].append(rolling_vol_20d.loc[date, symbol])
-                feature_data["rolling_momentum_3d"].append(momentum_3d.loc[date, symbol])
-                feature_data["rolling_momentum_5d"].append(momentum_5d.loc[date, symbol])
-                feature_data["rolling_momentum_10d"].append(momentum_10d.loc[date, symbol])
-                feature_data["ATR_14"].append(atr_14.loc[date, symbol])
-                feature_data["rolling_skew"].append(rolling_skew.loc[date, symbol])
-                feature_data["rolling_kurtosis"].append(rolling_kurtosis.loc[date, symbol])
-                feature_data["VWAP_14"].append(vwap_14.loc[date, symbol])
-                feature_data["turnover_rate"].append(turnover_rate.loc[date, symbol])
-                
-                # Price fields
-                feature_data["close"].append(close_df.loc[date, symbol])
-                feature_data["volume"].append(volume_df.loc[date, symbol])
-                feature_data["open"].append(open_df.loc[date, symbol])
-                feature_data["high"].append(high_df.loc[date, symbol])
-                feature_data["low"].append(low_df.loc[date, symbol])
         
         feature_frame = pd.DataFrame(feature_data, index=multi_index)
         
@@ -0,0 +1,205 @@
+"""
+Path A - Alpha Input Panel
+
+Precomputed cross-sectional input block for AlphaEngine.
+
+The legacy `_prepare_alpha_input` helper rebuilds a per-symbol DataFrame on
+every rebalance date through five scalar `.loc` lookups per symbol. The panel
+below is built once per run as a (dates x symbols x columns) float block
+(features + OHLCV), after which `slice(date)` is an O(1) dict lookup that
+returns a zero-copy DataFrame view of one cross-section.
+
+PathAAlphaPanelCache keeps panels alive across runs that share data (e.g.
+Path B walk-forward windows), so the block is only built once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from jgod.path_a.path_a_price_cube import PathAPriceCube
+
+
+# 價格欄位在 alpha input 中的欄位順序（與 _prepare_alpha_input 相同）
+ALPHA_PRICE_COLUMNS: Tuple[str, ...] = ("close", "volume", "open", "high", "low")
+
+
+@dataclass
+class PathAAlphaInputPanel:
+    """
+    Date-indexed (T x N x C) block of alpha inputs.
+
+    Attributes:
+        dates: Sorted trading dates (axis 0)
+        symbols: Universe in config order (axis 1)
+        columns: Feature columns followed by ALPHA_PRICE_COLUMNS (axis 2)
+        values: Read-only float64 array; missing inputs are stored as 0.0,
+            exactly as `_prepare_alpha_input` fills them
+    """
+
+    dates: pd.DatetimeIndex
+    symbols: List[str]
+    columns: pd.Index
+    values: np.ndarray
+    _date_pos: Dict[pd.Timestamp, int] = field(init=False, repr=False)
+    _symbol_index: pd.Index = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.values.flags.writeable = False
+        self._date_pos = {date: i for i, date in enumerate(self.dates)}
+        self._symbol_index = pd.Index(self.symbols)
+
+    @classmethod
+    def from_frames(
+        cls,
+        feature_frame: pd.DataFrame,
+        price_frame: pd.DataFrame,
+        universe: Sequence[str],
+        price_cube: Optional[PathAPriceCube] = None,
+    ) -> "PathAAlphaInputPanel":
+        """
+        Build the panel from a loader's feature and price frames.
+
+        Args:
+            feature_frame: Feature frame with MultiIndex (date, symbol)
+            price_frame: Price frame with index=date, columns=(symbol, field)
+            universe: Symbols in output order
+            price_cube: Optional pre-built cube of `price_frame` to reuse
+
+        Raises:
+            ValueError: If the feature frame is not (date, symbol) indexed or
+                holds non-numeric / duplicated entries.
+        """
+        if not isinstance(feature_frame.index, pd.MultiIndex):
+            raise ValueError("Alpha input panel requires a (date, symbol) MultiIndex feature frame")
+
+        symbols = list(universe)
+        if price_cube is None:
+            price_cube = PathAPriceCube.from_price_frame(price_frame, symbols)
+        dates = price_cube.dates
+        n_days, n_symbols = len(dates), len(symbols)
+
+        # 1. Features（價格欄位只來自 price_frame，避免重複）
+        feature_cols = [c for c in feature_frame.columns if c not in ALPHA_PRICE_COLUMNS]
+        target = pd.MultiIndex.from_product([dates, symbols])
+        feature_block = (
+            feature_frame[feature_cols]
+            .reindex(target)
+            .to_numpy(dtype=float)
+            .reshape(n_days, n_symbols, len(feature_cols))
+        )
+
+        # 2. Prices in alpha-input column order
+        field_idx = [price_cube.fields.index(f) for f in ALPHA_PRICE_COLUMNS]
+        price_block = price_cube.values[:, :, field_idx]
+
+        values = np.concatenate([feature_block, price_block], axis=2)
+        values[np.isnan(values)] = 0.0
+
+        return cls(
+            dates=dates,
+            symbols=symbols,
+            columns=pd.Index(feature_cols + list(ALPHA_PRICE_COLUMNS)),
+            values=values,
+        )
+
+    def covers(self, dates: Sequence[pd.Timestamp]) -> bool:
+        """Return True if every date is present in the panel."""
+        return all(pd.Timestamp(d) in self._date_pos for d in dates)
+
+    def slice(self, date: pd.Timestamp) -> pd.DataFrame:
+        """
+        Cross-section for one date (index=symbol, columns=inputs).
+
+        The returned DataFrame is a zero-copy, read-only view into the panel.
+
+        Raises:
+            KeyError: If the date is not in the panel
+        """
+        t = self._date_pos[pd.Timestamp(date)]
+        return pd.DataFrame(
+            self.values[t], index=self._symbol_index, columns=self.columns, copy=False
+        )
+
+    def restrict(self, start: pd.Timestamp, end: pd.Timestamp) -> "PathAAlphaInputPanel":
+        """Zero-copy sub-panel for the dates in [start, end]."""
+        lo = self.dates.searchsorted(pd.Timestamp(start), side="left")
+        hi = self.dates.searchsorted(pd.Timestamp(end), side="right")
+        return PathAAlphaInputPanel(
+            dates=self.dates[lo:hi],
+            symbols=self.symbols,
+            columns=self.columns,
+            values=self.values[lo:hi],
+        )
+
+
+class PathAAlphaPanelCache:
+    """
+    Per-run cache of alpha input panels.
+
+    Lookups are keyed either by the identity of the (feature, price) frames
+    a loader returned, or by an explicit `source_key` when the caller knows
+    that every window reads from the same underlying data (e.g. a run-level
+    data load shared by Path B windows). In the latter case a panel built for
+    a wide date range is reused, via a zero-copy `restrict`, by any window
+    whose dates it covers.
+    """
+
+    def __init__(self):
+        self._by_identity: Dict[Tuple[int, int, Tuple[str, ...]], Tuple[pd.DataFrame, pd.DataFrame, PathAAlphaInputPanel]] = {}
+        self._by_source: Dict[Tuple[Hashable, Tuple[str, ...]], PathAAlphaInputPanel] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self,
+        feature_frame: pd.DataFrame,
+        price_frame: pd.DataFrame,
+        universe: Sequence[str],
+        dates: Optional[pd.DatetimeIndex] = None,
+        source_key: Optional[Hashable] = None,
+        price_cube: Optional[PathAPriceCube] = None,
+    ) -> PathAAlphaInputPanel:
+        """
+        Return a cached panel for these inputs, building it on a miss.
+
+        Args:
+            feature_frame / price_frame / universe: see PathAAlphaInputPanel.from_frames
+            dates: Trading dates the caller will slice (used for source-key coverage)
+            source_key: Optional key asserting the frames come from a shared source
+            price_cube: Optional pre-built cube of `price_frame`
+        """
+        symbols = tuple(universe)
+
+        if source_key is not None and dates is not None and len(dates) > 0:
+            cached = self._by_source.get((source_key, symbols))
+            if cached is not None and cached.covers(dates):
+                self.hits += 1
+                return cached.restrict(dates.min(), dates.max())
+
+        identity = (id(feature_frame), id(price_frame), symbols)
+        entry = self._by_identity.get(identity)
+        if entry is not None and entry[0] is feature_frame and entry[1] is price_frame:
+            self.hits += 1
+            panel = entry[2]
+        else:
+            self.misses += 1
+            panel = PathAAlphaInputPanel.from_frames(
+                feature_frame, price_frame, symbols, price_cube=price_cube
+            )
+            # keep frame references so their ids cannot be recycled
+            self._by_identity[identity] = (feature_frame, price_frame, panel)
+
+        if source_key is not None:
+            previous = self._by_source.get((source_key, symbols))
+            if previous is None or len(panel.dates) >= len(previous.dates):
+                self._by_source[(source_key, symbols)] = panel
+        return panel
+
+    def clear(self) -> None:
+        self._by_identity.clear()
+        self._by_source.clear()
@@ -12,8 +12,9 @@ The goal of v1 is **not** to implement all details, but to:
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
-from typing import Protocol, Optional, List
+from typing import Hashable, Protocol, Optional, List
 
 import numpy as np
 import pandas as pd
@@ -23,6 +24,8 @@ from jgod.path_a.path_a_schema import (
     PathABacktestResult,
     PathAPortfolioSnapshot,
 )
+from jgod.path_a.path_a_price_cube import PathAPriceCube
+from jgod.path_a.path_a_alpha_panel import PathAAlphaInputPanel, PathAAlphaPanelCache
 # NOTE: We only import typing-level interfaces for these engines.
 # Concrete implementations live in their own modules.
 from jgod.alpha_engine.alpha_engine import AlphaEngine
@@ -38,6 +41,9 @@ from jgod.learning.error_learning_engine import ErrorLearningEngine
 # 價格欄位名稱（用於避免 feature_frame 和 price_frame 欄位重複）
 PRICE_COLUMNS = ["close", "open", "high", "low", "volume"]
 
+# 可用的回測引擎模式（PathAConfig.engine_mode）
+ENGINE_MODES = ("loop", "vectorized")
+
 
 # ---------------------------------------------------------------------------
 # Protocols for data loader & feature builder
@@ -122,6 +128,11 @@ class PathARunContext:
     optimizer: OptimizerCore
     error_engine: ErrorLearningEngine
     error_bridge: Optional[PathAErrorBridge] = None
+    # Optional run-level cache so runs sharing data reuse one alpha input panel
+    alpha_panel_cache: Optional[PathAAlphaPanelCache] = None
+    # Set when data_loader serves slices of a shared source (e.g. a Path B
+    # run-level data context); lets the cache reuse one wide panel by date range
+    alpha_panel_source_key: Optional[Hashable] = None
 
 
 def run_path_a_backtest(ctx: PathARunContext) -> PathABacktestResult:
@@ -140,6 +151,10 @@ def run_path_a_backtest(ctx: PathARunContext) -> PathABacktestResult:
     """
     
     config = ctx.config
+    if config.engine_mode not in ENGINE_MODES:
+        raise ValueError(
+            f"Unknown engine_mode '{config.engine_mode}', expected one of {ENGINE_MODES}"
+        )
     
     # ------------------------------------------------------------------
     # 1) Load data
@@ -164,6 +179,14 @@ def run_path_a_backtest(ctx: PathARunContext) -> PathABacktestResult:
     # Build rebalance schedule
     rebalance_dates = _build_rebalance_schedule(all_dates, config)
     
+    # Precompute alpha inputs once for the whole run
+    alpha_panel = _build_alpha_panel(ctx, feature_frame, price_frame, all_dates)
+    
+    if config.engine_mode == "vectorized":
+        return _run_vectorized_backtest(
+            ctx, price_frame, feature_frame, all_dates, rebalance_dates, alpha_panel
+        )
+    
     # Initialize NAV and state containers
     nav_series = pd.Series(index=all_dates, dtype=float)
     return_series = pd.Series(index=all_dates, dtype=float)
@@ -205,123 +228,13 @@ def run_path_a_backtest(ctx: PathARunContext) -> PathABacktestResult:
         # Rebalance if today is a rebalance date
         if current_date in rebalance_dates:
             # ------------------------------------------------------------------
-            # 2a) Prepare alpha inputs for AlphaEngine
+            # 2a-2c) Alpha -> risk -> optimizer
             # ------------------------------------------------------------------
-            # 使用 helper 準備 alpha input（合併 feature 和 price 資料）
-            alpha_input = _prepare_alpha_input(
-                feature_frame=feature_frame,
-                price_frame=price_frame,
-                current_date=current_date,
-                universe=config.universe
+            mu, new_weights = _compute_target_weights(
+                ctx, feature_frame, price_frame, current_date, alpha_panel,
+                previous_weights=current_weights,
             )
             
-            try:
-                # AlphaEngine 會自動偵測橫截面模式
-                alpha_result = ctx.alpha_engine.compute_all(alpha_input)
-                
-                # Extract composite_alpha
-                # 在橫截面模式下，alpha_result 的 index 應該是 symbol
-                if isinstance(alpha_result, pd.DataFrame):
-                    if 'composite_alpha' in alpha_result.columns:
-                        composite_alpha = alpha_result['composite_alpha']
-                    else:
-                        # 如果沒有 composite_alpha 欄位，使用第一個欄位
-                        composite_alpha = alpha_result.iloc[:, 0]
-                elif isinstance(alpha_result, pd.Series):
-                    composite_alpha = alpha_result
-                else:
-                    composite_alpha = pd.Series(0.0, index=config.universe)
-                
-                # 確保 composite_alpha 的 index 對齊 universe
-                if isinstance(composite_alpha, pd.Series):
-                    composite_alpha = composite_alpha.reindex(config.universe, fill_value=0.0)
-                else:
-                    composite_alpha = pd.Series(0.0, index=config.universe)
-            except Exception as e:
-                # Fallback: use zero alpha if computation fails
-                print(f"Warning: AlphaEngine computation failed on {current_date}: {e}")
-                composite_alpha = pd.Series(0.0, index=config.universe)
-            
-            # ------------------------------------------------------------------
-            # 2b) Update risk model & build covariance matrix
-            # ------------------------------------------------------------------
-            # For v1, we assume the risk model has been pre-fitted or can update itself.
-            # The risk model should already have the covariance matrix ready.
-            #
-            # TODO: Implement proper window selection and call risk_model.fit() if needed.
-            # For now, we assume the risk_model is already fitted and can provide covariance.
-            
-            try:
-                # 優先嘗試從 Risk Model 取得（如果已經 fit 且 symbols 對齊）
-                risk_model_ready = (
-                    hasattr(ctx.risk_model, 'symbols') and 
-                    ctx.risk_model.symbols == list(config.universe)
-                )
-                
-                if risk_model_ready:
-                    cov_matrix = ctx.risk_model.get_covariance_matrix()
-                    if cov_matrix.shape[0] == len(config.universe):
-                        # Shape 正確，使用它
-                        pass
-                    else:
-                        # Shape 不對，改用 sample covariance
-                        cov_matrix = _compute_sample_covariance(
-                            price_frame,
-                            list(config.universe),
-                            lookback_days=min(60, len(price_frame))
-                        )
-                else:
-                    # Risk Model 還沒 fit 或 symbols 不對齊，從 price_frame 計算
-                    cov_matrix = _compute_sample_covariance(
-                        price_frame,
-                        list(config.universe),
-                        lookback_days=min(60, len(price_frame))
-                    )
-            except Exception as e:
-                print(f"Warning: Failed to compute covariance matrix: {e}. Using identity matrix.")
-                # 使用小的 identity matrix（而不是全 1）
-                cov_matrix = np.eye(len(config.universe)) * 0.01
-            
-            # ------------------------------------------------------------------
-            # 2c) Optimize portfolio weights
-            # ------------------------------------------------------------------
-            # Construct expected return vector mu from composite_alpha
-            # Reindex to ensure alignment with universe
-            mu = composite_alpha.reindex(config.universe).fillna(0.0)
-            
-            # Convert to pd.Series if not already
-            if not isinstance(mu, pd.Series):
-                mu = pd.Series(mu, index=config.universe)
-            
-            # OptimizerCore.optimize() requires:
-            # - expected_returns: pd.Series
-            # - risk_model: MultiFactorRiskModel
-            # - factor_exposure: Optional[pd.DataFrame] (can be None)
-            # - benchmark_weights: Optional[pd.Series] (can be None)
-            # - sector_map: Optional[Dict[str, str]] (can be None)
-            
-            try:
-                optimized = ctx.optimizer.optimize(
-                    expected_returns=mu,
-                    risk_model=ctx.risk_model,
-                    factor_exposure=None,  # TODO: build factor exposure if available
-                    benchmark_weights=None,  # TODO: load benchmark weights if configured
-                    sector_map=None,  # TODO: build sector map if available
-                )
-                
-                new_weights = optimized.weights.reindex(config.universe).fillna(0.0)
-                
-                # Ensure weights sum to 1 (normalize if needed)
-                if new_weights.abs().sum() > 0:
-                    new_weights = new_weights / new_weights.abs().sum()
-                else:
-                    new_weights = pd.Series(0.0, index=config.universe)
-                
-            except Exception as e:
-                print(f"Warning: Optimizer failed on {current_date}: {e}. Using equal weights.")
-                # Fallback: equal weights
-                new_weights = pd.Series(1.0 / len(config.universe), index=config.universe)
-            
             # ------------------------------------------------------------------
             # 2d) Record portfolio snapshot at current_date
             # ------------------------------------------------------------------
@@ -377,6 +290,274 @@ def run_path_a_backtest(ctx: PathARunContext) -> PathABacktestResult:
     return result
 
 
+def _compute_target_weights(
+    ctx: PathARunContext,
+    feature_frame: pd.DataFrame,
+    price_frame: pd.DataFrame,
+    current_date: pd.Timestamp,
+    alpha_panel: Optional[PathAAlphaInputPanel] = None,
+    previous_weights: Optional[pd.Series] = None,
+) -> tuple[pd.Series, pd.Series]:
+    """
+    Run the rebalance decision (alpha -> risk -> optimizer) for one date.
+    
+    Shared by the loop and vectorized engines so both make identical
+    portfolio decisions. Alpha inputs come from the precomputed panel when
+    available, otherwise from `_prepare_alpha_input`.
+    
+    `previous_weights` (the weights held going into this rebalance) are
+    handed to the optimizer as a warm start when it supports one.
+    
+    Returns:
+        (mu, new_weights): expected-return vector and target weights,
+        both indexed by config.universe
+    """
+    config = ctx.config
+    
+    # ------------------------------------------------------------------
+    # 2a) Prepare alpha inputs for AlphaEngine
+    # ------------------------------------------------------------------
+    if alpha_panel is not None:
+        # O(1) zero-copy cross-section from the precomputed panel
+        alpha_input = alpha_panel.slice(current_date)
+    else:
+        # 使用 helper 準備 alpha input（合併 feature 和 price 資料）
+        alpha_input = _prepare_alpha_input(
+            feature_frame=feature_frame,
+            price_frame=price_frame,
+            current_date=current_date,
+            universe=config.universe
+        )
+    
+    try:
+        # AlphaEngine 會自動偵測橫截面模式
+        alpha_result = ctx.alpha_engine.compute_all(alpha_input)
+    
+        # Extract composite_alpha
+        # 在橫截面模式下，alpha_result 的 index 應該是 symbol
+        if isinstance(alpha_result, pd.DataFrame):
+            if 'composite_alpha' in alpha_result.columns:
+                composite_alpha = alpha_result['composite_alpha']
+            else:
+                # 如果沒有 composite_alpha 欄位，使用第一個欄位
+                composite_alpha = alpha_result.iloc[:, 0]
+        elif isinstance(alpha_result, pd.Series):
+            composite_alpha = alpha_result
+        else:
+            composite_alpha = pd.Series(0.0, index=config.universe)
+    
+        # 確保 composite_alpha 的 index 對齊 universe
+        if isinstance(composite_alpha, pd.Series):
+            composite_alpha = composite_alpha.reindex(config.universe, fill_value=0.0)
+        else:
+            composite_alpha = pd.Series(0.0, index=config.universe)
+    except Exception as e:
+        # Fallback: use zero alpha if computation fails
+        print(f"Warning: AlphaEngine computation failed on {current_date}: {e}")
+        composite_alpha = pd.Series(0.0, index=config.universe)
+    
+    # ------------------------------------------------------------------
+    # 2b) Update risk model & build covariance matrix
+    # ------------------------------------------------------------------
+    # For v1, we assume the risk model has been pre-fitted or can update itself.
+    # The risk model should already have the covariance matrix ready.
+    #
+    # TODO: Implement proper window selection and call risk_model.fit() if needed.
+    # For now, we assume the risk_model is already fitted and can provide covariance.
+    
+    try:
+        # 優先嘗試從 Risk Model 取得（如果已經 fit 且 symbols 對齊）
+        risk_model_ready = (
+            hasattr(ctx.risk_model, 'symbols') and 
+            ctx.risk_model.symbols == list(config.universe)
+        )
+    
+        if risk_model_ready:
+            cov_matrix = ctx.risk_model.get_covariance_matrix()
+            if cov_matrix.shape[0] == len(config.universe):
+                # Shape 正確，使用它
+                pass
+            else:
+                # Shape 不對，改用 sample covariance
+                cov_matrix = _compute_sample_covariance(
+                    price_frame,
+                    list(config.universe),
+                    lookback_days=min(60, len(price_frame))
+                )
+        else:
+            # Risk Model 還沒 fit 或 symbols 不對齊，從 price_frame 計算
+            cov_matrix = _compute_sample_covariance(
+                price_frame,
+                list(config.universe),
+                lookback_days=min(60, len(price_frame))
+            )
+    except Exception as e:
+        print(f"Warning: Failed to compute covariance matrix: {e}. Using identity matrix.")
+        # 使用小的 identity matrix（而不是全 1）
+        cov_matrix = np.eye(len(config.universe)) * 0.01
+    
+    # ------------------------------------------------------------------
+    # 2c) Optimize portfolio weights
+    # ------------------------------------------------------------------
+    # Construct expected return vector mu from composite_alpha
+    # Reindex to ensure alignment with universe
+    mu = composite_alpha.reindex(config.universe).fillna(0.0)
+    
+    # Convert to pd.Series if not already
+    if not isinstance(mu, pd.Series):
+        mu = pd.Series(mu, index=config.universe)
+    
+    # OptimizerCore.optimize() requires:
+    # - expected_returns: pd.Series
+    # - risk_model: MultiFactorRiskModel
+    # - factor_exposure: Optional[pd.DataFrame] (can be None)
+    # - benchmark_weights: Optional[pd.Series] (can be None)
+    # - sector_map: Optional[Dict[str, str]] (can be None)
+    # - initial_weights: Optional[pd.Series] warm start (can be None)
+    optimize_kwargs = {}
+    if (
+        previous_weights is not None
+        and previous_weights.abs().sum() > 0  # first rebalance starts from cash
+        and _supports_warm_start(ctx.optimizer)
+    ):
+        optimize_kwargs["initial_weights"] = previous_weights
+    
+    try:
+        optimized = ctx.optimizer.optimize(
+            expected_returns=mu,
+            risk_model=ctx.risk_model,
+            factor_exposure=None,  # TODO: build factor exposure if available
+            benchmark_weights=None,  # TODO: load benchmark weights if configured
+            sector_map=None,  # TODO: build sector map if available
+            **optimize_kwargs,
+        )
+    
+        new_weights = optimized.weights.reindex(config.universe).fillna(0.0)
+    
+        # Ensure weights sum to 1 (normalize if needed)
+        if new_weights.abs().sum() > 0:
+            new_weights = new_weights / new_weights.abs().sum()
+        else:
+            new_weights = pd.Series(0.0, index=config.universe)
+    
+    except Exception as e:
+        print(f"Warning: Optimizer failed on {current_date}: {e}. Using equal weights.")
+        # Fallback: equal weights
+        new_weights = pd.Series(1.0 / len(config.universe), index=config.universe)
+    
+    return mu, new_weights
+
+
+def _run_vectorized_backtest(
+    ctx: PathARunContext,
+    price_frame: pd.DataFrame,
+    feature_frame: pd.DataFrame,
+    all_dates: pd.DatetimeIndex,
+    rebalance_dates: list[pd.Timestamp],
+    alpha_panel: Optional[PathAAlphaInputPanel] = None,
+) -> PathABacktestResult:
+    """
+    Array-backed equivalent of the daily loop in run_path_a_backtest.
+    
+    The price frame is pivoted once into a (dates x symbols x fields) cube.
+    Python only runs at rebalance dates (alpha / risk / optimizer); daily
+    returns for all holding stretches are computed as one batched product
+    of the daily return matrix and the forward-filled weight matrix.
+    
+    Produces the same NAV / return series as the loop engine.
+    """
+    config = ctx.config
+    universe = list(config.universe)
+    n_days = len(all_dates)
+    
+    cube = PathAPriceCube.from_price_frame(price_frame, universe)
+    # (T-1, N): returns realized on day i (row i-1) vs. day i-1
+    asset_returns = cube.simple_returns("close")
+    
+    rebalance_idx = all_dates.get_indexer(pd.DatetimeIndex(rebalance_dates))
+    rebalance_idx = np.sort(rebalance_idx[rebalance_idx >= 0])
+    
+    # ------------------------------------------------------------------
+    # 1) Rebalance decisions (the only per-date Python work)
+    # ------------------------------------------------------------------
+    # Decisions depend on prices / features only, never on NAV, so they
+    # can all be taken before the NAV path is compounded.
+    weight_matrix = np.zeros((n_days, len(universe)), dtype=float)
+    costs = np.zeros(n_days, dtype=float)
+    target_weights: dict[int, pd.Series] = {}
+    
+    current_weights = pd.Series(0.0, index=universe, dtype=float)
+    for k, i in enumerate(rebalance_idx):
+        current_date = all_dates[i]
+        mu, new_weights = _compute_target_weights(
+            ctx, feature_frame, price_frame, current_date, alpha_panel,
+            previous_weights=current_weights,
+        )
+        
+        if ctx.error_bridge is not None and i > 0:
+            realized_returns = pd.Series(asset_returns[i - 1], index=universe)
+            try:
+                ctx.error_bridge.handle_prediction_outcome(
+                    date=current_date,
+                    weights=current_weights,
+                    realized_returns=realized_returns,
+                    expected_scores=mu,
+                    error_engine=ctx.error_engine,
+                )
+            except Exception as e:
+                print(f"Warning: ErrorBridge failed on {current_date}: {e}")
+        
+        turnover = (new_weights - current_weights).abs().sum()
+        costs[i] = turnover * (config.transaction_cost_bps / 1e4)
+        
+        # new weights are held from the next trading day until the next rebalance
+        stop = rebalance_idx[k + 1] + 1 if k + 1 < len(rebalance_idx) else n_days
+        weight_matrix[i + 1:stop] = new_weights.to_numpy(dtype=float)
+        
+        target_weights[int(i)] = new_weights
+        current_weights = new_weights
+    
+    # ------------------------------------------------------------------
+    # 2) Daily portfolio returns for every stretch in one batch
+    # ------------------------------------------------------------------
+    daily_returns = np.zeros(n_days, dtype=float)
+    if n_days > 1:
+        daily_returns[1:] = (weight_matrix[1:] * asset_returns).sum(axis=1)
+    
+    # ------------------------------------------------------------------
+    # 3) Compound NAV (O(T) scalar pass, same order of operations as the loop)
+    # ------------------------------------------------------------------
+    nav_values = np.empty(n_days, dtype=float)
+    portfolio_snapshots: list[PathAPortfolioSnapshot] = []
+    
+    current_nav = config.initial_nav
+    for i in range(n_days):
+        if i > 0:
+            current_nav *= (1.0 + daily_returns[i])
+        if i in target_weights:
+            portfolio_snapshots.append(
+                PathAPortfolioSnapshot(
+                    date=all_dates[i],
+                    symbols=list(universe),
+                    weights=target_weights[i],
+                    nav=current_nav,
+                    portfolio_return=float(daily_returns[i]),
+                )
+            )
+            current_nav *= (1.0 - costs[i])
+        nav_values[i] = current_nav
+    
+    return PathABacktestResult(
+        config=config,
+        nav_series=pd.Series(nav_values, index=all_dates, dtype=float),
+        return_series=pd.Series(daily_returns, index=all_dates, dtype=float),
+        portfolio_snapshots=portfolio_snapshots,
+        trades=None,
+        error_events=None,
+        summary_stats={},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -416,6 +597,48 @@ def _build_rebalance_schedule(
     return list(dates)
 
 
+def _build_alpha_panel(
+    ctx: PathARunContext,
+    feature_frame: pd.DataFrame,
+    price_frame: pd.DataFrame,
+    all_dates: pd.DatetimeIndex,
+) -> Optional[PathAAlphaInputPanel]:
+    """
+    Build (or fetch from ctx.alpha_panel_cache) the alpha input panel.
+    
+    Returns None when the frames cannot be represented as a numeric panel
+    (e.g. non-MultiIndex feature frame, non-numeric features); the backtest
+    then falls back to per-date `_prepare_alpha_input`.
+    """
+    universe = list(ctx.config.universe)
+    try:
+        if ctx.alpha_panel_cache is not None:
+            return ctx.alpha_panel_cache.get_or_build(
+                feature_frame, price_frame, universe, dates=all_dates,
+                source_key=ctx.alpha_panel_source_key,
+            )
+        return PathAAlphaInputPanel.from_frames(feature_frame, price_frame, universe)
+    except (ValueError, TypeError) as e:
+        print(f"Warning: alpha input panel unavailable ({e}); using per-date alpha inputs.")
+        return None
+
+
+def _supports_warm_start(optimizer: object) -> bool:
+    """
+    Whether `optimizer.optimize` accepts an `initial_weights` keyword.
+    
+    Custom / stub optimizers implementing the original signature are
+    called without it.
+    """
+    try:
+        params = inspect.signature(optimizer.optimize).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return "initial_weights" in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
 def _extract_price_for_date(
     price_frame: pd.DataFrame,
     date: pd.Timestamp,
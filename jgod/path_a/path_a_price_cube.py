@@ -0,0 +1,95 @@
+"""
+Path A - Price Cube
+
+Array-backed view of a Path A price frame.
+
+The price frame produced by a PathADataLoader is a (date x (symbol, field))
+DataFrame. Per-date `.loc` lookups on that frame are the dominant cost of the
+daily backtest loop, so the vectorized engine pivots it once into a contiguous
+(dates x symbols x fields) NumPy block and works on plain arrays afterwards.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 價格欄位順序（cube 的最後一個維度）
+PRICE_FIELDS: Tuple[str, ...] = ("close", "open", "high", "low", "volume")
+
+
+@dataclass
+class PathAPriceCube:
+    """
+    Contiguous (dates x symbols x fields) price block.
+
+    Attributes:
+        dates: Sorted trading dates (axis 0)
+        symbols: Universe in config order (axis 1)
+        fields: Price fields (axis 2), see PRICE_FIELDS
+        values: float64 array of shape (T, N, F); missing entries are NaN
+    """
+
+    dates: pd.DatetimeIndex
+    symbols: list[str]
+    fields: Tuple[str, ...]
+    values: np.ndarray
+
+    @classmethod
+    def from_price_frame(
+        cls,
+        price_frame: pd.DataFrame,
+        universe: Sequence[str],
+        fields: Sequence[str] = PRICE_FIELDS,
+    ) -> "PathAPriceCube":
+        """
+        Pivot a price frame into a cube.
+
+        Supports both column layouts used by the loaders:
+        MultiIndex (symbol, field) and wide "symbol_field" names.
+        Symbols / fields absent from the frame are filled with NaN.
+        """
+        symbols = list(universe)
+        fields = tuple(fields)
+
+        frame = price_frame
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            frame = frame.copy(deep=False)
+            frame.index = pd.to_datetime(frame.index)
+        if frame.index.has_duplicates:
+            frame = frame[~frame.index.duplicated(keep="last")]
+        dates = frame.index.sort_values()
+
+        if isinstance(frame.columns, pd.MultiIndex):
+            columns = pd.MultiIndex.from_product([symbols, list(fields)])
+        else:
+            columns = pd.Index([f"{symbol}_{f}" for symbol in symbols for f in fields])
+
+        block = frame.reindex(index=dates, columns=columns).to_numpy(dtype=float)
+        values = np.ascontiguousarray(
+            block.reshape(len(dates), len(symbols), len(fields))
+        )
+        return cls(dates=dates, symbols=symbols, fields=fields, values=values)
+
+    def field(self, name: str) -> np.ndarray:
+        """Return a (T, N) view of one price field."""
+        return self.values[:, :, self.fields.index(name)]
+
+    def simple_returns(self, field: str = "close") -> np.ndarray:
+        """
+        Day-over-day simple returns of shape (T - 1, N).
+
+        Mirrors the loop engine: a zero previous price is treated as missing
+        and any missing relative price counts as "no change" (return 0).
+        """
+        prices = self.field(field)
+        prev = prices[:-1]
+        prev = np.where(prev == 0, np.nan, prev)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_rel = prices[1:] / prev
+        price_rel = np.where(np.isnan(price_rel), 1.0, price_rel)
+        return price_rel - 1.0
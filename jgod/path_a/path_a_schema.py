@@ -44,7 +44,11 @@ class PathAConfig:
     max_weight_per_symbol: float = 0.1
     min_weight_per_symbol: float = 0.0
     allow_short: bool = False
-    
+
+    # Backtest engine: "loop" (per-day pandas loop) or "vectorized"
+    # (array-backed; only drops into Python at rebalance dates)
+    engine_mode: str = "loop"
+
     # Optional tags / metadata for logging & reproducibility
     experiment_name: str = "path_a_experiment"
     tags: Dict[str, str] = field(default_factory=dict)
@@ -17,11 +17,13 @@ from jgod.path_b.path_b_engine import (
     PathBWindowGovernanceResult,
     PathBRunGovernanceSummary,
 )
+from jgod.path_b.path_b_data_context import PathBRunDataContext
 
 __all__ = [
     "PathBEngine",
     "PathBConfig",
     "PathBWindowResult",
     "PathBRunResult",
+    "PathBRunDataContext",
 ]
 
@@ -0,0 +1,154 @@
+"""
+Path B - Run-level Data Context
+
+Walk-forward windows read overlapping date ranges from the same loader. Instead
+of letting every window call `load_price_frame` / `load_feature_frame` (which
+re-reads the FinMind cache, re-fetches from the API or regenerates mock paths),
+the data context loads the union of all window ranges once and serves each
+window a zero-copy positional slice of the shared frames.
+
+PathBRunDataContext implements the PathADataLoader protocol, so a window's
+`run_path_a_backtest` uses it unchanged. TimedDataLoader wraps any loader with
+the same load-time accounting, for runs that do not share data.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Hashable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from jgod.path_a.path_a_schema import PathAConfig
+from jgod.path_a.path_a_backtest import PathADataLoader
+
+
+@dataclass
+class PathBRunDataContext:
+    """
+    Price / feature frames for the union of all window date ranges.
+
+    Attributes:
+        price_frame: index=date (sorted), columns=MultiIndex (symbol, field)
+        feature_frame: MultiIndex (date, symbol), sorted by date
+        universe: Symbols the frames were loaded for
+        start_date / end_date: Loaded range ("YYYY-MM-DD", inclusive)
+        initial_load_time: Seconds spent in the one-time union load
+        load_time: Seconds spent serving window slices (cumulative)
+    """
+
+    price_frame: pd.DataFrame
+    feature_frame: pd.DataFrame
+    universe: List[str]
+    start_date: str
+    end_date: str
+    initial_load_time: float = 0.0
+    load_time: float = 0.0
+    _feature_dates: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.price_frame.index.is_monotonic_increasing:
+            self.price_frame = self.price_frame.sort_index()
+        if isinstance(self.feature_frame.index, pd.MultiIndex):
+            feature_dates = self.feature_frame.index.get_level_values(0)
+            if not feature_dates.is_monotonic_increasing:
+                self.feature_frame = self.feature_frame.sort_index(level=0, sort_remaining=False)
+                feature_dates = self.feature_frame.index.get_level_values(0)
+        else:
+            feature_dates = self.feature_frame.index
+            if not feature_dates.is_monotonic_increasing:
+                self.feature_frame = self.feature_frame.sort_index()
+                feature_dates = self.feature_frame.index
+        self._feature_dates = pd.DatetimeIndex(feature_dates).values
+
+    @classmethod
+    def load(
+        cls,
+        data_loader: PathADataLoader,
+        config: PathAConfig,
+    ) -> "PathBRunDataContext":
+        """
+        Load the frames once for config's (union) date range.
+
+        Args:
+            data_loader: Underlying Path A data loader
+            config: PathAConfig spanning every window's date range
+        """
+        start = time.perf_counter()
+        price_frame = data_loader.load_price_frame(config=config)
+        feature_frame = data_loader.load_feature_frame(config=config)
+        return cls(
+            price_frame=price_frame,
+            feature_frame=feature_frame,
+            universe=list(config.universe),
+            start_date=config.start_date,
+            end_date=config.end_date,
+            initial_load_time=time.perf_counter() - start,
+        )
+
+    @property
+    def source_key(self) -> Hashable:
+        """Key identifying this shared data source (see PathAAlphaPanelCache)."""
+        return ("path_b_run_data", id(self.price_frame), id(self.feature_frame))
+
+    def covers(self, config: PathAConfig) -> bool:
+        """Whether a window config can be served from this context."""
+        return (
+            list(config.universe) == self.universe
+            and pd.Timestamp(config.start_date) >= pd.Timestamp(self.start_date)
+            and pd.Timestamp(config.end_date) <= pd.Timestamp(self.end_date)
+        )
+
+    # ------------------------------------------------------------------
+    # PathADataLoader protocol implementation
+    # ------------------------------------------------------------------
+
+    def load_price_frame(self, config: PathAConfig) -> pd.DataFrame:
+        """Zero-copy row slice of the shared price frame for config's range."""
+        start = time.perf_counter()
+        lo, hi = self._bounds(self.price_frame.index.values, config)
+        frame = self.price_frame.iloc[lo:hi]
+        self.load_time += time.perf_counter() - start
+        return frame
+
+    def load_feature_frame(self, config: PathAConfig) -> pd.DataFrame:
+        """Zero-copy row slice of the shared feature frame for config's range."""
+        start = time.perf_counter()
+        lo, hi = self._bounds(self._feature_dates, config)
+        frame = self.feature_frame.iloc[lo:hi]
+        self.load_time += time.perf_counter() - start
+        return frame
+
+    def _bounds(self, dates: np.ndarray, config: PathAConfig) -> Tuple[int, int]:
+        if not self.covers(config):
+            raise ValueError(
+                f"Window {config.start_date} ~ {config.end_date} is outside the run data "
+                f"context {self.start_date} ~ {self.end_date} or uses a different universe"
+            )
+        lo = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(config.start_date)), side="left"))
+        hi = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(config.end_date)), side="right"))
+        return lo, hi
+
+
+class TimedDataLoader:
+    """PathADataLoader wrapper that accumulates time spent loading data."""
+
+    def __init__(self, data_loader: PathADataLoader):
+        self.data_loader = data_loader
+        self.load_time = 0.0
+
+    def load_price_frame(self, config: PathAConfig) -> pd.DataFrame:
+        start = time.perf_counter()
+        try:
+            return self.data_loader.load_price_frame(config=config)
+        finally:
+            self.load_time += time.perf_counter() - start
+
+    def load_feature_frame(self, config: PathAConfig) -> pd.DataFrame:
+        start = time.perf_counter()
+        try:
+            return self.data_loader.load_feature_frame(config=config)
+        finally:
+            self.load_time += time.perf_counter() - start
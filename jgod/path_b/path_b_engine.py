@@ -18,6 +18,9 @@ Reference:
 
 from __future__ import annotations
 
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence, Tuple, Any, Callable
 from datetime import datetime, timedelta
@@ -26,6 +29,8 @@ import numpy as np
 
 from jgod.path_a.path_a_schema import PathABacktestResult
 from jgod.path_a.path_a_backtest import PathADataLoader
+from jgod.path_a.path_a_alpha_panel import PathAAlphaPanelCache
+from jgod.path_b.path_b_data_context import PathBRunDataContext, TimedDataLoader
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +88,12 @@ class PathBConfig:
     
     # 實驗名稱
     experiment_name: str = "path_b_experiment"
+    
+    # 平行執行 window 的 process 數（1 = 依序執行）
+    max_workers: int = 1
+    
+    # 整個 run 只載入一次資料（所有 window 的聯集區間），各 window 取 zero-copy 切片
+    share_run_data: bool = True
 
 
 @dataclass
@@ -123,6 +134,9 @@ class PathBWindowResult:
     
     # 因子歸因
     factor_attribution: Optional[Dict[str, float]] = None
+    
+    # 執行時間（秒）：data_load_time（取得資料）/ compute_time（其餘）
+    timings: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -245,6 +259,12 @@ class PathBEngine:
         self.mode = mode
         self.base_universe: Optional[Sequence[str]] = None
         
+        # Per-run alpha input panel cache (reset at the start of each run())
+        self._alpha_panel_cache: Optional[PathAAlphaPanelCache] = None
+        
+        # Per-run shared data (set at the start of each run() if share_run_data)
+        self._data_context: Optional[PathBRunDataContext] = None
+        
         # TODO: integrate AlphaHealthMonitor
         # TODO: integrate RegimeManager
         # TODO: integrate KillSwitchController
@@ -262,24 +282,32 @@ class PathBEngine:
         # Step 1: Window 切割
         windows = self._generate_windows(config)
         
-        # Step 2-4: 執行每個 window
-        window_results = []
-        windows_governance = []  # 收集所有 window 的 governance 結果
-        
-        for window_id, (train_start, train_end, test_start, test_end) in enumerate(windows, 1):
-            window_result, governance_result = self._run_single_window(
-                window_id=window_id,
-                train_start=train_start,
-                train_end=train_end,
-                test_start=test_start,
-                test_end=test_end,
-                config=config
-            )
-            window_results.append(window_result)
-            windows_governance.append(governance_result)
+        # 同一次 run 的 windows 共用 alpha input panel cache
+        self._alpha_panel_cache = PathAAlphaPanelCache()
+        
+        # 資料只載入一次（在建立 process pool 之前，讓 worker 共享）
+        self._data_context = (
+            self._build_data_context(windows, config) if config.share_run_data else None
+        )
+        
+        # Step 2-4: 執行每個 window（windows 互相獨立，可平行執行）
+        tasks = [(window_id, window) for window_id, window in enumerate(windows, 1)]
+        if config.max_workers > 1 and len(tasks) > 1:
+            outputs = self._run_windows_parallel(tasks, config)
+        else:
+            outputs = [_run_window_task(self, task, config) for task in tasks]
+        
+        # 依 window 順序收集結果（governance 彙總因此與依序執行相同）
+        window_results = [window_result for window_result, _ in outputs]
+        windows_governance = [governance_result for _, governance_result in outputs]
         
         # Step 5: Combine & Export
         summary = self._compute_summary(window_results)
+        initial_load_time = self._data_context.initial_load_time if self._data_context else 0.0
+        summary["data_load_time"] = initial_load_time + sum(
+            w.timings.get("data_load_time", 0.0) for w in window_results
+        )
+        summary["compute_time"] = sum(w.timings.get("compute_time", 0.0) for w in window_results)
         governance_analysis = self._analyze_governance(window_results, config)
         
         # Step 6: Compute Governance Summary
@@ -302,6 +330,91 @@ class PathBEngine:
         
         return result
     
+    def _build_data_context(
+        self,
+        windows: List[Tuple[str, str, str, str]],
+        config: PathBConfig,
+    ) -> Optional[PathBRunDataContext]:
+        """
+        載入所有 window test 區間的聯集，並預先建立整段的 alpha input panel
+        
+        Args:
+            windows: _generate_windows 的結果
+            config: Path B 配置
+        
+        Returns:
+            PathBRunDataContext，載入失敗時回傳 None（各 window 自行載入）
+        """
+        from jgod.path_a.path_a_schema import PathAConfig
+        
+        start_date = min((w[2] for w in windows), key=pd.Timestamp)
+        end_date = max((w[3] for w in windows), key=pd.Timestamp)
+        union_config = PathAConfig(
+            start_date=start_date,
+            end_date=end_date,
+            universe=list(config.universe),
+            rebalance_frequency=config.rebalance_frequency,
+            initial_nav=config.initial_nav,
+            transaction_cost_bps=config.transaction_cost_bps,
+            slippage_bps=config.slippage_bps,
+            experiment_name=f"{config.experiment_name}_run_data",
+        )
+        
+        try:
+            data_context = PathBRunDataContext.load(
+                self._get_or_create_data_loader(config), union_config
+            )
+        except Exception as e:
+            print(f"Warning: run-level data load failed ({e}); windows will load their own data.")
+            return None
+        
+        # features / alpha inputs 只計算一次，各 window 以 restrict 取得 zero-copy 子面板
+        try:
+            self._alpha_panel_cache.get_or_build(
+                data_context.feature_frame,
+                data_context.price_frame,
+                data_context.universe,
+                dates=pd.DatetimeIndex(data_context.price_frame.index),
+                source_key=data_context.source_key,
+            )
+        except (ValueError, TypeError) as e:
+            print(f"Warning: alpha input panel unavailable ({e}); using per-window alpha inputs.")
+        
+        return data_context
+    
+    def _run_windows_parallel(
+        self,
+        tasks: List[Tuple[int, Tuple[str, str, str, str]]],
+        config: PathBConfig,
+    ) -> List[Tuple[PathBWindowResult, PathBWindowGovernanceResult]]:
+        """
+        以 process pool 執行 windows，回傳順序與 tasks 相同
+        
+        支援 fork 時，worker 直接繼承此 engine（data loader、已載入的資料、
+        alpha panel cache）為 copy-on-write 唯讀共享，不需 pickle；
+        否則 engine 會在每個 worker 啟動時 pickle 一次。
+        
+        Args:
+            tasks: (window_id, (train_start, train_end, test_start, test_end)) 列表
+            config: Path B 配置
+        
+        Returns:
+            (window_result, governance_result) 列表
+        """
+        if "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        else:
+            mp_context = multiprocessing.get_context()
+        
+        with ProcessPoolExecutor(
+            max_workers=min(config.max_workers, len(tasks)),
+            mp_context=mp_context,
+            initializer=_init_window_worker,
+            initargs=(self,),
+        ) as executor:
+            # map 保留 tasks 順序
+            return list(executor.map(_run_window_worker, tasks, [config] * len(tasks)))
+    
     def _generate_windows(
         self,
         config: PathBConfig
@@ -411,6 +524,8 @@ class PathBEngine:
         Returns:
             PathBWindowResult 物件
         """
+        window_start_time = time.perf_counter()
+        
         # Step 2 - Train 模式（IS）- 目前簡化為不做訓練，直接使用預設參數
         train_result = None
         
@@ -429,8 +544,14 @@ class PathBEngine:
             experiment_name=f"{config.experiment_name}_window_{window_id}",
         )
         
-        # 建立或取得 data loader
-        data_loader = self._get_or_create_data_loader(config)
+        # 取得 data loader：優先使用 run-level 共享資料，否則自行載入（計時）
+        if self._data_context is not None and self._data_context.covers(path_a_config):
+            data_loader = self._data_context
+            alpha_panel_source_key = self._data_context.source_key
+        else:
+            data_loader = TimedDataLoader(self._get_or_create_data_loader(config))
+            alpha_panel_source_key = None
+        load_time_before = data_loader.load_time
         
         # 建立引擎（如果沒有提供 factory，使用 build_orchestrator 的邏輯）
         alpha_engine, risk_model, optimizer = self._get_or_create_engines(config)
@@ -452,6 +573,8 @@ class PathBEngine:
             optimizer=optimizer,
             error_engine=error_engine,
             error_bridge=None,
+            alpha_panel_cache=self._alpha_panel_cache,
+            alpha_panel_source_key=alpha_panel_source_key,
         )
         
         test_result = run_path_a_backtest(context)
@@ -516,6 +639,12 @@ class PathBEngine:
             performance_result=perf_result,
         )
         
+        data_load_time = data_loader.load_time - load_time_before
+        window_result.timings = {
+            "data_load_time": data_load_time,
+            "compute_time": time.perf_counter() - window_start_time - data_load_time,
+        }
+        
         return window_result, governance_result
     
     def _get_or_create_data_loader(self, config: PathBConfig) -> PathADataLoader:
@@ -876,3 +1005,42 @@ class PathBEngine:
         
         return []
 
+
+# ---------------------------------------------------------------------------
+# Window execution helpers (module level so process pool workers can use them)
+# ---------------------------------------------------------------------------
+
+# 每個 worker process 各自持有的 engine（由 _init_window_worker 設定）
+_WORKER_ENGINE: Optional[PathBEngine] = None
+
+
+def _init_window_worker(engine: PathBEngine) -> None:
+    """Process pool initializer：保存 worker 使用的 engine"""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine
+
+
+def _run_window_worker(
+    task: Tuple[int, Tuple[str, str, str, str]],
+    config: PathBConfig,
+) -> Tuple[PathBWindowResult, PathBWindowGovernanceResult]:
+    """Process pool worker：以 worker 的 engine 執行單一 window"""
+    return _run_window_task(_WORKER_ENGINE, task, config)
+
+
+def _run_window_task(
+    engine: PathBEngine,
+    task: Tuple[int, Tuple[str, str, str, str]],
+    config: PathBConfig,
+) -> Tuple[PathBWindowResult, PathBWindowGovernanceResult]:
+    """執行單一 window task"""
+    window_id, (train_start, train_end, test_start, test_end) = task
+    return engine._run_single_window(
+        window_id=window_id,
+        train_start=train_start,
+        train_end=train_end,
+        test_start=test_start,
+        test_end=test_end,
+        config=config
+    )
+
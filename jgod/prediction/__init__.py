@@ -11,11 +11,13 @@ from jgod.prediction.rules.stock_upside_filter_v1 import (
 )
 from jgod.prediction.rules.stock_upside_filter_60_v1 import (
     StockUpsideFilter60V1,
+    StockUpsideBatchResult,
 )
 
 __all__ = [
     "StockUpsideFilterV1",
     "StockUpsideFilter60V1",
+    "StockUpsideBatchResult",
     "StockUpsideResult",
     "IndicatorScore",
 ]
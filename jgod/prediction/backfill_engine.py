@@ -0,0 +1,584 @@
+"""
+Prediction Backfill Engine
+
+批次產生 prediction_snapshots（取代逐 symbol × 逐日的查詢 / 評分 / commit）：
+
+1. 每個日期區塊以單一查詢預載 indicator_snapshots → (symbol, date, code) 陣列
+2. 在 worker process 中以 StockUpsideFilter60V1 評分
+3. 以 batched INSERT ... ON CONFLICT DO UPDATE 寫入（每個區塊一個 transaction）
+4. 每個區塊完成後寫入 checkpoint，中斷後重跑會從下一個區塊繼續；整個 job 完成後清除
+
+Reference:
+- scripts/run_backfill_predictions.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from jgod.prediction.rules.stock_upside_filter_60_v1 import (
+    IndicatorScore,
+    StockUpsideFilter60V1,
+    StockUpsideResult,
+)
+from jgod.storage.bulk_upsert import DEFAULT_BATCH_SIZE, upsert_rows
+from jgod.storage.indicator_store import ColumnarIndicatorStore
+from jgod.storage.prediction_cache import notify_predictions_written
+from jgod.storage.prediction_projection import project_prediction_row
+from jgod.storage.models import IndicatorSnapshot, PredictionSnapshot
+
+logger = logging.getLogger(__name__)
+
+# prediction_snapshots 欄位：衝突時覆寫（symbol / date 為 key）
+PREDICTION_UPDATE_COLUMNS = [
+    "score",
+    "total_score",
+    "signal",
+    "verdict",
+    "positive_factors_json",
+    "negative_factors_json",
+    "risk_flags_json",
+    "meta_json",
+    # Backward compatibility
+    "positive_indicators",
+    "negative_indicators",
+    "raw_payload",
+    # API projection
+    "positive_factor_labels",
+    "negative_factor_labels",
+    "risk_flag_labels",
+    "updated_at",
+]
+
+
+# ---------------------------------------------------------------------------
+# Result serialization (shared with scripts/run_backfill_predictions.py)
+# ---------------------------------------------------------------------------
+
+
+def extract_risk_flags(result: StockUpsideResult) -> List[Dict[str, Any]]:
+    """
+    Extract risk flags from prediction result.
+
+    Currently identifies:
+    - Negative total score
+    - SHORT verdict
+    - AVOID verdict
+    """
+    flags = []
+
+    if result.total_score < 0:
+        flags.append({
+            "type": "negative_score",
+            "severity": "medium",
+            "message": f"Total score is negative: {result.total_score:.2f}",
+        })
+
+    if result.verdict == "SHORT":
+        flags.append({
+            "type": "short_signal",
+            "severity": "high",
+            "message": "Strong sell signal detected",
+        })
+
+    if result.verdict == "AVOID":
+        flags.append({
+            "type": "avoid_signal",
+            "severity": "medium",
+            "message": "Avoid signal detected",
+        })
+
+    return flags
+
+
+def extract_top_indicators(
+    result: StockUpsideResult,
+    top_n: int,
+    positive: bool = True,
+) -> List[Dict[str, Any]]:
+    """Extract top N positive or negative indicators"""
+    scored: List[tuple[IndicatorScore, float]] = []
+    for ind in result.indicator_scores:
+        weighted = ind.score * ind.weight
+        scored.append((ind, weighted))
+
+    if positive:
+        scored = [x for x in scored if x[1] > 0]
+        scored.sort(key=lambda x: x[1], reverse=True)
+    else:
+        scored = [x for x in scored if x[1] < 0]
+        scored.sort(key=lambda x: x[1])
+
+    return [
+        {
+            "code": ind.code,
+            "name": ind.name,
+            "score": ind.score,
+            "weight": ind.weight,
+            "weighted_score": float(weighted),
+        }
+        for ind, weighted in scored[:top_n]
+    ]
+
+
+def serialize_result(result: StockUpsideResult) -> Dict[str, Any]:
+    """Serialize StockUpsideResult to JSON-serializable dict"""
+    return {
+        "symbol": result.symbol,
+        "total_score": result.total_score,
+        "verdict": result.verdict,
+        "summary": result.summary,
+        "indicator_scores": [
+            {
+                "code": ind.code,
+                "name": ind.name,
+                "score": ind.score,
+                "weight": ind.weight,
+                "reason": ind.reason,
+            }
+            for ind in result.indicator_scores
+        ],
+    }
+
+
+def build_prediction_row(
+    result: StockUpsideResult,
+    as_of_date: date,
+    top_n: int,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """prediction_snapshots row (column -> value) for one evaluation result."""
+    positive_indicators = extract_top_indicators(result, top_n, positive=True)
+    negative_indicators = extract_top_indicators(result, top_n, positive=False)
+    meta_json = serialize_result(result)
+    row = {
+        "symbol": result.symbol,
+        "date": as_of_date,
+        "score": result.total_score,
+        "total_score": result.total_score,
+        "signal": result.verdict,
+        "verdict": result.verdict,
+        "positive_factors_json": positive_indicators,
+        "negative_factors_json": negative_indicators,
+        "risk_flags_json": extract_risk_flags(result),
+        "meta_json": meta_json,
+        # Backward compatibility
+        "positive_indicators": positive_indicators,
+        "negative_indicators": negative_indicators,
+        "raw_payload": meta_json,
+        "updated_at": now or datetime.now(),
+    }
+    row.update(project_prediction_row(row))
+    return row
+
+
+def indicator_value(raw_value: Optional[float], normalized_value: Optional[float]) -> float:
+    """
+    Indicator value fed to the filter.
+
+    Use raw_value if available, otherwise normalized_value * 100 as proxy
+    (approximate reverse normalization), otherwise 0.0.
+    """
+    if raw_value is not None:
+        return raw_value
+    if normalized_value is not None:
+        return normalized_value * 100.0
+    return 0.0
+
+
+# ---------------------------------------------------------------------------
+# Indicator panel
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class IndicatorPanel:
+    """
+    indicator_snapshots of a (symbols × dates) block as dense arrays.
+
+    Attributes:
+        symbols / dates / codes: Axis labels
+        values: (n_symbols, n_dates, n_codes) indicator values (see indicator_value)
+        present: Same shape, True where a snapshot row exists
+    """
+
+    symbols: List[str]
+    dates: List[date]
+    codes: List[str]
+    values: np.ndarray
+    present: np.ndarray
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        symbols: Sequence[str],
+        dates: Sequence[date],
+    ) -> "IndicatorPanel":
+        """Load every snapshot of symbols within [min(dates), max(dates)] in one query."""
+        symbols = list(symbols)
+        dates = list(dates)
+        rows = (
+            session.query(
+                IndicatorSnapshot.symbol,
+                IndicatorSnapshot.date,
+                IndicatorSnapshot.indicator_code,
+                IndicatorSnapshot.raw_value,
+                IndicatorSnapshot.normalized_value,
+            )
+            .filter(
+                IndicatorSnapshot.symbol.in_(symbols),
+                IndicatorSnapshot.date >= min(dates),
+                IndicatorSnapshot.date <= max(dates),
+            )
+            .all()
+        ) if symbols and dates else []
+
+        symbol_pos = {symbol: i for i, symbol in enumerate(symbols)}
+        date_pos = {d: j for j, d in enumerate(dates)}
+        rows = [r for r in rows if r[1] in date_pos]
+        codes = sorted({r[2] for r in rows})
+        code_pos = {code: k for k, code in enumerate(codes)}
+
+        values = np.zeros((len(symbols), len(dates), len(codes)))
+        present = np.zeros(values.shape, dtype=bool)
+        if rows:
+            i = np.fromiter((symbol_pos[r[0]] for r in rows), dtype=np.int64, count=len(rows))
+            j = np.fromiter((date_pos[r[1]] for r in rows), dtype=np.int64, count=len(rows))
+            k = np.fromiter((code_pos[r[2]] for r in rows), dtype=np.int64, count=len(rows))
+            values[i, j, k] = [indicator_value(r[3], r[4]) for r in rows]
+            present[i, j, k] = True
+
+        return cls(symbols=symbols, dates=dates, codes=codes, values=values, present=present)
+
+    @classmethod
+    def from_store(
+        cls,
+        store: ColumnarIndicatorStore,
+        symbols: Sequence[str],
+        dates: Sequence[date],
+    ) -> "IndicatorPanel":
+        """Load the block from a ColumnarIndicatorStore (dense matrix, no pivot)."""
+        symbols = list(symbols)
+        dates = list(dates)
+        values, codes = store.load_matrix(symbols, dates)
+        present = ~np.isnan(values)
+        return cls(
+            symbols=symbols,
+            dates=dates,
+            codes=codes,
+            values=np.where(present, values, 0.0),
+            present=present,
+        )
+
+    def has_indicators(self) -> np.ndarray:
+        """(n_symbols, n_dates) mask: at least one indicator snapshot exists."""
+        return self.present.any(axis=2)
+
+    def indicators(self, i: int, j: int) -> Dict[str, Any]:
+        """Indicators dict of (symbols[i], dates[j]) for StockUpsideFilter60V1.evaluate()."""
+        mask = self.present[i, j]
+        codes = [code for code, keep in zip(self.codes, mask) if keep]
+        return dict(zip(codes, self.values[i, j][mask].tolist()))
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BackfillCheckpoint:
+    """
+    Progress file: the last date block fully committed for a backfill job.
+
+    A checkpoint written by a different job (other symbols, date range or
+    force flag) is ignored.
+    """
+
+    path: Path
+    job_key: str
+
+    def load(self) -> Optional[date]:
+        if not self.path.exists():
+            return None
+        try:
+            state = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", self.path, e)
+            return None
+        if state.get("job_key") != self.job_key:
+            logger.info("Checkpoint %s belongs to another backfill job, starting over", self.path)
+            return None
+        completed = state.get("completed_through")
+        return date.fromisoformat(completed) if completed else None
+
+    def save(self, completed_through: date) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "job_key": self.job_key,
+            "completed_through": completed_through.isoformat(),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state, indent=2))
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class PredictionBackfillConfig:
+    """
+    Prediction backfill settings.
+
+    Attributes:
+        start_date / end_date: Inclusive range (weekdays only)
+        force: Rebuild predictions that already exist
+        top_n: Top positive / negative indicators kept per prediction
+        workers: Worker processes for evaluation (1 = in-process)
+        date_chunk_size: Dates per block (one indicator query, one commit, one checkpoint)
+        batch_size: Rows per batched upsert
+        checkpoint_path: Progress file, removed when the job completes; None disables resume
+        restart: Discard an existing checkpoint instead of resuming from it
+        indicator_store_dir: Read indicators from a ColumnarIndicatorStore
+            instead of indicator_snapshots (None = database)
+    """
+
+    start_date: date
+    end_date: date
+    force: bool = False
+    top_n: int = 10
+    workers: int = 1
+    date_chunk_size: int = 20
+    batch_size: int = DEFAULT_BATCH_SIZE
+    checkpoint_path: Optional[Path] = None
+    restart: bool = False
+    indicator_store_dir: Optional[Path] = None
+
+
+@dataclass
+class PredictionBackfillStats:
+    """Counts over (symbol, date) combinations."""
+
+    total: int = 0
+    saved: int = 0
+    skipped_data: int = 0
+    skipped_exists: int = 0
+    skipped_checkpoint: int = 0
+    errors: int = 0
+
+
+class PredictionBackfillEngine:
+    """
+    Batched, parallel and resumable prediction_snapshots backfill.
+
+    Usage:
+        engine = PredictionBackfillEngine(session, PredictionBackfillConfig(start, end, workers=4))
+        stats = engine.run(symbols)
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        config: PredictionBackfillConfig,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        self.session = session
+        self.config = config
+        self.weights = weights or StockUpsideFilter60V1.DEFAULT_WEIGHTS.copy()
+        self.indicator_store = (
+            ColumnarIndicatorStore(Path(config.indicator_store_dir))
+            if config.indicator_store_dir is not None
+            else None
+        )
+
+    def run(self, symbols: Sequence[str]) -> PredictionBackfillStats:
+        """Backfill predictions for symbols × weekdays in the configured range."""
+        symbols = list(dict.fromkeys(symbols))
+        dates = generate_date_range(self.config.start_date, self.config.end_date)
+        stats = PredictionBackfillStats(total=len(symbols) * len(dates))
+
+        checkpoint = self._checkpoint(symbols)
+        if checkpoint is not None and self.config.restart:
+            checkpoint.clear()
+        if checkpoint is not None:
+            completed_through = checkpoint.load()
+            if completed_through is not None:
+                remaining = [d for d in dates if d > completed_through]
+                stats.skipped_checkpoint = len(symbols) * (len(dates) - len(remaining))
+                logger.info(
+                    "Resuming after %s (%d combinations already done)",
+                    completed_through,
+                    stats.skipped_checkpoint,
+                )
+                dates = remaining
+
+        chunk_size = max(1, self.config.date_chunk_size)
+        chunks = [dates[i:i + chunk_size] for i in range(0, len(dates), chunk_size)]
+
+        executor = (
+            ProcessPoolExecutor(max_workers=self.config.workers)
+            if self.config.workers > 1 and symbols
+            else None
+        )
+        try:
+            for chunk in chunks:
+                self._run_chunk(symbols, chunk, stats, executor)
+                if checkpoint is not None:
+                    checkpoint.save(chunk[-1])
+                logger.info(
+                    "Progress: through %s - Saved: %d, Skipped (data): %d, "
+                    "Skipped (exists): %d, Errors: %d",
+                    chunk[-1],
+                    stats.saved,
+                    stats.skipped_data,
+                    stats.skipped_exists,
+                    stats.errors,
+                )
+            # 整個 job 完成：清掉 checkpoint，同一 job 再跑（例如 --force）會重新處理全部日期
+            if checkpoint is not None:
+                checkpoint.clear()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return stats
+
+    def _checkpoint(self, symbols: List[str]) -> Optional[BackfillCheckpoint]:
+        if self.config.checkpoint_path is None:
+            return None
+        job = "|".join([
+            self.config.start_date.isoformat(),
+            self.config.end_date.isoformat(),
+            str(self.config.force),
+            ",".join(symbols),
+        ])
+        job_key = hashlib.sha1(job.encode("utf-8")).hexdigest()
+        return BackfillCheckpoint(Path(self.config.checkpoint_path), job_key)
+
+    def _run_chunk(
+        self,
+        symbols: List[str],
+        dates: List[date],
+        stats: PredictionBackfillStats,
+        executor: Optional[ProcessPoolExecutor],
+    ) -> None:
+        """Load, evaluate and write one date block (single transaction)."""
+        if self.indicator_store is not None:
+            panel = IndicatorPanel.from_store(self.indicator_store, symbols, dates)
+        else:
+            panel = IndicatorPanel.load(self.session, symbols, dates)
+        has_data = panel.has_indicators()
+        stats.skipped_data += int((~has_data).sum())
+
+        todo = has_data
+        if not self.config.force:
+            existing = self._existing_keys(symbols, dates)
+            exists = np.array(
+                [[(s, d) in existing for d in dates] for s in symbols], dtype=bool
+            ).reshape(has_data.shape)
+            stats.skipped_exists += int((todo & exists).sum())
+            todo = todo & ~exists
+
+        pairs = list(zip(*np.nonzero(todo)))
+        if not pairs:
+            return
+
+        items = [
+            (panel.symbols[i], panel.dates[j], panel.indicators(i, j))
+            for i, j in pairs
+        ]
+        if executor is None:
+            rows, errors = _evaluate_items(self.weights, self.config.top_n, items)
+        else:
+            n_tasks = min(len(items), self.config.workers * 4)
+            futures = [
+                executor.submit(_evaluate_items, self.weights, self.config.top_n, items[t::n_tasks])
+                for t in range(n_tasks)
+            ]
+            rows, errors = [], 0
+            for future in futures:
+                chunk_rows, chunk_errors = future.result()
+                rows.extend(chunk_rows)
+                errors += chunk_errors
+
+        try:
+            upsert_rows(
+                self.session,
+                PredictionSnapshot.__table__,
+                rows,
+                index_elements=["symbol", "date"],
+                update_columns=PREDICTION_UPDATE_COLUMNS,
+                batch_size=self.config.batch_size,
+                constraint="uq_prediction_snapshot",
+            )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        notify_predictions_written(self.session.get_bind())
+
+        stats.saved += len(rows)
+        stats.errors += errors
+
+    def _existing_keys(self, symbols: List[str], dates: List[date]) -> set:
+        rows = (
+            self.session.query(PredictionSnapshot.symbol, PredictionSnapshot.date)
+            .filter(
+                PredictionSnapshot.symbol.in_(symbols),
+                PredictionSnapshot.date >= min(dates),
+                PredictionSnapshot.date <= max(dates),
+            )
+            .all()
+        )
+        return {(symbol, d) for symbol, d in rows}
+
+
+def _evaluate_items(
+    weights: Dict[str, float],
+    top_n: int,
+    items: List[Tuple[str, date, Dict[str, Any]]],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Worker: evaluate (symbol, date, indicators) items → (prediction rows, error count)."""
+    filter_instance = StockUpsideFilter60V1(weights=weights)
+    now = datetime.now()
+    rows: List[Dict[str, Any]] = []
+    errors = 0
+    for symbol, as_of_date, indicators in items:
+        try:
+            result = filter_instance.evaluate(symbol, indicators)
+            rows.append(build_prediction_row(result, as_of_date, top_n, now=now))
+        except Exception as e:  # noqa: BLE001 - one bad combination must not stop the block
+            logger.error("  %s %s: Error building prediction: %s", symbol, as_of_date, e)
+            errors += 1
+    return rows, errors
+
+
+def generate_date_range(start_date: date, end_date: date) -> List[date]:
+    """Generate list of trading dates (excluding weekends)"""
+    dates = []
+    current = start_date
+    while current <= end_date:
+        if current.weekday() < 5:  # Skip weekends (Monday=0, Friday=4)
+            dates.append(current)
+        current += timedelta(days=1)
+    return dates
@@ -7,8 +7,8 @@ Build 100-indicator dict for StockUpsideFilter60V1.evaluate()
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import Dict, Any, Optional
+from datetime import date
+from typing import Dict, Any, Callable, Iterable, Optional
 
 import numpy as np
 import pandas as pd
@@ -22,6 +22,14 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from api_clients.finmind_client import FinMindClient, FinMindClientConfig
+from jgod.prediction.data.indicator_fetch_plan import (
+    INDICATOR_DATASETS,
+    IndicatorDatasetCache,
+    SymbolDatasets,
+    dataset_start,
+    fetch_symbol_datasets,
+    plan_ranges,
+)
 
 
 @dataclass
@@ -32,6 +40,8 @@ class IndicatorBuilderConfig:
     lookback_days_price: int = 180
     lookback_days_capital: int = 60
     lookback_months_fundamental: int = 12
+    # build_indicators_batch 的本地快取目錄（None = 不快取）
+    cache_dir: Optional[str] = None
 
 
 class StockIndicatorBuilder100:
@@ -44,9 +54,15 @@ class StockIndicatorBuilder100:
                              X01..X16, M01..M36
     """
 
-    def __init__(self, finmind_token: Optional[str] = None, config: Optional[IndicatorBuilderConfig] = None):
+    def __init__(
+        self,
+        finmind_token: Optional[str] = None,
+        config: Optional[IndicatorBuilderConfig] = None,
+        client: Optional[FinMindClient] = None,
+    ):
         self.config = config or IndicatorBuilderConfig()
-        self.client = FinMindClient(FinMindClientConfig(api_token=finmind_token))
+        self.client = client or FinMindClient(FinMindClientConfig(api_token=finmind_token))
+        self.cache = IndicatorDatasetCache(Path(self.config.cache_dir)) if self.config.cache_dir else None
 
     # ======================================================================
     # Public API
@@ -58,36 +74,77 @@ class StockIndicatorBuilder100:
     ) -> Dict[str, Any]:
         """
         Main entry: build 100-indicator snapshot for a single stock on a specific date.
-        """
-        start_price = as_of - timedelta(days=self.config.lookback_days_price)
-        start_capital = as_of - timedelta(days=self.config.lookback_days_capital)
-        start_fundamental = as_of.replace(year=as_of.year - 2)
 
-        # 1) 基本價量
-        price_df = self.client.get_daily_price(stock_id, start_price, as_of)
+        1) 基本價量 2) 三大法人 + 融資券 + 持股結構 + 當沖 3) 營收 & 財報，
+        每個資料集各打一次 FinMind（見 INDICATOR_DATASETS）。
+        多個日期請用 build_indicators_batch()。
+        """
+        frames = {
+            dataset.name: getattr(self.client, dataset.client_method)(
+                stock_id, dataset_start(self.config, dataset.window, as_of), as_of
+            )
+            for dataset in INDICATOR_DATASETS
+        }
+        return self._compute_indicators(frames)
+
+    def build_indicators_batch(
+        self,
+        stock_ids: Iterable[str],
+        as_of_dates: Iterable[date],
+        progress: Optional[Callable[[str, str, bool], None]] = None,
+    ) -> Dict[str, Dict[date, Dict[str, Any]]]:
+        """
+        Build indicator snapshots for every (stock, as_of) pair.
 
-        # 2) 三大法人 + 融資券 + 持股結構
-        inst_df = self.client.get_institutional_investors(stock_id, start_capital, as_of)
-        margin_df = self.client.get_margin_short(stock_id, start_capital, as_of)
-        share_df = self.client.get_shareholding(stock_id, start_capital, as_of)
-        daytrade_df = self.client.get_day_trading(stock_id, start_capital, as_of)
+        每個資料集對每檔股票只抓一次（涵蓋所有 as_of 的 lookback 聯集範圍），
+        之後每個 as_of 從記憶體切片計算，結果與逐一呼叫 build_indicators() 相同。
+        config.cache_dir 有設定時，抓回的資料會寫入本地快取供下次重用。
 
-        # 3) 營收 & 財報
-        revenue_df = self.client.get_month_revenue(stock_id, start_fundamental, as_of)
-        fs_df = self.client.get_financial_statement(stock_id, start_fundamental, as_of)
-        bs_df = self.client.get_balance_sheet(stock_id, start_fundamental, as_of)
-        cf_df = self.client.get_cash_flow(stock_id, start_fundamental, as_of)
+        Args:
+            stock_ids: 股票代碼
+            as_of_dates: 評估日期
+            progress: Optional callback(stock_id, dataset, from_cache)
 
+        Returns:
+            {stock_id: {as_of: indicators}}
+        """
+        as_of_dates = sorted(set(as_of_dates))
+        ranges = plan_ranges(self.config, as_of_dates)
+
+        results: Dict[str, Dict[date, Dict[str, Any]]] = {}
+        for stock_id in stock_ids:
+            datasets = fetch_symbol_datasets(self.client, stock_id, ranges, cache=self.cache, progress=progress)
+            results[stock_id] = {
+                as_of: self.build_indicators_from_datasets(datasets, as_of)
+                for as_of in as_of_dates
+            }
+        return results
+
+    def build_indicators_from_datasets(self, datasets: SymbolDatasets, as_of: date) -> Dict[str, Any]:
+        """Build one snapshot from pre-fetched datasets (no API calls)."""
+        frames = {
+            dataset.name: datasets.slice(
+                dataset.name, dataset_start(self.config, dataset.window, as_of), as_of
+            )
+            for dataset in INDICATOR_DATASETS
+        }
+        return self._compute_indicators(frames)
+
+    def _compute_indicators(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         indicators: Dict[str, Any] = {}
 
         # -------------------- P 系列：價量技術 --------------------
-        indicators.update(self._build_price_indicators(price_df))
+        indicators.update(self._build_price_indicators(frames["price"]))
 
         # -------------------- C 系列：籌碼 ------------------------
-        indicators.update(self._build_capital_indicators(inst_df, margin_df, share_df, daytrade_df))
+        indicators.update(self._build_capital_indicators(
+            frames["institutional"], frames["margin"], frames["shareholding"], frames["day_trading"]
+        ))
 
         # -------------------- F 系列：財報 ------------------------
-        indicators.update(self._build_fundamental_indicators(revenue_df, fs_df, bs_df, cf_df))
+        indicators.update(self._build_fundamental_indicators(
+            frames["revenue"], frames["financial_statement"], frames["balance_sheet"], frames["cash_flow"]
+        ))
 
         # -------------------- K / S / Q / X / M 系列：先 placeholder ----------------
         indicators.update(self._build_placeholder_k_s_q_x_m(indicators))
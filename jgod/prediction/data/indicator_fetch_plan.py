@@ -0,0 +1,242 @@
+"""
+Shared Multi-Dataset Fetch Plan for StockIndicatorBuilder100
+
+build_indicators() issues nine FinMind calls (price, institutional, margin,
+shareholding, day trading, revenue, financial statement, balance sheet,
+cash flow) per (stock, as_of). A backfill over D dates therefore downloads
+the same fundamentals D times per stock.
+
+A fetch plan downloads each dataset once per symbol over the union of every
+as-of window, optionally keeps it in a local cache, and serves the
+per-date windows as in-memory slices:
+
+    O(symbols × dates × 9) API calls  ->  O(symbols × 9)
+
+Cache layout (pickle, one file per dataset and fetched range):
+
+    {cache_dir}/{stock_id}/{dataset}_{start}_{end}.pkl
+
+Any cached file whose range contains the requested range is reused. Ranges
+ending today or later are not cached because their rows may not be
+published yet.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+
+# ---------------------------------------------------------------------------
+# Dataset registry
+# ---------------------------------------------------------------------------
+
+# window kinds (see dataset_start)
+WINDOW_PRICE = "price"
+WINDOW_CAPITAL = "capital"
+WINDOW_FUNDAMENTAL = "fundamental"
+
+
+@dataclass(frozen=True)
+class IndicatorDataset:
+    """One FinMind dataset consumed by StockIndicatorBuilder100."""
+    name: str
+    client_method: str
+    window: str
+
+
+# build_indicators() 的九個資料集（順序 = 原本的呼叫順序）
+INDICATOR_DATASETS: Tuple[IndicatorDataset, ...] = (
+    IndicatorDataset("price", "get_daily_price", WINDOW_PRICE),
+    IndicatorDataset("institutional", "get_institutional_investors", WINDOW_CAPITAL),
+    IndicatorDataset("margin", "get_margin_short", WINDOW_CAPITAL),
+    IndicatorDataset("shareholding", "get_shareholding", WINDOW_CAPITAL),
+    IndicatorDataset("day_trading", "get_day_trading", WINDOW_CAPITAL),
+    IndicatorDataset("revenue", "get_month_revenue", WINDOW_FUNDAMENTAL),
+    IndicatorDataset("financial_statement", "get_financial_statement", WINDOW_FUNDAMENTAL),
+    IndicatorDataset("balance_sheet", "get_balance_sheet", WINDOW_FUNDAMENTAL),
+    IndicatorDataset("cash_flow", "get_cash_flow", WINDOW_FUNDAMENTAL),
+)
+
+
+def dataset_start(config, window: str, as_of: date) -> date:
+    """
+    First calendar date of a dataset window ending at as_of.
+
+    Args:
+        config: IndicatorBuilderConfig (lookback settings)
+        window: WINDOW_PRICE / WINDOW_CAPITAL / WINDOW_FUNDAMENTAL
+        as_of: Evaluation date (window end, inclusive)
+    """
+    if window == WINDOW_PRICE:
+        return as_of - timedelta(days=config.lookback_days_price)
+    if window == WINDOW_CAPITAL:
+        return as_of - timedelta(days=config.lookback_days_capital)
+    if window == WINDOW_FUNDAMENTAL:
+        return as_of.replace(year=as_of.year - 2)
+    raise ValueError(f"Unknown dataset window: {window}")
+
+
+# ---------------------------------------------------------------------------
+# Per-symbol in-memory datasets
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SymbolDatasets:
+    """
+    All datasets of one symbol over the full backfill range.
+
+    Attributes:
+        stock_id: 股票代碼
+        frames: dataset name -> rows sorted by date
+        api_calls: FinMind calls made to build this plan (cache hits excluded)
+    """
+    stock_id: str
+    frames: Dict[str, pd.DataFrame]
+    api_calls: int = 0
+    _dates: Dict[str, pd.DatetimeIndex] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for name, frame in self.frames.items():
+            if not frame.empty and "date" in frame.columns:
+                frame = frame.sort_values("date", kind="mergesort").reset_index(drop=True)
+                self.frames[name] = frame
+                self._dates[name] = pd.DatetimeIndex(frame["date"])
+
+    def slice(self, name: str, start: date, end: date) -> pd.DataFrame:
+        """Rows of dataset `name` with start <= date <= end (same as a direct fetch)."""
+        frame = self.frames.get(name)
+        if frame is None or name not in self._dates:
+            return pd.DataFrame()
+        dates = self._dates[name]
+        lo = dates.searchsorted(pd.Timestamp(start), side="left")
+        hi = dates.searchsorted(pd.Timestamp(end), side="right")
+        # builders assign helper columns in place; hand out an independent copy
+        return frame.iloc[lo:hi].reset_index(drop=True).copy()
+
+
+# ---------------------------------------------------------------------------
+# Local cache
+# ---------------------------------------------------------------------------
+
+class IndicatorDatasetCache:
+    """
+    Pickle cache of whole-range dataset fetches.
+
+    Args:
+        cache_dir: Root cache directory
+        today: Override for the current date (tests); ranges ending on or
+            after today are not cached
+    """
+
+    def __init__(self, cache_dir: Path, today: Optional[date] = None):
+        self.cache_dir = Path(cache_dir)
+        self._today = today
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, stock_id: str, dataset: str, start: date, end: date) -> Optional[pd.DataFrame]:
+        """Rows for [start, end] from a cached file covering the range, or None."""
+        for path, file_start, file_end in self._files(stock_id, dataset):
+            if file_start <= start and end <= file_end:
+                try:
+                    with open(path, "rb") as f:
+                        frame = pickle.load(f)
+                except Exception as e:
+                    print(f"Warning: Failed to load cache {path}: {e}")
+                    continue
+                if frame.empty or "date" not in frame.columns:
+                    return frame
+                mask = (frame["date"] >= pd.Timestamp(start)) & (frame["date"] <= pd.Timestamp(end))
+                return frame[mask].reset_index(drop=True)
+        return None
+
+    def put(self, stock_id: str, dataset: str, start: date, end: date, frame: pd.DataFrame) -> None:
+        """Store a fetched range (skipped when the range is not settled yet)."""
+        if end >= (self._today or date.today()):
+            return
+        path = self.cache_dir / stock_id / f"{dataset}_{start.isoformat()}_{end.isoformat()}.pkl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(frame, f)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def _files(self, stock_id: str, dataset: str) -> List[Tuple[Path, date, date]]:
+        pattern = re.compile(
+            rf"^{re.escape(dataset)}_(\d{{4}}-\d{{2}}-\d{{2}})_(\d{{4}}-\d{{2}}-\d{{2}})\.pkl$"
+        )
+        files = []
+        for path in sorted((self.cache_dir / stock_id).glob(f"{dataset}_*.pkl")):
+            match = pattern.match(path.name)
+            if match:
+                files.append((path, date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2))))
+        return files
+
+
+# ---------------------------------------------------------------------------
+# Fetch plan
+# ---------------------------------------------------------------------------
+
+def plan_ranges(config, as_of_dates: Iterable[date]) -> Dict[str, Tuple[date, date]]:
+    """
+    Union fetch range per dataset covering every as-of window.
+
+    Returns:
+        dataset name -> (start, end) inclusive
+    """
+    as_of_dates = sorted(set(as_of_dates))
+    if not as_of_dates:
+        raise ValueError("as_of_dates must not be empty")
+    first, last = as_of_dates[0], as_of_dates[-1]
+    return {
+        dataset.name: (dataset_start(config, dataset.window, first), last)
+        for dataset in INDICATOR_DATASETS
+    }
+
+
+def fetch_symbol_datasets(
+    client,
+    stock_id: str,
+    ranges: Dict[str, Tuple[date, date]],
+    cache: Optional[IndicatorDatasetCache] = None,
+    progress: Optional[Callable[[str, str, bool], None]] = None,
+) -> SymbolDatasets:
+    """
+    Fetch every dataset of one symbol once over its planned range.
+
+    Args:
+        client: FinMindClient (or anything exposing the same get_* methods)
+        stock_id: 股票代碼
+        ranges: Output of plan_ranges()
+        cache: Optional local cache consulted before the API
+        progress: Optional callback(stock_id, dataset, from_cache)
+
+    Returns:
+        SymbolDatasets
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    api_calls = 0
+    for dataset in INDICATOR_DATASETS:
+        start, end = ranges[dataset.name]
+        frame = cache.get(stock_id, dataset.name, start, end) if cache is not None else None
+        from_cache = frame is not None
+        if frame is None:
+            frame = getattr(client, dataset.client_method)(stock_id, start, end)
+            api_calls += 1
+            if cache is not None:
+                cache.put(stock_id, dataset.name, start, end, frame)
+        frames[dataset.name] = frame
+        if progress is not None:
+            progress(stock_id, dataset.name, from_cache)
+    return SymbolDatasets(stock_id=stock_id, frames=frames, api_calls=api_calls)
@@ -9,6 +9,7 @@ from jgod.prediction.rules.stock_upside_filter_v1 import (
 )
 from jgod.prediction.rules.stock_upside_filter_60_v1 import (
     StockUpsideFilter60V1,
+    StockUpsideBatchResult,
 )
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     "StockUpsideResult",
     "IndicatorScore",
     "StockUpsideFilter60V1",
+    "StockUpsideBatchResult",
 ]
 
@@ -18,8 +18,10 @@ Reference:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
 
 
 @dataclass
@@ -42,6 +44,72 @@ class StockUpsideResult:
     indicator_scores: List[IndicatorScore]
 
 
+@dataclass
+class StockUpsideBatchResult:
+    """
+    evaluate_batch 的結果：總分 / verdict 以陣列表示，
+    逐指標明細（IndicatorScore）只在 result() / results() 被呼叫時才建立。
+
+    Attributes:
+        symbols: 股票代碼（列順序）
+        codes: 指標代碼（欄順序，與 weights 相同）
+        total_scores: (n_symbols,) 總分
+        verdicts: (n_symbols,) verdict 字串
+        raw: (n_symbols, n_codes) 原始值（NaN = 未提供）
+        normalized: (n_symbols, n_codes) 標準化分數（-1 ~ +1）
+        weights: (n_codes,) 指標權重
+    """
+    symbols: List[str]
+    codes: List[str]
+    total_scores: np.ndarray
+    verdicts: np.ndarray
+    raw: np.ndarray
+    normalized: np.ndarray
+    weights: np.ndarray
+    _positions: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._positions = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def result(self, symbol: str) -> StockUpsideResult:
+        """單一股票的完整結果（與 evaluate() 相同格式）"""
+        i = self._positions[symbol]
+        indicator_scores: List[IndicatorScore] = []
+        raw_row = self.raw[i].tolist()
+        for code, raw, normalized, weight in zip(
+            self.codes, raw_row, self.normalized[i].tolist(), self.weights.tolist()
+        ):
+            # 未提供的指標與 evaluate() 的 indicators.get(code, 0) 一致
+            if raw is None or (isinstance(raw, float) and np.isnan(raw)):
+                raw = 0
+            indicator_scores.append(
+                IndicatorScore(
+                    code=code,
+                    name=code,
+                    score=normalized,
+                    weight=weight,
+                    reason=f"raw={raw}, normalized={normalized:.2f}"
+                )
+            )
+        total_score = float(self.total_scores[i])
+        verdict = str(self.verdicts[i])
+        return StockUpsideResult(
+            symbol=symbol,
+            total_score=total_score,
+            verdict=verdict,
+            summary=StockUpsideFilter60V1._summary(symbol, total_score, verdict),
+            indicator_scores=indicator_scores,
+        )
+
+    def results(self, symbols: Optional[Sequence[str]] = None) -> Dict[str, StockUpsideResult]:
+        """指定股票（預設全部）的完整結果"""
+        symbols = self.symbols if symbols is None else symbols
+        return {symbol: self.result(symbol) for symbol in symbols}
+
+
 class StockUpsideFilter60V1:
     """
     Rule-based filter for evaluating upside potential of a stock
@@ -194,6 +262,17 @@ class StockUpsideFilter60V1:
         "M36": 0.8,
     }
 
+    # ------------------------------------------------------------
+    # Verdict thresholds on total_score (empirical), highest first
+    # ------------------------------------------------------------
+    VERDICT_THRESHOLDS = [
+        (45.0, "STRONG_BUY"),
+        (30.0, "BUY"),
+        (15.0, "NEUTRAL"),
+        (0.0, "AVOID"),
+    ]
+    VERDICT_BELOW_ALL = "SHORT"
+
     # ------------------------------------------------------------
     # Constructor
     # ------------------------------------------------------------
@@ -275,27 +354,119 @@ class StockUpsideFilter60V1:
         # --------------------------------------------------------
         # Verdict based on total_score (empirical thresholds)
         # --------------------------------------------------------
-        if total_score >= 45.0:
-            verdict = "STRONG_BUY"
-        elif total_score >= 30.0:
-            verdict = "BUY"
-        elif total_score >= 15.0:
-            verdict = "NEUTRAL"
-        elif total_score >= 0.0:
-            verdict = "AVOID"
-        else:
-            verdict = "SHORT"
-
-        summary = (
-            f"{symbol} total_score={total_score:.2f}, verdict={verdict}. "
-            "Evaluation based on J-GOD 60-Indicator Upside Framework."
-        )
+        verdict = self._verdict(total_score)
 
         return StockUpsideResult(
             symbol=symbol,
             total_score=total_score,
             verdict=verdict,
-            summary=summary,
+            summary=self._summary(symbol, total_score, verdict),
             indicator_scores=indicator_scores,
         )
 
+    # ------------------------------------------------------------
+    # Batch evaluate: whole universe as a (symbols × indicators) matrix
+    # ------------------------------------------------------------
+    def evaluate_batch(
+        self,
+        indicator_matrix: Any,
+        symbols: Sequence[str],
+        codes: Optional[Sequence[str]] = None,
+    ) -> StockUpsideBatchResult:
+        """
+        向量化評估多檔股票（與逐檔 evaluate() 結果一致）
+
+        Args:
+            indicator_matrix: (n_symbols × n_codes) 陣列
+                - 數值：value / 100 後 clip 至 [-1, 1]；NaN 視為未提供（= 0）
+                - bool dtype：True=1.0, False=-1.0
+                - object dtype：逐格套用 _normalize（可混合 bool / 數值 / None）
+            symbols: 股票代碼（對應列）
+            codes: 指標代碼（對應欄），預設為 weights 的順序；
+                未出現在 codes 的指標視為 0，不在 weights 內的欄位忽略
+
+        Returns:
+            StockUpsideBatchResult（逐指標明細延遲建立）
+        """
+        matrix = np.asarray(indicator_matrix)
+        symbols = list(symbols)
+        if matrix.ndim != 2 or matrix.shape[0] != len(symbols):
+            raise ValueError(
+                f"indicator_matrix must be (n_symbols × n_codes), got shape {matrix.shape} "
+                f"for {len(symbols)} symbols"
+            )
+
+        weight_codes = list(self.weights)
+        codes = weight_codes if codes is None else list(codes)
+        if matrix.shape[1] != len(codes):
+            raise ValueError(f"indicator_matrix has {matrix.shape[1]} columns but {len(codes)} codes")
+
+        # 對齊至 weights 順序（缺少的指標 = NaN = 未提供）
+        column_of = {code: j for j, code in enumerate(codes)}
+        n_symbols, n_codes = len(symbols), len(weight_codes)
+        if matrix.dtype == object or matrix.dtype == bool:
+            # 保留原始型別（bool 明細顯示 raw=True / False）
+            raw = np.full((n_symbols, n_codes), np.nan, dtype=object)
+        else:
+            raw = np.full((n_symbols, n_codes), np.nan)
+        normalized = np.zeros((n_symbols, n_codes))
+        for k, code in enumerate(weight_codes):
+            j = column_of.get(code)
+            if j is None:
+                continue
+            column = matrix[:, j]
+            raw[:, k] = column
+            normalized[:, k] = self._normalize_column(code, column)
+
+        # 逐指標累加（與 evaluate() 相同的加總順序，總分逐位元一致）
+        weights = np.array([self.weights[code] for code in weight_codes], dtype=float)
+        total_scores = np.zeros(n_symbols)
+        for k in range(n_codes):
+            total_scores += normalized[:, k] * weights[k]
+
+        return StockUpsideBatchResult(
+            symbols=symbols,
+            codes=weight_codes,
+            total_scores=total_scores,
+            verdicts=self._verdicts(total_scores),
+            raw=raw,
+            normalized=normalized,
+            weights=weights,
+        )
+
+    def _normalize_column(self, code: str, column: np.ndarray) -> np.ndarray:
+        """Vectorized _normalize for one indicator column."""
+        if column.dtype == bool:
+            return np.where(column, 1.0, -1.0)
+        if column.dtype == object:
+            normalize = np.frompyfunc(
+                lambda value: 0.0 if _is_missing(value) else self._normalize(code, value), 1, 1
+            )
+            return normalize(column).astype(float)
+        values = column.astype(float)
+        return np.where(np.isnan(values), 0.0, np.clip(values / 100.0, -1.0, 1.0))
+
+    @classmethod
+    def _verdict(cls, total_score: float) -> str:
+        for threshold, verdict in cls.VERDICT_THRESHOLDS:
+            if total_score >= threshold:
+                return verdict
+        return cls.VERDICT_BELOW_ALL
+
+    @classmethod
+    def _verdicts(cls, total_scores: np.ndarray) -> np.ndarray:
+        conditions = [total_scores >= threshold for threshold, _ in cls.VERDICT_THRESHOLDS]
+        choices = [verdict for _, verdict in cls.VERDICT_THRESHOLDS]
+        return np.select(conditions, choices, default=cls.VERDICT_BELOW_ALL)
+
+    @staticmethod
+    def _summary(symbol: str, total_score: float, verdict: str) -> str:
+        return (
+            f"{symbol} total_score={total_score:.2f}, verdict={verdict}. "
+            "Evaluation based on J-GOD 60-Indicator Upside Framework."
+        )
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
@@ -15,12 +15,14 @@ Reference: docs/J-GOD_RISK_MODEL_STANDARD_v1.md
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
 import pandas as pd
 import numpy as np
 
 from jgod.risk.exposure_schema import FactorExposure
 from jgod.risk.risk_factors import STANDARD_FACTOR_NAMES
+from jgod.risk.risk_model_incremental import IncrementalRiskState
 
 
 def _validate_factor_names(factor_names: List[str]) -> None:
@@ -109,6 +111,19 @@ def _calculate_ewma_covariance(
         r = row.values.reshape(-1, 1)
         cov_matrix = lambda_param * cov_matrix + (1 - lambda_param) * (r @ r.T)
     
+    return _finalize_ewma_covariance(cov_matrix, returns_df.columns)
+
+
+def _finalize_ewma_covariance(cov_matrix: np.ndarray, columns: Sequence[str]) -> pd.DataFrame:
+    """Annualize a raw (daily) EWMA covariance state and make it PSD
+    
+    Args:
+        cov_matrix: EWMA recursion state (K × K), daily
+        columns: Factor names for index / columns
+    
+    Returns:
+        Covariance matrix (annualized)
+    """
     # Annualize (assuming daily returns)
     cov_matrix = cov_matrix * 252
     
@@ -119,11 +134,99 @@ def _calculate_ewma_covariance(
     
     return pd.DataFrame(
         cov_matrix,
-        index=returns_df.columns,
-        columns=returns_df.columns
+        index=columns,
+        columns=columns
     )
 
 
+@dataclass
+class RiskObservationPanel:
+    """Columnar (date, symbol) observation panel used during fit
+    
+    One row per aligned observation, stored as NumPy columns instead of one
+    dict per (date, symbol):
+    
+        date_idx:   (n_obs,) int positions into `dates`
+        symbol_idx: (n_obs,) int positions into `symbols`
+        returns:    (n_obs,) float stock returns
+        exposures:  (n_obs × K) float factor exposures
+    
+    `dates` are sorted and `symbols` are sorted, so dense (T × N) views built
+    by `to_dense()` follow the same ordering as the model's B rows.
+    """
+    dates: pd.DatetimeIndex
+    symbols: List[str]
+    date_idx: np.ndarray
+    symbol_idx: np.ndarray
+    returns: np.ndarray
+    exposures: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.returns)
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        dates: pd.DatetimeIndex,
+        symbols: Sequence[str],
+        returns: np.ndarray,
+        exposures: np.ndarray
+    ) -> "RiskObservationPanel":
+        """Build a panel from per-observation date / symbol labels and values"""
+        date_idx, unique_dates = pd.factorize(pd.DatetimeIndex(dates), sort=True)
+        symbol_idx, unique_symbols = pd.factorize(pd.Index(symbols, dtype=object), sort=True)
+        return cls(
+            dates=pd.DatetimeIndex(unique_dates),
+            symbols=list(unique_symbols),
+            date_idx=date_idx.astype(np.intp),
+            symbol_idx=symbol_idx.astype(np.intp),
+            returns=np.asarray(returns, dtype=float),
+            exposures=np.asarray(exposures, dtype=float),
+        )
+    
+    @classmethod
+    def from_records(cls, records: List[Dict], n_factors: int) -> "RiskObservationPanel":
+        """Build a panel from legacy 'date' / 'symbol' / 'return' / 'exposure_vector' dicts"""
+        return cls.from_arrays(
+            dates=pd.DatetimeIndex([row['date'] for row in records]),
+            symbols=[row['symbol'] for row in records],
+            returns=np.array([row['return'] for row in records], dtype=float),
+            exposures=np.array(
+                [row['exposure_vector'] for row in records], dtype=float
+            ).reshape(len(records), n_factors),
+        )
+    
+    def to_records(self) -> List[Dict]:
+        """Expand into legacy per-observation dicts (for reference implementations)"""
+        return [
+            {
+                'date': self.dates[d],
+                'symbol': self.symbols[j],
+                'return': float(r),
+                'exposure_vector': x,
+            }
+            for d, j, r, x in zip(self.date_idx, self.symbol_idx, self.returns, self.exposures)
+        ]
+    
+    def with_returns(self, returns: np.ndarray) -> "RiskObservationPanel":
+        """Copy of the panel with a replaced return column (other columns shared)"""
+        return replace(self, returns=np.asarray(returns, dtype=float))
+    
+    def to_dense(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Dense views: returns (T × N), presence mask (T × N), exposures (T × N × K)
+        
+        Missing cells are 0.
+        """
+        T, N, K = len(self.dates), len(self.symbols), self.exposures.shape[1]
+        R = np.zeros((T, N))
+        present = np.zeros((T, N), dtype=bool)
+        X = np.zeros((T, N, K))
+        R[self.date_idx, self.symbol_idx] = self.returns
+        X[self.date_idx, self.symbol_idx] = self.exposures
+        present[self.date_idx, self.symbol_idx] = True
+        return R, present, X
+
+
 class MultiFactorRiskModel:
     """Multi-Factor Risk Model
     
@@ -149,6 +252,9 @@ class MultiFactorRiskModel:
         
         # Explain risk for a single stock
         risk_decomp = model.explain_risk(exposure)
+        
+        # Advance by new dates without a full refit
+        model.update(new_returns, new_exposures)
     """
     
     def __init__(self, factor_names: Optional[List[str]] = None):
@@ -188,6 +294,14 @@ class MultiFactorRiskModel:
         self.ewma_half_life = 60.0  # Half-life for beta regression weights
         self.factor_cov_lambda = 0.94  # EWMA decay for factor covariance
         self.specific_risk_lambda = 0.94  # EWMA decay for specific risk
+        self.winsorize_quantiles = (0.001, 0.999)  # Return winsorization quantiles (±3σ)
+        self.refit_interval = 21  # update(): rebuild incremental accumulators every N new dates
+        
+        # Incremental update state (see update())
+        self._state: Optional[IncrementalRiskState] = None
+        self._state_source: Optional[Tuple[RiskObservationPanel, pd.DataFrame]] = None
+        self._winsorize_bounds: Optional[Tuple[pd.Series, pd.Series, float, float]] = None
+        self._dates_since_refit = 0
         
     def fit(
         self,
@@ -219,34 +333,43 @@ class MultiFactorRiskModel:
             self._initialize_default_model()
             return
         
+        self._state = None
+        self._state_source = None
+        
         try:
             # Prepare data
-            aligned_data = self._prepare_aligned_data(exposures, returns)
+            panel = self._prepare_aligned_data(exposures, returns)
             
-            if len(aligned_data) < min_observations:
-                print(f"Warning: Insufficient data ({len(aligned_data)} < {min_observations}). Using default model.")
+            if len(panel) < min_observations:
+                print(f"Warning: Insufficient data ({len(panel)} < {min_observations}). Using default model.")
                 self._initialize_default_model()
                 return
             
             # Step 1: Get or estimate factor returns
             if factor_returns is None:
-                factor_returns = self._estimate_factor_returns_from_exposures(aligned_data)
+                factor_returns = self._estimate_factor_returns_from_exposures(panel)
             
             if factor_returns is None or len(factor_returns) < min_observations:
                 print("Warning: Insufficient factor returns. Using default model.")
                 self._initialize_default_model()
                 return
             
-            # Winsorize factor returns and stock returns
+            # Winsorize factor returns and stock returns (bounds are kept for update())
+            lower, upper = self.winsorize_quantiles
+            returns_series = pd.Series(panel.returns)
+            winsorize_bounds = (
+                factor_returns.quantile(lower), factor_returns.quantile(upper),
+                returns_series.quantile(lower), returns_series.quantile(upper),
+            )
             factor_returns = self._winsorize_factor_returns(factor_returns)
-            aligned_data = self._winsorize_stock_returns(aligned_data)
+            panel = self._winsorize_stock_returns(panel)
             
             # Step 2: Estimate factor covariance matrix F (EWMA, λ=0.94)
             self.F = self._estimate_factor_covariance_ewma(factor_returns)
             
             # Step 3: Estimate Betas (B) using WLS regression (12 months, EWMA weights)
             self.B, self.symbols, residuals_dict = self._estimate_betas_wls(
-                aligned_data, factor_returns
+                panel, factor_returns
             )
             
             # Step 4: Estimate Specific Risk (D) using EWMA residual variance
@@ -261,113 +384,288 @@ class MultiFactorRiskModel:
             self.factor_returns = factor_returns
             self.residuals = residuals_dict
             
+            # Incremental state is built lazily on the first update()
+            self._state_source = (panel, factor_returns)
+            self._winsorize_bounds = winsorize_bounds
+            self._dates_since_refit = 0
+            
         except Exception as e:
             print(f"Warning: Error fitting risk model: {e}. Using default model.")
             import traceback
             traceback.print_exc()
             self._initialize_default_model()
     
+    def update(
+        self,
+        new_returns: pd.Series,
+        new_exposures: List[FactorExposure],
+        factor_returns: Optional[pd.DataFrame] = None
+    ) -> None:
+        """Advance a fitted model by new dates without a full refit
+        
+        Incrementally advances:
+        1. Factor covariance F: the EWMA recursion continues from its last state
+        2. Betas B: each symbol's WLS normal equations F'WF / F'WR are decayed,
+           the new observation is added and any observation leaving the
+           12-month window is subtracted
+        3. Specific risk D: residual moments are advanced the same way and the
+           EWMA residual variance is evaluated in closed form
+        
+        Only symbols with new observations are re-solved. Every
+        `refit_interval` new dates all accumulators are rebuilt from the
+        retained windows (full-refit safeguard against drift). Winsorization
+        bounds are frozen at the last fit(); call fit() to re-estimate them.
+        
+        Args:
+            new_returns: Series of stock returns with MultiIndex (date, symbol)
+                         for dates after the last fitted date
+            new_exposures: FactorExposure objects for the new dates
+            factor_returns: Optional DataFrame of factor returns for the new dates
+                           If None, will be estimated from the new cross-sections
+        
+        Note:
+            If the model has not been fitted yet, this is a cold fit().
+            Observations on dates already covered by the model are ignored.
+        """
+        if not new_exposures or new_returns.empty:
+            return
+        
+        if self._state is None and self._state_source is None:
+            self.fit(new_exposures, new_returns, factor_returns)
+            return
+        
+        state = self._get_incremental_state()
+        panel = self._prepare_aligned_data(new_exposures, new_returns)
+        
+        # Only dates after the last fitted date
+        is_new = np.asarray(panel.dates > state.last_date)
+        if not is_new.all():
+            print(f"Warning: Ignoring {int((~is_new).sum())} already-fitted date(s) in update().")
+            keep = is_new[panel.date_idx]
+            panel = RiskObservationPanel.from_arrays(
+                dates=panel.dates[panel.date_idx[keep]],
+                symbols=np.asarray(panel.symbols, dtype=object)[panel.symbol_idx[keep]],
+                returns=panel.returns[keep],
+                exposures=panel.exposures[keep],
+            )
+        if len(panel) == 0:
+            return
+        
+        # Factor returns for the new dates
+        if factor_returns is None:
+            factor_returns = self._estimate_factor_returns_from_exposures(panel)
+        if factor_returns is None:
+            factor_returns = pd.DataFrame(columns=state.factor_returns.columns, dtype=float)
+        factor_returns = factor_returns[~factor_returns.index.duplicated(keep="first")]
+        if len(state.factor_returns) > 0:
+            factor_returns = factor_returns[factor_returns.index > state.factor_returns.index.max()]
+        factor_returns = factor_returns.sort_index()
+        
+        # Winsorize with the bounds of the last fit
+        factor_lower, factor_upper, return_lower, return_upper = self._winsorize_bounds
+        factor_returns = factor_returns.clip(lower=factor_lower, upper=factor_upper, axis=1)
+        panel = panel.with_returns(np.clip(panel.returns, return_lower, return_upper))
+        
+        # Step 1: Factor covariance recursion
+        state.advance_factor_returns(factor_returns)
+        
+        # Step 2-3: Push each new date into the symbols' windows
+        n_symbols_before = len(state.symbols)
+        state.add_symbols(panel.symbols)
+        symbol_rows = np.searchsorted(
+            np.asarray(state.symbols, dtype=object), np.asarray(panel.symbols, dtype=object)
+        )[panel.symbol_idx]
+        
+        factor_lookup = state.factor_returns[~state.factor_returns.index.duplicated(keep="first")]
+        order = np.argsort(panel.date_idx, kind="stable")
+        bounds = np.searchsorted(panel.date_idx[order], np.arange(len(panel.dates) + 1))
+        for t, date in enumerate(panel.dates):
+            obs = order[bounds[t]:bounds[t + 1]]
+            factor_row = factor_lookup.loc[date].to_numpy(dtype=float) if date in factor_lookup.index else None
+            state.advance(date, symbol_rows[obs], panel.returns[obs], panel.exposures[obs], factor_row)
+        
+        # Periodic full-refit safeguard
+        self._dates_since_refit += len(panel.dates)
+        if self._dates_since_refit >= self.refit_interval:
+            state.recompute()
+            self._dates_since_refit = 0
+            touched = np.arange(len(state.symbols))
+        elif len(state.symbols) != n_symbols_before:
+            touched = np.arange(len(state.symbols))
+        else:
+            touched = np.unique(symbol_rows)
+        
+        self._refresh_from_state(touched)
+    
+    def _get_incremental_state(self) -> IncrementalRiskState:
+        """Return the incremental state, building it from the last fit if needed"""
+        if self._state is None:
+            panel, factor_returns = self._state_source
+            self._state = IncrementalRiskState.from_panel(
+                panel,
+                factor_returns,
+                window=self.beta_regression_window,
+                beta_decay=np.exp(-np.log(2) / self.ewma_half_life),
+                specific_lambda=self.specific_risk_lambda,
+                factor_lambda=self.factor_cov_lambda,
+            )
+            self._state_source = None
+        return self._state
+    
+    def _refresh_from_state(self, rows: np.ndarray) -> None:
+        """Re-solve B / D for the given state rows and rebuild Σ"""
+        state = self._state
+        N = len(state.symbols)
+        
+        if self.B is None or self.D is None or self.symbols != state.symbols:
+            rows = np.arange(N)
+            self.B = np.zeros((N, self.K))
+            D_diagonal = np.zeros(N)
+            self.symbols = list(state.symbols)
+            self.specific_risk = {}
+            self.residuals = {}
+        else:
+            D_diagonal = np.diag(self.D).copy()
+        
+        betas, solved = state.solve_betas(rows)
+        specific_var = state.specific_variance(rows, betas, solved)
+        self.B[rows] = betas
+        D_diagonal[rows] = specific_var
+        self.D = np.diag(D_diagonal)
+        for j, var in zip(rows, specific_var):
+            self.specific_risk[state.symbols[j]] = float(np.sqrt(var))  # Store as volatility
+        self.residuals.update(state.residuals(rows, betas, solved))
+        
+        if state.factor_returns.empty:
+            self.F = self._estimate_factor_covariance_ewma(state.factor_returns)
+        else:
+            self.F = _finalize_ewma_covariance(state.factor_cov_raw, state.factor_returns.columns)
+        self.factor_returns = state.factor_returns
+        
+        self._build_covariance_matrix()
+    
     def _prepare_aligned_data(
         self,
         exposures: List[FactorExposure],
         returns: pd.Series
-    ) -> List[Dict]:
+    ) -> RiskObservationPanel:
         """Prepare aligned data for estimation
         
+        Every return whose (date, symbol) has an exposure becomes one row of a
+        columnar RiskObservationPanel. When an exposure appears more than once
+        for the same (date, symbol), the last one wins.
+        
         Args:
             exposures: List of FactorExposure objects
             returns: Series of stock returns
         
         Returns:
-            List of dictionaries with 'date', 'symbol', 'return', 'exposure_vector'
+            RiskObservationPanel with one row per aligned observation
         """
-        # Build exposure mapping
-        exposure_dict = {}
-        for exp in exposures:
-            key = (pd.Timestamp(exp.date), exp.symbol)
-            exposure_dict[key] = exp
-        
-        # Align returns with exposures
-        aligned_data = []
-        
+        # Exposure keys and matrix (n_exposures × K)
+        exposure_keys = pd.MultiIndex.from_arrays([
+            pd.DatetimeIndex([pd.Timestamp(exp.date) for exp in exposures]),
+            pd.Index([exp.symbol for exp in exposures], dtype=object),
+        ])
+        exposure_matrix = np.array(
+            [[exp.exposures.get(factor, 0.0) for factor in self.factor_names] for exp in exposures],
+            dtype=float
+        ).reshape(len(exposures), self.K)
+        
+        keep_last = ~exposure_keys.duplicated(keep='last')
+        exposure_keys = exposure_keys[keep_last]
+        exposure_matrix = exposure_matrix[keep_last]
+        
+        # Return keys: MultiIndex (date, symbol), or an index of (date, symbol) tuples
         if isinstance(returns.index, pd.MultiIndex):
-            for (date, symbol), ret in returns.items():
-                key = (pd.Timestamp(date), symbol)
-                if key in exposure_dict:
-                    exp = exposure_dict[key]
-                    aligned_data.append({
-                        'date': pd.Timestamp(date),
-                        'symbol': symbol,
-                        'return': float(ret),
-                        'exposure_vector': exp.get_exposure_vector(self.factor_names)
-                    })
+            return_values = returns.to_numpy(dtype=float)
+            return_dates = returns.index.get_level_values(0)
+            return_symbols = returns.index.get_level_values(1)
         else:
-            for idx, ret in returns.items():
-                if isinstance(idx, tuple) and len(idx) == 2:
-                    date, symbol = idx
-                    key = (pd.Timestamp(date), symbol)
-                    if key in exposure_dict:
-                        exp = exposure_dict[key]
-                        aligned_data.append({
-                            'date': pd.Timestamp(date),
-                            'symbol': symbol,
-                            'return': float(ret),
-                            'exposure_vector': exp.get_exposure_vector(self.factor_names)
-                        })
-        
-        return aligned_data
+            is_pair = np.array(
+                [isinstance(idx, tuple) and len(idx) == 2 for idx in returns.index], dtype=bool
+            )
+            pairs = returns.index[is_pair]
+            return_values = returns.to_numpy(dtype=float)[is_pair]
+            return_dates = [date for date, _ in pairs]
+            return_symbols = [symbol for _, symbol in pairs]
+        
+        return_keys = pd.MultiIndex.from_arrays([
+            pd.DatetimeIndex(pd.to_datetime(return_dates)),
+            pd.Index(return_symbols, dtype=object),
+        ])
+        
+        # Align returns (in their original order) with exposures
+        matched = exposure_keys.get_indexer(return_keys)
+        is_matched = matched >= 0
+        matched = matched[is_matched]
+        
+        return RiskObservationPanel.from_arrays(
+            dates=return_keys.get_level_values(0)[is_matched],
+            symbols=return_keys.get_level_values(1)[is_matched],
+            returns=return_values[is_matched],
+            exposures=exposure_matrix[matched],
+        )
     
     def _estimate_factor_returns_from_exposures(
         self,
-        aligned_data: List[Dict]
+        panel: RiskObservationPanel
     ) -> Optional[pd.DataFrame]:
         """Estimate factor returns using cross-sectional regression
         
+        For every date with at least K observations, solves X'X f = X'y.
+        Per-date normal equations are accumulated one date group at a time
+        and solved in one stacked solve; ill-conditioned dates (cond > 1e10)
+        are skipped.
+        
         Args:
-            aligned_data: List of aligned data dictionaries
+            panel: Aligned observation panel
         
         Returns:
             DataFrame of factor returns (date × factors)
         """
-        # Group by date
-        date_dict = {}
-        for row in aligned_data:
-            date = row['date']
-            if date not in date_dict:
-                date_dict[date] = []
-            date_dict[date].append(row)
-        
-        factor_returns_list = []
-        factor_dates = []
-        
-        for date in sorted(date_dict.keys()):
-            rows = date_dict[date]
-            
-            if len(rows) < self.K:  # Need at least K observations
-                continue
-            
-            # Build design matrix and return vector
-            X = np.array([row['exposure_vector'] for row in rows])
-            y = np.array([row['return'] for row in rows])
-            
-            # Cross-sectional regression: y = X * f
-            try:
-                XtX = X.T @ X
-                if np.linalg.cond(XtX) > 1e10:
+        if len(panel) == 0:
+            return None
+        
+        T, K = len(panel.dates), self.K
+        
+        # Per-date X'X (T × K × K), X'y (T × K) and observation counts,
+        # accumulated one date at a time (no n_obs × K × K temporary)
+        order = np.argsort(panel.date_idx, kind="stable")
+        bounds = np.searchsorted(panel.date_idx[order], np.arange(T + 1))
+        counts = np.diff(bounds)
+        XtX = np.zeros((T, K, K))
+        Xty = np.zeros((T, K))
+        for t in np.flatnonzero(counts):
+            obs = order[bounds[t]:bounds[t + 1]]
+            Xs = panel.exposures[obs]
+            XtX[t] = Xs.T @ Xs
+            Xty[t] = Xs.T @ panel.returns[obs]
+        
+        candidates = np.flatnonzero(counts >= K)  # Need at least K observations
+        if len(candidates) == 0:
+            return None
+        
+        cond = np.linalg.cond(XtX[candidates])
+        usable = candidates[~(cond > 1e10)]
+        
+        factor_ret = np.full((T, K), np.nan)
+        try:
+            factor_ret[usable] = np.linalg.solve(XtX[usable], Xty[usable][:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            for t in usable:
+                try:
+                    factor_ret[t] = np.linalg.solve(XtX[t], Xty[t])
+                except np.linalg.LinAlgError:
                     continue
-                
-                factor_ret = np.linalg.solve(XtX, X.T @ y)
-                factor_returns_list.append(factor_ret)
-                factor_dates.append(date)
-            except np.linalg.LinAlgError:
-                continue
-        
-        if not factor_returns_list:
+        
+        solved = np.flatnonzero(~np.isnan(factor_ret).any(axis=1))
+        if len(solved) == 0:
             return None
         
         return pd.DataFrame(
-            factor_returns_list,
-            index=pd.to_datetime(factor_dates),
+            factor_ret[solved],
+            index=pd.DatetimeIndex(panel.dates[solved]),
             columns=self.factor_names
         )
     
@@ -380,29 +678,26 @@ class MultiFactorRiskModel:
         Returns:
             Winsorized factor returns
         """
+        lower, upper = self.winsorize_quantiles
         winsorized = factor_returns.copy()
         for col in winsorized.columns:
-            winsorized[col] = _winsorize_series(winsorized[col], lower=0.001, upper=0.999)
+            winsorized[col] = _winsorize_series(winsorized[col], lower=lower, upper=upper)
         return winsorized
     
-    def _winsorize_stock_returns(self, aligned_data: List[Dict]) -> List[Dict]:
+    def _winsorize_stock_returns(self, panel: RiskObservationPanel) -> RiskObservationPanel:
         """Winsorize stock returns (±3σ)
         
         Args:
-            aligned_data: List of aligned data dictionaries
+            panel: Aligned observation panel
         
         Returns:
-            List with winsorized returns
+            Panel with winsorized returns
         """
-        returns = [row['return'] for row in aligned_data]
-        returns_series = pd.Series(returns)
-        returns_winsorized = _winsorize_series(returns_series, lower=0.001, upper=0.999)
-        
-        winsorized_data = aligned_data.copy()
-        for i, row in enumerate(winsorized_data):
-            row['return'] = float(returns_winsorized.iloc[i])
-        
-        return winsorized_data
+        lower, upper = self.winsorize_quantiles
+        returns_winsorized = _winsorize_series(
+            pd.Series(panel.returns), lower=lower, upper=upper
+        )
+        return panel.with_returns(returns_winsorized.to_numpy(dtype=float))
     
     def _estimate_factor_covariance_ewma(
         self,
@@ -435,130 +730,99 @@ class MultiFactorRiskModel:
     
     def _estimate_betas_wls(
         self,
-        aligned_data: List[Dict],
+        panel: RiskObservationPanel,
         factor_returns: pd.DataFrame
     ) -> Tuple[np.ndarray, List[str], Dict[str, List[float]]]:
-        """Estimate Betas using WLS regression with EWMA weights
+        """Estimate Betas using batched WLS regression with EWMA weights
+        
+        Vectorized equivalent of the original per-symbol WLS loop (kept as the
+        reference in tests/risk/test_risk_model_wls_batched.py):
+        - The panel is expanded once into a (T × N) return matrix with a presence mask
+        - Each symbol's regression window (its last 252 observations, restricted
+          to dates with factor returns) is expressed as a (T × N) boolean mask
+        - EWMA weights are applied by broadcasting instead of a T × T diagonal
+        - All N normal equations F' W F β = F' W R are solved in one stacked solve
         
-        Specification:
-        - Regression window: 12 months (252 trading days)
-        - Weights: EWMA with half-life = 60
-        - Winsorization: ±3σ (already done in fit())
+        Fallbacks match the per-symbol estimator:
+        - < K observations in window → zero beta
+        - < K observations with factor returns → latest exposure in window
+        - ill-conditioned F' W F (cond > 1e10) → latest aligned exposure
         
         Args:
-            aligned_data: List of aligned data dictionaries
+            panel: Aligned observation panel
             factor_returns: DataFrame of factor returns
         
         Returns:
             Tuple of (B matrix, symbols list, residuals dictionary)
         """
-        # Group by symbol
-        symbol_dict = {}
-        for row in aligned_data:
-            symbol = row['symbol']
-            if symbol not in symbol_dict:
-                symbol_dict[symbol] = []
-            symbol_dict[symbol].append(row)
-        
-        # Sort symbols for consistent ordering
-        symbols = sorted(symbol_dict.keys())
-        
-        # Estimate beta for each symbol
-        beta_rows = []
-        residuals_dict = {}
-        
-        for symbol in symbols:
-            rows = symbol_dict[symbol]
-            
-            # Sort by date
-            rows.sort(key=lambda x: x['date'])
-            
-            # Get recent 252 days (or all if less)
-            recent_rows = rows[-self.beta_regression_window:]
-            
-            if len(recent_rows) < self.K:  # Need at least K observations
-                # Use zero beta as default
-                beta_rows.append(np.zeros(self.K))
-                residuals_dict[symbol] = []
-                continue
-            
-            # Extract dates, returns, and exposures
-            dates = [row['date'] for row in recent_rows]
-            returns = np.array([row['return'] for row in recent_rows])
-            exposure_matrix = np.array([row['exposure_vector'] for row in recent_rows])
-            
-            # Get corresponding factor returns
-            factor_ret_rows = []
-            for date in dates:
-                if date in factor_returns.index:
-                    factor_ret_rows.append(factor_returns.loc[date].values)
-                else:
-                    # If factor return missing, skip this observation
-                    continue
-            
-            if len(factor_ret_rows) < self.K:
-                # Use recent exposure as fallback
-                beta = np.array(recent_rows[-1]['exposure_vector']) if recent_rows else np.zeros(self.K)
-                beta_rows.append(beta)
-                residuals_dict[symbol] = []
-                continue
-            
-            # Build factor return matrix (T × K)
-            F_matrix = np.array(factor_ret_rows)
-            
-            # Align returns with factor returns (remove missing dates)
-            aligned_returns = []
-            aligned_exposures = []
-            for i, date in enumerate(dates):
-                if date in factor_returns.index:
-                    aligned_returns.append(returns[i])
-                    aligned_exposures.append(exposure_matrix[i])
-            
-            if len(aligned_returns) < self.K:
-                # Use recent exposure as fallback
-                beta = exposure_aligned[-1] if len(exposure_aligned) > 0 else np.zeros(self.K)
-                beta_rows.append(beta)
-                residuals_dict[symbol] = []
-                continue
-            
-            returns_aligned = np.array(aligned_returns)
-            exposure_aligned = np.array(aligned_exposures)
-            
-            # Build matrices for WLS regression: R = F * beta + epsilon
-            R = returns_aligned.reshape(-1, 1)  # (T × 1)
-            F = F_matrix  # (T × K)
-            
-            # Calculate EWMA weights (half-life = 60)
-            T = len(R)
-            weights = _calculate_ewma_weights(T, half_life=self.ewma_half_life)
-            W = np.diag(weights)  # Weight matrix (T × T)
-            
-            # Weighted Least Squares: beta = (F' W F)^(-1) F' W R
-            try:
-                FtWF = F.T @ W @ F
-                
-                # Check condition number
-                if np.linalg.cond(FtWF) > 1e10:
-                    # Use recent exposure as fallback
-                    beta = exposure_aligned[-1] if len(exposure_aligned) > 0 else np.zeros(self.K)
-                    residuals_dict[symbol] = []
-                else:
-                    beta = np.linalg.solve(FtWF, F.T @ W @ R).flatten()
-                    
-                    # Calculate residuals: epsilon = R - F * beta
-                    predicted = F @ beta
-                    residuals = (R.flatten() - predicted).tolist()
-                    residuals_dict[symbol] = residuals
-                
-            except np.linalg.LinAlgError:
-                # Use recent exposure as fallback
-                beta = exposure_aligned[-1] if len(exposure_aligned) > 0 else np.zeros(self.K)
-                residuals_dict[symbol] = []
-            
-            beta_rows.append(beta)
-        
-        # Build B matrix (N × K)
-        B = np.array(beta_rows)
+        dates, symbols = panel.dates, list(panel.symbols)
+        R, present, X = panel.to_dense()
+        N, K = len(symbols), self.K
+        if N == 0:
+            return np.zeros((0, K)), symbols, {}
+        
+        # Factor returns aligned to the observation dates (missing → excluded)
+        factor_returns = factor_returns[~factor_returns.index.duplicated(keep="first")]
+        has_factor = dates.isin(factor_returns.index)
+        F = factor_returns.reindex(dates).to_numpy(dtype=float)
+        F[~has_factor] = 0.0
+        
+        # Regression window: the last `beta_regression_window` observations per symbol
+        obs_from_end = np.cumsum(present[::-1], axis=0)[::-1]
+        in_window = present & (obs_from_end <= self.beta_regression_window)
+        valid = in_window & has_factor[:, None]
+        n_window = in_window.sum(axis=0)
+        n_valid = valid.sum(axis=0)
+        
+        # EWMA weights (half-life) per symbol, normalized to sum to n_valid
+        decay = np.exp(-np.log(2) / self.ewma_half_life)
+        valid_from_end = np.cumsum(valid[::-1], axis=0)[::-1] - 1
+        W = np.where(valid, decay ** np.maximum(valid_from_end, 0), 0.0)
+        W_sum = W.sum(axis=0)
+        W = W / np.where(W_sum > 0, W_sum, 1.0) * n_valid
+        
+        # Normal equations for all symbols at once
+        outer = (F[:, :, None] * F[:, None, :]).reshape(len(dates), K * K)
+        FtWF = (W.T @ outer).reshape(N, K, K)
+        FtWR = (W * R).T @ F
+        
+        B = np.zeros((N, K))
+        solved = np.zeros(N, dtype=bool)
+        
+        candidates = np.flatnonzero(n_valid >= K)
+        if len(candidates) > 0:
+            cond = np.linalg.cond(FtWF[candidates])
+            well_conditioned = candidates[~(cond > 1e10)]
+            if len(well_conditioned) > 0:
+                try:
+                    B[well_conditioned] = np.linalg.solve(
+                        FtWF[well_conditioned], FtWR[well_conditioned][:, :, None]
+                    )[:, :, 0]
+                    solved[well_conditioned] = True
+                except np.linalg.LinAlgError:
+                    # Isolate the singular system(s); the rest keep their solution
+                    for j in well_conditioned:
+                        try:
+                            B[j] = np.linalg.solve(FtWF[j], FtWR[j])
+                            solved[j] = True
+                        except np.linalg.LinAlgError:
+                            pass
+        
+        # Fallback betas from the latest exposure
+        last_in_window = len(dates) - 1 - np.argmax(in_window[::-1], axis=0)
+        last_valid = len(dates) - 1 - np.argmax(valid[::-1], axis=0)
+        cols = np.arange(N)
+        use_window_exposure = (n_window >= K) & (n_valid < K)
+        use_valid_exposure = (n_valid >= K) & ~solved
+        B[use_window_exposure] = X[last_in_window, cols][use_window_exposure]
+        B[use_valid_exposure] = X[last_valid, cols][use_valid_exposure]
+        
+        # Residuals ε = R - F β over each solved symbol's window
+        residual_matrix = R - F @ B.T
+        residuals_dict = {
+            symbol: residual_matrix[valid[:, j], j].tolist() if solved[j] else []
+            for j, symbol in enumerate(symbols)
+        }
         
         return B, symbols, residuals_dict
     
@@ -579,35 +843,34 @@ class MultiFactorRiskModel:
             Tuple of (D diagonal matrix, specific_risk dictionary)
         """
         N = len(symbols)
-        D_diagonal = np.zeros(N)
-        specific_risk_dict = {}
-        
         lambda_param = self.specific_risk_lambda
         
+        # Right-aligned (N × L) residual matrix; padding contributes nothing
+        lengths = np.array([len(residuals_dict.get(symbol, [])) for symbol in symbols], dtype=int)
+        L = int(lengths.max()) if N > 0 else 0
+        resid = np.zeros((N, L))
         for i, symbol in enumerate(symbols):
-            residuals = residuals_dict.get(symbol, [])
-            
-            if len(residuals) < 10:
-                # Not enough data, use default
-                D_diagonal[i] = 1e-6
-                specific_risk_dict[symbol] = np.sqrt(1e-6)
-                continue
-            
-            # Calculate EWMA variance of residuals
-            residuals_array = np.array(residuals)
-            
-            # Initialize variance
-            var_ewma = np.var(residuals_array) * 252  # Annualize
-            
-            # Apply EWMA recursion
-            for residual in residuals_array:
-                var_ewma = lambda_param * var_ewma + (1 - lambda_param) * ((residual * np.sqrt(252)) ** 2)
-            
-            # Ensure non-negative
-            var_ewma = max(var_ewma, 1e-6)
-            
-            D_diagonal[i] = var_ewma
-            specific_risk_dict[symbol] = np.sqrt(var_ewma)  # Store as volatility
+            if lengths[i] > 0:
+                resid[i, L - lengths[i]:] = residuals_dict[symbol]
+        
+        # Initialize variance (annualized sample variance of each residual series)
+        n = np.maximum(lengths, 1)
+        mean = resid.sum(axis=1) / n
+        is_obs = np.arange(L)[None, :] >= (L - lengths)[:, None]
+        var0 = np.where(is_obs, resid - mean[:, None], 0.0)
+        var0 = (var0 ** 2).sum(axis=1) / n * 252
+        
+        # Closed form of the EWMA recursion v ← λ v + (1 - λ) (ε √252)²:
+        # v_n = λ^n v_0 + (1 - λ) Σ_k λ^(n-1-k) (ε_k √252)²
+        decay = lambda_param ** np.arange(L - 1, -1, -1, dtype=float)
+        var_ewma = lambda_param ** lengths * var0 + (1 - lambda_param) * ((resid ** 2 * 252) @ decay)
+        
+        # Ensure non-negative; not enough data (< 10 residuals) → default
+        D_diagonal = np.where(lengths < 10, 1e-6, np.maximum(var_ewma, 1e-6))
+        specific_risk_dict = {
+            symbol: float(np.sqrt(D_diagonal[i]))  # Store as volatility
+            for i, symbol in enumerate(symbols)
+        }
         
         # Build D as diagonal matrix
         D = np.diag(D_diagonal)
@@ -649,6 +912,8 @@ class MultiFactorRiskModel:
         self.symbols = []
         self.specific_risk = {}
         self.residuals = {}
+        self._state = None
+        self._state_source = None
     
     def get_factor_covariance(self) -> pd.DataFrame:
         """Get factor covariance matrix F
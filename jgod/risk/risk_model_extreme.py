@@ -6,6 +6,8 @@ This module provides an extreme-level risk model with:
 - PCA-based factor extraction
 - Factor model decomposition: cov = B F B^T + S
 - Positive semi-definite enforcement
+- Incremental updates: update() advances the sample-covariance moments
+  instead of recomputing them from the full history
 
 Reference: docs/JGOD_EXTREME_MODE_EDITOR_INSTRUCTIONS.md
 """
@@ -36,6 +38,9 @@ class RiskModelExtremeConfig:
     # Regularization
     min_eigenvalue: float = 1e-8  # Minimum eigenvalue for positive definiteness
     shrinkage_factor: float = 0.1  # Default shrinkage if Ledoit-Wolf fails
+    
+    # Incremental updates
+    refit_interval: int = 21  # update(): recompute moments from history every N updates
 
 
 class MultiFactorRiskModelExtreme:
@@ -74,6 +79,11 @@ class MultiFactorRiskModelExtreme:
         self.factor_count: int = 0
         self.factor_returns: Optional[pd.DataFrame] = None
         self.factor_loadings: Optional[pd.DataFrame] = None
+        
+        # Incremental update state (see update())
+        self._returns_history: Optional[pd.DataFrame] = None
+        self._moments: Optional[Tuple[int, np.ndarray, np.ndarray]] = None  # (n, Σ r, Σ r rᵀ)
+        self._updates_since_refit = 0
     
     def _compute_sample_covariance(
         self,
@@ -239,6 +249,7 @@ class MultiFactorRiskModelExtreme:
     def _estimate_factor_count_pca(
         self,
         returns_df: pd.DataFrame,
+        cov_sample: Optional[np.ndarray] = None,
     ) -> int:
         """
         Estimate optimal number of factors using PCA.
@@ -248,6 +259,7 @@ class MultiFactorRiskModelExtreme:
         
         Args:
             returns_df: DataFrame with returns (date × symbol)
+            cov_sample: Optional precomputed sample covariance of returns_df
         
         Returns:
             Optimal number of factors
@@ -256,7 +268,8 @@ class MultiFactorRiskModelExtreme:
             return 1
         
         # Compute covariance
-        cov_sample = self._compute_sample_covariance(returns_df)
+        if cov_sample is None:
+            cov_sample = self._compute_sample_covariance(returns_df)
         
         # Compute eigenvalues and eigenvectors
         eigenvalues, _ = np.linalg.eigh(cov_sample)
@@ -287,6 +300,7 @@ class MultiFactorRiskModelExtreme:
         self,
         returns_df: pd.DataFrame,
         n_factors: int,
+        cov_sample: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Extract factors using PCA.
@@ -294,6 +308,7 @@ class MultiFactorRiskModelExtreme:
         Args:
             returns_df: DataFrame with returns (date × symbol)
             n_factors: Number of factors to extract
+            cov_sample: Optional precomputed sample covariance of returns_df
         
         Returns:
             Tuple of (factor_returns, factor_loadings)
@@ -307,7 +322,8 @@ class MultiFactorRiskModelExtreme:
         returns_standardized = returns_df - returns_df.mean()
         
         # Compute covariance
-        cov_sample = self._compute_sample_covariance(returns_df)
+        if cov_sample is None:
+            cov_sample = self._compute_sample_covariance(returns_df)
         
         # PCA decomposition
         eigenvalues, eigenvectors = np.linalg.eigh(cov_sample)
@@ -453,15 +469,106 @@ class MultiFactorRiskModelExtreme:
             self._initialize_default()
             return
         
+        # Moments for update() are built lazily from the retained history
+        self._returns_history = returns_df
+        self._moments = None
+        self._updates_since_refit = 0
+        
+        self._fit_with_covariance(returns_df, self._compute_sample_covariance(returns_df))
+    
+    def update(
+        self,
+        new_returns: pd.DataFrame,
+        max_history: Optional[int] = None,
+    ) -> None:
+        """
+        Append new return rows and refit from incrementally updated moments.
+        
+        The sample covariance is the O(T N²) part of a fit. update() keeps the
+        running moments (n, Σ r, Σ r rᵀ) of the retained history, adds the
+        new rows and subtracts rows dropped by `max_history`, so only O(ΔT N²)
+        work is needed before PCA / factor covariance / specific risk are
+        re-derived. Every `config.refit_interval` updates the moments are
+        recomputed from the history (full-refit safeguard against drift).
+        
+        Falls back to fit_from_returns() on the combined history when the model
+        has no history yet, the columns change, or any return is NaN (pandas
+        pairwise-NaN covariance cannot be advanced incrementally).
+        
+        Args:
+            new_returns: DataFrame with new returns (date × symbol)
+            max_history: Optional rolling window length (rows) to keep
+        """
+        if new_returns.empty:
+            return
+        
+        history = self._returns_history
+        combined = new_returns if history is None else pd.concat([history, new_returns])
+        if max_history is not None:
+            combined = combined.iloc[-max_history:]
+        
+        same_columns = history is not None and list(new_returns.columns) == list(history.columns)
+        if not same_columns or new_returns.isna().values.any() or history.isna().values.any():
+            self.fit_from_returns(combined, symbols=self.symbols if same_columns else None)
+            return
+        
+        if self._moments is None:
+            self._moments = self._compute_moments(history)
+        n, sum_r, sum_rr = self._moments
+        
+        added = new_returns.to_numpy(dtype=float)
+        n, sum_r, sum_rr = n + len(added), sum_r + added.sum(axis=0), sum_rr + added.T @ added
+        n_dropped = len(history) + len(new_returns) - len(combined)
+        if n_dropped > 0:
+            dropped = history.iloc[:n_dropped].to_numpy(dtype=float)
+            n, sum_r, sum_rr = n - len(dropped), sum_r - dropped.sum(axis=0), sum_rr - dropped.T @ dropped
+        
+        self._returns_history = combined
+        self._updates_since_refit += 1
+        if self._updates_since_refit >= self.config.refit_interval:
+            n, sum_r, sum_rr = self._compute_moments(combined)
+            self._updates_since_refit = 0
+        self._moments = (n, sum_r, sum_rr)
+        
+        if n < 2:
+            self._initialize_default()
+            return
+        
+        # Sample covariance (ddof=1), annualized — same as _compute_sample_covariance
+        cov_sample = (sum_rr - np.outer(sum_r, sum_r) / n) / (n - 1)
+        cov_sample = cov_sample * self.config.periods_per_year
+        
+        self._fit_with_covariance(combined, cov_sample)
+    
+    def _compute_moments(self, returns_df: pd.DataFrame) -> Tuple[int, np.ndarray, np.ndarray]:
+        """Running moments (n, Σ r, Σ r rᵀ) of a NaN-free returns frame."""
+        values = returns_df.to_numpy(dtype=float)
+        return len(values), values.sum(axis=0), values.T @ values
+    
+    def _fit_with_covariance(
+        self,
+        returns_df: pd.DataFrame,
+        cov_sample: np.ndarray,
+    ) -> None:
+        """
+        Fit steps 1-6 of fit_from_returns given the sample covariance of returns_df.
+        
+        Args:
+            returns_df: DataFrame with returns (date × symbol)
+            cov_sample: Annualized sample covariance of returns_df (N × N)
+        """
+        n_assets = len(self.symbols)
+        
         try:
             # Step 1: Estimate factor count using PCA
-            self.factor_count = self._estimate_factor_count_pca(returns_df)
+            self.factor_count = self._estimate_factor_count_pca(returns_df, cov_sample=cov_sample)
             self.factor_count = max(1, min(self.factor_count, n_assets - 1))
             
             # Step 2: Extract factors using PCA
             factor_returns_array, factor_loadings = self._extract_factors_pca(
                 returns_df,
-                self.factor_count
+                self.factor_count,
+                cov_sample=cov_sample,
             )
             
             if factor_returns_array.size == 0:
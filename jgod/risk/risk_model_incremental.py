@@ -0,0 +1,379 @@
+"""Incremental state for MultiFactorRiskModel.update()
+
+Rolling sufficient statistics that let the risk model advance by a few days
+without refitting from scratch:
+
+- Factor covariance: the raw (daily, pre-PSD) EWMA recursion state
+- Betas: per-symbol WLS normal equations F'WF / F'WR over each symbol's
+  last `window` observations, kept in the current EWMA weight scale
+- Specific risk: λ-weighted and unweighted residual moments (Σ f f', Σ f r,
+  Σ r², Σ f, Σ r), from which the EWMA residual variance of any beta
+  follows in closed form
+
+Each symbol's window is a ring buffer of its last `window` observations, so
+observations leaving the window are subtracted exactly. `recompute()` rebuilds
+every accumulator from the buffers and is used as the periodic full-refit
+safeguard against floating-point drift.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from jgod.risk.risk_model import RiskObservationPanel
+
+
+# Per-symbol array fields (axis 0 = symbol) and their fill value for new symbols
+_PER_SYMBOL_FIELDS: Tuple[Tuple[str, float], ...] = (
+    ("buf_r", 0.0),
+    ("buf_f", 0.0),
+    ("buf_seq", -1),
+    ("head", 0),
+    ("count", 0),
+    ("seq", 0),
+    ("last_x_window", 0.0),
+    ("last_x_valid", 0.0),
+    ("FtWF", 0.0),
+    ("FtWR", 0.0),
+    ("L_ff", 0.0),
+    ("L_fr", 0.0),
+    ("L_rr", 0.0),
+    ("A_ff", 0.0),
+    ("A_fr", 0.0),
+    ("A_rr", 0.0),
+    ("A_f", 0.0),
+    ("A_r", 0.0),
+)
+
+
+def _batched_outer(a: np.ndarray) -> np.ndarray:
+    """(..., K) → (..., K, K) outer products"""
+    return a[..., :, None] * a[..., None, :]
+
+
+@dataclass
+class IncrementalRiskState:
+    """Rolling estimation state of a fitted MultiFactorRiskModel
+
+    Ring buffers (N × window): `buf_r` returns, `buf_f` factor returns of the
+    observation date (N × window × K), `buf_seq` the symbol's valid-observation
+    sequence number (-1 for empty slots and dates without factor returns).
+    `head` is the next write slot, `count` the number of filled slots and
+    `seq` the latest sequence number, so an observation's EWMA age is
+    `seq - buf_seq`.
+    """
+    symbols: List[str]
+    window: int
+    beta_decay: float
+    specific_lambda: float
+    factor_lambda: float
+
+    last_date: pd.Timestamp
+    factor_returns: pd.DataFrame
+    factor_cov_raw: np.ndarray
+
+    buf_r: np.ndarray
+    buf_f: np.ndarray
+    buf_seq: np.ndarray
+    head: np.ndarray
+    count: np.ndarray
+    seq: np.ndarray
+    last_x_window: np.ndarray
+    last_x_valid: np.ndarray
+
+    # Accumulators (filled by recompute())
+    FtWF: Optional[np.ndarray] = None
+    FtWR: Optional[np.ndarray] = None
+    L_ff: Optional[np.ndarray] = None
+    L_fr: Optional[np.ndarray] = None
+    L_rr: Optional[np.ndarray] = None
+    A_ff: Optional[np.ndarray] = None
+    A_fr: Optional[np.ndarray] = None
+    A_rr: Optional[np.ndarray] = None
+    A_f: Optional[np.ndarray] = None
+    A_r: Optional[np.ndarray] = None
+
+    @property
+    def n_valid(self) -> np.ndarray:
+        """Observations with factor returns in each symbol's window"""
+        return (self.buf_seq >= 0).sum(axis=1)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_panel(
+        cls,
+        panel: "RiskObservationPanel",
+        factor_returns: pd.DataFrame,
+        window: int,
+        beta_decay: float,
+        specific_lambda: float,
+        factor_lambda: float,
+    ) -> "IncrementalRiskState":
+        """Build the state from the (winsorized) panel and factor returns a fit used"""
+        factor_returns = factor_returns[~factor_returns.index.duplicated(keep="first")]
+        dates, symbols = panel.dates, list(panel.symbols)
+        N, K = len(symbols), panel.exposures.shape[1]
+        R, present, X = panel.to_dense()
+
+        has_factor = dates.isin(factor_returns.index)
+        F = factor_returns.reindex(dates).to_numpy(dtype=float)
+        F[~has_factor] = 0.0
+
+        # Last `window` observations per symbol, oldest in slot 0
+        obs_from_end = np.cumsum(present[::-1], axis=0)[::-1]
+        in_window = present & (obs_from_end <= window)
+        valid = in_window & has_factor[:, None]
+        n_window = in_window.sum(axis=0)
+
+        t_idx, j_idx = np.nonzero(in_window)
+        slot = n_window[j_idx] - obs_from_end[t_idx, j_idx]
+        valid_rank = np.cumsum(valid, axis=0)  # sequence numbers 1..n_valid
+
+        buf_r = np.zeros((N, window))
+        buf_f = np.zeros((N, window, K))
+        buf_seq = np.full((N, window), -1, dtype=np.int64)
+        buf_r[j_idx, slot] = R[t_idx, j_idx]
+        buf_f[j_idx, slot] = F[t_idx]
+        is_valid = valid[t_idx, j_idx]
+        buf_seq[j_idx[is_valid], slot[is_valid]] = valid_rank[t_idx[is_valid], j_idx[is_valid]]
+
+        last_x_window = np.zeros((N, K))
+        last_x_valid = np.zeros((N, K))
+        cols = np.arange(N)
+        last_in_window = len(dates) - 1 - np.argmax(in_window[::-1], axis=0)
+        last_valid = len(dates) - 1 - np.argmax(valid[::-1], axis=0)
+        has_window, has_valid = in_window.any(axis=0), valid.any(axis=0)
+        last_x_window[has_window] = X[last_in_window, cols][has_window]
+        last_x_valid[has_valid] = X[last_valid, cols][has_valid]
+
+        state = cls(
+            symbols=symbols,
+            window=window,
+            beta_decay=beta_decay,
+            specific_lambda=specific_lambda,
+            factor_lambda=factor_lambda,
+            last_date=pd.Timestamp(dates[-1]) if len(dates) > 0 else pd.Timestamp.min,
+            factor_returns=factor_returns,
+            factor_cov_raw=_ewma_recursion(factor_returns.to_numpy(dtype=float), factor_lambda),
+            buf_r=buf_r,
+            buf_f=buf_f,
+            buf_seq=buf_seq,
+            head=n_window % window,
+            count=n_window.astype(np.int64),
+            seq=valid.sum(axis=0).astype(np.int64),
+            last_x_window=last_x_window,
+            last_x_valid=last_x_valid,
+        )
+        state.recompute()
+        return state
+
+    def recompute(self) -> None:
+        """Rebuild every accumulator from the ring buffers (full-refit safeguard)"""
+        valid = self.buf_seq >= 0
+        age = np.where(valid, self.seq[:, None] - self.buf_seq, 0)
+        w = np.where(valid, self.beta_decay ** age, 0.0)
+        lam = np.where(valid, self.specific_lambda ** age, 0.0)
+        a = valid.astype(float)
+        f, r = self.buf_f, self.buf_r
+
+        # (N × K × window) @ (N × window × K)
+        self.FtWF = np.matmul((f * w[:, :, None]).transpose(0, 2, 1), f)
+        self.FtWR = np.einsum('nw,nwk->nk', w * r, f)
+        self.L_ff = np.matmul((f * lam[:, :, None]).transpose(0, 2, 1), f)
+        self.L_fr = np.einsum('nw,nwk->nk', lam * r, f)
+        self.L_rr = (lam * r * r).sum(axis=1)
+        self.A_ff = np.matmul((f * a[:, :, None]).transpose(0, 2, 1), f)
+        self.A_fr = np.einsum('nw,nwk->nk', a * r, f)
+        self.A_rr = (a * r * r).sum(axis=1)
+        self.A_f = (f * a[:, :, None]).sum(axis=1)
+        self.A_r = (a * r).sum(axis=1)
+
+    # ------------------------------------------------------------------
+    # Advancing
+    # ------------------------------------------------------------------
+
+    def add_symbols(self, new_symbols: Sequence[str]) -> None:
+        """Insert empty rows for unseen symbols, keeping `symbols` sorted"""
+        merged = sorted(set(self.symbols) | set(new_symbols))
+        if len(merged) == len(self.symbols):
+            return
+        rows = np.searchsorted(np.array(merged, dtype=object), np.array(self.symbols, dtype=object))
+        for name, fill in _PER_SYMBOL_FIELDS:
+            old = getattr(self, name)
+            expanded = np.full((len(merged),) + old.shape[1:], fill, dtype=old.dtype)
+            expanded[rows] = old
+            setattr(self, name, expanded)
+        self.symbols = merged
+
+    def advance_factor_returns(self, factor_returns: pd.DataFrame) -> None:
+        """Append new factor-return rows and advance the EWMA covariance recursion"""
+        if factor_returns.empty:
+            return
+        self.factor_cov_raw = _ewma_recursion(
+            factor_returns.to_numpy(dtype=float), self.factor_lambda, self.factor_cov_raw
+        )
+        self.factor_returns = pd.concat([self.factor_returns, factor_returns])
+
+    def advance(
+        self,
+        date: pd.Timestamp,
+        rows: np.ndarray,
+        returns: np.ndarray,
+        exposures: np.ndarray,
+        factor_row: Optional[np.ndarray],
+    ) -> None:
+        """Push one date's observations for symbol rows `rows` into the windows"""
+        slot = self.head[rows]
+
+        # 1. Oldest observation leaves a full window
+        leaving = rows[(self.count[rows] == self.window) & (self.buf_seq[rows, slot] >= 0)]
+        if len(leaving) > 0:
+            old_slot = self.head[leaving]
+            age = self.seq[leaving] - self.buf_seq[leaving, old_slot]
+            f_old = self.buf_f[leaving, old_slot]
+            r_old = self.buf_r[leaving, old_slot]
+            ff_old = _batched_outer(f_old)
+            w = (self.beta_decay ** age)[:, None]
+            lam = (self.specific_lambda ** age)[:, None]
+            self.FtWF[leaving] -= w[:, :, None] * ff_old
+            self.FtWR[leaving] -= w * f_old * r_old[:, None]
+            self.L_ff[leaving] -= lam[:, :, None] * ff_old
+            self.L_fr[leaving] -= lam * f_old * r_old[:, None]
+            self.L_rr[leaving] -= lam[:, 0] * r_old ** 2
+            self.A_ff[leaving] -= ff_old
+            self.A_fr[leaving] -= f_old * r_old[:, None]
+            self.A_rr[leaving] -= r_old ** 2
+            self.A_f[leaving] -= f_old
+            self.A_r[leaving] -= r_old
+
+        # 2. New observation enters (only dates with factor returns are regressed on)
+        if factor_row is not None:
+            f_new = np.broadcast_to(factor_row, (len(rows), len(factor_row)))
+            ff_new = _batched_outer(factor_row)
+            self.FtWF[rows] = self.beta_decay * self.FtWF[rows] + ff_new
+            self.FtWR[rows] = self.beta_decay * self.FtWR[rows] + f_new * returns[:, None]
+            self.L_ff[rows] = self.specific_lambda * self.L_ff[rows] + ff_new
+            self.L_fr[rows] = self.specific_lambda * self.L_fr[rows] + f_new * returns[:, None]
+            self.L_rr[rows] = self.specific_lambda * self.L_rr[rows] + returns ** 2
+            self.A_ff[rows] += ff_new
+            self.A_fr[rows] += f_new * returns[:, None]
+            self.A_rr[rows] += returns ** 2
+            self.A_f[rows] += f_new
+            self.A_r[rows] += returns
+            self.seq[rows] += 1
+            self.buf_seq[rows, slot] = self.seq[rows]
+            self.buf_f[rows, slot] = factor_row
+            self.last_x_valid[rows] = exposures
+        else:
+            self.buf_seq[rows, slot] = -1
+            self.buf_f[rows, slot] = 0.0
+
+        self.buf_r[rows, slot] = returns
+        self.last_x_window[rows] = exposures
+        self.head[rows] = (slot + 1) % self.window
+        self.count[rows] = np.minimum(self.count[rows] + 1, self.window)
+        self.last_date = max(self.last_date, pd.Timestamp(date))
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    def solve_betas(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """WLS betas for symbol rows, with the same fallbacks as a full fit
+
+        Returns:
+            Tuple of (betas (n × K), solved mask (n,))
+        """
+        K = self.FtWF.shape[1]
+        n_window = self.count[rows]
+        n_valid = self.n_valid[rows]
+        betas = np.zeros((len(rows), K))
+        solved = np.zeros(len(rows), dtype=bool)
+
+        candidates = np.flatnonzero(n_valid >= K)
+        if len(candidates) > 0:
+            FtWF, FtWR = self.FtWF[rows[candidates]], self.FtWR[rows[candidates]]
+            well_conditioned = ~(np.linalg.cond(FtWF) > 1e10)
+            idx = candidates[well_conditioned]
+            FtWF, FtWR = FtWF[well_conditioned], FtWR[well_conditioned]
+            if len(idx) > 0:
+                try:
+                    betas[idx] = np.linalg.solve(FtWF, FtWR[:, :, None])[:, :, 0]
+                    solved[idx] = True
+                except np.linalg.LinAlgError:
+                    # Isolate the singular system(s); the rest keep their solution
+                    for i, A, b in zip(idx, FtWF, FtWR):
+                        try:
+                            betas[i] = np.linalg.solve(A, b)
+                            solved[i] = True
+                        except np.linalg.LinAlgError:
+                            pass
+
+        use_window_exposure = (n_window >= K) & (n_valid < K)
+        use_valid_exposure = (n_valid >= K) & ~solved
+        betas[use_window_exposure] = self.last_x_window[rows][use_window_exposure]
+        betas[use_valid_exposure] = self.last_x_valid[rows][use_valid_exposure]
+        return betas, solved
+
+    def specific_variance(
+        self,
+        rows: np.ndarray,
+        betas: np.ndarray,
+        solved: np.ndarray,
+    ) -> np.ndarray:
+        """Annualized EWMA residual variance from the residual moments
+
+        Same closed form as `_estimate_specific_risk_ewma`, with
+        Σ ε² = Σ r² - 2 β'Σ f r + β'(Σ f f')β for both weightings.
+        """
+        lam = self.specific_lambda
+        n = self.n_valid[rows]
+        n_safe = np.maximum(n, 1)
+
+        def quadratic(rr, fr, ff):
+            return rr - 2.0 * np.einsum('nk,nk->n', fr, betas) + np.einsum('nk,nkl,nl->n', betas, ff, betas)
+
+        sum_e = self.A_r[rows] - np.einsum('nk,nk->n', self.A_f[rows], betas)
+        sum_e2 = quadratic(self.A_rr[rows], self.A_fr[rows], self.A_ff[rows])
+        var0 = np.maximum(sum_e2 / n_safe - (sum_e / n_safe) ** 2, 0.0) * 252
+        weighted_e2 = quadratic(self.L_rr[rows], self.L_fr[rows], self.L_ff[rows])
+
+        var_ewma = lam ** n * var0 + (1 - lam) * 252 * weighted_e2
+        return np.where(solved & (n >= 10), np.maximum(var_ewma, 1e-6), 1e-6)
+
+    def residuals(self, rows: np.ndarray, betas: np.ndarray, solved: np.ndarray) -> Dict[str, List[float]]:
+        """Residual series (oldest first) over each solved symbol's window"""
+        resid = self.buf_r[rows] - np.einsum('nwk,nk->nw', self.buf_f[rows], betas)
+        buf_seq = self.buf_seq[rows]
+        # chronological order of valid slots first; empty / invalid slots sort last
+        order = np.argsort(np.where(buf_seq >= 0, buf_seq, np.iinfo(np.int64).max), axis=1)
+        n_valid = (buf_seq >= 0).sum(axis=1)
+        return {
+            self.symbols[j]: resid[i, order[i, :n_valid[i]]].tolist() if solved[i] else []
+            for i, j in enumerate(rows)
+        }
+
+
+def _ewma_recursion(
+    returns: np.ndarray,
+    lambda_param: float,
+    initial: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Raw EWMA covariance recursion Cov_t = λ Cov_{t-1} + (1 - λ) r_t r_tᵀ
+
+    Starts from `initial` (default: 1e-6 · I, as in `_calculate_ewma_covariance`).
+    """
+    n_factors = returns.shape[1]
+    cov_matrix = np.eye(n_factors) * 1e-6 if initial is None else initial.copy()
+    for r in returns:
+        r = r.reshape(-1, 1)
+        cov_matrix = lambda_param * cov_matrix + (1 - lambda_param) * (r @ r.T)
+    return cov_matrix
@@ -0,0 +1,168 @@
+"""
+Bulk Upsert Helpers
+
+Batched `INSERT ... ON CONFLICT DO UPDATE` writes for backfill scripts.
+
+Row-by-row backfills issue one SELECT per row to decide between INSERT and
+UPDATE. These helpers load the existing keys once (for inserted / updated
+accounting) and let the database resolve conflicts on the table's unique
+constraint, writing `batch_size` rows per executemany call.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+from jgod.storage.models import DailyBar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+# daily_bars price fields (missing columns are written as 0.0)
+DAILY_BAR_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+# daily_bars optional fields (missing columns are written as NULL)
+DAILY_BAR_OPTIONAL_FIELDS = ("turnover", "adjusted_close")
+
+
+def upsert_rows(
+    session: Session,
+    table: Table,
+    rows: Sequence[Dict[str, Any]],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    constraint: Optional[str] = None,
+) -> None:
+    """
+    Insert rows, updating update_columns where index_elements already exist.
+
+    Does not commit; the caller owns the transaction.
+
+    Args:
+        session: SQLAlchemy session
+        table: Target table
+        rows: Row dicts keyed by column name (all rows share the same keys)
+        index_elements: Columns of the unique constraint to resolve conflicts on
+        update_columns: Columns overwritten on conflict
+        batch_size: Rows per executemany call
+        constraint: Constraint name (used by PostgreSQL; SQLite matches
+            the constraint by index_elements)
+    """
+    if not rows:
+        return
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        raise NotImplementedError(f"Bulk upsert is not supported for dialect '{dialect}'")
+
+    stmt = insert(table)
+    conflict_target = (
+        {"constraint": constraint}
+        if constraint is not None and dialect == "postgresql"
+        else {"index_elements": list(index_elements)}
+    )
+    stmt = stmt.on_conflict_do_update(
+        **conflict_target,
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+
+    for start in range(0, len(rows), batch_size):
+        session.execute(stmt, list(rows[start:start + batch_size]))
+
+
+def load_existing_dates(session: Session, symbol: str, dates: Iterable) -> set:
+    """Dates of `dates` that already have a daily_bars row for symbol (one query)."""
+    dates = list(dates)
+    if not dates:
+        return set()
+    query = (
+        session.query(DailyBar.date)
+        .filter(
+            DailyBar.symbol == symbol,
+            DailyBar.date >= min(dates),
+            DailyBar.date <= max(dates),
+        )
+    )
+    return {row[0] for row in query}
+
+
+def upsert_daily_bars(
+    session: Session,
+    symbol: str,
+    df: pd.DataFrame,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    source: str = "FinMind",
+) -> Tuple[int, int]:
+    """
+    Bulk upsert one symbol's bars into daily_bars.
+
+    Does not commit; the caller owns the transaction.
+
+    Args:
+        session: SQLAlchemy session
+        symbol: Stock symbol
+        df: Bars with a `date` column plus open/high/low/close/volume
+            (optional turnover / adjusted_close)
+        batch_size: Rows per executemany call
+        source: Value for the source column
+
+    Returns:
+        (inserted, updated) row counts
+    """
+    if df.empty:
+        return 0, 0
+
+    bars = df.copy()
+    bars["date"] = pd.to_datetime(bars["date"]).dt.date
+    # one row per date (the last one wins, as the row-by-row path did)
+    bars = bars.drop_duplicates(subset="date", keep="last")
+
+    existing = load_existing_dates(session, symbol, bars["date"])
+    now = datetime.now()
+
+    columns: Dict[str, List[Any]] = {"date": bars["date"].tolist()}
+    for name in DAILY_BAR_PRICE_FIELDS:
+        columns[name] = (
+            bars[name].astype(float).tolist() if name in bars.columns else [0.0] * len(bars)
+        )
+    for name in DAILY_BAR_OPTIONAL_FIELDS:
+        columns[name] = (
+            bars[name].astype(float).tolist() if name in bars.columns else [None] * len(bars)
+        )
+
+    rows = [
+        {
+            "symbol": symbol,
+            **{name: values[i] for name, values in columns.items()},
+            "source": source,
+            "updated_at": now,
+        }
+        for i in range(len(bars))
+    ]
+
+    upsert_rows(
+        session,
+        DailyBar.__table__,
+        rows,
+        index_elements=["symbol", "date"],
+        update_columns=list(DAILY_BAR_PRICE_FIELDS) + list(DAILY_BAR_OPTIONAL_FIELDS) + ["updated_at"],
+        batch_size=batch_size,
+        constraint="uq_daily_bars_symbol_date",
+    )
+
+    updated = sum(1 for bar_date in columns["date"] if bar_date in existing)
+    return len(rows) - updated, updated
@@ -2,15 +2,33 @@
 Database Connection Management
 
 SQLAlchemy engine and session management for J-GOD Taiwan stock database.
+
+Two engines share the same SQLite file:
+
+- get_engine() / get_session(): read-write, pooled (backfill scripts)
+- get_read_engine() / get_read_session(): read-only connections
+  (mode=ro + query_only), pooled separately for the API so readers never
+  wait on a writer's connection slots
+
+Settings (environment overrides):
+
+    JGOD_DB_JOURNAL_MODE      journal mode (default WAL)
+    JGOD_DB_BUSY_TIMEOUT_MS   wait for a lock instead of failing with
+                              "database is locked" (default 30000)
+    JGOD_DB_POOL_SIZE         pooled read-write connections (default 5)
+    JGOD_DB_MAX_OVERFLOW      extra read-write connections under load (default 10)
+    JGOD_DB_READ_POOL_SIZE    pooled read-only connections (default 10)
 """
 
 import logging
 import os
 from pathlib import Path
-from typing import Generator
+from typing import Any, Dict, Generator, Union
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +48,95 @@ if not _db_path.parent.exists():
     _db_path.parent.mkdir(parents=True, exist_ok=True)
     logger.info(f"Created data directory: {_db_path.parent}")
 
+# SQLite pragmas applied to every new connection. WAL lets readers (API, war room)
+# proceed while a backfill writes; synchronous=NORMAL is durable under WAL except
+# for the last transactions on power loss, and avoids an fsync per commit.
+# busy_timeout makes a connection wait for a competing writer's lock instead of
+# failing immediately with "database is locked".
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("JGOD_DB_BUSY_TIMEOUT_MS", "30000"))
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("JGOD_DB_JOURNAL_MODE", "WAL"),
+    "synchronous": "NORMAL",
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+}
+
+# Read-only connections: journal_mode is a property of the file (set by the
+# writer), query_only rejects writes even if the file could be opened writable.
+SQLITE_READ_PRAGMAS = {
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    "query_only": "ON",
+}
+
+POOL_SIZE = int(os.getenv("JGOD_DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("JGOD_DB_MAX_OVERFLOW", "10"))
+READ_POOL_SIZE = int(os.getenv("JGOD_DB_READ_POOL_SIZE", "10"))
+
 _engine = None
 _SessionLocal = None
+_read_engine = None
+_ReadSessionLocal = None
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: Dict[str, Any]) -> None:
+    """Run PRAGMA name=value for each entry on a DB-API (sqlite3) connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Connection event hook: apply SQLITE_PRAGMAS."""
+    apply_sqlite_pragmas(dbapi_connection, SQLITE_PRAGMAS)
+
+
+def _apply_sqlite_read_pragmas(dbapi_connection, connection_record) -> None:
+    """Connection event hook: apply SQLITE_READ_PRAGMAS."""
+    apply_sqlite_pragmas(dbapi_connection, SQLITE_READ_PRAGMAS)
+
+
+def create_sqlite_engine(db_path: Union[str, Path], read_only: bool = False) -> Engine:
+    """
+    Create a pooled SQLite engine with the J-GOD pragmas.
+
+    Args:
+        db_path: Database file
+        read_only: Open connections with mode=ro and query_only (the file
+            must already exist)
+
+    Returns:
+        Engine
+    """
+    db_path = Path(db_path)
+    timeout = SQLITE_BUSY_TIMEOUT_MS / 1000.0
+    if read_only:
+        engine = create_engine(
+            f"sqlite:///file:{db_path.resolve().as_posix()}?mode=ro&uri=true",
+            connect_args={"check_same_thread": False, "timeout": timeout},
+            poolclass=QueuePool,
+            pool_size=READ_POOL_SIZE,
+            max_overflow=READ_POOL_SIZE,
+            echo=False,
+        )
+        event.listen(engine, "connect", _apply_sqlite_read_pragmas)
+    else:
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            connect_args={"check_same_thread": False, "timeout": timeout},  # SQLite specific
+            poolclass=QueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            echo=False,  # Set to True for SQL logging
+        )
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def get_db_path() -> Path:
+    """Path of the J-GOD SQLite database file."""
+    return _db_path
 
 
 def get_engine():
@@ -43,15 +148,29 @@ def get_engine():
     """
     global _engine
     if _engine is None:
-        _engine = create_engine(
-            _db_url,
-            connect_args={"check_same_thread": False},  # SQLite specific
-            echo=False,  # Set to True for SQL logging
-        )
+        _engine = create_sqlite_engine(_db_path)
         logger.info(f"Database engine created: {_db_url}")
     return _engine
 
 
+def get_read_engine():
+    """
+    Get read-only SQLAlchemy engine (singleton) for API readers.
+    
+    Returns:
+        Engine: SQLAlchemy engine instance
+    """
+    global _read_engine
+    if _read_engine is None:
+        if not _db_path.exists():
+            # mode=ro cannot create the file; let the writer create it (and switch it to WAL)
+            with get_engine().connect():
+                pass
+        _read_engine = create_sqlite_engine(_db_path, read_only=True)
+        logger.info(f"Read-only database engine created: {_db_url}")
+    return _read_engine
+
+
 def get_session() -> Generator[Session, None, None]:
     """
     Get database session (context manager).
@@ -71,6 +190,24 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_read_session() -> Generator[Session, None, None]:
+    """
+    Get read-only database session (context manager) for API queries.
+    
+    Yields:
+        Session: SQLAlchemy session bound to get_read_engine()
+    """
+    global _ReadSessionLocal
+    if _ReadSessionLocal is None:
+        _ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_read_engine())
+    
+    session = _ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 def init_db():
     """
     Initialize database schema (create all tables).
@@ -81,6 +218,33 @@ def init_db():
     
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    migrate_schema(engine)
     logger.info(f"Database initialized: {_db_path}")
     logger.info(f"Tables created: {list(Base.metadata.tables.keys())}")
 
+
+def migrate_schema(engine: Engine) -> None:
+    """
+    Add nullable columns and indexes introduced after a table was created.
+
+    create_all() only creates missing tables; existing databases would
+    otherwise lack new columns (e.g. prediction_snapshots.*_labels) and
+    indexes.
+    """
+    from jgod.storage.models import Base  # Avoid circular import
+    
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable or column.primary_key:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+                logger.info(f"Added column {table.name}.{column.name}")
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
@@ -0,0 +1,287 @@
+"""
+Columnar Indicator Store - wide, month-partitioned indicator snapshots
+
+indicator_snapshots keeps one row per (symbol, date, indicator_code): 100
+indicators × 1,700 symbols × 2,500 days is ~425M rows, and every batch
+reader has to pivot them back row by row.
+
+This store keeps the same values wide, one row per (symbol, date) and one
+float column per indicator code, partitioned by month:
+
+    {root}/{YYYY-MM}.parquet   columns: symbol, date, P01, P02, ...
+
+NaN means "no snapshot for this code". Values are the ones fed to the filter
+(raw_value, else normalized_value * 100, else 0.0; see
+jgod.prediction.backfill_engine.indicator_value).
+
+indicator_snapshots stays the source of truth for the API; import_snapshots()
+copies a date range into the store.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from jgod.storage.models import IndicatorSnapshot
+
+try:
+    import pyarrow.parquet  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+KEY_COLUMNS = ["symbol", "date"]
+
+
+class ColumnarIndicatorStore:
+    """
+    Month-partitioned wide indicator snapshots.
+
+    Args:
+        root: Store directory
+        use_parquet: Store partitions as Parquet when pyarrow is available,
+            otherwise pickle
+    """
+
+    def __init__(self, root: Path, use_parquet: bool = True):
+        self.root = Path(root)
+        self.suffix = ".parquet" if use_parquet and PARQUET_AVAILABLE else ".pkl"
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def write(self, frame: pd.DataFrame) -> int:
+        """
+        Merge wide rows into their month partitions.
+
+        Values in `frame` overwrite stored ones; codes that are NaN (or not
+        present) in `frame` keep their stored value.
+
+        Args:
+            frame: Columns symbol, date and one column per indicator code
+
+        Returns:
+            Number of (symbol, date) rows written
+        """
+        if frame.empty:
+            return 0
+        missing = [c for c in KEY_COLUMNS if c not in frame.columns]
+        if missing:
+            raise ValueError(f"frame is missing key columns: {missing}")
+
+        frame = frame.copy()
+        frame["symbol"] = frame["symbol"].astype(str)
+        frame["date"] = pd.to_datetime(frame["date"])
+        codes = [c for c in frame.columns if c not in KEY_COLUMNS]
+        frame[codes] = frame[codes].astype(float)
+        frame = frame.drop_duplicates(subset=KEY_COLUMNS, keep="last")
+
+        for month, rows in frame.groupby(frame["date"].dt.strftime("%Y-%m")):
+            rows = rows.set_index(KEY_COLUMNS)
+            existing = self._read_partition(month)
+            if existing is not None:
+                rows = rows.combine_first(existing.set_index(KEY_COLUMNS))
+            rows = rows[sorted(rows.columns)].sort_index().reset_index()
+            self._write_partition(month, rows)
+        return len(frame)
+
+    def write_records(self, records: Dict[Tuple[str, date], Dict[str, float]]) -> int:
+        """Write {(symbol, date): {code: value}} records (e.g. StockIndicatorBuilder100 output)."""
+        if not records:
+            return 0
+        frame = pd.DataFrame.from_dict(records, orient="index")
+        frame.index = pd.MultiIndex.from_tuples(frame.index, names=KEY_COLUMNS)
+        return self.write(frame.reset_index())
+
+    def import_snapshots(
+        self,
+        session: Session,
+        start_date: date,
+        end_date: date,
+        symbols: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Copy indicator_snapshots rows in [start_date, end_date] into the store.
+
+        The value of each snapshot is resolved in SQL, then pivoted one month
+        at a time.
+
+        Returns:
+            Number of (symbol, date) rows written
+        """
+        written = 0
+        for month_start, month_end in _month_ranges(start_date, end_date):
+            value = func.coalesce(
+                IndicatorSnapshot.raw_value,
+                IndicatorSnapshot.normalized_value * 100.0,
+                0.0,
+            )
+            query = session.query(
+                IndicatorSnapshot.symbol,
+                IndicatorSnapshot.date,
+                IndicatorSnapshot.indicator_code,
+                value,
+            ).filter(
+                IndicatorSnapshot.date >= month_start,
+                IndicatorSnapshot.date <= month_end,
+            )
+            if symbols is not None:
+                query = query.filter(IndicatorSnapshot.symbol.in_(list(symbols)))
+            rows = query.all()
+            if not rows:
+                continue
+            long = pd.DataFrame(rows, columns=["symbol", "date", "code", "value"])
+            wide = long.pivot_table(
+                index=KEY_COLUMNS, columns="code", values="value", aggfunc="last"
+            )
+            wide.columns.name = None
+            written += self.write(wide.reset_index())
+        return written
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def load_matrix(
+        self,
+        symbols: Sequence[str],
+        dates: Sequence[date],
+        codes: Optional[Sequence[str]] = None,
+    ) -> Tuple[np.ndarray, List[str]]:
+        """
+        Dense (n_symbols, n_dates, n_codes) matrix of stored values.
+
+        Args:
+            symbols: Symbol axis
+            dates: Date axis
+            codes: Code axis; None = every code stored for the range (sorted)
+
+        Returns:
+            (values, codes); values is NaN where no snapshot exists
+        """
+        symbols = list(symbols)
+        dates = [pd.Timestamp(d) for d in dates]
+        frame = self.load_frame(symbols, dates, codes)
+
+        if codes is None:
+            codes = sorted(c for c in frame.columns if c not in KEY_COLUMNS)
+        codes = list(codes)
+
+        values = np.full((len(symbols), len(dates), len(codes)), np.nan)
+        if frame.empty or not codes:
+            return values, codes
+
+        i = pd.Index(symbols).get_indexer(frame["symbol"])
+        j = pd.Index(dates).get_indexer(frame["date"])
+        keep = (i >= 0) & (j >= 0)
+        block = frame.reindex(columns=codes).to_numpy(dtype=float)
+        values[i[keep], j[keep]] = block[keep]
+        return values, codes
+
+    def load_frame(
+        self,
+        symbols: Optional[Sequence[str]],
+        dates: Sequence[date],
+        codes: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Wide rows of symbols (None = all) within [min(dates), max(dates)]."""
+        if not len(dates):
+            return pd.DataFrame(columns=KEY_COLUMNS)
+        start, end = pd.Timestamp(min(dates)), pd.Timestamp(max(dates))
+        columns = None if codes is None else KEY_COLUMNS + list(codes)
+
+        frames = []
+        for month_start, _ in _month_ranges(start.date(), end.date()):
+            partition = self._read_partition(month_start.strftime("%Y-%m"), columns)
+            if partition is None or partition.empty:
+                continue
+            mask = (partition["date"] >= start) & (partition["date"] <= end)
+            if symbols is not None:
+                mask &= partition["symbol"].isin(list(symbols))
+            frames.append(partition[mask])
+        if not frames:
+            return pd.DataFrame(columns=KEY_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    def months(self) -> List[str]:
+        """Stored partitions (YYYY-MM), sorted."""
+        return sorted({p.stem for p in self.root.glob("*") if p.suffix in (".parquet", ".pkl")})
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _partition_path(self, month: str, suffix: Optional[str] = None) -> Path:
+        return self.root / f"{month}{suffix or self.suffix}"
+
+    def _read_partition(self, month: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        for suffix in (self.suffix, ".parquet", ".pkl"):
+            path = self._partition_path(month, suffix)
+            if not path.exists():
+                continue
+            if suffix == ".parquet":
+                if not PARQUET_AVAILABLE:
+                    raise ImportError(
+                        f"Indicator store partition {path} is Parquet but pyarrow is not "
+                        "installed. Install pyarrow (pip install pyarrow) to read it."
+                    )
+                if columns is not None:
+                    # 只讀需要的欄位（columnar 讀取）
+                    stored = pyarrow.parquet.read_schema(path).names
+                    frame = pd.read_parquet(path, columns=[c for c in columns if c in stored])
+                else:
+                    frame = pd.read_parquet(path)
+            else:
+                with open(path, "rb") as f:
+                    frame = pickle.load(f)
+            if columns is not None:
+                frame = frame.reindex(columns=columns)
+            return frame
+        return None
+
+    def _write_partition(self, month: str, frame: pd.DataFrame) -> None:
+        path = self._partition_path(month)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            if self.suffix == ".parquet":
+                frame.to_parquet(tmp, index=False)
+            else:
+                with open(tmp, "wb") as f:
+                    pickle.dump(frame, f)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        # a partition written in the other format is superseded
+        for other in (".parquet", ".pkl"):
+            stale = self._partition_path(month, other)
+            if other != self.suffix and stale.exists():
+                stale.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _month_ranges(start_date: date, end_date: date) -> Iterable[Tuple[date, date]]:
+    """Calendar months overlapping [start_date, end_date], clipped to it."""
+    cursor = date(start_date.year, start_date.month, 1)
+    while cursor <= end_date:
+        next_month = (
+            date(cursor.year + 1, 1, 1) if cursor.month == 12 else date(cursor.year, cursor.month + 1, 1)
+        )
+        yield max(cursor, start_date), min(date.fromordinal(next_month.toordinal() - 1), end_date)
+        cursor = next_month
@@ -7,7 +7,7 @@ ORM models for stocks, indicators, predictions, and virtual trades.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, Boolean, Column, Date, DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy import JSON, Boolean, Column, Date, DateTime, Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
@@ -96,6 +96,10 @@ class PredictionSnapshot(Base):
     positive_indicators = Column(JSON, nullable=True)  # Top positive 指標列表（向後兼容）
     negative_indicators = Column(JSON, nullable=True)  # Top negative 指標列表（向後兼容）
     raw_payload = Column(JSON, nullable=True)  # 完整 evaluate 結果（向後兼容）
+    # API 用的正規化投影（背填時寫入，見 jgod/storage/prediction_projection.py）
+    positive_factor_labels = Column(JSON, nullable=True)  # List[str]
+    negative_factor_labels = Column(JSON, nullable=True)  # List[str]
+    risk_flag_labels = Column(JSON, nullable=True)  # List[str]
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -104,6 +108,20 @@ class PredictionSnapshot(Base):
     )
 
 
+# /predictions/latest/{symbol}：symbol 內依日期倒序取第一筆
+Index(
+    "ix_prediction_snapshots_symbol_date_desc",
+    PredictionSnapshot.symbol,
+    PredictionSnapshot.date.desc(),
+)
+# /predictions/{date}：單日全市場（依分數排序）
+Index(
+    "ix_prediction_snapshots_date_score",
+    PredictionSnapshot.date,
+    PredictionSnapshot.score,
+)
+
+
 class VirtualTrade(Base):
     """模擬交易紀錄表（virtual_trades）"""
     
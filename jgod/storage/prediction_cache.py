@@ -0,0 +1,128 @@
+"""
+Prediction Response Cache
+
+In-process TTL cache for prediction API responses ("latest per symbol",
+"by date"). Dashboards poll these endpoints for the whole universe; entries
+are served from memory for JGOD_PREDICTION_CACHE_TTL seconds (default 30).
+
+Invalidation: writers call notify_predictions_written(bind) after
+committing prediction_snapshots. This bumps an in-process generation and
+touches a version file next to the SQLite database, so API processes see
+writes made by backfill scripts too. Every cache lookup compares the
+current generation + version-file mtime with the one stored in the entry.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+
+PREDICTION_CACHE_TTL = float(os.getenv("JGOD_PREDICTION_CACHE_TTL", "30"))
+PREDICTION_CACHE_MAX_ENTRIES = int(os.getenv("JGOD_PREDICTION_CACHE_MAX_ENTRIES", "4096"))
+
+VERSION_FILE_SUFFIX = ".predictions-version"
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def version_file_for(db_path: Path) -> Path:
+    """Version file that marks prediction_snapshots writes to db_path."""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + VERSION_FILE_SUFFIX)
+
+
+def notify_predictions_written(bind: Optional[Engine] = None) -> None:
+    """
+    Invalidate cached prediction responses after a prediction_snapshots write.
+
+    Args:
+        bind: Engine that was written to; for a SQLite file database its
+            version file is touched so other processes invalidate as well
+    """
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+    database = getattr(getattr(bind, "url", None), "database", None)
+    if bind is not None and bind.dialect.name == "sqlite" and database and database != ":memory:":
+        if database.startswith("file:"):
+            database = database[len("file:"):].split("?", 1)[0]
+        path = version_file_for(Path(database))
+        try:
+            path.touch()
+            # mtime resolution can be coarse; make successive writes distinguishable
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, max(stat.st_mtime_ns, time.time_ns())))
+        except OSError:
+            pass
+
+
+class TTLCache:
+    """
+    Thread-safe TTL + LRU cache whose entries also expire on version change.
+
+    Args:
+        ttl: Seconds an entry stays valid
+        max_entries: Least recently used entries beyond this are evicted
+        version_file: Optional file whose mtime is part of the version
+    """
+
+    def __init__(
+        self,
+        ttl: float = PREDICTION_CACHE_TTL,
+        max_entries: int = PREDICTION_CACHE_MAX_ENTRIES,
+        version_file: Optional[Path] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version_file = Path(version_file) if version_file is not None else None
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self) -> Tuple[int, int]:
+        mtime = 0
+        if self.version_file is not None:
+            try:
+                mtime = self.version_file.stat().st_mtime_ns
+            except OSError:
+                mtime = 0
+        return _generation, mtime
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value for key, computing (and storing) it on a miss."""
+        if self.ttl <= 0:
+            return compute()
+
+        version = self.version()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
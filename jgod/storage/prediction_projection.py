@@ -0,0 +1,64 @@
+"""
+Prediction Snapshot Projection
+
+prediction_snapshots carries two generations of factor columns:
+positive_factors_json / negative_factors_json (current) and
+positive_indicators / negative_indicators (legacy; lists or comma-separated
+strings). The API used to reconcile them for every row it served.
+
+The reconciled lists are now computed once, when a snapshot is written, and
+stored in the *_labels columns. The API reads those and only falls back to
+normalize_* for rows written before the columns existed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+def normalize_factor_list(primary: Any, legacy: Any = None) -> List[str]:
+    """
+    Factor list as strings: primary column first, legacy column as fallback.
+
+    Args:
+        primary: positive_factors_json / negative_factors_json value
+        legacy: positive_indicators / negative_indicators value (list or
+            comma-separated string)
+    """
+    if primary:
+        if isinstance(primary, list):
+            return [str(item) for item in primary]
+        return [str(primary)]
+    if legacy:
+        if isinstance(legacy, list):
+            return [str(item) for item in legacy]
+        if isinstance(legacy, str):
+            return [item.strip() for item in legacy.split(",") if item.strip()]
+    return []
+
+
+def normalize_risk_flags(value: Any) -> List[str]:
+    """risk_flags_json value as a list of strings."""
+    if value:
+        if isinstance(value, list):
+            return [str(item) for item in value]
+        return [str(value)]
+    return []
+
+
+def project_prediction_row(row: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Projection columns of a prediction_snapshots row (column -> value dict).
+
+    Returns:
+        positive_factor_labels / negative_factor_labels / risk_flag_labels
+    """
+    return {
+        "positive_factor_labels": normalize_factor_list(
+            row.get("positive_factors_json"), row.get("positive_indicators")
+        ),
+        "negative_factor_labels": normalize_factor_list(
+            row.get("negative_factors_json"), row.get("negative_indicators")
+        ),
+        "risk_flag_labels": normalize_risk_flags(row.get("risk_flags_json")),
+    }
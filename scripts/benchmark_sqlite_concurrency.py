@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Benchmark concurrent SQLite reads while a backfill writes.
+
+Usage example:
+
+    python scripts/benchmark_sqlite_concurrency.py --readers 8 --seconds 10
+
+A writer thread upserts daily_bars in batches (like
+scripts/run_backfill_raw_data.py) while reader threads run API-style
+prediction_snapshots queries. Two setups are compared on fresh temporary
+databases:
+
+- default: the original get_engine settings (plain create_engine, rollback
+           journal, sqlite3's default 5 s busy timeout, one shared engine)
+- wal:     default + WAL / synchronous=NORMAL (get_engine before the
+           busy_timeout and read-only pool)
+- tuned:   jgod.storage.db.create_sqlite_engine (WAL, busy_timeout, pooled
+           writer + separate read-only pool)
+
+Reported per setup: read latency percentiles, failed reads ("database is
+locked") and writer throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from jgod.storage.bulk_upsert import upsert_daily_bars
+from jgod.storage.db import apply_sqlite_pragmas, create_sqlite_engine
+from jgod.storage.models import Base, PredictionSnapshot
+
+
+# ---------------------------------------------------------------------------
+# Setup
+# ---------------------------------------------------------------------------
+
+
+def seed_predictions(engine: Engine, n_symbols: int, n_days: int) -> List[str]:
+    symbols = [str(1000 + i) for i in range(n_symbols)]
+    start = date(2023, 1, 2)
+    now = datetime.now()
+    rows = [
+        {
+            "symbol": symbol,
+            "date": start + timedelta(days=d),
+            "score": float(d % 50),
+            "verdict": "BUY",
+            "updated_at": now,
+        }
+        for symbol in symbols
+        for d in range(n_days)
+    ]
+    with engine.begin() as conn:
+        conn.execute(PredictionSnapshot.__table__.insert(), rows)
+    return symbols
+
+
+def _apply_wal_pragmas(dbapi_connection, connection_record) -> None:
+    apply_sqlite_pragmas(dbapi_connection, {"journal_mode": "WAL", "synchronous": "NORMAL"})
+
+
+def make_engines(mode: str, db_path: Path) -> Dict[str, Engine]:
+    if mode in ("default", "wal"):
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+        )
+        if mode == "wal":
+            event.listen(engine, "connect", _apply_wal_pragmas)
+        return {"writer": engine, "reader": engine}
+    return {
+        "writer": create_sqlite_engine(db_path),
+        "reader": create_sqlite_engine(db_path, read_only=True),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def writer_loop(engine: Engine, stop: threading.Event, batch_days: int, counter: Dict[str, int]) -> None:
+    session = sessionmaker(bind=engine)()
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp("2015-01-01")
+    i = 0
+    try:
+        while not stop.is_set():
+            dates = pd.bdate_range(start + pd.Timedelta(days=i * batch_days * 2), periods=batch_days)
+            close = rng.uniform(50, 150, batch_days)
+            bars = pd.DataFrame({
+                "date": dates, "open": close, "high": close + 1, "low": close - 1,
+                "close": close, "volume": 1000.0,
+            })
+            try:
+                upsert_daily_bars(session, f"W{i % 50}", bars)
+                session.commit()
+                counter["rows"] += batch_days
+            except OperationalError:
+                session.rollback()
+                counter["errors"] += 1
+            i += 1
+    finally:
+        session.close()
+
+
+def reader_loop(
+    engine: Engine,
+    symbols: List[str],
+    stop: threading.Event,
+    latencies: List[float],
+    errors: List[int],
+    seed: int,
+) -> None:
+    rng = np.random.default_rng(seed)
+    query = text(
+        "SELECT date, score, verdict FROM prediction_snapshots "
+        "WHERE symbol = :symbol AND date >= :start ORDER BY date"
+    )
+    while not stop.is_set():
+        symbol = symbols[rng.integers(len(symbols))]
+        started = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                conn.execute(query, {"symbol": symbol, "start": date(2023, 6, 1)}).fetchall()
+            latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            errors.append(1)
+
+
+def run(mode: str, readers: int, seconds: float, batch_days: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        engines = make_engines(mode, db_path)
+        Base.metadata.create_all(bind=engines["writer"])
+        symbols = seed_predictions(engines["writer"], n_symbols=200, n_days=500)
+
+        stop = threading.Event()
+        counter = {"rows": 0, "errors": 0}
+        latencies: List[float] = []
+        read_errors: List[int] = []
+        threads = [threading.Thread(target=writer_loop, args=(engines["writer"], stop, batch_days, counter))]
+        threads += [
+            threading.Thread(
+                target=reader_loop,
+                args=(engines["reader"], symbols, stop, latencies, read_errors, seed),
+            )
+            for seed in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        for engine in set(engines.values()):
+            engine.dispose()
+
+    lat = np.array(latencies) * 1000.0 if latencies else np.array([np.nan])
+    return {
+        "reads": len(latencies),
+        "read_errors": len(read_errors),
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p95_ms": float(np.percentile(lat, 95)),
+        "p99_ms": float(np.percentile(lat, 99)),
+        "max_ms": float(np.max(lat)),
+        "rows_written": counter["rows"],
+        "write_errors": counter["errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--batch-days", type=int, default=250)
+    args = parser.parse_args()
+
+    for mode in ("default", "wal", "tuned"):
+        result = run(mode, args.readers, args.seconds, args.batch_days)
+        print(
+            f"{mode:>8}: reads={result['reads']:>7} read_errors={result['read_errors']:>6} "
+            f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms "
+            f"p99={result['p99_ms']:.2f}ms max={result['max_ms']:.1f}ms "
+            f"rows_written={result['rows_written']} write_errors={result['write_errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
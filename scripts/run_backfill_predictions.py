@@ -8,6 +8,7 @@ Usage:
     PYTHONPATH=. python scripts/run_backfill_predictions.py
     PYTHONPATH=. python scripts/run_backfill_predictions.py --start-date 2024-01-01 --end-date 2024-12-31
     PYTHONPATH=. python scripts/run_backfill_predictions.py --symbols 2330,2454 --force
+    PYTHONPATH=. python scripts/run_backfill_predictions.py --indicator-store data/indicator_store
 """
 
 from __future__ import annotations
@@ -15,24 +16,25 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from datetime import date, datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import List
 
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from jgod.prediction.rules.stock_upside_filter_60_v1 import (
-    IndicatorScore,
-    StockUpsideFilter60V1,
-    StockUpsideResult,
+from jgod.prediction.backfill_engine import (
+    PredictionBackfillConfig,
+    PredictionBackfillEngine,
 )
+from jgod.storage.bulk_upsert import DEFAULT_BATCH_SIZE
 from jgod.storage.db import get_session, init_db
-from jgod.storage.models import DailyBar, IndicatorSnapshot, PredictionSnapshot, Stock
+from jgod.storage.models import Stock
+
+DEFAULT_CHECKPOINT = "data/checkpoints/prediction_backfill.json"
 
 # Configure logging
 logging.basicConfig(
@@ -97,304 +99,54 @@ Examples:
         help="Minimum number of indicators required (default: 90)",
     )
     
-    return parser.parse_args()
-
-
-def load_symbols_from_db(session: Session) -> List[str]:
-    """Load all symbols from stocks table"""
-    stocks = session.query(Stock).filter(Stock.is_active == True).all()
-    return [stock.symbol for stock in stocks]
-
-
-def check_data_availability(
-    session: Session,
-    symbol: str,
-    as_of_date: date,
-    min_indicators: int,
-    stats: Dict[str, int],
-) -> bool:
-    """
-    檢查該 symbol+date 是否有足夠資料可做預測。
-
-    新版規則（2025-12-06）：
-    - 不再要求 daily_bars 一定要存在
-    - 只要有 indicator_snapshots（>0），就視為資料足夠，可以做 prediction
-    - 如果完全沒有 indicators（==0），才視為 insufficient_data
-    """
-
-    # 可選：保留 daily_bars 的 count 只做 debug 用，不作為條件
-    daily_bar_count = (
-        session.query(func.count(DailyBar.id))
-        .filter(DailyBar.symbol == symbol, DailyBar.date == as_of_date)
-        .scalar()
-    )
-
-    indicator_count = (
-        session.query(func.count(IndicatorSnapshot.id))
-        .filter(
-            IndicatorSnapshot.symbol == symbol,
-            IndicatorSnapshot.date == as_of_date,
-        )
-        .scalar()
-    )
-
-    logger.info(
-        "Data availability for %s %s -> daily_bars: %d, indicators: %d (min_indicators=%d, not used as threshold)",
-        symbol,
-        as_of_date,
-        daily_bar_count,
-        indicator_count,
-        min_indicators,
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for evaluation (default: 1)",
     )
-
-    # ✅ 新規則：只看 indicators
-    if indicator_count == 0:
-        stats["insufficient_data"] += 1
-        logger.warning(
-            "Skipping %s %s: no indicators found (indicator_count=0)",
-            symbol,
-            as_of_date,
-        )
-        return False
-
-    # 只要有 1 筆以上指標，就一定要進 prediction
-    return True
-
-
-def load_indicators_from_db(
-    session: Session,
-    symbol: str,
-    as_of_date: date,
-) -> Dict[str, Any]:
-    """
-    Load indicators from database and convert to dict format.
     
-    Returns:
-        Dict[str, Any]: Indicators dict for StockUpsideFilter60V1.evaluate()
-    """
-    snapshots = (
-        session.query(IndicatorSnapshot)
-        .filter(
-            IndicatorSnapshot.symbol == symbol,
-            IndicatorSnapshot.date == as_of_date,
-        )
-        .all()
+    parser.add_argument(
+        "--chunk-days",
+        type=int,
+        default=20,
+        help="Trading dates per block: one indicator query, one commit, one checkpoint (default: 20)",
     )
     
-    indicators: Dict[str, Any] = {}
-    for snap in snapshots:
-        # Use raw_value if available, otherwise use normalized_value * 100 as proxy
-        if snap.raw_value is not None:
-            indicators[snap.indicator_code] = snap.raw_value
-        elif snap.normalized_value is not None:
-            # Reverse normalization for filter (approximate)
-            indicators[snap.indicator_code] = snap.normalized_value * 100.0
-        else:
-            indicators[snap.indicator_code] = 0.0
-    
-    return indicators
-
-
-def extract_risk_flags(result: StockUpsideResult) -> List[Dict[str, Any]]:
-    """
-    Extract risk flags from prediction result.
-    
-    Currently identifies:
-    - Negative total score
-    - SHORT verdict
-    - AVOID verdict
-    """
-    flags = []
-    
-    if result.total_score < 0:
-        flags.append({
-            "type": "negative_score",
-            "severity": "medium",
-            "message": f"Total score is negative: {result.total_score:.2f}",
-        })
-    
-    if result.verdict == "SHORT":
-        flags.append({
-            "type": "short_signal",
-            "severity": "high",
-            "message": "Strong sell signal detected",
-        })
-    
-    if result.verdict == "AVOID":
-        flags.append({
-            "type": "avoid_signal",
-            "severity": "medium",
-            "message": "Avoid signal detected",
-        })
-    
-    return flags
-
-
-def extract_top_indicators(
-    result: StockUpsideResult,
-    top_n: int,
-    positive: bool = True,
-) -> List[Dict[str, Any]]:
-    """Extract top N positive or negative indicators"""
-    scored: List[tuple[IndicatorScore, float]] = []
-    for ind in result.indicator_scores:
-        weighted = ind.score * ind.weight
-        scored.append((ind, weighted))
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per batched upsert (default: {DEFAULT_BATCH_SIZE})",
+    )
     
-    if positive:
-        scored = [x for x in scored if x[1] > 0]
-        scored.sort(key=lambda x: x[1], reverse=True)
-    else:
-        scored = [x for x in scored if x[1] < 0]
-        scored.sort(key=lambda x: x[1])
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=DEFAULT_CHECKPOINT,
+        help=f"Progress file used to resume an interrupted backfill; removed once the job completes (default: {DEFAULT_CHECKPOINT})",
+    )
     
-    return [
-        {
-            "code": ind.code,
-            "name": ind.name,
-            "score": ind.score,
-            "weight": ind.weight,
-            "weighted_score": float(weighted),
-        }
-        for ind, weighted in scored[:top_n]
-    ]
-
-
-def serialize_result(result: StockUpsideResult) -> Dict[str, Any]:
-    """Serialize StockUpsideResult to JSON-serializable dict"""
-    return {
-        "symbol": result.symbol,
-        "total_score": result.total_score,
-        "verdict": result.verdict,
-        "summary": result.summary,
-        "indicator_scores": [
-            {
-                "code": ind.code,
-                "name": ind.name,
-                "score": ind.score,
-                "weight": ind.weight,
-                "reason": ind.reason,
-            }
-            for ind in result.indicator_scores
-        ],
-    }
-
-
-def backfill_prediction(
-    session: Session,
-    filter_instance: StockUpsideFilter60V1,
-    symbol: str,
-    as_of_date: date,
-    force: bool = False,
-    top_n: int = 10,
-) -> bool:
-    """
-    Build and save prediction snapshot for a symbol on a specific date.
+    parser.add_argument(
+        "--indicator-store",
+        type=str,
+        default=None,
+        help="Read indicators from a columnar indicator store directory instead of indicator_snapshots",
+    )
     
-    Returns:
-        bool: True if successful
-    """
-    # Check if prediction already exists
-    if not force:
-        existing = (
-            session.query(PredictionSnapshot)
-            .filter(
-                PredictionSnapshot.symbol == symbol,
-                PredictionSnapshot.date == as_of_date,
-            )
-            .first()
-        )
-        
-        if existing:
-            logger.debug(f"  {symbol} {as_of_date}: prediction exists, skip (use --force to rebuild)")
-            return False
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and start from --start-date",
+    )
     
-    try:
-        # Load indicators from DB
-        indicators = load_indicators_from_db(session, symbol, as_of_date)
-        
-        if not indicators:
-            logger.warning(f"  {symbol} {as_of_date}: No indicators found")
-            return False
-        
-        # Evaluate using filter
-        result = filter_instance.evaluate(symbol, indicators)
-        
-        # Extract top indicators
-        positive_indicators = extract_top_indicators(result, top_n, positive=True)
-        negative_indicators = extract_top_indicators(result, top_n, positive=False)
-        
-        # Extract risk flags
-        risk_flags = extract_risk_flags(result)
-        
-        # Serialize meta data
-        meta_json = serialize_result(result)
-        
-        # Check if exists
-        existing = (
-            session.query(PredictionSnapshot)
-            .filter(
-                PredictionSnapshot.symbol == symbol,
-                PredictionSnapshot.date == as_of_date,
-            )
-            .first()
-        )
-        
-        now = datetime.now()
-        
-        if existing:
-            # Update existing
-            existing.score = result.total_score
-            existing.total_score = result.total_score
-            existing.signal = result.verdict
-            existing.verdict = result.verdict
-            existing.positive_factors_json = positive_indicators
-            existing.negative_factors_json = negative_indicators
-            existing.risk_flags_json = risk_flags
-            existing.meta_json = meta_json
-            # Backward compatibility
-            existing.positive_indicators = positive_indicators
-            existing.negative_indicators = negative_indicators
-            existing.raw_payload = meta_json
-            existing.updated_at = now
-        else:
-            # Insert new
-            new_snapshot = PredictionSnapshot(
-                symbol=symbol,
-                date=as_of_date,
-                score=result.total_score,
-                total_score=result.total_score,
-                signal=result.verdict,
-                verdict=result.verdict,
-                positive_factors_json=positive_indicators,
-                negative_factors_json=negative_indicators,
-                risk_flags_json=risk_flags,
-                meta_json=meta_json,
-                # Backward compatibility
-                positive_indicators=positive_indicators,
-                negative_indicators=negative_indicators,
-                raw_payload=meta_json,
-            )
-            session.add(new_snapshot)
-        
-        session.commit()
-        return True
-        
-    except Exception as e:
-        session.rollback()
-        logger.error(f"  {symbol} {as_of_date}: Error building prediction: {e}", exc_info=True)
-        return False
+    return parser.parse_args()
 
 
-def generate_date_range(start_date: date, end_date: date) -> List[date]:
-    """Generate list of trading dates (excluding weekends)"""
-    dates = []
-    current = start_date
-    while current <= end_date:
-        if current.weekday() < 5:  # Skip weekends (Monday=0, Friday=4)
-            dates.append(current)
-        current += timedelta(days=1)
-    return dates
+def load_symbols_from_db(session: Session) -> List[str]:
+    """Load all symbols from stocks table"""
+    stocks = session.query(Stock).filter(Stock.is_active == True).all()
+    return [stock.symbol for stock in stocks]
 
 
 def main():
@@ -436,83 +188,30 @@ def main():
                 logger.warning("No active stocks found in database. Please ensure stocks table is populated.")
                 return
         
-        # Initialize filter
-        filter_instance = StockUpsideFilter60V1()
-        
-        # Generate date range
-        dates = generate_date_range(start_date_obj, end_date_obj)
-        logger.info(f"Processing {len(dates)} dates from {start_date_obj} to {end_date_obj}")
-        
-        # Process each symbol × date
-        total_predictions = 0
-        total_skipped_data = 0
-        total_skipped_exists = 0
-        total_errors = 0
-        total_combinations = len(symbol_list) * len(dates)
-        current = 0
-        
-        # Stats dict for check_data_availability
-        stats = {"insufficient_data": 0}
-        
-        logger.info(f"Starting backfill for {len(symbol_list)} symbols × {len(dates)} dates = {total_combinations} combinations")
-        
-        for symbol in symbol_list:
-            for as_of_date in dates:
-                current += 1
-                
-                if current % 50 == 0:
-                    logger.info(
-                        f"Progress: {current}/{total_combinations} "
-                        f"({current*100//total_combinations}%) - "
-                        f"Saved: {total_predictions}, Skipped (data): {total_skipped_data}, "
-                        f"Skipped (exists): {total_skipped_exists}, Errors: {total_errors}"
-                    )
-                
-                # Check data availability
-                is_available = check_data_availability(
-                    session, symbol, as_of_date, args.min_indicators, stats
-                )
-                
-                if not is_available:
-                    total_skipped_data = stats["insufficient_data"]
-                    continue
-                
-                # Build and save prediction
-                success = backfill_prediction(
-                    session,
-                    filter_instance,
-                    symbol,
-                    as_of_date,
-                    force=args.force,
-                )
-                
-                if success:
-                    total_predictions += 1
-                else:
-                    # Check if it was skipped due to existing prediction
-                    existing = (
-                        session.query(PredictionSnapshot)
-                        .filter(
-                            PredictionSnapshot.symbol == symbol,
-                            PredictionSnapshot.date == as_of_date,
-                        )
-                        .first()
-                    )
-                    if existing and not args.force:
-                        total_skipped_exists += 1
-                    else:
-                        total_errors += 1
+        config = PredictionBackfillConfig(
+            start_date=start_date_obj,
+            end_date=end_date_obj,
+            force=args.force,
+            workers=args.workers,
+            date_chunk_size=args.chunk_days,
+            batch_size=args.batch_size,
+            checkpoint_path=project_root / args.checkpoint if args.checkpoint else None,
+            restart=args.restart,
+            indicator_store_dir=project_root / args.indicator_store if args.indicator_store else None,
+        )
+        engine = PredictionBackfillEngine(session, config)
         
-        # Final update of skipped data count from stats
-        total_skipped_data = stats["insufficient_data"]
+        logger.info(f"Starting backfill for {len(symbol_list)} symbols from {start_date_obj} to {end_date_obj}")
+        stats = engine.run(symbol_list)
         
         logger.info("=" * 70)
         logger.info("✅ Backfill completed!")
-        logger.info(f"  Total combinations processed: {total_combinations}")
-        logger.info(f"  ✅ Predictions saved: {total_predictions}")
-        logger.info(f"  ⏭️  Skipped (insufficient data): {total_skipped_data}")
-        logger.info(f"  ⏭️  Skipped (already exists): {total_skipped_exists}")
-        logger.info(f"  ❌ Errors: {total_errors}")
+        logger.info(f"  Total combinations: {stats.total}")
+        logger.info(f"  ✅ Predictions saved: {stats.saved}")
+        logger.info(f"  ⏭️  Skipped (insufficient data): {stats.skipped_data}")
+        logger.info(f"  ⏭️  Skipped (already exists): {stats.skipped_exists}")
+        logger.info(f"  ⏭️  Skipped (checkpoint): {stats.skipped_checkpoint}")
+        logger.info(f"  ❌ Errors: {stats.errors}")
         logger.info("=" * 70)
         
     finally:
@@ -33,11 +33,10 @@ try:
 except ImportError:
     pass
 
-import pandas as pd
-
 from api_clients.finmind_client import FinMindClient, FinMindClientConfig
+from jgod.storage.bulk_upsert import DEFAULT_BATCH_SIZE, upsert_daily_bars
 from jgod.storage.db import get_session, init_db
-from jgod.storage.models import DailyBar, Stock
+from jgod.storage.models import Stock
 
 logging.basicConfig(
     level=logging.INFO,
@@ -73,6 +72,12 @@ def parse_args() -> argparse.Namespace:
         default="2024-12-31",
         help="End date (YYYY-MM-DD)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per batched upsert into daily_bars",
+    )
     return parser.parse_args()
 
 
@@ -123,10 +128,14 @@ def backfill_daily_bars(
     symbol: str,
     start_date: date,
     end_date: date,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> int:
     """
     Backfill daily bars for a single symbol.
     
+    Existing (symbol, date) keys are loaded in one query and rows are written
+    with batched INSERT ... ON CONFLICT DO UPDATE (see jgod.storage.bulk_upsert).
+    
     Returns:
         int: Number of records inserted/updated
     """
@@ -145,48 +154,7 @@ def backfill_daily_bars(
             logger.error(f"No 'date' column in data for {symbol}")
             return 0
         
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-        
-        inserted = 0
-        updated = 0
-        
-        for _, row in df.iterrows():
-            bar_date = row["date"]
-            
-            # Check if exists
-            existing = (
-                session.query(DailyBar)
-                .filter(DailyBar.symbol == symbol, DailyBar.date == bar_date)
-                .first()
-            )
-            
-            if existing:
-                # Update existing
-                existing.open = float(row.get("open", 0.0))
-                existing.high = float(row.get("high", 0.0))
-                existing.low = float(row.get("low", 0.0))
-                existing.close = float(row.get("close", 0.0))
-                existing.volume = float(row.get("volume", 0.0))
-                existing.turnover = float(row.get("turnover", 0.0)) if "turnover" in row else None
-                existing.adjusted_close = float(row.get("adjusted_close", 0.0)) if "adjusted_close" in row else None
-                existing.updated_at = datetime.now()
-                updated += 1
-            else:
-                # Insert new
-                new_bar = DailyBar(
-                    symbol=symbol,
-                    date=bar_date,
-                    open=float(row.get("open", 0.0)),
-                    high=float(row.get("high", 0.0)),
-                    low=float(row.get("low", 0.0)),
-                    close=float(row.get("close", 0.0)),
-                    volume=float(row.get("volume", 0.0)),
-                    turnover=float(row.get("turnover", 0.0)) if "turnover" in row else None,
-                    adjusted_close=float(row.get("adjusted_close", 0.0)) if "adjusted_close" in row else None,
-                    source="FinMind",
-                )
-                session.add(new_bar)
-                inserted += 1
+        inserted, updated = upsert_daily_bars(session, symbol, df, batch_size=batch_size)
         
         session.commit()
         logger.info(f"  {symbol}: {inserted} inserted, {updated} updated")
@@ -246,7 +214,9 @@ def main():
         total_records = 0
         for stock_data in universe:
             symbol = stock_data["symbol"]
-            records = backfill_daily_bars(session, client, symbol, start_date, end_date)
+            records = backfill_daily_bars(
+                session, client, symbol, start_date, end_date, batch_size=args.batch_size
+            )
             total_records += records
         
         logger.info(f"✅ Backfill completed: {total_records} total records")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Columnar Indicator Store Builder for J-GOD
+
+將 indicator_snapshots（每個 symbol × date × indicator 一列）複製成
+按月分區的寬表（見 jgod/storage/indicator_store.py），供批次讀取。
+indicator_snapshots 本身不變，API 仍從資料表讀取。
+
+Usage:
+    PYTHONPATH=. python scripts/run_build_indicator_store.py
+    PYTHONPATH=. python scripts/run_build_indicator_store.py --start-date 2024-01-01 --end-date 2024-12-31
+    PYTHONPATH=. python scripts/run_build_indicator_store.py --symbols 2330,2454 --store-dir data/indicator_store
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from jgod.storage.db import get_session, init_db
+from jgod.storage.indicator_store import ColumnarIndicatorStore
+
+DEFAULT_STORE_DIR = "data/indicator_store"
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Copy indicator_snapshots into the columnar indicator store")
+    parser.add_argument(
+        "--start-date",
+        type=str,
+        default="2024-01-01",
+        help="Start date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--end-date",
+        type=str,
+        default="2024-12-31",
+        help="End date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--symbols",
+        type=str,
+        default=None,
+        help="Comma-separated stock symbols (default: all symbols in indicator_snapshots)",
+    )
+    parser.add_argument(
+        "--store-dir",
+        type=str,
+        default=DEFAULT_STORE_DIR,
+        help=f"Store directory (default: {DEFAULT_STORE_DIR})",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+
+    try:
+        start_date = datetime.strptime(args.start_date, "%Y-%m-%d").date()
+        end_date = datetime.strptime(args.end_date, "%Y-%m-%d").date()
+    except ValueError as e:
+        logger.error(f"Invalid date format: {e}")
+        sys.exit(1)
+
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()] if args.symbols else None
+
+    init_db()
+    store = ColumnarIndicatorStore(project_root / args.store_dir)
+
+    session_gen = get_session()
+    session = next(session_gen)
+    try:
+        written = store.import_snapshots(session, start_date, end_date, symbols=symbols)
+        logger.info(f"✅ Wrote {written} (symbol, date) rows to {store.root} ({len(store.months())} month partitions)")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
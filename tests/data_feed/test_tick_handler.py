@@ -4,12 +4,16 @@
 測試 UnifiedTick、SinopacConverter、MockSinopacAPI 的功能
 """
 
+import numpy as np
 import pytest
 from data_feed.tick_handler import (
     UnifiedTick,
     BaseTickConverter,
     SinopacConverter,
     MockSinopacAPI,
+    CompactTick,
+    TickBatch,
+    TICK_DTYPE,
 )
 
 
@@ -165,3 +169,75 @@ class TestIntegration:
         assert unified_tick.volume > 0
         assert unified_tick.bid_price < unified_tick.ask_price
 
+
+
+class TestTickBatch:
+    """測試 CompactTick / TickBatch 與向量化批次轉換"""
+    
+    @staticmethod
+    def _raw_rows():
+        mock_api = MockSinopacAPI(symbol="2330", base_price=750.0)
+        rows = [mock_api.get_next_raw_tick() for _ in range(50)]
+        rows[3] = dict(rows[3], code="2317")
+        rows[5] = dict(rows[5], code="2330.TW")
+        return rows
+    
+    def test_convert_batch_matches_convert_to_unified(self):
+        converter = SinopacConverter()
+        rows = self._raw_rows()
+        result = converter.convert_batch(rows)
+        
+        assert result.rejected == []
+        assert result.batch.data.dtype == TICK_DTYPE
+        assert result.batch.symbols == ["2330.TW", "2317.TW"]
+        expected = [converter.convert_to_unified(row) for row in rows]
+        assert [tick.to_unified() for tick in result.batch] == expected
+        assert result.batch.to_unified() == expected
+    
+    def test_convert_batch_reports_rejected_rows(self):
+        converter = SinopacConverter()
+        good = {"ts": 1.0, "code": "2330", "price": 750.0, "volume": 10, "bid": 749.5, "ask": 750.5}
+        rows = [
+            good,
+            "not a dict",
+            {"ts": 1.0, "code": "2330"},
+            dict(good, ts=-1),
+            dict(good, price="abc"),
+            dict(good, volume=-5),
+            dict(good, bid=0.0),
+            dict(good, bid=751.0),
+            dict(good, volume="7"),
+        ]
+        result = converter.convert_batch(rows)
+        
+        assert [r.index for r in result.rejected] == [1, 2, 3, 4, 5, 6, 7]
+        assert result.rejected[0].reason == "raw_data is not a dict"
+        assert result.rejected[1].reason.startswith("Missing required fields")
+        assert result.rejected[-1].reason.startswith("Bid price")
+        assert list(result.batch.volume) == [10, 7]
+        
+        # 逐筆轉換也會拒絕同樣的列
+        for index, row in enumerate(rows):
+            if index in {r.index for r in result.rejected}:
+                with pytest.raises((ValueError, TypeError)):
+                    converter.convert_to_unified(row)
+    
+    def test_base_converter_default_convert_batch(self):
+        converter = SinopacConverter()
+        rows = self._raw_rows()[:5] + [{"ts": 1.0}]
+        result = BaseTickConverter.convert_batch(converter, rows)
+        assert [r.index for r in result.rejected] == [5]
+        assert list(result.batch) == list(converter.convert_batch(rows[:5]).batch)
+    
+    def test_batch_indexing_and_concatenate(self):
+        batch = SinopacConverter().convert_batch(self._raw_rows()).batch
+        tick = batch[3]
+        assert isinstance(tick, CompactTick)
+        assert tick.symbol == "2317.TW"
+        assert len(batch[10:20]) == 10
+        
+        merged = TickBatch.concatenate([batch[:3], batch[3:4], batch[4:]])
+        assert list(merged) == list(batch)
+        assert TickBatch.from_ticks(batch.to_unified()).data.tolist() == batch.data.tolist()
+        assert CompactTick.from_unified(tick.to_unified()) == tick
+        np.testing.assert_array_equal(batch.symbol_names()[:4], ["2330.TW"] * 3 + ["2317.TW"])
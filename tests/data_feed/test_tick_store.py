@@ -0,0 +1,168 @@
+"""
+測試 Tick Store 模組
+
+測試 TickRecorder 錄製檔、TickStore 讀取與 TickReplayer 重播
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from data_feed.tick_handler import CompactTick, MockSinopacAPI, SinopacConverter, TickBatch
+from data_feed.tick_store import (
+    HEADER_SIZE,
+    RECORD_DTYPE,
+    ReplayStats,
+    TickRecorder,
+    TickReplayer,
+    TickStore,
+    open_tick_file,
+)
+
+# 2024-01-02 09:00:00 (UTC+8)
+OPEN_TS = datetime(2024, 1, 2, 9, 0, tzinfo=timezone(timedelta(hours=8))).timestamp()
+
+
+def _mock_batch(symbol: str, n: int, start: float = OPEN_TS) -> TickBatch:
+    api = MockSinopacAPI(symbol=symbol)
+    api.current_time = start
+    return SinopacConverter().convert_batch([api.get_next_raw_tick() for _ in range(n)]).batch
+
+
+class TestTickRecorder:
+    """測試錄製與讀取"""
+
+    def test_round_trip_per_symbol_files(self, tmp_path):
+        batch = TickBatch.concatenate([_mock_batch("2330", 50), _mock_batch("2317", 30)])
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record_batch(batch)
+
+        store = TickStore(tmp_path)
+        assert store.days() == [date(2024, 1, 2)]
+        assert store.symbols("20240102") == ["2317.TW", "2330.TW"]
+
+        tick_file = store.open("2330.TW", date(2024, 1, 2))
+        assert isinstance(tick_file.records, np.memmap)
+        assert (tick_file.symbol, tick_file.source, len(tick_file)) == ("2330.TW", "sinopac", 50)
+        assert tick_file.path.stat().st_size == HEADER_SIZE + 50 * RECORD_DTYPE.itemsize
+        assert list(tick_file.to_batch()) == [t for t in batch if t.symbol == "2330.TW"]
+
+        day = store.load_day("2024-01-02")
+        assert np.all(np.diff(day.timestamp) >= 0)
+        assert sorted(day) == sorted(batch)
+
+    def test_single_ticks_append_across_sessions(self, tmp_path):
+        ticks = list(_mock_batch("2330", 25))
+        with TickRecorder(tmp_path, flush_size=10) as recorder:
+            for tick in ticks[:15]:
+                recorder.record(tick)
+            assert recorder.ticks_written == 10
+        assert recorder.ticks_written == 15
+
+        with TickRecorder(tmp_path) as recorder:
+            for tick in ticks[15:]:
+                recorder.record(tick)
+
+        assert list(TickStore(tmp_path).open("2330.TW", "20240102").to_batch()) == ticks
+
+    def test_partial_trailing_record_is_ignored_then_truncated(self, tmp_path):
+        ticks = list(_mock_batch("2330", 5))
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record_batch(TickBatch.from_ticks(ticks[:3]))
+        path = TickStore(tmp_path).path_for("2330.TW", "20240102")
+        with open(path, "ab") as fh:
+            fh.write(b"\x01" * 7)  # 寫到一半中斷
+
+        assert len(open_tick_file(path)) == 3
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record_batch(TickBatch.from_ticks(ticks[3:]))
+        assert list(open_tick_file(path).to_batch()) == ticks
+
+    def test_trading_day_uses_market_timezone(self, tmp_path):
+        # 2024-01-02 23:59:59 與 2024-01-03 00:00:01（UTC+8）分屬兩個交易日
+        midnight = OPEN_TS + 15 * 3600
+        ticks = [
+            CompactTick(midnight - 1, "2330.TW", "sinopac", 750.0, 1, 749.5, 750.5),
+            CompactTick(midnight + 1, "2330.TW", "sinopac", 751.0, 2, 750.5, 751.5),
+        ]
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record_batch(TickBatch.from_ticks(ticks))
+        store = TickStore(tmp_path)
+        assert store.days() == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert list(store.load_day("20240103")) == ticks[1:]
+
+    def test_rejects_foreign_files_and_bad_symbols(self, tmp_path):
+        path = tmp_path / "bad.ticks"
+        path.write_bytes(b"\0" * HEADER_SIZE)
+        with pytest.raises(ValueError):
+            open_tick_file(path)
+        with pytest.raises(ValueError):
+            TickStore(tmp_path).path_for("../2330", "20240102")
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestTickReplayer:
+    """測試重播"""
+
+    def test_as_fast_as_possible_batches(self, tmp_path):
+        batch = TickBatch.concatenate([_mock_batch("2330", 100), _mock_batch("2317", 100)])
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record_batch(batch)
+
+        seen = []
+        replayer = TickReplayer.from_store(tmp_path, "20240102", batch_size=64)
+        stats = replayer.replay_batches(seen.append)
+        assert [len(b) for b in seen] == [64, 64, 64, 8]
+        assert (stats.ticks, stats.batches) == (200, 4)
+        assert stats.market_seconds == pytest.approx(9.9)
+        assert stats.ticks_per_second > 0
+
+        ticks = []
+        assert TickReplayer(replayer.batch).replay(ticks.append).ticks == 200
+        assert ticks == list(replayer.batch)
+
+    def test_paced_replay_follows_market_time(self):
+        batch = _mock_batch("2330", 11)  # 0.1 秒一筆，跨 1 秒市場時間
+        clock = _FakeClock()
+        sizes = []
+        stats = TickReplayer(batch, speed=2.0, clock=clock, sleep=clock.sleep).replay_batches(
+            lambda b: sizes.append(len(b))
+        )
+        assert sum(sizes) == 11
+        assert stats.wall_seconds == pytest.approx(0.5)
+        assert stats.speedup == pytest.approx(2.0)
+        assert all(s == pytest.approx(0.05) for s in clock.slept)
+
+    def test_feeds_multi_symbol_pipeline(self, tmp_path):
+        from factor_engine import MultiSymbolPipelineConfig, MultiSymbolTickPipeline
+
+        batch = TickBatch.concatenate([_mock_batch("2330", 300), _mock_batch("2317", 300)])
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record_batch(batch)
+        day = TickStore(tmp_path).load_day("20240102")
+
+        config = MultiSymbolPipelineConfig(volume_bar_size=5_000)
+        expected = MultiSymbolTickPipeline(config).process_tick_batch(day)
+        pipeline = MultiSymbolTickPipeline(config)
+        bars = []
+        TickReplayer(day, batch_size=37).replay_batches(
+            lambda b: bars.extend(pipeline.process_tick_batch(b).bars.volume_bars())
+        )
+        assert len(bars) == len(expected.bars) > 0
+        assert [b.total_volume for b in bars] == list(expected.bars.total_volume)
+
+    def test_empty_replay(self):
+        assert TickReplayer(TickBatch.empty()).replay(lambda t: None) == ReplayStats()
@@ -23,7 +23,7 @@ from scripts.run_jgod_experiment import build_orchestrator
 class TestExperimentExtremeSmoke:
     """Smoke Test for Extreme Mode."""
     
-    def test_extreme_mode_smoke(self):
+    def test_extreme_mode_smoke(self, tmp_path, monkeypatch):
         """
         Smoke Test for Extreme Mode.
         
@@ -33,6 +33,9 @@ class TestExperimentExtremeSmoke:
         - Result contains required summary metrics
         - No exceptions are raised
         """
+        # Orchestrator 寫到工作目錄下的 output/experiments/，改在 tmp_path 執行
+        monkeypatch.chdir(tmp_path)
+        
         # Build orchestrator with EXTREME mode
         orchestrator = build_orchestrator(
             data_source="mock",
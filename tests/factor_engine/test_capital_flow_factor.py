@@ -6,6 +6,9 @@
 
 import sys
 import os
+import random
+
+import pytest
 
 # 添加專案根目錄到 Python 路徑
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -261,6 +264,54 @@ class TestIntegration:
         assert all(-1.0 <= f.smart_aggression_index <= 1.0 for f in factors)
 
 
+def _random_ticks(n, seed, integer_volume=True):
+    """隨機 Tick：買 / 賣 / 中性混合，偶爾出現無效報價"""
+    rng = random.Random(seed)
+    ticks = []
+    for i in range(n):
+        bid = 100.0 + rng.uniform(-1, 1)
+        ask = bid + 0.2
+        price = rng.choice([ask + 0.05, bid - 0.05, (bid + ask) / 2])
+        volume = rng.randint(0, 500) if integer_volume else rng.uniform(0, 500)
+        if rng.random() < 0.02:
+            ask = bid  # 無效報價，應被略過
+        ticks.append(FakeTick(float(i), "2330.TW", price, volume, bid, ask))
+    return ticks
+
+
+class TestIncrementalAccumulators:
+    """累加器（O(1)）與全掃描（O(window)）輸出一致"""
+
+    def test_identical_to_full_scan(self):
+        ticks = _random_ticks(2000, seed=1)
+        for window_size in (1, 2, 7, 50):
+            incremental = CapitalFlowEngine(window_size=window_size, min_points=1)
+            full = CapitalFlowEngine(window_size=window_size, min_points=1, incremental=False)
+            for t in ticks:
+                assert incremental.update_from_tick(t) == full.update_from_tick(t)
+
+    def test_fractional_volume_stays_within_tolerance(self):
+        incremental = CapitalFlowEngine(window_size=64, min_points=5)
+        full = CapitalFlowEngine(window_size=64, min_points=5, incremental=False)
+        for t in _random_ticks(3000, seed=2, integer_volume=False):
+            a, b = incremental.update_from_tick(t), full.update_from_tick(t)
+            if b is None:
+                assert a is None
+                continue
+            assert a.window_trades == b.window_trades
+            assert a.window_volume == pytest.approx(b.window_volume, rel=1e-9)
+            assert a.net_signed_volume == pytest.approx(b.net_signed_volume, rel=1e-9, abs=1e-6)
+            assert a.momentum_of_imbalance == pytest.approx(b.momentum_of_imbalance, rel=1e-9, abs=1e-9)
+
+    def test_reset_clears_accumulators(self):
+        engine = CapitalFlowEngine(window_size=10, min_points=1)
+        engine.compute_from_ticks(_random_ticks(30, seed=3))
+        engine.reset()
+        t = _random_ticks(1, seed=4)[0]
+        reference = CapitalFlowEngine(window_size=10, min_points=1, incremental=False)
+        assert engine.update_from_tick(t) == reference.update_from_tick(t)
+
+
 if __name__ == "__main__":
     # 簡單測試執行
     print("=== 執行單元測試 ===")
@@ -9,6 +9,9 @@
 5. 多個 reference symbols 處理
 """
 
+import math
+import random
+
 import pytest
 import numpy as np
 from collections import deque
@@ -17,6 +20,9 @@ from factor_engine.cross_asset_factor import (
     CrossAssetWindowConfig,
     CrossAssetFactor,
     CrossAssetFactorEngine,
+    AlignedRollingMoments,
+    RingBuffer,
+    RollingPairMoments,
 )
 from factor_engine.info_time_engine import VolumeBar
 
@@ -394,6 +400,109 @@ class TestCrossAssetFactorEngine:
         assert np.isfinite(qqq_factor.spread_zscore)
 
 
+def _random_bars(n, symbols, seed=0, round_robin=True):
+    """幾何隨機漫步 VolumeBar；round_robin=False 時每次隨機挑一個 symbol 更新"""
+    rng = random.Random(seed)
+    prices = {symbol: 100.0 * (i + 1) for i, symbol in enumerate(symbols)}
+    bars = []
+    for i in range(n):
+        for symbol in (symbols if round_robin else [rng.choice(symbols)]):
+            prices[symbol] *= math.exp(rng.gauss(0.0, 0.01))
+            price = prices[symbol]
+            bars.append(VolumeBar(
+                start_ts=i * 60.0, end_ts=(i + 1) * 60.0, symbol=symbol, vwap=price,
+                total_volume=1000, tick_count=10, open_price=price, high_price=price,
+                low_price=price, close_price=price, avg_bid=price, avg_ask=price,
+            ))
+    return bars
+
+
+class TestRollingMoments:
+    """測試 ring buffer + Welford 滑動動差（incremental=True）"""
+    
+    def test_ring_buffer_window_wraps(self):
+        buf = RingBuffer(4)
+        for value in range(7):
+            buf.append(float(value))
+        assert len(buf) == 4
+        assert buf.at(6) == 6.0
+        np.testing.assert_array_equal(buf.window(3), [4.0, 5.0, 6.0])
+        np.testing.assert_array_equal(buf.window(2, end=5), [3.0, 4.0])
+    
+    def test_pair_moments_add_remove_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        xs = rng.normal(750.0, 2.0, 500)
+        ys = 0.5 * xs + rng.normal(0.0, 1.0, 500)
+        moments = RollingPairMoments()
+        w = 20
+        for i in range(len(xs)):
+            moments.add(xs[i], ys[i])
+            if i >= w:
+                moments.remove(xs[i - w], ys[i - w])
+        assert moments.n == w
+        assert moments.var_x == pytest.approx(np.var(xs[-w:], ddof=1), rel=1e-9)
+        assert moments.var_y == pytest.approx(np.var(ys[-w:], ddof=1), rel=1e-9)
+        assert moments.cov == pytest.approx(np.cov(xs[-w:], ys[-w:], ddof=1)[0, 1], rel=1e-9)
+    
+    def test_aligned_moments_pair_tail_windows(self):
+        """兩條序列長度不同時，與 target[-W:] 對 ref[-W:] 逐位配對相同"""
+        rng = np.random.default_rng(1)
+        target, ref = RingBuffer(10), RingBuffer(10)
+        aligned = AlignedRollingMoments(target, ref, window_size=5)
+        xs, ys = [], []
+        for _ in range(200):
+            buf, values = (target, xs) if rng.random() < 0.5 else (ref, ys)
+            value = float(rng.normal())
+            buf.append(value)
+            values.append(value)
+            moments = aligned.current()
+            if len(xs) < 5 or len(ys) < 5:
+                assert moments is None
+                continue
+            expected = np.cov(xs[-5:], ys[-5:], ddof=1)[0, 1]
+            assert moments.cov == pytest.approx(expected, rel=1e-9, abs=1e-12)
+        assert len(aligned._windows) <= aligned.max_offsets
+    
+    @pytest.mark.parametrize("window_size", [1, 2, 10, 60])
+    @pytest.mark.parametrize("round_robin", [True, False])
+    def test_incremental_matches_full_recompute(self, window_size, round_robin):
+        symbols = ["2330.TW", "QQQ", "ES", "USD/TWD"]
+        config = CrossAssetWindowConfig(
+            target_symbol="2330.TW",
+            reference_symbols=symbols[1:],
+            window_size=window_size,
+        )
+        fast = CrossAssetFactorEngine(config)
+        full = CrossAssetFactorEngine(config, incremental=False)
+        compared = 0
+        for bar in _random_bars(200 if round_robin else 800, symbols, seed=window_size, round_robin=round_robin):
+            a = fast.update_with_bar(bar)
+            b = full.update_with_bar(bar)
+            assert (a is None) == (b is None)
+            for fa, fb in zip(a or [], b or []):
+                assert fa.reference_symbol == fb.reference_symbol
+                assert fa.timestamp == fb.timestamp
+                assert fa.rolling_corr == pytest.approx(fb.rolling_corr, rel=1e-7, abs=1e-9)
+                assert fa.rolling_beta == pytest.approx(fb.rolling_beta, rel=1e-7, abs=1e-9)
+                assert fa.spread_zscore == pytest.approx(fb.spread_zscore, rel=1e-7, abs=1e-9)
+                compared += 1
+        assert compared > 0
+    
+    def test_reset_clears_rolling_state(self):
+        config = CrossAssetWindowConfig(target_symbol="2330.TW", reference_symbols=["QQQ"], window_size=5)
+        engine = CrossAssetFactorEngine(config)
+        bars = _random_bars(20, ["2330.TW", "QQQ"])
+        for bar in bars:
+            engine.update_with_bar(bar)
+        engine.reset()
+        reference = CrossAssetFactorEngine(config, incremental=False)
+        for bar in bars[:14]:
+            a = engine.update_with_bar(bar)
+            b = reference.update_with_bar(bar)
+        assert a is not None
+        assert a[0].rolling_beta == pytest.approx(b[0].rolling_beta, rel=1e-9)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -0,0 +1,163 @@
+"""
+測試 MultiSymbolTickPipeline：與「每個標的一條單標的因子鏈」逐筆處理的結果一致
+"""
+
+import random
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from factor_engine import (
+    CapitalFlowEngine,
+    FSignalEngine,
+    InertiaFactorEngine,
+    InfoTimeBarGenerator,
+    MultiSymbolPipelineConfig,
+    MultiSymbolTickPipeline,
+)
+
+
+@dataclass
+class _Tick:
+    timestamp: float
+    symbol: str
+    price: float
+    volume: int
+    bid_price: float
+    ask_price: float
+
+
+def _random_ticks(n, symbols, seed=0):
+    """多標的 tick 流；少數 tick 無成交量或買賣價交叉（F_C 應略過）"""
+    rng = random.Random(seed)
+    mids = {symbol: 100.0 + 50.0 * i for i, symbol in enumerate(symbols)}
+    ticks = []
+    for i in range(n):
+        symbol = rng.choice(symbols)
+        mids[symbol] += rng.gauss(0.0, 0.05)
+        mid = mids[symbol]
+        bid, ask = mid - 0.05, mid + 0.05
+        price = rng.choice([bid, ask, mid])
+        volume = rng.randint(1, 500)
+        roll = rng.random()
+        if roll < 0.02:
+            volume = 0
+        elif roll < 0.04:
+            bid, ask = ask, bid
+        ticks.append(_Tick(1_000.0 + i * 0.01, symbol, price, volume, bid, ask))
+    return ticks
+
+
+def _reference_chain(config, ticks):
+    """每個標的各自一組單標的引擎，逐筆處理"""
+    engines = {}
+    bars, factors = [], []
+    for tick in ticks:
+        if tick.symbol not in engines:
+            engines[tick.symbol] = (
+                InfoTimeBarGenerator(volume_bar_size=config.volume_bar_size),
+                CapitalFlowEngine(
+                    symbol=tick.symbol,
+                    window_size=config.flow_window_size,
+                    min_points=config.flow_min_points,
+                ),
+                InertiaFactorEngine(config.inertia_config(tick.symbol)),
+                FSignalEngine(config.signal_config(tick.symbol)),
+            )
+        bar_gen, flow, inertia_engine, signal_engine = engines[tick.symbol]
+        bar = bar_gen.add_tick(tick)
+        if bar is not None:
+            bars.append((bar, bar_gen.calculate_infotime_factor()))
+        cf = flow.update_from_tick(tick)
+        if cf is not None:
+            inertia = inertia_engine.update_with_capital_flow(cf)
+            signal = signal_engine.update_with_factors(cf, inertia)
+            factors.append((cf, inertia, signal))
+    return bars, factors
+
+
+@pytest.mark.parametrize("flow_window_size,batch_size", [(1, 64), (2, 7), (25, 256), (60, 1000)])
+def test_pipeline_matches_single_symbol_chains(flow_window_size, batch_size):
+    config = MultiSymbolPipelineConfig(
+        volume_bar_size=3_000,
+        flow_window_size=flow_window_size,
+        flow_min_points=1,
+        inertia_window_size=30,
+        inertia_min_effective_points=5,
+    )
+    symbols = [f"{1000 + i}.TW" for i in range(12)]
+    ticks = _random_ticks(3_000, symbols, seed=flow_window_size)
+    expected_bars, expected_factors = _reference_chain(config, ticks)
+
+    pipeline = MultiSymbolTickPipeline(config, capacity=4)
+    bars, factors = [], []
+    for start in range(0, len(ticks), batch_size):
+        result = pipeline.process_ticks(ticks[start:start + batch_size])
+        bars.extend(zip(result.bars.volume_bars(), result.bars.infotime))
+        flow = result.factors.capital_flow_factors()
+        inertia = dict(zip(result.factors.tick_index[~np.isnan(result.factors.inertia_sai)],
+                           result.factors.inertia_factors()))
+        signals = dict(zip(result.factors.tick_index[~np.isnan(result.factors.signal_score)],
+                           result.factors.signals()))
+        factors.extend((cf, inertia.get(i), signals.get(i)) for i, cf in zip(result.factors.tick_index, flow))
+
+    assert [bar for bar, _ in bars] == [bar for bar, _ in expected_bars]
+    np.testing.assert_allclose([f for _, f in bars], [f for _, f in expected_bars], rtol=1e-12)
+
+    assert len(factors) == len(expected_factors)
+    for (cf, inertia, signal), (ref_cf, ref_inertia, ref_signal) in zip(factors, expected_factors):
+        assert cf == ref_cf
+        assert (inertia is None) == (ref_inertia is None)
+        if inertia is not None:
+            assert inertia.inertia_sai == pytest.approx(ref_inertia.inertia_sai, abs=1e-12)
+        assert (signal is None) == (ref_signal is None)
+        if signal is not None:
+            assert signal.raw_score == pytest.approx(ref_signal.raw_score, abs=1e-12)
+            assert signal.bucket == ref_signal.bucket
+
+
+def test_process_batch_arrays_and_reset():
+    pipeline = MultiSymbolTickPipeline(MultiSymbolPipelineConfig(volume_bar_size=100, flow_min_points=2))
+    ids = pipeline.symbol_ids(["2330.TW", "2317.TW"])
+    batch = dict(
+        symbol_id=ids[[0, 1, 0, 1]],
+        price=np.array([100.5, 50.0, 100.5, 49.5]),
+        volume=np.array([30, 80, 40, 10]),
+        bid=np.full(4, 99.5),
+        ask=np.full(4, 100.5),
+        timestamp=np.arange(4, dtype=float) + 1.0,
+    )
+    batch["bid"][[1, 3]] = 49.5
+    batch["ask"][[1, 3]] = 50.5
+    result = pipeline.process_batch(**batch)
+
+    # 與 InfoTimeBarGenerator 相同：首筆 tick 開始 Bar 後再累積一次
+    assert list(result.bars.tick_index) == [1, 2]
+    assert list(result.bars.total_volume) == [160, 100]
+    assert [pipeline.symbols[i] for i in result.bars.symbol_id] == ["2317.TW", "2330.TW"]
+    assert list(result.factors.tick_index) == [2, 3]
+    assert result.factors.smart_aggression_index[0] == pytest.approx(1.0)
+    assert result.factors.smart_aggression_index[1] == pytest.approx(-10 / 90)
+
+    pipeline.reset()
+    assert len(pipeline.process_batch(**batch).factors) == 2
+    with pytest.raises(ValueError, match="unknown symbol id"):
+        pipeline.process_batch(np.array([5]), *(np.ones(1),) * 5)
+
+
+def test_process_tick_batch_matches_process_ticks():
+    from data_feed import MockSinopacAPI, SinopacConverter
+
+    rows = []
+    for code in ("2330", "2317", "2454"):
+        api = MockSinopacAPI(symbol=code, base_price=500.0)
+        rows.extend(api.get_next_raw_tick() for _ in range(200))
+    batch = SinopacConverter().convert_batch(rows).batch
+    config = MultiSymbolPipelineConfig(volume_bar_size=5_000, inertia_min_effective_points=5)
+
+    columnar = MultiSymbolTickPipeline(config).process_tick_batch(batch)
+    per_tick = MultiSymbolTickPipeline(config).process_ticks(batch.to_unified())
+    assert columnar.bars.volume_bars() == per_tick.bars.volume_bars()
+    assert columnar.factors.capital_flow_factors() == per_tick.factors.capital_flow_factors()
+    np.testing.assert_array_equal(columnar.factors.signal_score, per_tick.factors.signal_score)
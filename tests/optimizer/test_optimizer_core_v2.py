@@ -9,8 +9,103 @@ Reference:
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 import numpy as np
 
-# Test file placeholder - tests will be added later
+pytest.importorskip("cvxpy")
+
+from jgod.optimizer import OptimizerCoreV2, OptimizerRequest
+
+
+N_ASSETS = 20
+
+
+def _structure(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    A = rng.normal(0.0, 0.1, size=(N_ASSETS, N_ASSETS))
+    cov = A @ A.T / N_ASSETS + np.eye(N_ASSETS) * 0.01
+    betas = rng.normal(size=(N_ASSETS, 2))
+    sectors = np.eye(3)[rng.integers(0, 3, size=N_ASSETS)]
+    return cov, betas, sectors
+
+
+def _request(seed: int, structure=None) -> OptimizerRequest:
+    cov, betas, sectors = structure if structure is not None else _structure()
+    rng = np.random.default_rng(100 + seed)
+    prev = rng.dirichlet(np.ones(N_ASSETS))
+    return OptimizerRequest(
+        expected_active_return=rng.normal(0.01, 0.02, size=N_ASSETS),
+        cov_matrix=cov,
+        factor_betas=betas,
+        sector_map=sectors,
+        prev_weights=prev,
+        benchmark_weights=np.full(N_ASSETS, 1.0 / N_ASSETS),
+        linear_cost=np.full(N_ASSETS, 0.001),
+        quad_cost=np.full(N_ASSETS, 0.01),
+        bounds=(np.zeros(N_ASSETS), np.full(N_ASSETS, rng.uniform(0.15, 0.3))),
+        params={
+            "lambda": float(rng.uniform(1.0, 5.0)),
+            "TE_max": 0.05,
+            "T_max": 0.5,
+            "factor_limits": {"value": (-0.5, 0.5)},
+            "factor_index": {"value": 0},
+            "sector_limits": {0: (0.1, 0.6)},
+        },
+    )
+
+
+def _assert_same_results(expected, actual):
+    assert len(expected) == len(actual)
+    for a, b in zip(expected, actual):
+        np.testing.assert_allclose(b.weights, a.weights, atol=1e-3)
+        assert b.diagnostics["objective_value"] == pytest.approx(
+            a.diagnostics["objective_value"], abs=1e-5
+        )
+
+
+def test_solve_many_matches_individual_solves():
+    requests = [_request(seed) for seed in range(6)]
+    optimizer = OptimizerCoreV2()
+
+    expected = [optimizer.solve(req) for req in requests]
+    results = optimizer.solve_many(requests)
+
+    _assert_same_results(expected, results)
+    assert results[0].diagnostics["warm_start"] is False
+    assert all(r.diagnostics["warm_start"] for r in results[1:])
+    for r in results:
+        assert r.diagnostics["solve_time"] >= 0.0
+        assert r.diagnostics["build_time"] >= 0.0
+        assert r.cost > 0.0
+
+
+def test_solve_many_rebuilds_for_different_structure():
+    other = _structure(seed=1)
+    requests = [_request(0), _request(1, other), _request(2), _request(3, other)]
+    # 其他 params 改變也屬於不同結構
+    requests.append(dataclasses.replace(requests[0], params={**requests[0].params, "T_max": 0.3}))
+
+    results = OptimizerCoreV2().solve_many(requests)
+
+    assert [r.diagnostics["warm_start"] for r in results] == [False, False, True, True, False]
+    _assert_same_results([OptimizerCoreV2().solve(req) for req in requests], results)
+
+
+def test_solve_many_process_pool_preserves_order():
+    requests = [_request(seed) for seed in range(5)]
+    optimizer = OptimizerCoreV2()
+
+    _assert_same_results(optimizer.solve_many(requests), optimizer.solve_many(requests, max_workers=2))
+
+
+def test_solve_many_reports_failing_request_index():
+    requests = [_request(0), _request(1)]
+    # 上下限矛盾 → infeasible
+    requests[1] = dataclasses.replace(
+        requests[1], bounds=(np.full(N_ASSETS, 0.2), np.full(N_ASSETS, 0.3))
+    )
 
+    with pytest.raises(RuntimeError, match="Request 1"):
+        OptimizerCoreV2().solve_many(requests)
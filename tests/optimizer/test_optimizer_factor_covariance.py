@@ -0,0 +1,128 @@
+"""Tests for the factor-structured covariance path of OptimizerCore
+
+covariance_mode="factor" 使用 B / F / D 因子結構與解析梯度，
+結果需與 dense N × N Σ 一致。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.optimizer import OptimizerCore, OptimizerConfig
+from jgod.optimizer.factor_covariance import FactorCovariance, DEFAULT_SPECIFIC_VARIANCE
+
+
+class FactorRiskModel:
+    """Risk model stub exposing B / F / D and the matching dense Σ"""
+
+    def __init__(self, symbols, B, F, d):
+        self.symbols = list(symbols)
+        self.B = B
+        self.F = pd.DataFrame(F)
+        self.D = np.diag(d)
+        self.cov_matrix = B @ F @ B.T + self.D
+
+    def get_covariance_matrix(self):
+        return self.cov_matrix
+
+    def get_symbols(self):
+        return self.symbols
+
+
+class DenseOnlyRiskModel:
+    def __init__(self, symbols, cov_matrix):
+        self.symbols = list(symbols)
+        self.cov_matrix = cov_matrix
+
+    def get_covariance_matrix(self):
+        return self.cov_matrix
+
+    def get_symbols(self):
+        return self.symbols
+
+
+def _factor_model(n_stocks=40, n_factors=4, seed=3):
+    rng = np.random.default_rng(seed)
+    symbols = [f"S{i:03d}" for i in range(n_stocks)]
+    B = rng.normal(0.0, 1.0, size=(n_stocks, n_factors))
+    A = rng.normal(0.0, 0.05, size=(n_factors, n_factors))
+    F = A @ A.T + np.eye(n_factors) * 1e-3
+    d = rng.uniform(0.01, 0.05, size=n_stocks)
+    mu = pd.Series(rng.normal(0.05, 0.03, size=n_stocks), index=symbols)
+    return FactorRiskModel(symbols, B, F, d), mu
+
+
+def _config(mode, te_enabled=False, max_weight=0.2):
+    config = OptimizerConfig(covariance_mode=mode)
+    config.weight_constraints.max_weight = max_weight
+    config.tracking_error.enabled = te_enabled
+    config.tracking_error.te_max = 0.03
+    return config
+
+
+def test_factor_covariance_matches_dense():
+    model, _ = _factor_model()
+    stock_ids = list(reversed(model.symbols)) + ["MISSING"]
+
+    factor_cov = FactorCovariance.from_risk_model(stock_ids, model)
+
+    dense = np.zeros((len(stock_ids), len(stock_ids)))
+    dense[:-1, :-1] = model.cov_matrix[::-1, ::-1]
+    dense[-1, -1] = DEFAULT_SPECIFIC_VARIANCE
+    np.testing.assert_allclose(factor_cov.to_dense(), dense, rtol=1e-12, atol=1e-15)
+
+    w = np.random.default_rng(0).normal(size=len(stock_ids))
+    np.testing.assert_allclose(factor_cov.matvec(w), dense @ w, rtol=1e-12)
+    assert factor_cov.quad(w) == pytest.approx(w @ dense @ w, rel=1e-12)
+
+
+def test_factor_covariance_requires_factor_structure():
+    model = DenseOnlyRiskModel(["A", "B"], np.eye(2))
+    assert FactorCovariance.from_risk_model(["A", "B"], model) is None
+
+
+@pytest.mark.parametrize("te_enabled", [False, True], ids=["no_te", "te"])
+def test_factor_mode_matches_dense_mode(te_enabled):
+    model, mu = _factor_model()
+    benchmark = pd.Series(1.0 / len(mu), index=mu.index)
+    sector_map = {s: ("TECH" if i % 2 else "FIN") for i, s in enumerate(mu.index)}
+
+    results = {}
+    for mode in ("dense", "factor"):
+        config = _config(mode, te_enabled=te_enabled)
+        config.sector_constraints.enabled = True
+        config.sector_constraints.sector_bounds = {"TECH": (0.3, 0.6)}
+        results[mode] = OptimizerCore(config=config).optimize(
+            expected_returns=mu,
+            risk_model=model,
+            benchmark_weights=benchmark,
+            sector_map=sector_map,
+        )
+
+    dense, factor = results["dense"], results["factor"]
+    assert dense.status == factor.status == "success", (dense.message, factor.message)
+    assert factor.diagnostics["covariance_mode"] == "factor"
+    assert dense.diagnostics["covariance_mode"] == "dense"
+    np.testing.assert_allclose(factor.weights.values, dense.weights.values, atol=1e-4)
+    assert factor.objective_value == pytest.approx(dense.objective_value, abs=1e-7)
+    assert factor.diagnostics["total_volatility"] == pytest.approx(
+        dense.diagnostics["total_volatility"], rel=1e-4
+    )
+    if te_enabled:
+        assert factor.diagnostics["tracking_error"] <= 0.03 + 1e-6
+
+
+def test_factor_mode_falls_back_to_dense():
+    stock_ids = ["A", "B", "C"]
+    mu = pd.Series([0.10, 0.05, 0.02], index=stock_ids)
+    model = DenseOnlyRiskModel(stock_ids, np.eye(3) * 0.04)
+
+    result = OptimizerCore(config=_config("factor", max_weight=0.7)).optimize(mu, model)
+
+    assert result.status == "success"
+    assert result.diagnostics["covariance_mode"] == "dense"
+
+
+def test_unknown_covariance_mode_raises():
+    with pytest.raises(ValueError):
+        OptimizerCore(config=OptimizerConfig(covariance_mode="sparse"))
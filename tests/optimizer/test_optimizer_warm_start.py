@@ -0,0 +1,125 @@
+"""Tests for OptimizerCore warm start and constraint-structure reuse
+
+連續再平衡時以前一期權重作為起點，universe 不變時重用 bounds / sector 限制。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.optimizer import OptimizerCore, OptimizerConfig
+
+
+class MockRiskModel:
+    def __init__(self, symbols, cov_matrix):
+        self.symbols = list(symbols)
+        self.cov_matrix = cov_matrix
+
+    def get_covariance_matrix(self):
+        return self.cov_matrix
+
+    def get_symbols(self):
+        return self.symbols
+
+
+def _problem(n_stocks=30, seed=7):
+    rng = np.random.default_rng(seed)
+    symbols = [f"S{i:02d}" for i in range(n_stocks)]
+    A = rng.normal(0.0, 0.1, size=(n_stocks, n_stocks))
+    cov = A @ A.T / n_stocks + np.eye(n_stocks) * 0.01
+    mu = pd.Series(rng.normal(0.05, 0.03, size=n_stocks), index=symbols)
+    return MockRiskModel(symbols, cov), mu
+
+
+def _optimizer():
+    config = OptimizerConfig()
+    config.weight_constraints.max_weight = 0.2
+    config.sector_constraints.enabled = True
+    config.sector_constraints.sector_bounds = {"TECH": (0.3, 0.6)}
+    return OptimizerCore(config=config)
+
+
+def test_warm_start_reaches_same_solution_in_fewer_iterations():
+    model, mu = _problem()
+    sector_map = {s: ("TECH" if i % 2 else "FIN") for i, s in enumerate(mu.index)}
+    optimizer = _optimizer()
+
+    first = optimizer.optimize(mu, model, sector_map=sector_map)
+    # 下一期：預期報酬小幅變動
+    mu_next = mu + np.random.default_rng(1).normal(0.0, 0.002, size=len(mu))
+    cold = _optimizer().optimize(mu_next, model, sector_map=sector_map)
+    warm = optimizer.optimize(mu_next, model, sector_map=sector_map, initial_weights=first.weights)
+
+    assert cold.status == warm.status == "success"
+    assert cold.diagnostics["warm_start"] is False
+    assert warm.diagnostics["warm_start"] is True
+    assert warm.diagnostics["iterations"] <= cold.diagnostics["iterations"]
+    assert warm.diagnostics["solve_time"] >= 0.0
+    np.testing.assert_allclose(warm.weights.values, cold.weights.values, atol=1e-4)
+    assert warm.objective_value == pytest.approx(cold.objective_value, abs=1e-8)
+
+
+def test_invalid_warm_start_falls_back_to_uniform():
+    model, mu = _problem(n_stocks=5)
+    optimizer = _optimizer()
+
+    # index 不重疊 → 全為 0 → 退回均勻分配
+    result = optimizer.optimize(mu, model, initial_weights=pd.Series([1.0], index=["OTHER"]))
+
+    assert result.status == "success"
+    assert result.diagnostics["warm_start"] is False
+    assert result.weights.sum() == pytest.approx(1.0)
+
+
+def test_constraint_structures_reused_for_unchanged_universe():
+    model, mu = _problem(n_stocks=10)
+    sector_map = {s: ("TECH" if i % 2 else "FIN") for i, s in enumerate(mu.index)}
+    optimizer = _optimizer()
+
+    optimizer.optimize(mu, model, sector_map=sector_map)
+    structures = optimizer._structures
+    sector_constraints = structures.sector_constraints
+
+    optimizer.optimize(mu * 1.1, model, sector_map=dict(sector_map))
+    assert optimizer._structures is structures
+    assert optimizer._structures.sector_constraints is sector_constraints
+
+    # sector 改變 → 只重建 sector 限制
+    changed = dict(sector_map, S00="TECH")
+    optimizer.optimize(mu, model, sector_map=changed)
+    assert optimizer._structures is structures
+    assert optimizer._structures.sector_constraints is not sector_constraints
+
+    # universe 改變 → 重建
+    optimizer.optimize(mu.iloc[:-1], model)
+    assert optimizer._structures is not structures
+    assert len(optimizer._structures.bounds) == len(mu) - 1
+
+
+def test_constraint_structures_rebuilt_after_in_place_changes():
+    model, mu = _problem(n_stocks=10)
+    sector_map = {s: ("TECH" if i % 2 else "FIN") for i, s in enumerate(mu.index)}
+    exposure = pd.DataFrame({"R_MKT": np.linspace(0.5, 1.5, len(mu))}, index=mu.index)
+    optimizer = _optimizer()
+    optimizer.config.factor_constraints.factor_bounds = {"R_MKT": (0.9, 1.1)}
+
+    optimizer.optimize(mu, model, factor_exposure=exposure, sector_map=sector_map)
+    structures = optimizer._structures
+    factor_constraints = structures.factor_constraints
+
+    # 同一個 DataFrame 原地修改 → 因子限制重建
+    exposure.loc[:, "R_MKT"] = 2.0
+    optimizer.optimize(mu, model, factor_exposure=exposure, sector_map=sector_map)
+    assert optimizer._structures is structures
+    assert optimizer._structures.factor_constraints is not factor_constraints
+    assert optimizer._structures.factor_constraints[0]["jac"](None)[0] == pytest.approx(2.0)
+
+    # config 原地修改 → 全部重建
+    optimizer.config.weight_constraints.max_weight = 0.3
+    optimizer.config.sector_constraints.sector_bounds = {"TECH": (0.4, 0.5)}
+    result = optimizer.optimize(mu, model, sector_map=sector_map)
+    assert optimizer._structures is not structures
+    assert optimizer._structures.bounds[0] == (0.0, 0.3)
+    tech = sum(w for s, w in result.weights.items() if sector_map[s] == "TECH")
+    assert result.status == "success"
+    assert 0.4 - 1e-6 <= tech <= 0.5 + 1e-6
@@ -0,0 +1,150 @@
+"""
+Tests for concurrent per-symbol fetching in the FinMind loaders.
+
+A fake client with simulated latency records every API call; a counting
+RateLimiter checks that every attempt acquires a quota slot.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.path_a.path_a_schema import PathAConfig
+from jgod.path_a.finmind_fetch_pool import fetch_symbols, resolve_rate_limiter
+from jgod.utils.rate_limiter import RateLimiter
+
+finmind_extreme = pytest.importorskip("jgod.path_a.finmind_data_loader_extreme")
+if not finmind_extreme.FINMIND_AVAILABLE:
+    pytest.skip("FinMind client not available", allow_module_level=True)
+
+FinMindLoaderConfigExtreme = finmind_extreme.FinMindLoaderConfigExtreme
+FinMindPathADataLoaderExtreme = finmind_extreme.FinMindPathADataLoaderExtreme
+
+
+class FakeClient:
+    """FinMind client without its own rate limiter."""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_stock_daily(self, stock_id, start_date, end_date):
+        with self._lock:
+            self.calls.append(stock_id)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+        dates = pd.bdate_range(start_date, end_date)
+        base = 100.0 + int(stock_id) % 97
+        close = base + np.arange(len(dates)) * 0.1
+        return pd.DataFrame({
+            "date": dates,
+            "open": close,
+            "max": close + 0.5,
+            "min": close - 0.5,
+            "close": close,
+            "Trading_Volume": 1000.0,
+        })
+
+
+class CountingRateLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__(minute_limit=None, hour_limit=None)
+        self.keys = []
+
+    def acquire(self, key="default"):
+        self.keys.append(key)
+        super().acquire(key)
+
+
+def _loader(client, fetch_workers, rate_limiter=None):
+    config = FinMindLoaderConfigExtreme(
+        cache_enabled=False,
+        fallback_to_mock_extreme=False,
+        max_retries=1,
+        fetch_workers=fetch_workers,
+        rate_limiter=rate_limiter,
+    )
+    return FinMindPathADataLoaderExtreme(client=client, config=config)
+
+
+def _config(n_symbols=8):
+    return PathAConfig(
+        start_date="2024-01-01",
+        end_date="2024-02-29",
+        universe=[f"{2300 + i}.TW" for i in range(n_symbols)],
+        rebalance_frequency="M",
+    )
+
+
+def test_concurrent_fetch_matches_serial_and_rate_limits_every_call():
+    config = _config()
+    serial_client = FakeClient()
+    serial = _loader(serial_client, fetch_workers=1).load_price_frame(config)
+
+    limiter = CountingRateLimiter()
+    client = FakeClient()
+    loader = _loader(client, fetch_workers=4, rate_limiter=limiter)
+    concurrent = loader.load_price_frame(config)
+
+    pd.testing.assert_frame_equal(concurrent, serial)
+    assert list(concurrent.columns.get_level_values(0).unique()) == list(config.universe)
+    assert client.max_active > 1
+    assert sorted(client.calls) == sorted(serial_client.calls)
+    assert limiter.keys == ["price"] * len(client.calls)
+
+    stats = loader.fetch_stats
+    assert list(stats) == list(config.universe)
+    assert all(s.status == "ok" and s.rows > 0 and s.elapsed > 0 for s in stats.values())
+
+
+def test_missing_symbols_and_progress():
+    progress = []
+    data, stats = fetch_symbols(
+        ["A", "B", "A", "C"],
+        lambda symbol: None if symbol == "B" else pd.DataFrame({"x": [1, 2]}),
+        max_workers=3,
+        progress=lambda s, done, total: progress.append((s.symbol, done, total)),
+    )
+
+    assert sorted(data) == ["A", "C"]
+    assert list(stats) == ["A", "B", "C"]
+    assert stats["B"].status == "missing"
+    assert stats["A"].rows == 2
+    assert sorted(p[0] for p in progress) == ["A", "B", "C"]
+    assert [p[1:] for p in progress] == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_loader_limiter_is_used_even_when_client_has_one():
+    class LimitedClient(FakeClient):
+        """Client whose own limiter does not cover get_stock_daily."""
+
+        def __init__(self):
+            super().__init__(latency=0.0)
+            self.rate_limiter = CountingRateLimiter()
+
+    config = _config(n_symbols=4)
+    client = LimitedClient()
+    loader = _loader(client, fetch_workers=4)
+    assert isinstance(loader.rate_limiter, RateLimiter)
+    assert loader.rate_limiter is not client.rate_limiter
+
+    shared = CountingRateLimiter()
+    client = LimitedClient()
+    _loader(client, fetch_workers=4, rate_limiter=shared).load_price_frame(config)
+    assert shared.keys == ["price"] * len(client.calls)
+    assert client.rate_limiter.keys == []  # 只取一次 quota
+
+    own = RateLimiter()
+    assert resolve_rate_limiter(own, 80, 5800) is own
+    assert isinstance(resolve_rate_limiter(None, 80, 5800), RateLimiter)
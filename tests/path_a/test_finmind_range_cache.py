@@ -0,0 +1,125 @@
+"""
+Tests for FinMindRangeCache (per-symbol, date-partitioned FinMind cache).
+
+A fake fetcher records every API range requested so the tests can check that
+only missing gaps are fetched.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from jgod.path_a.finmind_range_cache import FinMindRangeCache
+
+
+class FakeFetcher:
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, symbol, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        if self.fail:
+            return None
+        dates = pd.bdate_range(start_date, end_date)
+        return pd.DataFrame({
+            "date": dates.strftime("%Y-%m-%d"),
+            "stock_id": symbol.split(".")[0],
+            "close": [float(d.dayofyear) for d in dates],
+        })
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FinMindRangeCache(tmp_path, today=date(2025, 1, 1))
+
+
+def test_sub_ranges_are_served_locally_and_gaps_fetched(cache):
+    fetch = FakeFetcher()
+
+    first = cache.get("2330.TW", "2023-03-01", "2023-06-30", fetch=fetch)
+    inner = cache.get("2330.TW", "2023-04-03", "2023-05-31", fetch=fetch)
+    wider = cache.get("2330.TW", "2023-01-01", "2023-08-31", fetch=fetch)
+
+    assert fetch.calls == [
+        ("2023-03-01", "2023-06-30"),
+        ("2023-01-01", "2023-02-28"),
+        ("2023-07-01", "2023-08-31"),
+    ]
+    assert inner["date"].tolist() == pd.bdate_range("2023-04-03", "2023-05-31").strftime("%Y-%m-%d").tolist()
+    assert wider["date"].tolist() == pd.bdate_range("2023-01-01", "2023-08-31").strftime("%Y-%m-%d").tolist()
+    pd.testing.assert_frame_equal(first, wider[wider["date"].between("2023-03-01", "2023-06-30")].reset_index(drop=True))
+    assert cache.missing_ranges("2330.TW", "2023-01-01", "2023-09-30") == [("2023-09-01", "2023-09-30")]
+
+
+def test_partitions_are_per_year_and_compacted(cache, tmp_path):
+    fetch = FakeFetcher()
+    cache.get("2317.TW", "2022-12-01", "2023-01-31", fetch=fetch)
+    # 重疊的 legacy 資料 + 新區間都不應產生重複日期
+    cache.get("2317.TW", "2022-11-01", "2023-02-28", fetch=fetch)
+
+    partitions = sorted(p.stem for p in (tmp_path / "2317.TW").iterdir() if p.stem.isdigit())
+    assert partitions == ["2022", "2023"]
+
+    rows = cache.get("2317.TW", "2022-11-01", "2023-02-28")
+    assert rows["date"].is_unique
+    assert rows["date"].is_monotonic_increasing
+
+
+def test_empty_gaps_are_covered_but_failures_are_retried(cache):
+    fetch = FakeFetcher()
+    cache.get("2454.TW", "2023-01-02", "2023-01-06", fetch=fetch)
+
+    # 週末沒有交易：API 回傳空資料，仍視為已涵蓋
+    assert cache.get("2454.TW", "2023-01-07", "2023-01-08", fetch=fetch) is None
+    cache.get("2454.TW", "2023-01-07", "2023-01-08", fetch=fetch)
+    assert fetch.calls.count(("2023-01-07", "2023-01-08")) == 1
+
+    fetch.fail = True
+    cache.get("2454.TW", "2023-01-09", "2023-01-13", fetch=fetch)
+    cache.get("2454.TW", "2023-01-09", "2023-01-13", fetch=fetch)
+    assert fetch.calls.count(("2023-01-09", "2023-01-13")) == 2
+
+
+def test_empty_weekday_gaps_are_retried(cache):
+    empty = lambda symbol, start, end: pd.DataFrame()  # noqa: E731
+
+    # API 暫時沒有回資料（重試用盡後回傳空 DataFrame）：不可永久標記為已涵蓋
+    assert cache.get("3008.TW", "2023-01-09", "2023-01-13", fetch=empty) is None
+    assert cache.missing_ranges("3008.TW", "2023-01-09", "2023-01-13") == [("2023-01-09", "2023-01-13")]
+
+    fetch = FakeFetcher()
+    rows = cache.get("3008.TW", "2023-01-09", "2023-01-13", fetch=fetch)
+    assert fetch.calls == [("2023-01-09", "2023-01-13")]
+    assert len(rows) == 5
+
+
+def test_unsettled_dates_are_refetched(tmp_path):
+    cache = FinMindRangeCache(tmp_path, today=date(2024, 1, 10))
+    fetch = FakeFetcher()
+
+    cache.get("2330.TW", "2024-01-01", "2024-01-31", fetch=fetch)
+    cache.get("2330.TW", "2024-01-01", "2024-01-31", fetch=fetch)
+
+    assert fetch.calls == [("2024-01-01", "2024-01-31"), ("2024-01-10", "2024-01-31")]
+
+
+def test_legacy_range_files_are_imported(tmp_path):
+    legacy = FakeFetcher()("2330.TW", "2022-01-03", "2022-03-31")
+    legacy.to_pickle(tmp_path / "2330.TW_2022-01-03_2022-03-31.pkl")
+    # 其他 symbol 的 legacy 檔案不應被匯入
+    legacy.to_pickle(tmp_path / "2330.TWO_2022-01-03_2022-03-31.pkl")
+
+    cache = FinMindRangeCache(tmp_path, today=date(2025, 1, 1))
+    fetch = FakeFetcher()
+    rows = cache.get("2330.TW", "2022-02-01", "2022-02-28", fetch=fetch)
+
+    assert fetch.calls == []
+    assert rows["date"].tolist() == pd.bdate_range("2022-02-01", "2022-02-28").strftime("%Y-%m-%d").tolist()
+    assert cache.missing_ranges("2330.TW", "2022-01-01", "2022-04-30") == [
+        ("2022-01-01", "2022-01-02"),
+        ("2022-04-01", "2022-04-30"),
+    ]
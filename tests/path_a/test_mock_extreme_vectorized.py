@@ -0,0 +1,98 @@
+"""
+Tests for the vectorized MockPathADataLoaderExtreme generator.
+
+向量化版本一次模擬 (days × symbols) 陣列：同 seed 可重現，
+分佈需與逐檔 / 逐日的 legacy 版本一致。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.path_a.mock_data_loader_extreme import MockPathADataLoaderExtreme, MockConfigExtreme
+from jgod.path_a.path_a_schema import PathAConfig
+
+
+def _config(n_symbols=3, start="2024-01-01", end="2024-03-31"):
+    universe = ["2330.TW", "2317.TW", "2303.TW"] + [f"S{i:03d}" for i in range(n_symbols - 3)]
+    return PathAConfig(
+        start_date=start,
+        end_date=end,
+        universe=universe[:n_symbols],
+        rebalance_frequency="M",
+    )
+
+
+def _frame(config, seed=42, vectorized=True):
+    loader = MockPathADataLoaderExtreme(config=MockConfigExtreme(seed=seed, vectorized=vectorized))
+    return loader.load_price_frame(config)
+
+
+def _distribution(price_frame):
+    close = price_frame.xs("close", axis=1, level="field")
+    open_ = price_frame.xs("open", axis=1, level="field")
+    high = price_frame.xs("high", axis=1, level="field")
+    low = price_frame.xs("low", axis=1, level="field")
+    volume = price_frame.xs("volume", axis=1, level="field")
+    log_returns = np.log(close).diff().iloc[1:].values
+    return {
+        "return_std": log_returns.std(),
+        "tail_freq": (np.abs(log_returns) > 0.06).mean(),
+        "range": ((high - low) / close).values.mean(),
+        "gap_std": (open_ / close.shift(1)).iloc[1:].values.std(),
+        "log_volume": np.log(volume).values.mean(),
+    }
+
+
+def test_seed_reproducible_and_valid():
+    config = _config()
+    frame = _frame(config)
+
+    pd.testing.assert_frame_equal(frame, _frame(config))
+    assert not frame.equals(_frame(config, seed=43))
+
+    assert list(frame.columns) == [
+        (symbol, field)
+        for symbol in config.universe
+        for field in ("open", "high", "low", "close", "volume")
+    ]
+    assert not frame.isna().any().any()
+    for symbol in config.universe:
+        bars = frame[symbol]
+        assert (bars["high"] >= bars[["open", "close"]].max(axis=1)).all()
+        assert (bars["low"] <= bars[["open", "close"]].min(axis=1)).all()
+        assert (bars["low"] > 0).all()
+        assert (bars["volume"] >= 100.0).all()
+    # 首日收盤 = base price
+    assert frame[("2330.TW", "close")].iloc[0] == pytest.approx(550.0)
+
+
+def test_distribution_matches_legacy_generator():
+    config = _config(n_symbols=120, start="2023-01-01", end="2023-12-31")
+
+    vectorized = _distribution(_frame(config, seed=1))
+    legacy = _distribution(_frame(config, seed=1, vectorized=False))
+
+    assert vectorized["return_std"] == pytest.approx(legacy["return_std"], rel=0.03)
+    assert vectorized["tail_freq"] == pytest.approx(legacy["tail_freq"], rel=0.15)
+    assert vectorized["range"] == pytest.approx(legacy["range"], rel=0.03)
+    assert vectorized["gap_std"] == pytest.approx(legacy["gap_std"], rel=0.03)
+    assert vectorized["log_volume"] == pytest.approx(legacy["log_volume"], abs=0.15)
+
+
+@pytest.mark.parametrize("vectorized", [True, False], ids=["vectorized", "legacy"])
+def test_feature_frame_aligned_with_price_frame(vectorized):
+    config = _config()
+    loader = MockPathADataLoaderExtreme(config=MockConfigExtreme(seed=5, vectorized=vectorized))
+    price_frame = loader.load_price_frame(config)
+    feature_frame = loader.load_feature_frame(config)
+
+    assert list(feature_frame.index.names) == ["date", "symbol"]
+    assert len(feature_frame) == len(price_frame) * len(config.universe)
+    date = price_frame.index[10]
+    for symbol in config.universe:
+        row = feature_frame.loc[(date, symbol)]
+        assert row["close"] == price_frame.loc[date, (symbol, "close")]
+        assert row["volume"] == price_frame.loc[date, (symbol, "volume")]
+        close = price_frame[(symbol, "close")]
+        assert row["daily_return_1d"] == pytest.approx(close.pct_change().loc[date])
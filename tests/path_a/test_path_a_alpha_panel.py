@@ -0,0 +1,76 @@
+"""
+Tests for the precomputed alpha input panel.
+
+The panel's per-date cross-sections must match `_prepare_alpha_input`
+exactly, while being zero-copy views into one run-level block.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.path_a.path_a_schema import PathAConfig
+from jgod.path_a.path_a_backtest import _prepare_alpha_input
+from jgod.path_a.path_a_alpha_panel import PathAAlphaInputPanel, PathAAlphaPanelCache
+from jgod.path_a.mock_data_loader import MockPathADataLoader
+
+
+UNIVERSE = ["2330.TW", "2317.TW", "2303.TW"]
+
+
+@pytest.fixture(scope="module")
+def frames():
+    config = PathAConfig(start_date="2024-01-01", end_date="2024-03-31", universe=UNIVERSE)
+    loader = MockPathADataLoader()
+    return loader.load_feature_frame(config), loader.load_price_frame(config)
+
+
+def test_panel_slice_matches_prepare_alpha_input(frames):
+    feature_frame, price_frame = frames
+    panel = PathAAlphaInputPanel.from_frames(feature_frame, price_frame, UNIVERSE)
+
+    for date in price_frame.index[::5]:
+        expected = _prepare_alpha_input(feature_frame, price_frame, date, UNIVERSE)
+        pd.testing.assert_frame_equal(panel.slice(date), expected, check_column_type=False)
+
+
+def test_panel_slice_is_zero_copy_and_read_only(frames):
+    feature_frame, price_frame = frames
+    panel = PathAAlphaInputPanel.from_frames(feature_frame, price_frame, UNIVERSE)
+
+    cross_section = panel.slice(price_frame.index[10])
+    assert np.shares_memory(cross_section.to_numpy(), panel.values)
+    with pytest.raises(ValueError):
+        panel.values[0, 0, 0] = 1.0
+
+
+def test_panel_fills_missing_symbol_with_zero(frames):
+    feature_frame, price_frame = frames
+    universe = UNIVERSE + ["9999.TW"]
+    panel = PathAAlphaInputPanel.from_frames(feature_frame, price_frame, universe)
+
+    date = price_frame.index[-1]
+    expected = _prepare_alpha_input(feature_frame, price_frame, date, universe)
+    pd.testing.assert_frame_equal(panel.slice(date), expected, check_column_type=False)
+    assert (panel.slice(date).loc["9999.TW"] == 0.0).all()
+
+
+def test_panel_cache_reuses_by_identity_and_source_key(frames):
+    feature_frame, price_frame = frames
+    cache = PathAAlphaPanelCache()
+
+    first = cache.get_or_build(feature_frame, price_frame, UNIVERSE)
+    again = cache.get_or_build(feature_frame, price_frame, UNIVERSE)
+    assert again is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A shared source: a sub-window of dates is served from the full panel
+    cache.get_or_build(feature_frame, price_frame, UNIVERSE,
+                       dates=price_frame.index, source_key="run")
+    window_dates = price_frame.index[20:40]
+    sub = cache.get_or_build(feature_frame.copy(), price_frame.copy(), UNIVERSE,
+                             dates=window_dates, source_key="run")
+    assert list(sub.dates) == list(window_dates)
+    assert np.shares_memory(sub.values, first.values)
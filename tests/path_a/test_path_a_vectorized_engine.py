@@ -0,0 +1,164 @@
+"""
+Tests for the vectorized Path A engine (PathAConfig.engine_mode="vectorized").
+
+The vectorized engine must reproduce the loop engine's NAV / return series
+and portfolio snapshots exactly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.path_a.path_a_schema import PathAConfig
+from jgod.path_a.path_a_backtest import PathARunContext, run_path_a_backtest
+from jgod.path_a.path_a_price_cube import PathAPriceCube
+from jgod.path_a.mock_data_loader import MockPathADataLoader
+from jgod.learning.error_learning_engine import ErrorLearningEngine
+from jgod.optimizer.optimizer_core import OptimizerResult
+
+
+UNIVERSE = ["2330.TW", "2317.TW", "2303.TW", "2454.TW"]
+
+
+class SumAlphaEngine:
+    """Composite alpha = row sum of all input columns."""
+
+    def compute_all(self, feature_df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"composite_alpha": feature_df.sum(axis=1)})
+
+
+class IdentityRiskModel:
+    """Risk model stub exposing only get_covariance_matrix()."""
+
+    def get_covariance_matrix(self) -> np.ndarray:
+        return np.eye(len(UNIVERSE))
+
+
+class SoftmaxOptimizer:
+    """Deterministic, alpha-dependent weights so every rebalance trades."""
+
+    def optimize(self, expected_returns, risk_model, **kwargs) -> OptimizerResult:
+        scores = expected_returns - expected_returns.max()
+        weights = np.exp(scores) / np.exp(scores).sum()
+        return OptimizerResult(
+            weights=weights,
+            status="success",
+            message="softmax",
+            objective_value=0.0,
+            diagnostics={},
+        )
+
+
+class RecordingErrorBridge:
+    def __init__(self):
+        self.calls = []
+
+    def handle_prediction_outcome(
+        self, date, weights, realized_returns, expected_scores, error_engine
+    ) -> None:
+        self.calls.append((date, weights.copy(), realized_returns.copy()))
+
+
+def _run(engine_mode: str, rebalance_frequency: str):
+    config = PathAConfig(
+        start_date="2024-01-01",
+        end_date="2024-06-30",
+        universe=UNIVERSE,
+        rebalance_frequency=rebalance_frequency,
+        engine_mode=engine_mode,
+    )
+    bridge = RecordingErrorBridge()
+    ctx = PathARunContext(
+        config=config,
+        data_loader=MockPathADataLoader(),
+        alpha_engine=SumAlphaEngine(),  # type: ignore[arg-type]
+        risk_model=IdentityRiskModel(),  # type: ignore[arg-type]
+        optimizer=SoftmaxOptimizer(),  # type: ignore[arg-type]
+        error_engine=ErrorLearningEngine(),
+        error_bridge=bridge,  # type: ignore[arg-type]
+    )
+    return run_path_a_backtest(ctx), bridge
+
+
+@pytest.mark.parametrize("rebalance_frequency", ["M", "W", "D"])
+def test_vectorized_engine_matches_loop(rebalance_frequency):
+    """NAV, returns, snapshots and error-bridge calls are identical."""
+    loop_result, loop_bridge = _run("loop", rebalance_frequency)
+    vec_result, vec_bridge = _run("vectorized", rebalance_frequency)
+
+    pd.testing.assert_series_equal(loop_result.nav_series, vec_result.nav_series)
+    pd.testing.assert_series_equal(loop_result.return_series, vec_result.return_series)
+
+    assert len(loop_result.portfolio_snapshots) == len(vec_result.portfolio_snapshots)
+    for a, b in zip(loop_result.portfolio_snapshots, vec_result.portfolio_snapshots):
+        assert a.date == b.date
+        assert a.nav == b.nav
+        assert a.portfolio_return == b.portfolio_return
+        pd.testing.assert_series_equal(a.weights, b.weights)
+
+    assert len(loop_bridge.calls) == len(vec_bridge.calls)
+    for (d1, w1, r1), (d2, w2, r2) in zip(loop_bridge.calls, vec_bridge.calls):
+        assert d1 == d2
+        pd.testing.assert_series_equal(w1, w2, check_names=False)
+        np.testing.assert_allclose(r1.to_numpy(dtype=float), r2.to_numpy(dtype=float))
+
+
+def test_unknown_engine_mode_raises():
+    with pytest.raises(ValueError):
+        _run("turbo", "M")
+
+
+def test_price_cube_handles_missing_symbol_and_zero_price():
+    dates = pd.date_range("2024-01-01", periods=3, freq="B")
+    columns = pd.MultiIndex.from_product([["A"], ["close", "volume"]])
+    frame = pd.DataFrame(
+        [[10.0, 1.0], [0.0, 1.0], [12.0, 1.0]], index=dates, columns=columns
+    )
+
+    cube = PathAPriceCube.from_price_frame(frame, ["A", "B"])
+
+    assert cube.values.shape == (3, 2, 5)
+    assert np.isnan(cube.field("close")[:, 1]).all()
+
+    returns = cube.simple_returns("close")
+    # 10 -> 0 is a real move; 0 -> 12 has no valid base and counts as flat
+    np.testing.assert_allclose(returns[:, 0], [-1.0, 0.0])
+    np.testing.assert_allclose(returns[:, 1], [0.0, 0.0])
+
+
+class WarmStartRecordingOptimizer(SoftmaxOptimizer):
+    def __init__(self):
+        self.initial_weights = []
+
+    def optimize(self, expected_returns, risk_model, initial_weights=None, **kwargs) -> OptimizerResult:
+        self.initial_weights.append(initial_weights)
+        return super().optimize(expected_returns, risk_model, **kwargs)
+
+
+@pytest.mark.parametrize("engine_mode", ["loop", "vectorized"])
+def test_previous_weights_passed_as_warm_start(engine_mode):
+    optimizer = WarmStartRecordingOptimizer()
+    ctx = PathARunContext(
+        config=PathAConfig(
+            start_date="2024-01-01",
+            end_date="2024-04-30",
+            universe=UNIVERSE,
+            rebalance_frequency="M",
+            engine_mode=engine_mode,
+        ),
+        data_loader=MockPathADataLoader(),
+        alpha_engine=SumAlphaEngine(),  # type: ignore[arg-type]
+        risk_model=IdentityRiskModel(),  # type: ignore[arg-type]
+        optimizer=optimizer,  # type: ignore[arg-type]
+        error_engine=ErrorLearningEngine(),
+    )
+    result = run_path_a_backtest(ctx)
+
+    snapshots = result.portfolio_snapshots
+    assert len(optimizer.initial_weights) == len(snapshots) > 1
+    # first rebalance starts from cash → no warm start
+    assert optimizer.initial_weights[0] is None
+    for previous, initial in zip(snapshots[:-1], optimizer.initial_weights[1:]):
+        pd.testing.assert_series_equal(initial, previous.weights, check_names=False)
@@ -22,18 +22,14 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 class TestPathBCLISmoke:
     """Smoke Test for Path B CLI Script"""
     
-    def test_path_b_cli_execution(self):
+    def test_path_b_cli_execution(self, tmp_path):
         """
         Test that Path B CLI script can be executed successfully
         and generates expected output files.
         """
         experiment_name = "path_b_smoke_demo"
-        output_dir = PROJECT_ROOT / "output" / "path_b" / experiment_name
-        
-        # 清理之前的輸出（如果存在）
-        if output_dir.exists():
-            import shutil
-            shutil.rmtree(output_dir)
+        # CLI 輸出到工作目錄下的 output/，在 tmp_path 執行以免寫進 repo
+        output_dir = tmp_path / "output" / "path_b" / experiment_name
         
         # 建立 CLI 命令
         cmd = [
@@ -54,7 +50,7 @@ class TestPathBCLISmoke:
         env = {"PYTHONPATH": str(PROJECT_ROOT)}
         result = subprocess.run(
             cmd,
-            cwd=str(PROJECT_ROOT),
+            cwd=str(tmp_path),
             env=env,
             capture_output=True,
             text=True,
@@ -0,0 +1,110 @@
+"""
+Run-level data context for Path B (PathBConfig.share_run_data)
+
+The union date range is loaded once and every window gets a zero-copy slice
+equal to the corresponding rows of the shared frames.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.path_a.mock_data_loader import MockConfig, MockPathADataLoader
+from jgod.path_a.path_a_schema import PathAConfig
+from jgod.path_b.path_b_data_context import PathBRunDataContext
+from jgod.path_b.path_b_engine import PathBEngine, PathBConfig
+
+
+UNIVERSE = ["2330.TW", "2317.TW", "2454.TW"]
+
+
+class CountingLoader(MockPathADataLoader):
+    def __init__(self):
+        super().__init__(config=MockConfig(seed=7))
+        self.calls = []
+
+    def load_price_frame(self, config):
+        self.calls.append(("price", config.start_date, config.end_date))
+        return super().load_price_frame(config)
+
+    def load_feature_frame(self, config):
+        self.calls.append(("feature", config.start_date, config.end_date))
+        return super().load_feature_frame(config)
+
+
+def _path_a_config(start, end, universe=UNIVERSE):
+    return PathAConfig(start_date=start, end_date=end, universe=list(universe))
+
+
+def test_window_slices_are_zero_copy_views():
+    context = PathBRunDataContext.load(CountingLoader(), _path_a_config("2024-01-01", "2024-06-30"))
+    window = _path_a_config("2024-02-10", "2024-03-31")
+
+    prices = context.load_price_frame(window)
+    features = context.load_feature_frame(window)
+
+    expected_prices = context.price_frame.loc["2024-02-10":"2024-03-31"]
+    pd.testing.assert_frame_equal(prices, expected_prices)
+    assert np.shares_memory(prices.to_numpy(), context.price_frame.to_numpy())
+
+    feature_dates = features.index.get_level_values(0)
+    assert feature_dates.min() == prices.index.min()
+    assert feature_dates.max() == prices.index.max()
+    assert len(features) == len(prices) * len(UNIVERSE)
+    assert context.load_time > 0.0
+
+    with pytest.raises(ValueError):
+        context.load_price_frame(_path_a_config("2023-12-01", "2024-01-31"))
+    with pytest.raises(ValueError):
+        context.load_price_frame(_path_a_config("2024-02-01", "2024-02-28", UNIVERSE[:2]))
+
+
+def _config(share_run_data):
+    return PathBConfig(
+        train_start="2024-01-01",
+        train_end="2024-01-31",
+        test_start="2024-02-01",
+        test_end="2024-05-31",
+        walkforward_window="1m",
+        walkforward_step="1m",
+        universe=UNIVERSE,
+        rebalance_frequency="W",
+        alpha_config_set=[],
+        share_run_data=share_run_data,
+    )
+
+
+def test_run_loads_data_once_and_reports_timings():
+    loader = CountingLoader()
+    engine = PathBEngine(data_loader=loader)
+    result = engine.run(_config(share_run_data=True))
+
+    assert len(result.window_results) > 1
+    # 只載入一次，涵蓋所有 window 的 test 區間
+    # （mock 的 load_feature_frame 內部會再呼叫 load_price_frame）
+    ranges = {(start, end) for _, start, end in loader.calls}
+    assert len(ranges) == 1
+    assert [kind for kind, _, _ in loader.calls].count("feature") == 1
+    (start, end), = ranges
+    assert start == min(w.test_start for w in result.window_results)
+    assert end == max(w.test_end for w in result.window_results)
+    # alpha input panel 只建立一次，各 window 取子面板
+    assert engine._alpha_panel_cache.misses == 1
+    assert engine._alpha_panel_cache.hits == len(result.window_results)
+
+    for window in result.window_results:
+        assert set(window.timings) == {"data_load_time", "compute_time"}
+        assert window.timings["compute_time"] > 0.0
+    assert result.summary["data_load_time"] > 0.0
+    assert result.summary["compute_time"] > 0.0
+
+
+def test_unshared_run_loads_per_window():
+    loader = CountingLoader()
+    result = PathBEngine(data_loader=loader).run(_config(share_run_data=False))
+
+    feature_calls = [call for call in loader.calls if call[0] == "feature"]
+    assert len(feature_calls) == len(result.window_results)
+    assert all(w.timings["data_load_time"] > 0.0 for w in result.window_results)
@@ -0,0 +1,54 @@
+"""
+Parallel window execution for Path B Engine (PathBConfig.max_workers)
+
+Running windows in a process pool must produce the same window results,
+ordering and governance summary as sequential execution.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from jgod.path_b.path_b_engine import PathBEngine, PathBConfig
+
+
+def _config(max_workers: int) -> PathBConfig:
+    return PathBConfig(
+        train_start="2024-01-01",
+        train_end="2024-01-31",
+        test_start="2024-02-01",
+        test_end="2024-05-31",
+        walkforward_window="1m",
+        walkforward_step="1m",
+        universe=["2330.TW", "2317.TW", "2454.TW"],
+        rebalance_frequency="W",
+        alpha_config_set=[],
+        data_source="mock",
+        mode="basic",
+        sharpe_threshold=10.0,  # 確保 governance rules 有觸發
+        max_workers=max_workers,
+    )
+
+
+def test_parallel_windows_match_sequential():
+    sequential = PathBEngine().run(_config(max_workers=1))
+    parallel = PathBEngine().run(_config(max_workers=2))
+
+    assert len(sequential.window_results) > 1
+    assert [w.window_id for w in parallel.window_results] == list(
+        range(1, len(sequential.window_results) + 1)
+    )
+
+    for seq, par in zip(sequential.window_results, parallel.window_results):
+        assert (seq.test_start, seq.test_end) == (par.test_start, par.test_end)
+        pd.testing.assert_series_equal(seq.test_result.nav_series, par.test_result.nav_series)
+        assert seq.sharpe_ratio == par.sharpe_ratio
+
+    assert [g.rules_triggered for g in parallel.windows_governance] == [
+        g.rules_triggered for g in sequential.windows_governance
+    ]
+    assert parallel.governance_summary == sequential.governance_summary
+    timing_keys = {"data_load_time", "compute_time"}
+    assert {k: v for k, v in parallel.summary.items() if k not in timing_keys} == {
+        k: v for k, v in sequential.summary.items() if k not in timing_keys
+    }
@@ -73,7 +73,7 @@ class TestPathCEngineSmoke:
         assert experiment_config.name == "test_experiment"
         assert len(experiment_config.scenarios) == 1
     
-    def test_path_c_engine_run_smoke(self):
+    def test_path_c_engine_run_smoke(self, tmp_path):
         """
         Test that PathCEngine.run_experiment() can be called without errors.
         Minimal test with mock data.
@@ -97,7 +97,7 @@ class TestPathCEngineSmoke:
         experiment_config = PathCExperimentConfig(
             name="smoke_test_experiment",
             scenarios=[scenario],
-            output_dir="output/path_c",
+            output_dir=str(tmp_path / "path_c"),
         )
         
         # Run should not raise exception
@@ -112,7 +112,7 @@ class TestPathCEngineSmoke:
         assert isinstance(summary.ranking_table, list), "Ranking table should be a list"
         assert summary.total_scenarios >= 1, "Should have at least 1 total scenario"
     
-    def test_path_c_ranking_table_structure(self):
+    def test_path_c_ranking_table_structure(self, tmp_path):
         """Test ranking table structure"""
         engine = PathCEngine()
         
@@ -147,7 +147,7 @@ class TestPathCEngineSmoke:
         experiment_config = PathCExperimentConfig(
             name="ranking_test_experiment",
             scenarios=scenarios,
-            output_dir="output/path_c",
+            output_dir=str(tmp_path / "path_c"),
         )
         
         summary = engine.run_experiment(experiment_config)
@@ -65,12 +65,15 @@ def test_path_d_train_config_creation(mock_path_b_config):
 
 
 @pytest.mark.slow
-def test_path_d_engine_train_minimal(mock_path_b_config):
+def test_path_d_engine_train_minimal(mock_path_b_config, tmp_path, monkeypatch):
     """
     測試 Path D Engine 訓練（最小配置）
     
     注意：這是一個 smoke test，只確保流程不報錯，不驗證結果品質。
     """
+    # policy 會寫到工作目錄下的 models/path_d/，改在 tmp_path 執行以免覆寫 repo 內的檔案
+    monkeypatch.chdir(tmp_path)
+    
     config = PathDTrainConfig(
         experiment_name="smoke_test",
         data_source="mock",
@@ -0,0 +1,127 @@
+"""
+Tests for the shared multi-dataset fetch plan of StockIndicatorBuilder100.
+"""
+
+from collections import Counter
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.prediction.data.indicator_builder_100 import (
+    IndicatorBuilderConfig,
+    StockIndicatorBuilder100,
+)
+from jgod.prediction.data.indicator_fetch_plan import INDICATOR_DATASETS
+
+AS_OF_DATES = list(pd.bdate_range("2024-03-01", "2024-04-30").date)
+
+
+class FakeFinMindClient:
+    """In-memory FinMind: deterministic rows per dataset, filtered to [start, end]."""
+
+    def __init__(self):
+        self.calls = Counter()
+        rng = np.random.default_rng(7)
+        days = pd.bdate_range("2021-01-01", "2024-12-31")
+        close = 500 * np.exp(np.cumsum(rng.normal(0, 0.02, len(days))))
+        self.tables = {
+            "get_daily_price": pd.DataFrame({
+                "date": days, "open": close * (1 + rng.normal(0, 0.01, len(days))),
+                "high": close * 1.02, "low": close * 0.98, "close": close,
+                "volume": rng.integers(1_000, 5_000, len(days)).astype(float),
+            }),
+            # 每日三列（不同法人），驗證同日多列的切片
+            "get_institutional_investors": pd.DataFrame({
+                "date": np.repeat(days, 3),
+                "name": np.tile(["Foreign", "Trust", "Dealer"], len(days)),
+                "foreign_buy": rng.integers(0, 100, 3 * len(days)),
+                "foreign_sell": rng.integers(0, 100, 3 * len(days)),
+            }),
+            "get_margin_short": pd.DataFrame({
+                "date": days,
+                "MarginPurchaseToday": rng.integers(0, 1_000, len(days)),
+                "ShortSaleToday": rng.integers(0, 500, len(days)),
+            }),
+            "get_shareholding": pd.DataFrame({
+                "date": days, "big_dealer_ratio": rng.uniform(40, 80, len(days)),
+            }),
+            "get_day_trading": pd.DataFrame({
+                "date": days, "Volume": rng.integers(0, 1_000, len(days)),
+            }),
+        }
+        months = pd.date_range("2021-01-10", "2024-12-10", freq="MS") + pd.Timedelta(days=9)
+        self.tables["get_month_revenue"] = pd.DataFrame({
+            "date": months, "revenue": rng.uniform(1e9, 2e9, len(months)),
+        })
+        quarters = pd.date_range("2021-03-31", "2024-12-31", freq="QE")
+        self.tables["get_financial_statement"] = pd.DataFrame({
+            "date": quarters,
+            "gross_profit": rng.uniform(1, 2, len(quarters)),
+            "operating_revenue": rng.uniform(3, 4, len(quarters)),
+            "operating_income": rng.uniform(0.5, 1, len(quarters)),
+            "eps": rng.uniform(5, 10, len(quarters)),
+            "net_income": rng.uniform(0.3, 0.6, len(quarters)),
+        })
+        self.tables["get_balance_sheet"] = pd.DataFrame({
+            "date": quarters,
+            "total_assets": rng.uniform(10, 12, len(quarters)),
+            "total_equity": rng.uniform(5, 6, len(quarters)),
+            "total_liabilities": rng.uniform(4, 5, len(quarters)),
+        })
+        self.tables["get_cash_flow"] = pd.DataFrame({
+            "date": quarters,
+            "operating_cash_flow": rng.uniform(1, 2, len(quarters)),
+            "capital_expenditure": rng.uniform(0.5, 1, len(quarters)),
+        })
+
+    def __getattr__(self, method):
+        if method not in self.__dict__.get("tables", {}):
+            raise AttributeError(method)
+
+        def fetch(stock_id, start, end):
+            self.calls[method] += 1
+            table = self.tables[method]
+            mask = (table["date"] >= pd.Timestamp(start)) & (table["date"] <= pd.Timestamp(end))
+            return table[mask].reset_index(drop=True)
+
+        return fetch
+
+
+@pytest.fixture
+def client():
+    return FakeFinMindClient()
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.SettingWithCopyWarning")
+def test_batch_matches_per_date_build_with_one_call_per_dataset(client):
+    builder = StockIndicatorBuilder100(client=client)
+    batch = builder.build_indicators_batch(["2330", "2317"], AS_OF_DATES)
+
+    assert sum(client.calls.values()) == 2 * len(INDICATOR_DATASETS)
+    assert set(batch) == {"2330", "2317"}
+
+    for as_of in AS_OF_DATES[::7]:
+        assert batch["2330"][as_of] == builder.build_indicators("2330", as_of)
+    # 非 placeholder 指標確實有值
+    sample = batch["2330"][AS_OF_DATES[-1]]
+    assert sample["P11"] != 0.0 and sample["F04"] != 0.0 and sample["C04"] != 0.0
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.SettingWithCopyWarning")
+def test_local_cache_reused_across_runs(client, tmp_path):
+    config = IndicatorBuilderConfig(cache_dir=str(tmp_path / "cache"))
+    first = StockIndicatorBuilder100(client=client, config=config).build_indicators_batch(
+        ["2330"], AS_OF_DATES
+    )
+    assert sum(client.calls.values()) == len(INDICATOR_DATASETS)
+
+    hits = []
+    second = StockIndicatorBuilder100(client=client, config=config).build_indicators_batch(
+        ["2330"], AS_OF_DATES[5:20], progress=lambda stock_id, dataset, cached: hits.append(cached)
+    )
+    # 子範圍完全由快取提供
+    assert sum(client.calls.values()) == len(INDICATOR_DATASETS)
+    assert hits == [True] * len(INDICATOR_DATASETS)
+    assert second["2330"][AS_OF_DATES[10]] == first["2330"][AS_OF_DATES[10]]
@@ -0,0 +1,165 @@
+"""
+Tests for PredictionBackfillEngine (batched, parallel, resumable backfill).
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from jgod.prediction.backfill_engine import (
+    PredictionBackfillConfig,
+    PredictionBackfillEngine,
+    build_prediction_row,
+    generate_date_range,
+)
+from jgod.prediction.rules.stock_upside_filter_60_v1 import StockUpsideFilter60V1
+from jgod.storage.indicator_store import ColumnarIndicatorStore
+from jgod.storage.models import Base, IndicatorSnapshot, PredictionSnapshot
+
+SYMBOLS = ["2330", "2317", "2454"]
+START, END = date(2024, 1, 1), date(2024, 1, 12)  # 10 weekdays
+MISSING = ("2454", date(2024, 1, 5))
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    rows = []
+    for s, symbol in enumerate(SYMBOLS):
+        for d, as_of in enumerate(generate_date_range(START, END)):
+            if (symbol, as_of) == MISSING:
+                continue
+            for k, code in enumerate(["P01", "C01", "F01", "S01"]):
+                raw = float((s + 1) * (d - 4) * (k + 1))
+                rows.append(IndicatorSnapshot(
+                    symbol=symbol,
+                    date=as_of,
+                    indicator_code=code,
+                    # F01 只有 normalized_value
+                    raw_value=None if code == "F01" else raw,
+                    normalized_value=0.25 if code == "F01" else None,
+                ))
+    session.add_all(rows)
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _config(**kwargs):
+    return PredictionBackfillConfig(start_date=START, end_date=END, date_chunk_size=3, **kwargs)
+
+
+def _predictions(session):
+    return {
+        (p.symbol, p.date): p
+        for p in session.query(PredictionSnapshot).all()
+    }
+
+
+def test_backfill_matches_per_row_evaluation(session):
+    stats = PredictionBackfillEngine(session, _config()).run(SYMBOLS)
+
+    assert stats.total == 30
+    assert stats.saved == 29
+    assert stats.skipped_data == 1
+    assert stats.errors == 0
+
+    predictions = _predictions(session)
+    assert MISSING not in predictions
+
+    as_of = date(2024, 1, 10)
+    indicators = {
+        snap.indicator_code: snap.raw_value if snap.raw_value is not None else snap.normalized_value * 100.0
+        for snap in session.query(IndicatorSnapshot).filter_by(symbol="2317", date=as_of)
+    }
+    expected = build_prediction_row(StockUpsideFilter60V1().evaluate("2317", indicators), as_of, top_n=10)
+    actual = predictions[("2317", as_of)]
+    for column in ("score", "verdict", "positive_factors_json", "negative_factors_json",
+                   "risk_flags_json", "meta_json", "raw_payload"):
+        assert getattr(actual, column) == expected[column], column
+
+
+def test_existing_predictions_skipped_unless_forced(session):
+    PredictionBackfillEngine(session, _config()).run(SYMBOLS)
+    first = {key: p.updated_at for key, p in _predictions(session).items()}
+
+    stats = PredictionBackfillEngine(session, _config()).run(SYMBOLS)
+    assert (stats.saved, stats.skipped_exists) == (0, 29)
+
+    stats = PredictionBackfillEngine(session, _config(force=True)).run(SYMBOLS)
+    assert (stats.saved, stats.skipped_exists) == (29, 0)
+    assert session.query(PredictionSnapshot).count() == 29
+    session.expire_all()
+    assert all(p.updated_at >= first[key] for key, p in _predictions(session).items())
+
+
+def test_interrupted_backfill_resumes_from_checkpoint(session, tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.json"
+    engine = PredictionBackfillEngine(session, _config(checkpoint_path=checkpoint, force=True))
+
+    original = engine._run_chunk
+    calls = []
+
+    def flaky(symbols, dates, stats, executor):
+        calls.append(dates[0])
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        original(symbols, dates, stats, executor)
+
+    monkeypatch.setattr(engine, "_run_chunk", flaky)
+    with pytest.raises(KeyboardInterrupt):
+        engine.run(SYMBOLS)
+    assert session.query(PredictionSnapshot).count() == 6 * 3 - 1
+
+    resumed = PredictionBackfillEngine(session, _config(checkpoint_path=checkpoint, force=True))
+    stats = resumed.run(SYMBOLS)
+
+    assert stats.skipped_checkpoint == 6 * 3
+    assert stats.saved == 4 * 3
+    assert session.query(PredictionSnapshot).count() == 29
+
+    # 不同 job（不同 symbols）不沿用 checkpoint
+    other = PredictionBackfillEngine(session, _config(checkpoint_path=checkpoint, force=True))
+    assert other.run(SYMBOLS[:2]).skipped_checkpoint == 0
+
+
+def test_completed_job_clears_checkpoint_so_rerun_saves(session, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+    first = PredictionBackfillEngine(session, _config(checkpoint_path=checkpoint, force=True)).run(SYMBOLS)
+    assert first.saved == 29
+    assert not checkpoint.exists()
+
+    second = PredictionBackfillEngine(session, _config(checkpoint_path=checkpoint, force=True)).run(SYMBOLS)
+    assert (second.saved, second.skipped_checkpoint) == (29, 0)
+
+
+def test_worker_processes_match_in_process(session):
+    PredictionBackfillEngine(session, _config(workers=2)).run(SYMBOLS)
+    parallel = {key: (p.score, p.meta_json) for key, p in _predictions(session).items()}
+    session.query(PredictionSnapshot).delete()
+    session.commit()
+
+    PredictionBackfillEngine(session, _config(workers=1)).run(SYMBOLS)
+    serial = {key: (p.score, p.meta_json) for key, p in _predictions(session).items()}
+
+    assert parallel == serial
+    assert len(serial) == 29
+
+
+def test_columnar_store_source_matches_database(session, tmp_path):
+    PredictionBackfillEngine(session, _config()).run(SYMBOLS)
+    from_db = {key: (p.score, p.meta_json) for key, p in _predictions(session).items()}
+    session.query(PredictionSnapshot).delete()
+    session.commit()
+
+    ColumnarIndicatorStore(tmp_path / "store").import_snapshots(session, START, END)
+    stats = PredictionBackfillEngine(session, _config(indicator_store_dir=tmp_path / "store")).run(SYMBOLS)
+    from_store = {key: (p.score, p.meta_json) for key, p in _predictions(session).items()}
+
+    assert (stats.saved, stats.skipped_data) == (29, 1)
+    assert from_store == from_db
@@ -0,0 +1,81 @@
+"""
+Tests for StockUpsideFilter60V1.evaluate_batch (vectorized universe scoring).
+"""
+
+import numpy as np
+import pytest
+
+from jgod.prediction.rules.stock_upside_filter_60_v1 import StockUpsideFilter60V1
+
+
+@pytest.fixture
+def model():
+    return StockUpsideFilter60V1()
+
+
+def _universe(model, n_symbols=50, seed=0):
+    rng = np.random.default_rng(seed)
+    codes = list(model.weights)
+    matrix = rng.normal(0.0, 80.0, size=(n_symbols, len(codes)))
+    # 部分指標未提供
+    matrix[rng.random(matrix.shape) < 0.1] = np.nan
+    matrix[0, :] = 0.0
+    symbols = [f"S{i:04d}" for i in range(n_symbols)]
+    return symbols, codes, matrix
+
+
+def _as_dict(codes, row):
+    return {code: value for code, value in zip(codes, row) if not np.isnan(value)}
+
+
+def test_batch_matches_per_symbol_evaluate(model):
+    symbols, codes, matrix = _universe(model)
+    batch = model.evaluate_batch(matrix, symbols)
+
+    assert len(batch) == len(symbols)
+    for i, symbol in enumerate(symbols):
+        expected = model.evaluate(symbol, _as_dict(codes, matrix[i]))
+        assert batch.total_scores[i] == expected.total_score
+        assert batch.verdicts[i] == expected.verdict
+
+    # 明細只在要求時建立，且與 evaluate() 完全相同
+    symbol = symbols[3]
+    assert batch.result(symbol) == model.evaluate(symbol, _as_dict(codes, matrix[3]))
+    assert set(batch.results(symbols[:2])) == set(symbols[:2])
+
+
+def test_verdict_thresholds(model):
+    codes = ["P01"]
+    weight = model.weights["P01"]
+    # P01 clipped 至 +/-1，總分 = normalized * weight；直接驗證邊界
+    scores = np.array([45.0, 44.99, 30.0, 15.0, 0.0, -0.01])
+    verdicts = model._verdicts(scores)
+    assert verdicts.tolist() == ["STRONG_BUY", "BUY", "BUY", "NEUTRAL", "AVOID", "SHORT"]
+    assert [model._verdict(s) for s in scores] == verdicts.tolist()
+
+    batch = model.evaluate_batch(np.array([[100.0], [-100.0]]), ["A", "B"], codes=codes)
+    assert batch.total_scores.tolist() == [weight, -weight]
+
+
+def test_column_subset_bool_and_object_inputs(model):
+    codes = ["P02", "C01", "NOT_A_CODE"]
+    symbols = ["2330", "2317"]
+
+    bools = np.array([[True, False, True], [False, True, False]])
+    batch = model.evaluate_batch(bools, symbols, codes=codes)
+    for i, symbol in enumerate(symbols):
+        indicators = dict(zip(codes, bools[i].tolist()))
+        assert batch.result(symbol) == model.evaluate(symbol, indicators)
+
+    mixed = np.array([[True, 250.0, None], [None, -30.0, 5.0]], dtype=object)
+    batch = model.evaluate_batch(mixed, symbols, codes=codes)
+    for i, symbol in enumerate(symbols):
+        indicators = {c: v for c, v in zip(codes, mixed[i].tolist()) if v is not None}
+        assert batch.result(symbol) == model.evaluate(symbol, indicators)
+
+
+def test_shape_mismatch_raises(model):
+    with pytest.raises(ValueError):
+        model.evaluate_batch(np.zeros((2, 3)), ["A"], codes=["P01", "P02", "P03"])
+    with pytest.raises(ValueError):
+        model.evaluate_batch(np.zeros((1, 2)), ["A"], codes=["P01", "P02", "P03"])
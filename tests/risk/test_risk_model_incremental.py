@@ -0,0 +1,166 @@
+"""Tests for incremental risk model updates
+
+`update()` on a fitted model must agree with a cold fit on the full history
+(MultiFactorRiskModel) or on the rolling window (MultiFactorRiskModelExtreme).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.risk.risk_model import MultiFactorRiskModel
+from jgod.risk.risk_model_extreme import MultiFactorRiskModelExtreme, RiskModelExtremeConfig
+from jgod.risk.exposure_schema import FactorExposure
+from jgod.risk.risk_factors import STANDARD_FACTOR_NAMES
+
+
+N_DAYS = 280
+
+
+@pytest.fixture(scope="module")
+def history():
+    """25 symbols × 280 days (longer than the 252-day beta window)
+
+    ~5% of observations are missing, two dates have no factor returns and
+    'NEW' only starts trading in the last week.
+    """
+    rng = np.random.default_rng(11)
+    K = len(STANDARD_FACTOR_NAMES)
+    dates = pd.bdate_range("2023-01-02", periods=N_DAYS)
+    symbols = [f"S{j:02d}" for j in range(24)] + ["NEW"]
+
+    factor_returns = pd.DataFrame(
+        rng.normal(0.0, 0.01, size=(N_DAYS, K)), index=dates, columns=STANDARD_FACTOR_NAMES
+    ).drop(index=dates[[40, 270]])
+
+    exposures, index, values = [], [], []
+    for date in dates:
+        for symbol in symbols:
+            if rng.random() < 0.05 or (symbol == "NEW" and date < dates[-5]):
+                continue
+            exposures.append(FactorExposure(
+                symbol=symbol,
+                date=date,
+                exposures={f: float(rng.normal()) for f in STANDARD_FACTOR_NAMES},
+            ))
+            index.append((date, symbol))
+            values.append(float(rng.normal(0.0, 0.02)))
+    returns = pd.Series(values, index=pd.MultiIndex.from_tuples(index, names=["date", "symbol"]))
+    return dates, exposures, returns, factor_returns
+
+
+def _slice(history, start, end):
+    dates, exposures, returns, _ = history
+    lo, hi = dates[start], dates[end - 1]
+    return_dates = returns.index.get_level_values("date")
+    return (
+        returns[(return_dates >= lo) & (return_dates <= hi)],
+        [exp for exp in exposures if lo <= exp.date <= hi],
+    )
+
+
+def _model(winsorize: bool = False, refit_interval: int = 21) -> MultiFactorRiskModel:
+    model = MultiFactorRiskModel(factor_names=STANDARD_FACTOR_NAMES)
+    if not winsorize:
+        model.winsorize_quantiles = (0.0, 1.0)
+    model.refit_interval = refit_interval
+    return model
+
+
+def _fit_then_update(history, model, use_factor_returns):
+    factor_returns = history[3] if use_factor_returns else None
+    model.fit(*reversed(_slice(history, 0, 260)), factor_returns=factor_returns)
+    for start, end in [(260, 265), (265, 266), (266, N_DAYS)]:
+        model.update(*_slice(history, start, end), factor_returns=factor_returns)
+    return model
+
+
+def _cold_fit(history, model, use_factor_returns):
+    factor_returns = history[3] if use_factor_returns else None
+    model.fit(*reversed(_slice(history, 0, N_DAYS)), factor_returns=factor_returns)
+    return model
+
+
+@pytest.mark.parametrize("use_factor_returns", [True, False], ids=["given_factors", "estimated_factors"])
+@pytest.mark.parametrize("refit_interval", [21, 1], ids=["incremental", "refit_every_date"])
+def test_update_matches_cold_fit(history, use_factor_returns, refit_interval):
+    updated = _fit_then_update(history, _model(refit_interval=refit_interval), use_factor_returns)
+    cold = _cold_fit(history, _model(), use_factor_returns)
+
+    assert updated.symbols == cold.symbols
+    assert "NEW" in updated.symbols
+    np.testing.assert_allclose(updated.B, cold.B, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(np.diag(updated.D), np.diag(cold.D), rtol=1e-9)
+    np.testing.assert_allclose(updated.F.values, cold.F.values, rtol=1e-12, atol=1e-18)
+    np.testing.assert_allclose(updated.get_covariance_matrix(), cold.get_covariance_matrix(), rtol=1e-9, atol=1e-15)
+    for symbol in cold.symbols:
+        np.testing.assert_allclose(updated.residuals[symbol], cold.residuals[symbol], atol=1e-12)
+        assert updated.specific_risk[symbol] == pytest.approx(cold.specific_risk[symbol], rel=1e-9)
+
+
+def test_update_with_frozen_winsorization_stays_close(history):
+    """Default winsorization bounds are frozen between fits → small drift only"""
+    updated = _fit_then_update(history, _model(winsorize=True), use_factor_returns=True)
+    cold = _cold_fit(history, _model(winsorize=True), use_factor_returns=True)
+
+    cov_updated, cov_cold = updated.get_covariance_matrix(), cold.get_covariance_matrix()
+    assert np.abs(cov_updated - cov_cold).max() < 1e-2 * np.abs(cov_cold).max()
+
+
+def test_update_skips_fitted_dates_and_cold_fits_when_unfitted(history):
+    model = _model()
+    model.fit(*reversed(_slice(history, 0, 260)), factor_returns=history[3])
+    before = model.get_covariance_matrix().copy()
+
+    model.update(*_slice(history, 250, 260), factor_returns=history[3])
+    np.testing.assert_array_equal(model.get_covariance_matrix(), before)
+
+    unfitted = _model()
+    unfitted.update(*_slice(history, 0, 260), factor_returns=history[3])
+    np.testing.assert_array_equal(unfitted.get_covariance_matrix(), before)
+
+
+@pytest.fixture(scope="module")
+def extreme_returns():
+    rng = np.random.default_rng(5)
+    n_days, n_assets = 300, 40
+    loadings = rng.normal(size=(n_assets, 3))
+    values = rng.normal(0.0, 0.01, size=(n_days, 3)) @ loadings.T * 0.5
+    values += rng.normal(0.0, 0.01, size=(n_days, n_assets))
+    return pd.DataFrame(
+        values,
+        index=pd.bdate_range("2023-01-02", periods=n_days),
+        columns=[f"A{i:02d}" for i in range(n_assets)],
+    )
+
+
+@pytest.mark.parametrize("refit_interval", [21, 2])
+def test_extreme_update_matches_cold_fit(extreme_returns, refit_interval):
+    window = 200
+    model = MultiFactorRiskModelExtreme(RiskModelExtremeConfig(refit_interval=refit_interval))
+    model.fit_from_returns(extreme_returns.iloc[:window])
+    for start in range(window, len(extreme_returns), 10):
+        model.update(extreme_returns.iloc[start:start + 10], max_history=window)
+
+    cold = MultiFactorRiskModelExtreme()
+    cold.fit_from_returns(extreme_returns.iloc[-window:])
+
+    assert model.factor_count == cold.factor_count
+    pd.testing.assert_index_equal(model.factor_returns.index, cold.factor_returns.index)
+    np.testing.assert_allclose(model.get_covariance_matrix(), cold.get_covariance_matrix(), rtol=1e-9, atol=1e-14)
+    np.testing.assert_allclose(np.diag(model.S), np.diag(cold.S), rtol=1e-9)
+    # PCA loadings are defined up to sign
+    np.testing.assert_allclose(np.abs(model.B), np.abs(cold.B), atol=1e-9)
+
+
+def test_extreme_update_with_nan_falls_back_to_full_fit(extreme_returns):
+    new_rows = extreme_returns.iloc[200:210].copy()
+    new_rows.iloc[3, 4] = np.nan
+
+    model = MultiFactorRiskModelExtreme()
+    model.fit_from_returns(extreme_returns.iloc[:200])
+    model.update(new_rows)
+
+    cold = MultiFactorRiskModelExtreme()
+    cold.fit_from_returns(pd.concat([extreme_returns.iloc[:200], new_rows]))
+    np.testing.assert_allclose(model.get_covariance_matrix(), cold.get_covariance_matrix())
@@ -0,0 +1,152 @@
+"""Tests for the columnar RiskObservationPanel used by MultiFactorRiskModel.fit
+
+Each vectorized fit step is checked against a straightforward per-row /
+per-date reference built from legacy aligned-data dicts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.risk.risk_model import MultiFactorRiskModel, RiskObservationPanel
+from jgod.risk.exposure_schema import FactorExposure
+from jgod.risk.risk_factors import STANDARD_FACTOR_NAMES
+
+
+FACTORS = STANDARD_FACTOR_NAMES
+
+
+@pytest.fixture
+def model():
+    return MultiFactorRiskModel(factor_names=FACTORS)
+
+
+@pytest.fixture
+def exposures_and_returns():
+    """12 symbols × 30 days, one missing return and one duplicated exposure"""
+    rng = np.random.default_rng(3)
+    symbols = [f'S{j:02d}' for j in (7, 3, 11, 0, 5, 9, 1, 10, 2, 8, 4, 6)]
+    dates = pd.date_range('2024-01-01', periods=30, freq='B')
+
+    exposures = [
+        FactorExposure(
+            symbol=symbol,
+            date=date,
+            exposures={f: float(rng.normal()) for f in FACTORS[:-1]},  # last factor missing → 0.0
+        )
+        for date in dates
+        for symbol in symbols
+    ]
+    # duplicated (date, symbol): the last exposure wins
+    exposures.append(FactorExposure(symbol='S00', date=dates[5], exposures={FACTORS[0]: 9.0}))
+
+    index = pd.MultiIndex.from_product([dates, symbols], names=['date', 'symbol'])
+    returns = pd.Series(rng.normal(0.0, 0.02, size=len(index)), index=index)
+    returns = returns.drop(index=(dates[3], 'S03'))
+    return exposures, returns
+
+
+def _legacy_records(model, exposures, returns):
+    exposure_dict = {(pd.Timestamp(exp.date), exp.symbol): exp for exp in exposures}
+    records = []
+    for (date, symbol), ret in returns.items():
+        exp = exposure_dict.get((pd.Timestamp(date), symbol))
+        if exp is not None:
+            records.append({
+                'date': pd.Timestamp(date),
+                'symbol': symbol,
+                'return': float(ret),
+                'exposure_vector': exp.get_exposure_vector(model.factor_names),
+            })
+    return records
+
+
+def _sorted(records):
+    return sorted(records, key=lambda r: (r['date'], r['symbol']))
+
+
+def test_prepare_aligned_data_matches_legacy_records(model, exposures_and_returns):
+    exposures, returns = exposures_and_returns
+
+    panel = model._prepare_aligned_data(exposures, returns)
+    expected = _legacy_records(model, exposures, returns)
+
+    assert isinstance(panel, RiskObservationPanel)
+    assert len(panel) == len(expected) == len(returns)
+    assert panel.symbols == sorted(panel.symbols)
+    assert panel.dates.is_monotonic_increasing
+
+    for got, want in zip(_sorted(panel.to_records()), _sorted(expected)):
+        assert got['date'] == want['date'] and got['symbol'] == want['symbol']
+        assert got['return'] == want['return']
+        np.testing.assert_array_equal(got['exposure_vector'], want['exposure_vector'])
+
+
+def test_prepare_aligned_data_accepts_tuple_index(model, exposures_and_returns):
+    exposures, returns = exposures_and_returns
+    tuple_returns = pd.Series(returns.to_numpy(), index=pd.Index(list(returns.index), tupleize_cols=False))
+
+    panel = model._prepare_aligned_data(exposures, tuple_returns)
+
+    assert len(panel) == len(returns)
+    np.testing.assert_array_equal(panel.returns, model._prepare_aligned_data(exposures, returns).returns)
+
+
+def test_records_round_trip(model, exposures_and_returns):
+    panel = model._prepare_aligned_data(*exposures_and_returns)
+    rebuilt = RiskObservationPanel.from_records(panel.to_records(), model.K)
+
+    pd.testing.assert_index_equal(rebuilt.dates, panel.dates)
+    assert rebuilt.symbols == panel.symbols
+    np.testing.assert_array_equal(rebuilt.date_idx, panel.date_idx)
+    np.testing.assert_array_equal(rebuilt.symbol_idx, panel.symbol_idx)
+    np.testing.assert_array_equal(rebuilt.exposures, panel.exposures)
+
+
+def test_factor_returns_match_per_date_regression(model, exposures_and_returns):
+    panel = model._prepare_aligned_data(*exposures_and_returns)
+    # make the last factor non-degenerate so the regressions are solvable
+    panel.exposures[:, -1] = np.random.default_rng(0).normal(size=len(panel))
+
+    factor_returns = model._estimate_factor_returns_from_exposures(panel)
+
+    records = panel.to_records()
+    for date in panel.dates:
+        rows = [r for r in records if r['date'] == date]
+        X = np.array([r['exposure_vector'] for r in rows])
+        y = np.array([r['return'] for r in rows])
+        expected = np.linalg.solve(X.T @ X, X.T @ y)
+        np.testing.assert_allclose(factor_returns.loc[date].to_numpy(), expected, rtol=1e-10)
+
+
+def test_factor_returns_skip_degenerate_dates(model, exposures_and_returns):
+    # last factor exposure is always 0 → every X'X is singular
+    panel = model._prepare_aligned_data(*exposures_and_returns)
+
+    assert model._estimate_factor_returns_from_exposures(panel) is None
+
+
+def test_specific_risk_matches_ewma_recursion(model):
+    rng = np.random.default_rng(1)
+    residuals = {
+        'A': rng.normal(0, 0.01, size=120).tolist(),
+        'B': rng.normal(0, 0.03, size=40).tolist(),
+        'C': rng.normal(0, 0.02, size=5).tolist(),  # < 10 residuals → default
+        'D': [],
+    }
+    symbols = ['A', 'B', 'C', 'D', 'E']
+
+    D, specific_risk = model._estimate_specific_risk_ewma(residuals, symbols)
+
+    lam = model.specific_risk_lambda
+    for i, symbol in enumerate(symbols):
+        series = residuals.get(symbol, [])
+        if len(series) < 10:
+            expected = 1e-6
+        else:
+            expected = np.var(series) * 252
+            for r in series:
+                expected = lam * expected + (1 - lam) * ((r * np.sqrt(252)) ** 2)
+            expected = max(expected, 1e-6)
+        assert D[i, i] == pytest.approx(expected, rel=1e-10)
+        assert specific_risk[symbol] == pytest.approx(np.sqrt(expected), rel=1e-10)
@@ -0,0 +1,185 @@
+"""Tests for the batched WLS beta estimator in MultiFactorRiskModel
+
+The batched `_estimate_betas_wls` must return the same B, residuals and
+fallbacks as the original per-symbol loop (`wls_betas_per_symbol` below).
+The `wls_problem` fixture doubles as the benchmark fixture (100 / 500 / 2000
+symbols); run the benchmark with:
+
+    JGOD_RUN_BENCHMARKS=1 pytest tests/risk/test_risk_model_wls_batched.py -s
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgod.risk.risk_model import MultiFactorRiskModel, RiskObservationPanel, _calculate_ewma_weights
+from jgod.risk.risk_factors import STANDARD_FACTOR_NAMES
+
+
+def build_wls_problem(n_symbols: int, n_days: int = 300, seed: int = 7):
+    """Synthetic aligned data + factor returns for beta estimation
+
+    Aligned data is returned as legacy per-observation dicts; the batched
+    estimator takes it as a RiskObservationPanel (see `_panel`).
+    Roughly 5% of (date, symbol) observations are dropped so symbols have
+    different regression windows, and 2% of factor-return dates are missing.
+    """
+    rng = np.random.default_rng(seed)
+    K = len(STANDARD_FACTOR_NAMES)
+    dates = pd.bdate_range("2023-01-02", periods=n_days)
+    symbols = [f"S{j:04d}" for j in range(n_symbols)]
+
+    factor_values = rng.normal(0.0, 0.01, size=(n_days, K))
+    factor_returns = pd.DataFrame(factor_values, index=dates, columns=STANDARD_FACTOR_NAMES)
+    factor_returns = factor_returns.drop(index=dates[rng.random(n_days) < 0.02])
+
+    true_betas = rng.normal(0.0, 1.0, size=(n_symbols, K))
+    returns = factor_values @ true_betas.T + rng.normal(0.0, 0.02, size=(n_days, n_symbols))
+    exposures = rng.normal(0.0, 1.0, size=(n_days, n_symbols, K))
+    keep = rng.random((n_days, n_symbols)) > 0.05
+
+    aligned_data = [
+        {
+            'date': dates[i],
+            'symbol': symbols[j],
+            'return': float(returns[i, j]),
+            'exposure_vector': exposures[i, j],
+        }
+        for i in range(n_days)
+        for j in range(n_symbols)
+        if keep[i, j]
+    ]
+    return aligned_data, factor_returns
+
+
+def wls_betas_per_symbol(model, aligned_data, factor_returns):
+    """Reference: the original one-symbol-at-a-time WLS beta estimator
+
+    Window: each symbol's last `beta_regression_window` observations; EWMA
+    weights with half-life `ewma_half_life`. Fallbacks:
+    - < K observations in window → zero beta
+    - < K observations with factor returns → latest exposure in window
+    - ill-conditioned F' W F (cond > 1e10) or singular → latest aligned exposure
+    """
+    by_symbol = {}
+    for row in aligned_data:
+        by_symbol.setdefault(row['symbol'], []).append(row)
+    symbols = sorted(by_symbol)
+
+    beta_rows = []
+    residuals_dict = {}
+    for symbol in symbols:
+        rows = sorted(by_symbol[symbol], key=lambda r: r['date'])[-model.beta_regression_window:]
+        residuals_dict[symbol] = []
+        if len(rows) < model.K:
+            beta_rows.append(np.zeros(model.K))
+            continue
+
+        aligned = [r for r in rows if r['date'] in factor_returns.index]
+        if len(aligned) < model.K:
+            beta_rows.append(np.array(rows[-1]['exposure_vector']))
+            continue
+
+        F = np.array([factor_returns.loc[r['date']].values for r in aligned])
+        R = np.array([r['return'] for r in aligned]).reshape(-1, 1)
+        W = np.diag(_calculate_ewma_weights(len(R), half_life=model.ewma_half_life))
+        latest_exposure = np.array(aligned[-1]['exposure_vector'])
+
+        try:
+            FtWF = F.T @ W @ F
+            if np.linalg.cond(FtWF) > 1e10:
+                beta = latest_exposure
+            else:
+                beta = np.linalg.solve(FtWF, F.T @ W @ R).flatten()
+                residuals_dict[symbol] = (R.flatten() - F @ beta).tolist()
+        except np.linalg.LinAlgError:
+            beta = latest_exposure
+        beta_rows.append(beta)
+
+    return np.array(beta_rows), symbols, residuals_dict
+
+
+@pytest.fixture
+def model():
+    return MultiFactorRiskModel(factor_names=STANDARD_FACTOR_NAMES)
+
+
+@pytest.fixture(params=[100, 500, 2000], ids=lambda n: f"{n}_symbols")
+def wls_problem(request):
+    """Benchmark fixture: aligned data + factor returns at 100 / 500 / 2000 symbols"""
+    return build_wls_problem(request.param)
+
+
+def _panel(model, aligned_data):
+    return RiskObservationPanel.from_records(aligned_data, model.K)
+
+
+def _assert_same_estimates(reference, batched):
+    B_ref, symbols_ref, resid_ref = reference
+    B_new, symbols_new, resid_new = batched
+
+    assert symbols_new == symbols_ref
+    np.testing.assert_allclose(B_new, B_ref, rtol=1e-8, atol=1e-10)
+    assert resid_new.keys() == resid_ref.keys()
+    for symbol in symbols_ref:
+        assert len(resid_new[symbol]) == len(resid_ref[symbol])
+        np.testing.assert_allclose(resid_new[symbol], resid_ref[symbol], rtol=1e-8, atol=1e-12)
+
+
+def test_batched_wls_matches_per_symbol(model):
+    aligned_data, factor_returns = build_wls_problem(n_symbols=30)
+
+    _assert_same_estimates(
+        wls_betas_per_symbol(model, aligned_data, factor_returns),
+        model._estimate_betas_wls(_panel(model, aligned_data), factor_returns),
+    )
+
+
+def test_batched_wls_fallbacks(model):
+    """Short history, missing factor returns and degenerate factors use the same fallbacks"""
+    aligned_data, factor_returns = build_wls_problem(n_symbols=4, n_days=40)
+    dates = factor_returns.index
+
+    # S0000: fewer than K observations → zero beta
+    aligned_data = [r for r in aligned_data if r['symbol'] != "S0000" or r['date'] >= dates[-3]]
+    # S0001: observations only on dates without factor returns → latest exposure
+    extra_dates = pd.bdate_range(dates[-1] + pd.Timedelta(days=1), periods=10)
+    aligned_data = [r for r in aligned_data if r['symbol'] != "S0001"] + [
+        {'date': d, 'symbol': "S0001", 'return': 0.01, 'exposure_vector': np.full(model.K, float(i))}
+        for i, d in enumerate(extra_dates)
+    ]
+
+    _assert_same_estimates(
+        wls_betas_per_symbol(model, aligned_data, factor_returns),
+        model._estimate_betas_wls(_panel(model, aligned_data), factor_returns),
+    )
+
+    # Degenerate (constant-zero) factor → singular F'WF → latest aligned exposure
+    degenerate = factor_returns.copy()
+    degenerate[STANDARD_FACTOR_NAMES[0]] = 0.0
+    _assert_same_estimates(
+        wls_betas_per_symbol(model, aligned_data, degenerate),
+        model._estimate_betas_wls(_panel(model, aligned_data), degenerate),
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.getenv("JGOD_RUN_BENCHMARKS"), reason="set JGOD_RUN_BENCHMARKS=1 to run")
+def test_batched_wls_benchmark(model, wls_problem):
+    aligned_data, factor_returns = wls_problem
+
+    t0 = time.perf_counter()
+    reference = wls_betas_per_symbol(model, aligned_data, factor_returns)
+    t_reference = time.perf_counter() - t0
+
+    panel = _panel(model, aligned_data)
+    t0 = time.perf_counter()
+    batched = model._estimate_betas_wls(panel, factor_returns)
+    t_batched = time.perf_counter() - t0
+
+    _assert_same_estimates(reference, batched)
+    print(f"\nWLS betas N={len(batched[1])}: per-symbol {t_reference:.3f}s, "
+          f"batched {t_batched:.3f}s ({t_reference / max(t_batched, 1e-9):.1f}x)")
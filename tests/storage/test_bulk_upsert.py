@@ -0,0 +1,78 @@
+"""
+Tests for the daily_bars bulk upsert path and SQLite pragmas.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from jgod.storage.bulk_upsert import upsert_daily_bars
+from jgod.storage.db import _apply_sqlite_pragmas
+from jgod.storage.models import Base, DailyBar
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _bars(start, periods, close=100.0):
+    dates = pd.bdate_range(start, periods=periods)
+    return pd.DataFrame({
+        "date": dates,
+        "open": close,
+        "high": close + 1,
+        "low": close - 1,
+        "close": close,
+        "volume": 1000.0,
+    })
+
+
+def test_insert_then_update_in_batches(session):
+    inserted, updated = upsert_daily_bars(session, "2330", _bars("2024-01-01", 10), batch_size=3)
+    session.commit()
+    assert (inserted, updated) == (10, 0)
+
+    # 重疊 5 天 + 新增 5 天，收盤價改變
+    inserted, updated = upsert_daily_bars(
+        session, "2330", _bars("2024-01-08", 10, close=200.0), batch_size=4
+    )
+    session.commit()
+    assert (inserted, updated) == (5, 5)
+
+    rows = session.query(DailyBar).filter(DailyBar.symbol == "2330").order_by(DailyBar.date).all()
+    assert len(rows) == 15
+    assert [r.close for r in rows] == [100.0] * 5 + [200.0] * 10
+    assert rows[-1].high == 201.0
+    assert rows[0].turnover is None
+    assert all(r.source == "FinMind" for r in rows)
+
+
+def test_other_symbols_untouched_and_duplicates_collapsed(session):
+    upsert_daily_bars(session, "2317", _bars("2024-01-01", 3, close=50.0))
+    bars = pd.concat([_bars("2024-01-01", 3), _bars("2024-01-03", 1, close=300.0)], ignore_index=True)
+    bars["turnover"] = 5.0
+
+    inserted, updated = upsert_daily_bars(session, "2330", bars)
+    session.commit()
+
+    assert (inserted, updated) == (3, 0)
+    last = session.query(DailyBar).filter_by(symbol="2330", date=date(2024, 1, 3)).one()
+    assert last.close == 300.0
+    assert last.turnover == 5.0
+    assert session.query(DailyBar).filter_by(symbol="2317").count() == 3
+
+
+def test_sqlite_pragmas_enable_wal(session):
+    assert session.execute(text("PRAGMA journal_mode")).scalar().lower() == "wal"
+    # NORMAL = 1
+    assert session.execute(text("PRAGMA synchronous")).scalar() == 1
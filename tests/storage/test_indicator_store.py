@@ -0,0 +1,97 @@
+"""
+Tests for the columnar (wide, month-partitioned) indicator store.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from jgod.prediction.backfill_engine import IndicatorPanel
+from jgod.storage.indicator_store import ColumnarIndicatorStore
+from jgod.storage.models import Base, IndicatorSnapshot
+
+DATES = [date(2024, 1, 30), date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 2)]
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    rows = []
+    for s, symbol in enumerate(["2330", "2317"]):
+        for d, as_of in enumerate(DATES):
+            if (symbol, as_of) == ("2317", DATES[2]):
+                continue
+            for k, code in enumerate(["P01", "C01", "F01"]):
+                rows.append(IndicatorSnapshot(
+                    symbol=symbol,
+                    date=as_of,
+                    indicator_code=code,
+                    raw_value=None if code == "F01" else float(s * 100 + d * 10 + k),
+                    normalized_value=0.5 if code == "F01" else None,
+                ))
+    session.add_all(rows)
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("use_parquet", [True, False])
+def test_import_matches_row_table_panel(session, tmp_path, use_parquet):
+    store = ColumnarIndicatorStore(tmp_path / "store", use_parquet=use_parquet)
+    assert store.import_snapshots(session, DATES[0], DATES[-1]) == 7
+    assert store.months() == ["2024-01", "2024-02"]
+
+    symbols = ["2317", "2330", "9999"]
+    from_db = IndicatorPanel.load(session, symbols, DATES)
+    from_store = IndicatorPanel.from_store(store, symbols, DATES)
+
+    assert from_store.codes == from_db.codes == ["C01", "F01", "P01"]
+    np.testing.assert_array_equal(from_store.present, from_db.present)
+    np.testing.assert_array_equal(from_store.values, from_db.values)
+    assert from_store.indicators(1, 3) == from_db.indicators(1, 3)
+
+
+def test_write_merges_codes_and_rows(tmp_path):
+    store = ColumnarIndicatorStore(tmp_path / "store")
+    store.write_records({
+        ("2330", date(2024, 3, 1)): {"P01": 1.0, "C01": 2.0},
+        ("2330", date(2024, 3, 4)): {"P01": 3.0},
+    })
+    # 新值覆寫；新欄位加入；未提供的欄位保留
+    store.write_records({
+        ("2330", date(2024, 3, 1)): {"P01": 10.0, "F01": 5.0},
+        ("2317", date(2024, 3, 1)): {"C01": 7.0},
+    })
+
+    values, codes = store.load_matrix(["2330", "2317"], [date(2024, 3, 1), date(2024, 3, 4)])
+    assert codes == ["C01", "F01", "P01"]
+    np.testing.assert_array_equal(values[0, 0], [2.0, 5.0, 10.0])
+    np.testing.assert_array_equal(values[0, 1], [np.nan, np.nan, 3.0])
+    np.testing.assert_array_equal(values[1, 0], [7.0, np.nan, np.nan])
+    assert np.isnan(values[1, 1]).all()
+
+    # 指定欄位（含不存在的指標）只讀需要的欄
+    values, codes = store.load_matrix(["2330"], [date(2024, 3, 1)], codes=["P01", "X01"])
+    np.testing.assert_array_equal(values[0, 0], [10.0, np.nan])
+
+
+def test_parquet_partition_without_pyarrow_raises_clear_error(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    import jgod.storage.indicator_store as indicator_store
+
+    ColumnarIndicatorStore(tmp_path / "store").write_records({("2330", date(2024, 3, 1)): {"P01": 1.0}})
+
+    monkeypatch.setattr(indicator_store, "PARQUET_AVAILABLE", False)
+    store = ColumnarIndicatorStore(tmp_path / "store")
+    with pytest.raises(ImportError, match="pyarrow"):
+        store.load_matrix(["2330"], [date(2024, 3, 1)], codes=["P01"])
+    # 寫入也會先讀取既有分區：不可默默以 pickle 覆蓋（並刪除）Parquet 分區
+    with pytest.raises(ImportError, match="pyarrow"):
+        store.write_records({("2330", date(2024, 3, 1)): {"P01": 2.0}})
+    assert (tmp_path / "store" / "2024-03.parquet").exists()
@@ -0,0 +1,108 @@
+"""
+Tests for the prediction API storage paths: projection columns, indexes and
+the invalidating response cache.
+"""
+
+import os
+from datetime import date, datetime
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from jgod.prediction.backfill_engine import build_prediction_row
+from jgod.prediction.rules.stock_upside_filter_60_v1 import StockUpsideFilter60V1
+from jgod.storage.db import migrate_schema
+from jgod.storage.models import PredictionSnapshot
+from jgod.storage.prediction_cache import TTLCache, notify_predictions_written, version_file_for
+from jgod.storage.prediction_projection import normalize_factor_list, project_prediction_row
+
+
+def test_projection_matches_legacy_normalization():
+    positive = [{"code": "P01", "weighted_score": 1.2}]
+    assert normalize_factor_list(positive, "ignored") == [str(positive[0])]
+    assert normalize_factor_list(None, "P01, C02,") == ["P01", "C02"]
+    assert normalize_factor_list([], ["F01"]) == ["F01"]
+    assert normalize_factor_list(None, None) == []
+
+    result = StockUpsideFilter60V1().evaluate("2330", {"P01": 80.0, "C01": -50.0})
+    row = build_prediction_row(result, date(2024, 1, 2), top_n=5)
+    assert row["positive_factor_labels"] == [str(item) for item in row["positive_factors_json"]]
+    assert row["negative_factor_labels"] == [str(item) for item in row["negative_factors_json"]]
+    assert row["risk_flag_labels"] == project_prediction_row(row)["risk_flag_labels"]
+
+
+def test_cache_hits_until_notified_or_version_file_changes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    version_file = version_file_for(tmp_path / "test.db")
+    cache = TTLCache(ttl=60, version_file=version_file)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("latest:2330", compute) == 1
+    assert cache.get_or_compute("latest:2330", compute) == 1
+
+    # 同 process 寫入
+    notify_predictions_written(engine)
+    assert version_file.exists()
+    assert cache.get_or_compute("latest:2330", compute) == 2
+
+    # 其他 process 寫入：只有 version file 的 mtime 改變
+    stat = version_file.stat()
+    os.utime(version_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get_or_compute("latest:2330", compute) == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+    engine.dispose()
+
+
+def test_cache_ttl_and_lru_bound():
+    cache = TTLCache(ttl=0.0)
+    assert cache.get_or_compute("k", lambda: 1) == 1
+    assert cache.get_or_compute("k", lambda: 2) == 2  # ttl <= 0 disables caching
+
+    cache = TTLCache(ttl=60, max_entries=2)
+    for key in ["a", "b", "c"]:
+        cache.get_or_compute(key, lambda: key)
+    assert len(cache) == 2
+    assert cache.get_or_compute("a", lambda: "recomputed") == "recomputed"
+
+
+def test_migrate_schema_adds_projection_columns_and_indexes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE prediction_snapshots (id INTEGER PRIMARY KEY, symbol VARCHAR NOT NULL, "
+            "date DATE NOT NULL, score FLOAT, total_score FLOAT, signal VARCHAR, verdict VARCHAR, "
+            "positive_factors_json JSON, negative_factors_json JSON, risk_flags_json JSON, "
+            "meta_json JSON, positive_indicators JSON, negative_indicators JSON, raw_payload JSON, "
+            "created_at DATETIME, updated_at DATETIME, "
+            "CONSTRAINT uq_prediction_snapshot UNIQUE (symbol, date))"
+        )
+    migrate_schema(engine)
+    migrate_schema(engine)  # idempotent
+
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns("prediction_snapshots")}
+    assert {"positive_factor_labels", "negative_factor_labels", "risk_flag_labels"} <= columns
+    indexes = {i["name"] for i in inspector.get_indexes("prediction_snapshots")}
+    assert {"ix_prediction_snapshots_symbol_date_desc", "ix_prediction_snapshots_date_score"} <= indexes
+
+    with engine.connect() as conn:
+        plan = " ".join(
+            str(row) for row in conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT date, score FROM prediction_snapshots "
+                "WHERE date = '2024-01-02' ORDER BY score DESC"
+            )
+        )
+    assert "ix_prediction_snapshots_date_score" in plan
+
+    # ORM 可讀寫遷移後的舊表
+    session = sessionmaker(bind=engine)()
+    session.add(PredictionSnapshot(symbol="2330", date=date(2024, 1, 2), score=1.0,
+                                   positive_factor_labels=["P01"], updated_at=datetime.now()))
+    session.commit()
+    assert session.query(PredictionSnapshot.positive_factor_labels).scalar() == ["P01"]
+    session.close()
+    engine.dispose()
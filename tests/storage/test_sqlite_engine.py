@@ -0,0 +1,99 @@
+"""
+Tests for the pooled read-write / read-only SQLite engines.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from jgod.storage.db import create_sqlite_engine
+from jgod.storage.models import Base
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "test.db"
+    engine = create_sqlite_engine(path)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO stocks (symbol, is_active) VALUES ('2330', 1)"))
+    engine.dispose()
+    return path
+
+
+def test_read_only_engine_reads_during_open_write_and_rejects_writes(db_path):
+    writer = create_sqlite_engine(db_path)
+    reader = create_sqlite_engine(db_path, read_only=True)
+    try:
+        with writer.connect() as w:
+            w.exec_driver_sql("BEGIN IMMEDIATE")
+            w.execute(text("INSERT INTO stocks (symbol, is_active) VALUES ('2317', 1)"))
+
+            # WAL：寫入 transaction 未結束時讀取不會被擋，也看不到未提交資料
+            with reader.connect() as r:
+                started = time.perf_counter()
+                assert r.execute(text("SELECT COUNT(*) FROM stocks")).scalar() == 1
+                assert time.perf_counter() - started < 1.0
+            w.commit()
+
+        with reader.connect() as r:
+            assert r.execute(text("SELECT COUNT(*) FROM stocks")).scalar() == 2
+            assert r.execute(text("PRAGMA journal_mode")).scalar().lower() == "wal"
+            with pytest.raises(OperationalError):
+                r.execute(text("INSERT INTO stocks (symbol, is_active) VALUES ('2454', 1)"))
+    finally:
+        writer.dispose()
+        reader.dispose()
+
+
+def test_competing_writer_waits_instead_of_database_locked(db_path):
+    first = create_sqlite_engine(db_path)
+    second = create_sqlite_engine(db_path)
+    try:
+        locked = threading.Event()
+
+        def hold_lock():
+            with first.connect() as conn:
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                conn.execute(text("INSERT INTO stocks (symbol, is_active) VALUES ('2317', 1)"))
+                locked.set()
+                time.sleep(0.3)
+                conn.commit()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        locked.wait()
+        with second.begin() as conn:
+            conn.execute(text("INSERT INTO stocks (symbol, is_active) VALUES ('2454', 1)"))
+        holder.join()
+
+        with second.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM stocks")).scalar() == 3
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() > 0
+    finally:
+        first.dispose()
+        second.dispose()
+
+
+def test_data_connection_is_reused_per_thread(tmp_path, monkeypatch):
+    import jgod.data.db as data_db
+
+    monkeypatch.setattr(data_db, "DB_PATH", tmp_path / "tw.db")
+    conn = data_db.get_connection()
+    assert data_db.get_connection() is conn
+    assert conn.execute("SELECT COUNT(*) FROM tw_stock_daily").fetchone() == (0,)
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(data_db.get_connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    # 呼叫端 close() 後下次呼叫重新開啟
+    conn.close()
+    reopened = data_db.get_connection()
+    assert reopened is not conn
+    assert reopened.execute("SELECT COUNT(*) FROM tw_stock_daily").fetchone() == (0,)